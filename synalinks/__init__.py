@@ -13,6 +13,7 @@ from synalinks.api import DataModel
 from synalinks.api import Decision
 from synalinks.api import EmbeddedEntity
 from synalinks.api import Embedding
+from synalinks.api import EmbeddingCache
 from synalinks.api import EmbeddingModel
 from synalinks.api import Embeddings
 from synalinks.api import Entities
@@ -47,6 +48,7 @@ from synalinks.api import Program
 from synalinks.api import ProgramAsJudge
 from synalinks.api import Relation
 from synalinks.api import Relations
+from synalinks.api import RequestScheduler
 from synalinks.api import Reward
 from synalinks.api import SelfCritique
 from synalinks.api import Sequential
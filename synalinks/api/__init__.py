@@ -66,12 +66,18 @@ from synalinks.src.backend.pydantic.base import (
 )
 from synalinks.src.backend.pydantic.base import is_tool_call as is_tool_call
 from synalinks.src.backend.pydantic.base import is_triplet_search as is_triplet_search
+from synalinks.src.embedding_models.embedding_cache import (
+    EmbeddingCache as EmbeddingCache,
+)
 from synalinks.src.embedding_models.embedding_model import (
     EmbeddingModel as EmbeddingModel,
 )
 from synalinks.src.initializers.initializer import Initializer as Initializer
 from synalinks.src.knowledge_bases.knowledge_base import KnowledgeBase as KnowledgeBase
 from synalinks.src.language_models.language_model import LanguageModel as LanguageModel
+from synalinks.src.language_models.request_scheduler import (
+    RequestScheduler as RequestScheduler,
+)
 from synalinks.src.metrics.metric import Metric as Metric
 from synalinks.src.modules.agents.function_calling_agent import (
     FunctionCallingAgent as FunctionCallingAgent,
@@ -8,10 +8,16 @@ from synalinks.src.backend.config import api_key as api_key
 from synalinks.src.backend.config import backend as backend
 from synalinks.src.backend.config import epsilon as epsilon
 from synalinks.src.backend.config import floatx as floatx
+from synalinks.src.backend.config import (
+    max_concurrent_operations as max_concurrent_operations,
+)
 from synalinks.src.backend.config import set_api_key as set_api_key
 from synalinks.src.backend.config import set_backend as set_backend
 from synalinks.src.backend.config import set_epsilon as set_epsilon
 from synalinks.src.backend.config import set_floatx as set_floatx
+from synalinks.src.backend.config import (
+    set_max_concurrent_operations as set_max_concurrent_operations,
+)
 from synalinks.src.backend.config import synalinks_home as synalinks_home
 from synalinks.src.saving.serialization_lib import (
     enable_unsafe_deserialization as enable_unsafe_deserialization,
@@ -24,4 +30,4 @@ from synalinks.src.utils.io_utils import (
 )
 from synalinks.src.utils.io_utils import (
     is_interactive_logging_enabled as is_interactive_logging_enabled,
-)
\ No newline at end of file
+)
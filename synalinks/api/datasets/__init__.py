@@ -7,3 +7,4 @@ since your modifications would be overwritten.
 from synalinks.api.datasets import arcagi as arcagi
 from synalinks.api.datasets import gsm8k as gsm8k
 from synalinks.api.datasets import hotpotqa as hotpotqa
+from synalinks.src.trainers.data_adapters.lazy_dataset import LazyDataset as LazyDataset
@@ -6,6 +6,12 @@ since your modifications would be overwritten.
 
 from synalinks.src.embedding_models import deserialize as deserialize
 from synalinks.src.embedding_models import serialize as serialize
+from synalinks.src.embedding_models.embedding_cache import (
+    EmbeddingCache as EmbeddingCache,
+)
 from synalinks.src.embedding_models.embedding_model import (
     EmbeddingModel as EmbeddingModel,
 )
+from synalinks.src.language_models.request_scheduler import (
+    RequestScheduler as RequestScheduler,
+)
@@ -7,3 +7,16 @@ since your modifications would be overwritten.
 from synalinks.src.language_models import deserialize as deserialize
 from synalinks.src.language_models import serialize as serialize
 from synalinks.src.language_models.language_model import LanguageModel as LanguageModel
+from synalinks.src.language_models.language_model import (
+    StreamingIterator as StreamingIterator,
+)
+from synalinks.src.language_models.language_model_cache import DiskCache as DiskCache
+from synalinks.src.language_models.language_model_cache import (
+    InMemoryCache as InMemoryCache,
+)
+from synalinks.src.language_models.language_model_cache import (
+    LanguageModelCache as LanguageModelCache,
+)
+from synalinks.src.language_models.request_scheduler import (
+    RequestScheduler as RequestScheduler,
+)
@@ -9,6 +9,9 @@ from synalinks.src.rewards import get as get
 from synalinks.src.rewards import serialize as serialize
 from synalinks.src.rewards.cosine_similarity import CosineSimilarity as CosineSimilarity
 from synalinks.src.rewards.cosine_similarity import cosine_similarity as cosine_similarity
+from synalinks.src.rewards.cosine_similarity import (
+    cosine_similarity_batch as cosine_similarity_batch,
+)
 from synalinks.src.rewards.exact_match import ExactMatch as ExactMatch
 from synalinks.src.rewards.exact_match import exact_match as exact_match
 from synalinks.src.rewards.lm_as_judge import LMAsJudge as LMAsJudge
@@ -40,6 +40,7 @@ from synalinks.src.trainers.data_adapters.data_adapter_utils import pack_x_y as
 from synalinks.src.trainers.data_adapters.data_adapter_utils import (
     unpack_x_y as unpack_x_y,
 )
+from synalinks.src.trainers.data_adapters.lazy_dataset import LazyDataset as LazyDataset
 from synalinks.src.utils.file_utils import get_file as get_file
 from synalinks.src.utils.io_utils import (
     disable_interactive_logging as disable_interactive_logging,
@@ -6,7 +6,6 @@ from typing import Any
 from typing import Dict
 
 import click
-import inquirer
 import jinja2
 
 from synalinks.cli.constants import PROJECT_CONFIG_FILENAME
@@ -48,6 +47,8 @@ def base_setup_config() -> Dict[str, Any]:
     Returns:
         (dict): The base configuration for the project.
     """
+    import inquirer
+
     questions = []
     config = get_config_json("default_project_config.json")
     default_project_name = config.get("project_name")
@@ -90,6 +91,8 @@ def models_setup_config(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         (dict): The updated project configuration with language model settings.
     """
+    import inquirer
+
     questions = []
     lm_config = get_config_json("language_models.json")
     em_config = get_config_json("embedding_models.json")
@@ -145,6 +148,8 @@ def secrets_setup_config(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         (dict): The secrets configuration for the project.
     """
+    import inquirer
+
     secrets = copy.deepcopy(get_config_json("api_key_config.json"))
     lm_provider = config.get("model_provider", None)
     if lm_provider:
@@ -224,6 +229,8 @@ def maybe_setup_project() -> Dict[str, Any]:
     Returns:
         (dict): The project configuration.
     """
+    import inquirer
+
     if is_inside_synalinks_project():
         config = get_synalinks_project_config()
     else:
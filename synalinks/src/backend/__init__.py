@@ -20,15 +20,23 @@ from synalinks.src.backend.common.json_schema_utils import out_mask_schema
 from synalinks.src.backend.common.json_schema_utils import prefix_schema
 from synalinks.src.backend.common.json_schema_utils import standardize_schema
 from synalinks.src.backend.common.json_schema_utils import suffix_schema
+from synalinks.src.backend.common.json_utils import PartialJsonParser
 from synalinks.src.backend.common.json_utils import concatenate_json
 from synalinks.src.backend.common.json_utils import factorize_json
 from synalinks.src.backend.common.json_utils import in_mask_json
 from synalinks.src.backend.common.json_utils import out_mask_json
+from synalinks.src.backend.common.json_utils import parse_partial_json
 from synalinks.src.backend.common.json_utils import prefix_json
 from synalinks.src.backend.common.json_utils import suffix_json
+from synalinks.src.backend.common.predictions_scope import PredictionsScope
+from synalinks.src.backend.common.predictions_scope import get_predictions_scope
+from synalinks.src.backend.common.predictions_scope import in_predictions_scope
 from synalinks.src.backend.common.stateless_scope import StatelessScope
 from synalinks.src.backend.common.stateless_scope import get_stateless_scope
 from synalinks.src.backend.common.stateless_scope import in_stateless_scope
+from synalinks.src.backend.common.streaming_scope import StreamingScope
+from synalinks.src.backend.common.streaming_scope import get_streaming_scope
+from synalinks.src.backend.common.streaming_scope import in_streaming_scope
 from synalinks.src.backend.common.symbolic_data_model import any_symbolic_data_models
 from synalinks.src.backend.common.symbolic_data_model import is_symbolic_data_model
 from synalinks.src.backend.common.symbolic_scope import SymbolicScope
@@ -44,6 +44,46 @@ def dynamic_enum(schema, prop_to_update, labels, description=None):
     return schema
 
 
+def dynamic_list(schema, prop_name, title, max_items=None, description=None):
+    """Create a schema with a list of objects of the given schema.
+
+    Args:
+        schema (dict): The schema of the list items.
+        prop_name (str): The name of the list property.
+        title (str): The title of the resulting schema.
+        max_items (int, optional): The maximum number of items in the list.
+        description (str, optional): An optional description for the list.
+
+    Returns:
+        dict: The schema with the list of items (the `$defs` of the items
+            schema are moved at the top level).
+    """
+    schema = copy.deepcopy(schema)
+    defs = schema.pop("$defs", {})
+    item_title = schema.get("title")
+    defs[item_title] = schema
+
+    list_property = {
+        "items": {"$ref": f"#/$defs/{item_title}"},
+        "minItems": 1,
+        "title": prop_name.title().replace("_", " "),
+        "type": "array",
+    }
+    if max_items:
+        list_property["maxItems"] = max_items
+    if description:
+        list_property["description"] = description
+
+    return {
+        "$defs": defs,
+        "additionalProperties": False,
+        "properties": {prop_name: list_property},
+        "required": [prop_name],
+        "title": title,
+        "type": "object",
+    }
+
+
 def dynamic_tool_calls(tools):
     """
     Generates a dynamic schema for tool calls based on a list of tools.
@@ -10,6 +10,7 @@ from synalinks.src.backend import DataModel
 from synalinks.src.backend import Field
 from synalinks.src.backend import is_schema_equal
 from synalinks.src.backend.common.dynamic_json_schema_utils import dynamic_enum
+from synalinks.src.backend.common.dynamic_json_schema_utils import dynamic_list
 from synalinks.src.backend.common.dynamic_json_schema_utils import dynamic_tool_calls
 from synalinks.src.backend.common.dynamic_json_schema_utils import dynamic_tool_choice
 from synalinks.src.utils.tool_utils import Tool
@@ -75,6 +76,40 @@ class DynamicEnumTest(testing.TestCase):
         self.assertTrue(is_schema_equal(Decision.get_schema(), schema))
 
 
+class DynamicListSchemaTest(testing.TestCase):
+    def test_basic_dynamic_list(self):
+        class Decision(DataModel):
+            thinking: str
+            choice: str
+
+        class Decisions(DataModel):
+            decisions: List[Decision] = Field(min_length=1, max_length=3)
+
+        schema = dynamic_list(
+            Decision.get_schema(),
+            "decisions",
+            "Decisions",
+            max_items=3,
+        )
+
+        self.assertTrue(is_schema_equal(Decisions.get_schema(), schema))
+
+    def test_dynamic_list_of_dynamic_enum(self):
+        class Decision(DataModel):
+            thinking: str
+            choice: str
+
+        schema = dynamic_enum(Decision.get_schema(), "choice", ["easy", "difficult"])
+        schema = dynamic_list(schema, "decisions", "Decisions")
+
+        self.assertEqual(
+            sorted(schema["$defs"].keys()),
+            ["Choice", "Decision"],
+        )
+        self.assertNotIn("$defs", schema["$defs"]["Decision"])
+        self.assertNotIn("maxItems", schema["properties"]["decisions"])
+
+
 class DynamicToolCallsSchemaTest(testing.TestCase):
     def test_dynamic_tool_call_schema(self):
         class Calculate(DataModel):
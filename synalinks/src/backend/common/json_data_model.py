@@ -5,6 +5,7 @@ import inspect
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend.common.json_schema_utils import standardize_schema
+from synalinks.src.backend.common.json_utils import copy_json
 from synalinks.src.backend.common.symbolic_data_model import SymbolicDataModel
 from synalinks.src.utils.async_utils import run_maybe_nested
 from synalinks.src.utils.naming import auto_name
@@ -17,6 +18,12 @@ class JsonDataModel:
     This structure is the one flowing in the pipelines as
     the backend data models are only used for the variable/data model declaration.
 
+    The JSON object and schema are treated as immutable: the operations
+    (concatenation, masking, etc.) build new objects sharing the unchanged
+    values of their inputs instead of copying them, and `update()` replaces
+    the JSON object instead of modifying it in place (copy-on-write).
+    Use `get()` to obtain a copy of a field that can be safely modified.
+
     Args:
         schema (dict): The JSON object's schema. If not provided,
             uses the data model to infer it.
@@ -402,8 +409,11 @@ class JsonDataModel:
 
         Args:
             name (str): The attribute name to access.
+
+        Returns:
+            (any): A copy of the field's value.
         """
-        return copy.deepcopy(self._json.get(name, default_value))
+        return copy_json(self._json.get(name, default_value))
 
     def update(self, kv_dict):
         """Update wrapper to make it easier to modify JSON fields.
@@ -411,12 +421,16 @@ class JsonDataModel:
         Args:
             kv_dict (dict): The key/json dict to update.
         """
-        self._json.update(kv_dict)
+        # The JSON object may be shared with other data models
+        self._json = {**self._json, **kv_dict}
 
     def clone(self, name=None):
-        """Clone a data model and give it a different name."""
+        """Clone a data model and give it a different name.
 
-        clone = copy.deepcopy(self)
+        The clone shares the JSON object and schema of this data model.
+        """
+
+        clone = copy.copy(self)
         if name:
             clone.name = name
         else:
@@ -425,20 +439,20 @@ class JsonDataModel:
 
     def get_nested_entity(self, key):
         """Retrieve a nested Entity and convert it to a JsonDataModel"""
-        json = copy.deepcopy(self.get(key))
+        json = self.get(key)
         if "label" in json:
             schema_key = json.get("label")
         else:
             return None
-        schema = copy.deepcopy(self.get_schema().get("$defs").get(schema_key))
+        schema = self.get_schema().get("$defs").get(schema_key)
 
         defs = {}
-        for obj_key, obj_schema in copy.deepcopy(self.get_schema().get("$defs")).items():
+        for obj_key, obj_schema in self.get_schema().get("$defs").items():
             if str(schema).find(f"#/$defs/{obj_key}") > 0:
                 defs[obj_key] = obj_schema
 
         if defs:
-            schema.update({"$defs": defs})
+            schema = {**schema, "$defs": defs}
 
         if schema:
             return JsonDataModel(json=json, schema=schema, name=self.name + "_" + key)
@@ -458,7 +472,7 @@ class JsonDataModel:
                     if str(schema).find(f"#/$defs/{obj_key}") > 0:
                         defs[obj_key] = obj_schema
                 if defs:
-                    schema.update({"$defs": defs})
+                    schema = {**schema, "$defs": defs}
 
                 outputs.append(
                     JsonDataModel(
@@ -304,3 +304,17 @@ class JsonDataModelTest(testing.TestCase):
 
         self.assertTrue(foo_json in foobar_json)
         self.assertFalse(bar_json in foo_json)
+
+    def test_copy_on_write(self):
+        class Trajectory(DataModel):
+            messages: List[str]
+
+        x = JsonDataModel(data_model=Trajectory(messages=["a"]))
+        clone = x.clone()
+        self.assertIs(clone.get_json(), x.get_json())
+
+        messages = clone.get("messages")
+        messages.append("b")
+        clone.update({"messages": messages})
+        self.assertEqual(clone.get("messages"), ["a", "b"])
+        self.assertEqual(x.get("messages"), ["a"])
@@ -2,12 +2,108 @@
 
 import collections
 import copy
+import functools
+import json
+import threading
 
 from synalinks.src.utils.nlp_utils import add_suffix
 from synalinks.src.utils.nlp_utils import is_plural
 from synalinks.src.utils.nlp_utils import to_plural_without_numerical_suffix
 from synalinks.src.utils.nlp_utils import to_singular_without_numerical_suffix
 
+# The maximum number of results kept by each memoized schema operation
+SCHEMA_CACHE_SIZE = 1024
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def get_schema_key(schema):
+    """Returns a canonical key of a JSON schema, equal for equal schemas.
+
+    Args:
+        schema (dict): The JSON schema.
+
+    Returns:
+        (str): The canonical key.
+    """
+    return json.dumps(schema, sort_keys=True, default=str)
+
+
+def memoize_schema_operation(fn):
+    """Memoize the results of a schema operation in an LRU cache.
+
+    The results are looked up using the identity of the schemas first (which
+    is cheap and the common case, as the same schema objects flow across
+    the graphs), then using their canonical key. As equal inputs give the same
+    result object, chains of operations on equal schemas are memoized
+    by identity after the first one.
+
+    The cached results are shared, so they must not be modified
+    (copy them before making changes).
+
+    Args:
+        fn (callable): The schema operation, taking schemas
+            (dicts) and hashable or list arguments.
+
+    Returns:
+        (callable): The memoized operation.
+    """
+    by_identity = collections.OrderedDict()
+    by_content = collections.OrderedDict()
+    lock = threading.Lock()
+
+    def lookup(cache, key):
+        with lock:
+            entry = cache.get(key)
+            if entry is not None:
+                cache.move_to_end(key)
+            return entry
+
+    def store(cache, key, entry):
+        with lock:
+            cache[key] = entry
+            if len(cache) > SCHEMA_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            options = tuple(_freeze(arg) for arg in args if not isinstance(arg, dict))
+            options += tuple((k, _freeze(v)) for k, v in sorted(kwargs.items()))
+            hash(options)
+        except TypeError:
+            return fn(*args, **kwargs)
+        # The entries keep a reference to the schemas, so their ids can't be reused
+        identity_key = (
+            tuple(id(arg) for arg in args if isinstance(arg, dict)),
+            options,
+        )
+        entry = lookup(by_identity, identity_key)
+        if entry is not None:
+            return entry[1]
+        content_key = (
+            tuple(get_schema_key(arg) for arg in args if isinstance(arg, dict)),
+            options,
+        )
+        entry = lookup(by_content, content_key)
+        if entry is None:
+            entry = (args, fn(*args, **kwargs))
+            store(by_content, content_key, entry)
+        store(by_identity, identity_key, (args, entry[1]))
+        return entry[1]
+
+    def cache_clear():
+        with lock:
+            by_identity.clear()
+            by_content.clear()
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
 
 def standardize_schema(schema):
     """Standardize the JSON schema for consistency"""
@@ -19,28 +115,30 @@ def contains_schema(schema1, schema2):
     return schema2.get("properties").items() <= schema1.get("properties").items()
 
 
+@memoize_schema_operation
 def prefix_schema(schema, prefix):
     """Add a prefix to the schema properties"""
-    schema = copy.deepcopy(schema)
     new_properties = {}
     for prop_key, prop_value in schema.get("properties").items():
         title = prop_value["title"]
-        prop_value["title"] = f"{prefix.title()} {title}"
-        new_properties[f"{prefix}_{prop_key}"] = prop_value
-    schema["properties"] = new_properties
-    return schema
+        new_properties[f"{prefix}_{prop_key}"] = {
+            **prop_value,
+            "title": f"{prefix.title()} {title}",
+        }
+    return {**schema, "properties": new_properties}
 
 
+@memoize_schema_operation
 def suffix_schema(schema, suffix):
     """Add a suffix to the schema properties"""
-    schema = copy.deepcopy(schema)
     new_properties = {}
     for prop_key, prop_value in schema.get("properties").items():
         title = prop_value["title"]
-        prop_value["title"] = f"{title} {suffix.title()}"
-        new_properties[f"{prop_key}_{suffix}"] = prop_value
-    schema["properties"] = new_properties
-    return schema
+        new_properties[f"{prop_key}_{suffix}"] = {
+            **prop_value,
+            "title": f"{title} {suffix.title()}",
+        }
+    return {**schema, "properties": new_properties}
 
 
 def is_schema_equal(schema1, schema2):
@@ -81,6 +179,7 @@ def is_array(schema):
     return False
 
 
+@memoize_schema_operation
 def concatenate_schema(schema1, schema2):
     """Concatenate two JSON schemas into a single schema.
 
@@ -93,9 +192,9 @@ def concatenate_schema(schema1, schema2):
 
     Returns:
         (dict): A new JSON schema that combines the properties of the input schemas.
+            The properties' schemas are shared with the inputs, except the renamed
+            ones.
     """
-    schema1 = copy.deepcopy(schema1)
-    schema2 = copy.deepcopy(schema2)
     # Initialize the resulting schema
     result_schema = {
         "additionalProperties": False,
@@ -122,7 +221,10 @@ def concatenate_schema(schema1, schema2):
         while new_prop_key in result_schema["properties"]:
             suffix += 1
             new_prop_key = add_suffix(prop_key, suffix)
-            prop_value["title"] = new_prop_key.title().replace("_", " ")
+            prop_value = {
+                **prop_value,
+                "title": new_prop_key.title().replace("_", " "),
+            }
         result_schema["properties"][new_prop_key] = prop_value
 
         required1 = schema1.get("required")
@@ -153,6 +255,7 @@ def concatenate_schema(schema1, schema2):
     return result_schema
 
 
+@memoize_schema_operation
 def factorize_schema(schema):
     """Factorize a JSON schema by grouping similar properties into lists.
 
@@ -167,7 +270,6 @@ def factorize_schema(schema):
     Returns:
         (dict): A factorized JSON schema with grouped properties.
     """
-    schema = copy.deepcopy(schema)
     # Initialize the resulting schema
     result_schema = {
         "$defs": {},
@@ -183,19 +285,25 @@ def factorize_schema(schema):
 
     schema_properties = schema.get("properties", {})
 
+    # Group the properties by base name in a single pass
+    base_keys = {}
+    groups = collections.defaultdict(list)
+    for prop_key in schema_properties:
+        base_key = to_singular_without_numerical_suffix(prop_key)
+        base_keys[prop_key] = base_key
+        groups[base_key].append(prop_key)
+
     for prop_key, prop_value in schema_properties.items():
         # Get the base name
-        base_key = to_singular_without_numerical_suffix(prop_key)
+        base_key = base_keys[prop_key]
         plural_key = to_plural_without_numerical_suffix(base_key)
-        # Find all similar properties
-        similar_prop_keys = [
-            p
-            for p in schema_properties.keys()
-            if to_singular_without_numerical_suffix(p) == base_key and p != prop_key
-        ]
-        similar_prop_values = [schema["properties"][p] for p in similar_prop_keys]
-        if similar_prop_keys and not is_plural(prop_key):
+        has_similar_props = len(groups[base_key]) > 1
+        if has_similar_props and not is_plural(prop_key):
             if plural_key not in result_schema["properties"]:
+                # Find all similar properties
+                similar_prop_values = [
+                    schema_properties[p] for p in groups[base_key] if p != prop_key
+                ]
                 # Create an array property
                 array_prop = copy.deepcopy(prop_value)
                 array_prop["title"] = plural_key.title()
@@ -239,6 +347,7 @@ def factorize_schema(schema):
     return result_schema
 
 
+@memoize_schema_operation
 def out_mask_schema(schema, mask=None, recursive=True):
     """Mask specific fields of a JSON schema.
 
@@ -309,6 +418,7 @@ def out_mask_schema(schema, mask=None, recursive=True):
     return schema
 
 
+@memoize_schema_operation
 def in_mask_schema(schema, mask=None, recursive=True):
     """Keep specific fields of a JSON schema.
 
@@ -1,5 +1,8 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import os
+import time
+import unittest
 from typing import List
 from typing import Literal
 from typing import Union
@@ -13,6 +16,24 @@ from synalinks.src.backend.common.json_schema_utils import factorize_schema
 from synalinks.src.backend.common.json_schema_utils import in_mask_schema
 from synalinks.src.backend.common.json_schema_utils import is_schema_equal
 from synalinks.src.backend.common.json_schema_utils import out_mask_schema
+from synalinks.src.backend.common.json_schema_utils import prefix_schema
+from synalinks.src.utils.nlp_utils import add_suffix
+
+
+def get_wide_schema(size=100):
+    """A JSON schema with `size` suffixed properties for each of 3 base names."""
+    properties = {}
+    for i in range(size):
+        for key in ["answer", "thinking", "document"]:
+            prop_key = add_suffix(key, i) if i else key
+            properties[prop_key] = {"title": prop_key.title(), "type": "string"}
+    return {
+        "additionalProperties": False,
+        "properties": properties,
+        "required": list(properties.keys()),
+        "title": "Outputs",
+        "type": "object",
+    }
 
 
 class JsonSchemaConcatenateTest(testing.TestCase):
@@ -259,6 +280,31 @@ class JsonSchemaFactorizeTest(testing.TestCase):
         result_schema = factorize_schema(schema)
         self.assertTrue(is_schema_equal(result_schema, expected_schema))
 
+    def test_factorize_wide_schema(self):
+        schema = get_wide_schema()
+
+        result_schema = factorize_schema(schema)
+        self.assertEqual(
+            result_schema["required"],
+            ["answers", "thinkings", "documents"],
+        )
+        self.assertEqual(result_schema["properties"]["answers"]["type"], "array")
+
+    @unittest.skipUnless(
+        os.environ.get("SYNALINKS_BENCHMARKS"),
+        "benchmarks only run with SYNALINKS_BENCHMARKS=1",
+    )
+    def test_factorize_wide_schema_benchmark(self):
+        schema = get_wide_schema()
+
+        n = 10
+        start = time.perf_counter()
+        for _ in range(n):
+            # Bypass the memoization
+            factorize_schema.__wrapped__(schema)
+        elapsed = (time.perf_counter() - start) / n
+        self.assertLess(elapsed, 0.05)
+
 
 class JsonSchemaOutMaskTest(testing.TestCase):
     def test_mask_basic(self):
@@ -608,3 +654,49 @@ class JsonSchemaContainsTest(testing.TestCase):
         schema2 = standardize_schema(Input2.get_schema())
 
         self.assertFalse(contains_schema(schema1, schema2))
+
+
+class JsonSchemaMemoizationTest(testing.TestCase):
+    def test_data_model_schema_is_cached(self):
+        class Query(DataModel):
+            query: str
+
+        self.assertIs(Query.get_schema(), Query.get_schema())
+
+    def test_results_are_memoized(self):
+        class Query(DataModel):
+            query: str
+
+        class Answer(DataModel):
+            answer: str
+
+        schema = concatenate_schema(Query.get_schema(), Answer.get_schema())
+        self.assertIs(
+            concatenate_schema(Query.get_schema(), Answer.get_schema()),
+            schema,
+        )
+        # Equal schemas give the same result object
+        self.assertIs(
+            concatenate_schema(Query.model_json_schema(), Answer.model_json_schema()),
+            schema,
+        )
+        self.assertIs(
+            out_mask_schema(schema, mask=["answer"]),
+            out_mask_schema(schema, mask=["answer"]),
+        )
+        self.assertEqual(
+            out_mask_schema(schema, mask=["query"]),
+            {**Answer.get_schema(), "title": "Query"},
+        )
+
+    def test_memoized_operations_are_not_modifying_inputs(self):
+        class Query(DataModel):
+            query: str
+
+        schema = Query.get_schema()
+        expected = Query.model_json_schema()
+        concatenate_schema(schema, schema)
+        prefix_schema(schema, prefix="input")
+        out_mask_schema(schema, mask=["query"])
+        in_mask_schema(schema, mask=["foo"])
+        self.assertEqual(schema, expected)
@@ -2,6 +2,8 @@
 
 import collections
 import copy
+import json as jsonlib
+import re
 
 from synalinks.src.utils.nlp_utils import add_suffix
 from synalinks.src.utils.nlp_utils import is_plural
@@ -9,22 +11,35 @@ from synalinks.src.utils.nlp_utils import to_plural_without_numerical_suffix
 from synalinks.src.utils.nlp_utils import to_singular_without_numerical_suffix
 
 
+def copy_json(json):
+    """Deep copy a Json value.
+
+    A faster equivalent of `copy.deepcopy()` for the Json values
+    (dicts, lists and scalars), falling back to it for other objects.
+
+    Args:
+        json (dict | list | any): The Json value to copy.
+
+    Returns:
+        (dict | list | any): The copied value.
+    """
+    if isinstance(json, dict):
+        return {key: copy_json(value) for key, value in json.items()}
+    if isinstance(json, list):
+        return [copy_json(value) for value in json]
+    if json is None or isinstance(json, (str, int, float, bool)):
+        return json
+    return copy.deepcopy(json)
+
+
 def prefix_json(json, prefix):
     """Add a prefix to the json object keys"""
-    json = copy.deepcopy(json)
-    prefixed_json = {}
-    for prop_key, prop_value in json.items():
-        prefixed_json[f"{prefix}_{prop_key}"] = prop_value
-    return prefixed_json
+    return {f"{prefix}_{prop_key}": prop_value for prop_key, prop_value in json.items()}
 
 
 def suffix_json(json, suffix):
     """Add a suffix to the json object keys"""
-    json = copy.deepcopy(json)
-    suffixed_json = {}
-    for prop_key, prop_value in json.items():
-        suffixed_json[f"{prop_key}_{suffix}"] = prop_value
-    return suffixed_json
+    return {f"{prop_key}_{suffix}": prop_value for prop_key, prop_value in json.items()}
 
 
 def concatenate_json(json1, json2):
@@ -33,6 +48,11 @@ def concatenate_json(json1, json2):
     This function merges the properties of two Json object into a single object.
     If there are conflicting property names, it appends a suffix to make them unique.
 
+    Like the other Json operations, the inputs are left untouched and the
+    result shares their values (no copy is made), so concatenating is
+    proportional to the number of top-level properties, not to the size
+    of the objects.
+
     Args:
         json1 (dict): The first Json object to be concatenated.
         json2 (dict): The second Json object to be concatenated.
@@ -40,24 +60,15 @@ def concatenate_json(json1, json2):
     Returns:
         (dict): A new Json object that combines the properties of the input objects.
     """
-    json1 = copy.deepcopy(json1)
-    json2 = copy.deepcopy(json2)
+    result_json = dict(json1)
 
-    result_json = {}
-
-    def add_property(prop_key, prop_value, suffix=0):
+    for prop_key, prop_value in json2.items():
         new_prop_key = prop_key
-        original_value = prop_value
+        suffix = 0
         while new_prop_key in result_json:
             suffix += 1
             new_prop_key = add_suffix(prop_key, suffix)
-        result_json[new_prop_key] = original_value
-
-    for prop_key, prop_value in json1.items():
-        add_property(prop_key, prop_value)
-
-    for prop_key, prop_value in json2.items():
-        add_property(prop_key, prop_value)
+        result_json[new_prop_key] = prop_value
 
     return result_json
 
@@ -75,25 +86,27 @@ def factorize_json(json):
     Returns:
         (dict): A factorized Json object with grouped properties.
     """
-    json = copy.deepcopy(json)
     # Initialize the resulting Json object
     result_json = {}
+    base_keys = {
+        prop_key: to_singular_without_numerical_suffix(prop_key) for prop_key in json
+    }
+    base_key_counts = collections.Counter(base_keys.values())
 
     for prop_key, prop_value in json.items():
         # Get the base name
-        base_key = to_singular_without_numerical_suffix(prop_key)
+        base_key = base_keys[prop_key]
         plural_key = to_plural_without_numerical_suffix(base_key)
 
-        # Find all similar properties
-        similar_props = [
-            p
-            for p in json.keys()
-            if to_singular_without_numerical_suffix(p) == base_key and p != prop_key
-        ]
-        if similar_props and not is_plural(prop_key):
+        # Check if there is other similar properties
+        has_similar_props = base_key_counts[base_key] > 1
+        if has_similar_props and not is_plural(prop_key):
             if plural_key not in result_json:
                 # Create an array property
                 result_json[plural_key] = []
+            elif result_json[plural_key] is json.get(plural_key):
+                # Copy the input list before extending it
+                result_json[plural_key] = list(result_json[plural_key])
 
             # Add the values to the list
             if isinstance(prop_value, list):
@@ -110,12 +123,49 @@ def factorize_json(json):
     return result_json
 
 
+def _mask_json(json, keep, recursive):
+    """Returns the Json object without the properties rejected by `keep`.
+
+    Only the objects (and lists) containing removed properties are copied,
+    the unchanged ones are returned as they are.
+    """
+    result_json = {}
+    changed = False
+    for prop_key, prop_value in json.items():
+        if not keep(prop_key, prop_value):
+            changed = True
+            continue
+        if recursive:
+            new_value = _mask_value(prop_value, keep)
+            if new_value is not prop_value:
+                changed = True
+                prop_value = new_value
+        result_json[prop_key] = prop_value
+    return result_json if changed else json
+
+
+def _mask_value(value, keep):
+    if isinstance(value, dict):
+        return _mask_json(value, keep, recursive=True)
+    if isinstance(value, list):
+        new_value = [
+            _mask_json(item, keep, recursive=True) if isinstance(item, dict) else item
+            for item in value
+        ]
+        if any(new is not old for new, old in zip(new_value, value)):
+            return new_value
+    return value
+
+
 def out_mask_json(json, mask=None, recursive=True):
     """Mask specific fields of a Json object.
 
     This function look for properties to mask and remove them.
     It ignores the suffixes that other operations could add.
 
+    The input is left untouched and the result shares its unchanged
+    nested objects, only the objects containing masked properties are copied.
+
     Args:
         json (dict): The input Json object to mask
         mask (list): The base key list to remove
@@ -125,38 +175,17 @@ def out_mask_json(json, mask=None, recursive=True):
     Returns:
         - (dict): A masked Json object with removed properties.
     """
-    json = copy.deepcopy(json)
-
     if not mask:
-        return json
-
-    stack = collections.deque([json])
+        return dict(json)
 
     # Ensure that the mask keys are in singular form
-    mask = [to_singular_without_numerical_suffix(k) for k in mask]
+    mask = {to_singular_without_numerical_suffix(k) for k in mask}
 
-    while stack:
-        current = stack.pop()
-        keys_to_delete = []
+    def keep(prop_key, prop_value):
+        return to_singular_without_numerical_suffix(prop_key) not in mask
 
-        for prop_key, prop_value in current.items():
-            base_key = to_singular_without_numerical_suffix(prop_key)
-
-            if base_key in mask:
-                keys_to_delete.append(prop_key)
-
-            if recursive:
-                if isinstance(prop_value, dict):
-                    stack.append(prop_value)
-                elif isinstance(prop_value, list):
-                    for item in prop_value:
-                        if isinstance(item, dict):
-                            stack.append(item)
-
-        for key in keys_to_delete:
-            del current[key]
-
-    return json
+    result_json = _mask_json(json, keep, recursive)
+    return dict(result_json) if result_json is json else result_json
 
 
 def in_mask_json(json, mask=None, recursive=True):
@@ -165,6 +194,9 @@ def in_mask_json(json, mask=None, recursive=True):
     This function looks for properties to keep and removes all others.
     It ignores the suffixes that other operations could add.
 
+    The input is left untouched and the result shares its unchanged
+    nested objects, only the objects containing removed properties are copied.
+
     Args:
         json (dict): The input Json object to mask
         mask (list): The base key list to keep
@@ -174,37 +206,131 @@ def in_mask_json(json, mask=None, recursive=True):
     Returns:
         (dict): A masked Json object with only the specified properties.
     """
-    json = copy.deepcopy(json)
-
     if not mask:
         return {}
 
-    stack = collections.deque([json])
-
     # Ensure that the mask keys are in singular form
-    mask = [to_singular_without_numerical_suffix(k) for k in mask]
+    mask = {to_singular_without_numerical_suffix(k) for k in mask}
+
+    def keep(prop_key, prop_value):
+        if recursive and isinstance(prop_value, list):
+            return True
+        return to_singular_without_numerical_suffix(prop_key) in mask
+
+    result_json = _mask_json(json, keep, recursive)
+    return dict(result_json) if result_json is json else result_json
 
-    while stack:
-        current = stack.pop()
-        keys_to_keep = []
 
-        for prop_key, prop_value in current.items():
-            base_key = to_singular_without_numerical_suffix(prop_key)
+PARTIAL_UNICODE_ESCAPE_REGEX = re.compile(r"\\u[0-9a-fA-F]{0,3}$")
 
-            if base_key in mask:
-                keys_to_keep.append(prop_key)
 
-            if recursive:
-                if isinstance(prop_value, dict):
-                    stack.append(prop_value)
-                elif isinstance(prop_value, list):
-                    keys_to_keep.append(prop_key)
-                    for item in prop_value:
-                        if isinstance(item, dict):
-                            stack.append(item)
+class PartialJsonParser:
+    """Parser for a JSON object being streamed.
 
-        keys_to_delete = set(current.keys()) - set(keys_to_keep)
-        for key in keys_to_delete:
-            del current[key]
+    The chunks are scanned once, as they arrive, to track the unclosed
+    strings, objects and arrays. Each time a new chunk is fed, the parser
+    returns the largest valid JSON object that can be obtained by closing
+    them. This object is parsed from the whole text received so far, so
+    each feed is linear in the size of the text, and parsing the whole
+    stream is quadratic. Incomplete keys, numbers and literals are left
+    out until they are complete, while incomplete string values are
+    returned as they are (allowing to stream the fields of a structured
+    output one by one).
+
+    Example:
+
+    ```python
+    parser = PartialJsonParser()
+    parser.feed('{"thinking": "Let me')  # {"thinking": "Let me"}
+    parser.feed(' think", "answer": 4')  # {"thinking": "Let me think"}
+    parser.feed("2}")  # {"thinking": "Let me think", "answer": 42}
+    ```
+    """
 
-    return json
+    def __init__(self):
+        self.text = ""
+        self._closers = []
+        self._in_string = False
+        self._escaped = False
+        # The last position where the text can be cut, with the closers to add
+        self._checkpoint = None
+
+    def feed(self, text):
+        """Feed a new chunk of text to the parser.
+
+        Args:
+            text (str): The new chunk of text.
+
+        Returns:
+            (dict | list): The JSON parsed so far or `None` if nothing
+                can be parsed yet.
+        """
+        offset = len(self.text)
+        self.text += text
+        for i, char in enumerate(text, start=offset):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{" or char == "[":
+                self._closers.append("}" if char == "{" else "]")
+                self._checkpoint = (i + 1, "".join(reversed(self._closers)))
+            elif char == "}" or char == "]":
+                if self._closers:
+                    self._closers.pop()
+                self._checkpoint = (i + 1, "".join(reversed(self._closers)))
+            elif char == ",":
+                self._checkpoint = (i, "".join(reversed(self._closers)))
+        return self.get_json()
+
+    def get_json(self):
+        """Returns the JSON parsed so far.
+
+        Returns:
+            (dict | list): The JSON parsed so far or `None` if nothing
+                can be parsed yet.
+        """
+        if not self._closers and not self._in_string:
+            try:
+                return jsonlib.loads(self.text)
+            except ValueError:
+                pass
+        text = self.text
+        if self._in_string:
+            if self._escaped:
+                text = text[:-1]
+            text = PARTIAL_UNICODE_ESCAPE_REGEX.sub("", text) + '"'
+        elif text.rstrip()[-1:] not in ("}", "]", '"'):
+            # Incomplete number or literal
+            text = None
+        if text is not None:
+            try:
+                return jsonlib.loads(text + "".join(reversed(self._closers)))
+            except ValueError:
+                pass
+        if self._checkpoint is not None:
+            position, closers = self._checkpoint
+            try:
+                return jsonlib.loads(self.text[:position] + closers)
+            except ValueError:
+                pass
+        return None
+
+
+def parse_partial_json(text):
+    """Parse an incomplete JSON object (e.g. a streamed response).
+
+    Args:
+        text (str): The incomplete JSON text.
+
+    Returns:
+        (dict | list): The largest valid JSON that can be obtained by closing
+            the unclosed strings, objects and arrays or `None` if nothing
+            can be parsed yet.
+    """
+    return PartialJsonParser().feed(text)
@@ -1,15 +1,33 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import json
+import os
+import time
+import unittest
 from typing import List
 from typing import Literal
 from typing import Union
 
 from synalinks.src import testing
 from synalinks.src.backend import DataModel
+from synalinks.src.backend import PartialJsonParser
 from synalinks.src.backend import concatenate_json
 from synalinks.src.backend import factorize_json
 from synalinks.src.backend import in_mask_json
 from synalinks.src.backend import out_mask_json
+from synalinks.src.backend import parse_partial_json
+from synalinks.src.backend import prefix_json
+from synalinks.src.backend.common.json_utils import copy_json
+from synalinks.src.utils.nlp_utils import add_suffix
+
+
+def get_wide_json(size=100):
+    """A JSON object with `size` suffixed keys for each of 3 base names."""
+    json = {}
+    for i in range(size):
+        for key in ["answer", "thinking", "document"]:
+            json[add_suffix(key, i) if i else key] = f"{key} {i}"
+    return json
 
 
 class JsonConcatenateTest(testing.TestCase):
@@ -381,6 +399,28 @@ class JsonFactorizeTest(testing.TestCase):
         result = factorize_json(inputs)
         self.assertEqual(result, expected)
 
+    def test_factorize_wide_json(self):
+        json = get_wide_json()
+
+        result = factorize_json(json)
+        self.assertEqual(list(result.keys()), ["answers", "thinkings", "documents"])
+        self.assertEqual(result["answers"], [f"answer {i}" for i in range(100)])
+
+    @unittest.skipUnless(
+        os.environ.get("SYNALINKS_BENCHMARKS"),
+        "benchmarks only run with SYNALINKS_BENCHMARKS=1",
+    )
+    def test_factorize_wide_json_benchmark(self):
+        json = get_wide_json()
+
+        n = 10
+        start = time.perf_counter()
+        for _ in range(n):
+            factorize_json(json)
+        elapsed = (time.perf_counter() - start) / n
+        # ~1ms here, ~200ms when comparing every key against every other key
+        self.assertLess(elapsed, 0.05)
+
 
 class JsonOutMaskTest(testing.TestCase):
     def test_mask_basic(self):
@@ -695,3 +735,93 @@ class JsonInMaskTest(testing.TestCase):
 
         result = in_mask_json(json, mask=["foo"], recursive=False)
         self.assertEqual(result, expected)
+
+
+class PartialJsonTest(testing.TestCase):
+    def test_parse_partial_json(self):
+        self.assertEqual(parse_partial_json(""), None)
+        self.assertEqual(parse_partial_json("{"), {})
+        self.assertEqual(parse_partial_json('{"foo'), {})
+        self.assertEqual(parse_partial_json('{"foo": '), {})
+        self.assertEqual(parse_partial_json('{"foo": "ba'), {"foo": "ba"})
+        self.assertEqual(parse_partial_json('{"foo": "bar", "b'), {"foo": "bar"})
+        self.assertEqual(parse_partial_json('{"foo": "bar\\'), {"foo": "bar"})
+        self.assertEqual(parse_partial_json('{"foo": "bar", "n": 4'), {"foo": "bar"})
+        self.assertEqual(
+            parse_partial_json('{"foo": ["a", {"b": tr'),
+            {"foo": ["a", {}]},
+        )
+        self.assertEqual(
+            parse_partial_json('{"foo": "bar", "n": 42}'),
+            {"foo": "bar", "n": 42},
+        )
+
+    def test_incremental_parsing(self):
+        class Answer(DataModel):
+            thinking: List[str]
+            answer: str
+            score: float
+
+        expected = Answer(
+            thinking=['Let me "think"', "é"],
+            answer="42",
+            score=0.5,
+        ).get_json()
+        text = json.dumps(expected)
+
+        parser = PartialJsonParser()
+        previous = None
+        for char in text:
+            result = parser.feed(char)
+            if result is not None and previous is not None:
+                # The parsed JSON only grows
+                for key in previous:
+                    self.assertIn(key, result)
+            previous = result
+        self.assertEqual(previous, expected)
+
+
+class JsonStructuralSharingTest(testing.TestCase):
+    def test_inputs_are_not_modified(self):
+        json1 = {"answers": ["a"], "context": {"foo": "test", "bar": "test"}}
+        json2 = {"answer": "b", "context": {"foo": "test"}}
+        expected1 = copy_json(json1)
+        expected2 = copy_json(json2)
+
+        factorize_json(concatenate_json(json1, json2))
+        out_mask_json(json1, mask=["foo"])
+        in_mask_json(json1, mask=["context", "bar"])
+        prefix_json(json2, prefix="input")
+
+        self.assertEqual(json1, expected1)
+        self.assertEqual(json2, expected2)
+
+    def test_unchanged_values_are_shared(self):
+        documents = [{"text": "test"} for _ in range(3)]
+        json1 = {"documents": documents, "meta": {"foo": "test", "bar": "test"}}
+        json2 = {"query": "test"}
+
+        result = concatenate_json(json1, json2)
+        self.assertIs(result["documents"], documents)
+
+        result = out_mask_json(json1, mask=["foo"])
+        self.assertIs(result["documents"], documents)
+        self.assertEqual(result["meta"], {"bar": "test"})
+        self.assertEqual(json1["meta"], {"foo": "test", "bar": "test"})
+
+    def test_copy_json(self):
+        json = {"foo": [{"bar": 1.0}, None, True], "baz": "test"}
+        result = copy_json(json)
+        self.assertEqual(result, json)
+        self.assertIsNot(result["foo"], json["foo"])
+        self.assertIsNot(result["foo"][0], json["foo"][0])
+
+    def test_chain_shares_the_unchanged_values(self):
+        messages = [{"role": "user", "content": "test"}] * 10000
+        json = {"messages": messages}
+        for i in range(100):
+            json = concatenate_json(json, {"step": i})
+            json = out_mask_json(json, mask=["step"], recursive=False)
+        self.assertEqual(json, {"messages": messages})
+        # The values are shared along the chain instead of being deep copied
+        self.assertIs(json["messages"], messages)
@@ -0,0 +1,50 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import contextvars
+
+# A context variable (instead of the global state) so that the batches
+# predicted concurrently each record their own predictions
+PREDICTIONS_SCOPE = contextvars.ContextVar("predictions_scope", default=None)
+
+
+class PredictionsScope:
+    """Scope deferring the recording of the training predictions.
+
+    The generators predicting in the scope record their training predictions
+    in the scope instead of their state. They are added to the state with
+    `flush()`, e.g. when the batch predicted ahead of time gets its turn to
+    be rewarded by the optimizer.
+    """
+
+    def __init__(self):
+        self.predictions = []
+
+    def __enter__(self):
+        self._token = PREDICTIONS_SCOPE.set(self)
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        PREDICTIONS_SCOPE.reset(self._token)
+
+    def record(self, state, prediction):
+        """Record a training prediction.
+
+        Args:
+            state (Variable): The state of the module that made the prediction.
+            prediction (dict): The prediction.
+        """
+        self.predictions.append((state, prediction))
+
+    def flush(self):
+        """Add the recorded predictions to the state of their module."""
+        for state, prediction in self.predictions:
+            state.get("predictions").append(prediction)
+        self.predictions = []
+
+
+def in_predictions_scope():
+    return PREDICTIONS_SCOPE.get() is not None
+
+
+def get_predictions_scope():
+    return PREDICTIONS_SCOPE.get()
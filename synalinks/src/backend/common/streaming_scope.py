@@ -0,0 +1,68 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+import contextvars
+
+# A context variable (instead of the global state) so that concurrent
+# streams running in the same thread don't interfere
+STREAMING_SCOPE = contextvars.ContextVar("streaming_scope", default=None)
+
+
+class StreamingScope:
+    """Scope to stream the language model responses of the given modules.
+
+    The modules in the scope (e.g. the `Generator` producing the outputs
+    of a program) put the chunks of their response in the scope's queue
+    as they are generated, while the other modules run normally.
+
+    Args:
+        modules (list | callable): The modules to stream or a callable
+            returning them (resolved when first needed, i.e. once the
+            program is built).
+    """
+
+    def __init__(self, modules):
+        self._modules = modules
+        self._module_ids = None
+        self.queue = asyncio.Queue()
+        self.streamed = False
+
+    def __enter__(self):
+        self._token = STREAMING_SCOPE.set(self)
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        STREAMING_SCOPE.reset(self._token)
+
+    def is_streamed(self, module):
+        """Check if the response of a module should be streamed.
+
+        Args:
+            module (Module): The module.
+
+        Returns:
+            (bool): True if the module should stream its response.
+        """
+        if self._module_ids is None:
+            modules = self._modules
+            if callable(modules):
+                modules = modules()
+            self._module_ids = {id(module) for module in modules}
+        return id(module) in self._module_ids
+
+    def put(self, chunk):
+        """Add a chunk of a streamed response to the queue.
+
+        Args:
+            chunk (dict): The chunk.
+        """
+        self.streamed = True
+        self.queue.put_nowait(chunk)
+
+
+def in_streaming_scope():
+    return STREAMING_SCOPE.get() is not None
+
+
+def get_streaming_scope():
+    return STREAMING_SCOPE.get()
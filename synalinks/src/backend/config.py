@@ -19,6 +19,9 @@ _SYNALINKS_API_KEY = None
 # Default backend: Pydantic.
 _BACKEND = "pydantic"
 
+# The maximum number of operations executed concurrently, `None` for no limit.
+_MAX_CONCURRENT_OPERATIONS = None
+
 # Available backends
 _AVAILABLE_BACKEND = ["pydantic"]
 
@@ -198,6 +201,58 @@ else:
     _synalinks_DIR = os.path.join(_synalinks_base_dir, ".synalinks")
 
 
+@synalinks_export("synalinks.config.max_concurrent_operations")
+def max_concurrent_operations():
+    """Return the maximum number of operations executed concurrently.
+
+    This limit is shared by every functional program running in the same
+    event loop. Operations nested inside a running operation (e.g. the
+    modules of a program used as a module) are not counted twice.
+
+    Returns:
+        (int): The maximum number of concurrent operations,
+            `None` if there is no limit.
+
+    Example:
+
+    ```python
+    >>> synalinks.config.max_concurrent_operations()
+    None
+    ```
+    """
+    return _MAX_CONCURRENT_OPERATIONS
+
+
+@synalinks_export("synalinks.config.set_max_concurrent_operations")
+def set_max_concurrent_operations(value):
+    """Set the maximum number of operations executed concurrently.
+
+    Args:
+        value (int): The maximum number of concurrent operations,
+            `None` to remove the limit.
+
+    Example:
+
+    ```python
+    >>> synalinks.config.set_max_concurrent_operations(8)
+    >>> synalinks.config.max_concurrent_operations()
+    8
+    ```
+
+    ```python
+    >>> # Remove the limit.
+    >>> synalinks.config.set_max_concurrent_operations(None)
+    ```
+    """
+    if value is not None and (not isinstance(value, int) or value < 1):
+        raise ValueError(
+            "`max_concurrent_operations` should be a positive integer or `None`. "
+            f"Received: {value}"
+        )
+    global _MAX_CONCURRENT_OPERATIONS
+    _MAX_CONCURRENT_OPERATIONS = value
+
+
 @synalinks_export(["synalinks.config.synalinks_home", "synalinks.synalinks_home"])
 def synalinks_home():
     # Private accessor for the synalinks home location.
@@ -1,5 +1,6 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import functools
 import inspect
 
 import pydantic
@@ -15,6 +16,16 @@ from synalinks.src.utils.async_utils import run_maybe_nested
 IS_THREAD_SAFE = True
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_data_model_schema(cls):
+    """Returns the JSON schema of a `DataModel` class (cached per class).
+
+    Generating the schema with pydantic is costly and the schema of a class
+    doesn't change, so it is generated once and shared (it must not be modified).
+    """
+    return cls.model_json_schema()
+
+
 class MetaDataModel(type(pydantic.BaseModel)):
     """The metaclass data model.
 
@@ -280,7 +291,7 @@ class DataModel(pydantic.BaseModel, SynalinksSaveable, metaclass=MetaDataModel):
         Returns:
             (dict): The JSON schema.
         """
-        return cls.model_json_schema()
+        return _get_data_model_schema(cls)
 
     @classmethod
     def prettify_schema(cls):
@@ -1,14 +1,14 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import concurrent.futures
 import json
 from typing import List
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib import colors
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import DataModel
+from synalinks.src.trainers.data_adapters.lazy_dataset import LazyDataset
 from synalinks.src.utils import file_utils
 
 from .dsl import Grid
@@ -907,6 +907,9 @@ def plot_task(
         task_name (str): The task name to fetch the data if not provided.
         to_file (str): The filepath where to save the figure.
     """
+    import matplotlib.pyplot as plt
+    from matplotlib import colors
+
     if not x and not y_true and task_name:
         x, y_true = fetch_and_format(task_name)
         if not to_file:
@@ -990,10 +993,14 @@ def plot_task(
 
 
 @synalinks_export("synalinks.datasets.arcagi.load_data")
-def load_data(task_names=None):
+def load_data(task_names=None, num_workers=16):
     """
     Load and format data from github
 
+    The task files are fetched (or read from the local cache) and parsed
+    concurrently, and the data models are built lazily when the samples
+    are accessed.
+
     Example:
 
     ```python
@@ -1002,56 +1009,46 @@ def load_data(task_names=None):
 
     Args:
         task_names (list): Optional. The list of tasks to fetch.
+        num_workers (int): Optional. The number of tasks fetched and parsed
+            concurrently (Default to 16).
 
     Returns:
-        (tuple): The train and test data ready for training
+        (tuple): The train and test data ready for training, as `LazyDataset`s
     """
-    x_train = []
-    y_train = []
-    x_test = []
-    y_test = []
-
     if not task_names:
-        for task_name in TRAINING_TASK_NAMES:
-            (x, y) = fetch_and_format(task_name)
-            x_train.append(x)
-            y_train.append(y)
+        training_task_names = TRAINING_TASK_NAMES
+        evaluation_task_names = EVALUATION_TASK_NAMES
+    else:
+        training_task_names = [
+            task_name for task_name in task_names if task_name in TRAINING_TASK_NAMES
+        ]
+        evaluation_task_names = [
+            task_name for task_name in task_names if task_name in EVALUATION_TASK_NAMES
+        ]
 
-        for task_name in EVALUATION_TASK_NAMES:
-            (x, y) = fetch_and_format(task_name)
-            x_test.append(x)
-            y_test.append(y)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+        tasks = list(
+            executor.map(_fetch_task, training_task_names + evaluation_task_names)
+        )
+    training_tasks = tasks[: len(training_task_names)]
+    evaluation_tasks = tasks[len(training_task_names) :]
 
-    else:
-        for task_name in task_names:
-            if task_name in TRAINING_TASK_NAMES:
-                (x, y) = fetch_and_format(task_name)
-                x_train.append(x)
-                y_train.append(y)
-
-            if task_name in EVALUATION_TASK_NAMES:
-                (x, y) = fetch_and_format(task_name)
-                x_test.append(x)
-                x_test.append(y)
-
-    x_train = np.array(x_train, dtype="object")
-    y_train = np.array(y_train, dtype="object")
-    x_test = np.array(x_test, dtype="object")
-    y_test = np.array(y_test, dtype="object")
+    x_train = LazyDataset(training_tasks, _format_inputs)
+    y_train = LazyDataset(training_tasks, _format_outputs)
+    x_test = LazyDataset(evaluation_tasks, _format_inputs)
+    y_test = LazyDataset(evaluation_tasks, _format_outputs)
 
     return (x_train, y_train), (x_test, y_test)
 
 
-@synalinks_export("synalinks.datasets.arcagi.fetch_and_format")
-def fetch_and_format(task_name):
-    """
-    Fetch and format one task by name
+def _fetch_task(task_name):
+    """Fetch (or read from the local cache) and parse the JSON file of a task.
 
-    Example:
+    Args:
+        task_name (str): The task name.
 
-    ```python
-    x, y = synalinks.datasets.arcagi.fetch_and_format("62c24649")
-    ```
+    Returns:
+        (dict): The JSON data of the task.
     """
     if task_name in TRAINING_TASK_NAMES:
         url = f"{BASE_URL}/training/{task_name}.json"
@@ -1062,33 +1059,56 @@ def fetch_and_format(task_name):
             f"Task '{task_name}' not recognized, make sure that the task name is valid."
         )
 
-    x = None
-    y = None
-
     file_path = file_utils.get_file(origin=url, progbar=False)
     with open(file_path, "r") as f:
-        json_data = json.loads(f.read())
-        trainset = json_data.get("train")
-        testset = json_data.get("test")
-        x = ARCAGIInput(grid=testset[0].get("input"))
-        x.examples.append(
-            TaskExample(
-                inputs=tuple(map(tuple, trainset[0].get("input"))),
-                outputs=tuple(map(tuple, trainset[0].get("output"))),
-            )
-        )
+        return json.loads(f.read())
+
+
+def _format_inputs(json_data):
+    """Format the inputs of a task.
+
+    Args:
+        json_data (dict): The JSON data of the task.
+
+    Returns:
+        (ARCAGIInput): The task inputs.
+    """
+    trainset = json_data.get("train")
+    testset = json_data.get("test")
+    x = ARCAGIInput(grid=testset[0].get("input"))
+    for example in trainset[:3]:
         x.examples.append(
             TaskExample(
-                inputs=tuple(map(tuple, trainset[1].get("input"))),
-                outputs=tuple(map(tuple, trainset[1].get("output"))),
+                inputs=tuple(map(tuple, example.get("input"))),
+                outputs=tuple(map(tuple, example.get("output"))),
             )
         )
-        if len(trainset) > 2:
-            x.examples.append(
-                TaskExample(
-                    inputs=tuple(map(tuple, trainset[2].get("input"))),
-                    outputs=tuple(map(tuple, trainset[2].get("output"))),
-                )
-            )
-        y = ARCAGIOutput(grid=tuple(map(tuple, testset[0].get("output"))))
-    return x, y
+    return x
+
+
+def _format_outputs(json_data):
+    """Format the target output of a task.
+
+    Args:
+        json_data (dict): The JSON data of the task.
+
+    Returns:
+        (ARCAGIOutput): The task target output.
+    """
+    testset = json_data.get("test")
+    return ARCAGIOutput(grid=tuple(map(tuple, testset[0].get("output"))))
+
+
+@synalinks_export("synalinks.datasets.arcagi.fetch_and_format")
+def fetch_and_format(task_name):
+    """
+    Fetch and format one task by name
+
+    Example:
+
+    ```python
+    x, y = synalinks.datasets.arcagi.fetch_and_format("62c24649")
+    ```
+    """
+    json_data = _fetch_task(task_name)
+    return _format_inputs(json_data), _format_outputs(json_data)
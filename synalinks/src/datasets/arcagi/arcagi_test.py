@@ -0,0 +1,51 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import json
+import os
+from unittest.mock import patch
+
+from synalinks.src import testing
+from synalinks.src.datasets.arcagi import arcagi
+from synalinks.src.trainers.data_adapters.lazy_dataset import LazyDataset
+
+TASK = {
+    "train": [
+        {"input": [[0, 1], [1, 0]], "output": [[1, 0], [0, 1]]},
+        {"input": [[2, 2], [0, 0]], "output": [[0, 0], [2, 2]]},
+    ],
+    "test": [
+        {"input": [[3, 0], [0, 3]], "output": [[0, 3], [3, 0]]},
+    ],
+}
+
+
+class ARCAGITest(testing.TestCase):
+    def test_load_data(self):
+        temp_dir = self.get_temp_dir()
+        task_file = os.path.join(temp_dir, "task.json")
+        with open(task_file, "w") as f:
+            f.write(json.dumps(TASK))
+
+        task_names = arcagi.get_training_task_names()[:5] + [
+            arcagi.get_validation_task_names()[0]
+        ]
+        with patch(
+            "synalinks.src.utils.file_utils.get_file",
+            return_value=task_file,
+        ) as mock_get_file:
+            (x_train, y_train), (x_test, y_test) = arcagi.load_data(
+                task_names=task_names,
+                num_workers=4,
+            )
+        self.assertEqual(mock_get_file.call_count, 6)
+
+        self.assertIsInstance(x_train, LazyDataset)
+        self.assertEqual(len(x_train), 5)
+        self.assertEqual(len(y_train), 5)
+        self.assertEqual(len(x_test), 1)
+        self.assertEqual(len(y_test), 1)
+
+        x, y = x_test[0], y_test[0]
+        self.assertEqual(len(x.examples), 2)
+        self.assertEqual(x.grid, ((3, 0), (0, 3)))
+        self.assertEqual(y.grid, ((0, 3), (3, 0)))
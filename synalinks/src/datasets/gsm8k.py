@@ -1,11 +1,9 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
-import numpy as np
-from datasets import load_dataset
-
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import DataModel
 from synalinks.src.backend import Field
+from synalinks.src.trainers.data_adapters.lazy_dataset import LazyDataset
 
 
 class MathQuestion(DataModel):
@@ -45,11 +43,26 @@ def get_output_data_model():
     return NumericalAnswerWithThinking
 
 
+def _get_input(data_point):
+    return MathQuestion(question=data_point["question"])
+
+
+def _get_output(data_point):
+    thinking = data_point["answer"].split("####")[0].strip()
+    answer = data_point["answer"].split("####")[-1].strip()
+    return NumericalAnswerWithThinking(
+        thinking=thinking,
+        answer=float(answer.replace(",", "")),
+    )
+
+
 @synalinks_export("synalinks.datasets.gsm8k.load_data")
 def load_data():
     """
     Load and format data from HuggingFace
 
+    The data models are built lazily when the samples are accessed.
+
     Example:
 
     ```python
@@ -57,43 +70,16 @@ def load_data():
     ```
 
     Returns:
-        (tuple): The train and test data ready for training
+        (tuple): The train and test data ready for training, as `LazyDataset`s
     """
+    from datasets import load_dataset
+
     dataset = load_dataset("gsm8k", "main")
 
-    x_train = []
-    y_train = []
-    x_test = []
-    y_test = []
-
-    for data_point in dataset["train"]:
-        question = data_point["question"]
-        thinking = data_point["answer"].split("####")[0].strip()
-        answer = data_point["answer"].split("####")[-1].strip()
-        x_train.append(MathQuestion(question=question))
-        y_train.append(
-            NumericalAnswerWithThinking(
-                thinking=thinking,
-                answer=float(answer.replace(",", "")),
-            )
-        )
-
-    for data_point in dataset["test"]:
-        question = data_point["question"]
-        thinking = data_point["answer"].split("####")[0].strip()
-        answer = data_point["answer"].split("####")[-1].strip()
-        x_test.append(MathQuestion(question=question))
-        y_test.append(
-            NumericalAnswerWithThinking(
-                thinking=thinking,
-                answer=float(answer.replace(",", "")),
-            )
-        )
-
-    x_train = np.array(x_train, dtype="object")
-    y_train = np.array(y_train, dtype="object")
-
-    x_test = np.array(x_test, dtype="object")
-    y_test = np.array(y_test, dtype="object")
+    x_train = LazyDataset(dataset["train"], _get_input)
+    y_train = LazyDataset(dataset["train"], _get_output)
+
+    x_test = LazyDataset(dataset["test"], _get_input)
+    y_test = LazyDataset(dataset["test"], _get_output)
 
     return (x_train, y_train), (x_test, y_test)
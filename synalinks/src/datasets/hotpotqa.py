@@ -1,12 +1,13 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import functools
 
 import numpy as np
-from datasets import load_dataset
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import DataModel
 from synalinks.src.backend import Entity
+from synalinks.src.trainers.data_adapters.lazy_dataset import LazyDataset
 
 
 class Document(Entity):
@@ -55,11 +56,46 @@ def get_output_data_model():
     return Answer
 
 
+def _get_document(examples, record):
+    row, i = record
+    context = examples[int(row)]["context"]
+    return Document(
+        label="Document",
+        title=context["title"][i],
+        text="\n".join(context["sentences"][i]),
+    )
+
+
+def _get_document_records(examples):
+    """Returns the (example, document) index pairs of every document.
+
+    Only the number of documents of each example is read (from the Arrow
+    table, without converting the contexts to Python objects).
+    """
+    import pyarrow.compute as pc
+
+    titles = pc.struct_field(examples.data.column("context"), "title")
+    num_documents = pc.list_value_length(titles).fill_null(0).to_numpy()
+    rows = np.repeat(np.arange(len(num_documents)), num_documents)
+    starts = np.repeat(np.cumsum(num_documents) - num_documents, num_documents)
+    return np.stack([rows, np.arange(len(rows)) - starts], axis=-1)
+
+
+def _get_question(example):
+    return Question(question=example["question"])
+
+
+def _get_answer(example):
+    return Answer(answer=example["answer"])
+
+
 @synalinks_export("synalinks.datasets.hotpotqa.load_knowledge")
 def load_knowledge():
     """
     Load and format data from HuggingFace
 
+    The documents are built lazily when accessed.
+
     Example:
 
     ```python
@@ -67,24 +103,15 @@ def load_knowledge():
     ```
 
     Returns:
-        (list): The  data ready for knowledge injestion
+        (LazyDataset): The  data ready for knowledge injestion
     """
-    documents = []
+    from datasets import load_dataset
+
     train_examples = load_dataset(
         "hotpot_qa", "fullwiki", split="train", trust_remote_code=True
     )
-    for raw_example in train_examples:
-        context = raw_example.get("context", None)
-        if context:
-            for i in range(len(context["title"])):
-                documents.append(
-                    Document(
-                        title=context["title"][i],
-                        text="\n".join(context["sentences"][i]),
-                    )
-                )
-    documents = np.array(documents, dtype="object")
-    return documents
+    records = _get_document_records(train_examples)
+    return LazyDataset(records, functools.partial(_get_document, train_examples))
 
 
 @synalinks_export("synalinks.datasets.hotpotqa.load_data")
@@ -92,6 +119,8 @@ def load_data():
     """
     Load and format data from HuggingFace
 
+    The data models are built lazily when the samples are accessed.
+
     Example:
 
     ```python
@@ -99,12 +128,9 @@ def load_data():
     ```
 
     Returns:
-        (tuple): The train and test data ready for training
+        (tuple): The train and test data ready for training, as `LazyDataset`s
     """
-    x_train = []
-    y_train = []
-    x_test = []
-    y_test = []
+    from datasets import load_dataset
 
     train_examples = load_dataset(
         "hotpot_qa", "fullwiki", split="train", trust_remote_code=True
@@ -113,19 +139,11 @@ def load_data():
         "hotpot_qa", "fullwiki", split="validation", trust_remote_code=True
     )
 
-    for raw_example in train_examples:
-        x_train.append(Question(question=raw_example["question"]))
-        y_train.append(Answer(answer=raw_example["answer"]))
-
-    for raw_example in eval_examples:
-        if raw_example["level"] == "hard":
-            x_test.append(Question(question=raw_example["question"]))
-            y_test.append(Answer(answer=raw_example["answer"]))
-
-    x_train = np.array(x_train, dtype="object")
-    y_train = np.array(y_train, dtype="object")
+    x_train = LazyDataset(train_examples, _get_question)
+    y_train = LazyDataset(train_examples, _get_answer)
 
-    x_test = np.array(x_test, dtype="object")
-    y_test = np.array(y_test, dtype="object")
+    hard_examples = np.flatnonzero(np.array(eval_examples["level"]) == "hard")
+    x_test = LazyDataset(eval_examples, _get_question, indices=hard_examples)
+    y_test = LazyDataset(eval_examples, _get_answer, indices=hard_examples)
 
     return (x_train, y_train), (x_test, y_test)
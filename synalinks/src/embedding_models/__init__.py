@@ -1,5 +1,7 @@
 from synalinks.src.api_export import synalinks_export
+from synalinks.src.embedding_models.embedding_cache import EmbeddingCache
 from synalinks.src.embedding_models.embedding_model import EmbeddingModel
+from synalinks.src.language_models.request_scheduler import RequestScheduler
 from synalinks.src.saving import serialization_lib
 
 ALL_OBJECTS = {
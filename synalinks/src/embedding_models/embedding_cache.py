@@ -0,0 +1,158 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.backend.config import synalinks_home
+from synalinks.src.utils.sqlite_utils import SQLiteLRUTable
+
+
+@synalinks_export(
+    [
+        "synalinks.EmbeddingCache",
+        "synalinks.embedding_models.EmbeddingCache",
+    ]
+)
+class EmbeddingCache:
+    """A persistent, content-addressed cache for embedding vectors.
+
+    The vectors are stored as float32 blobs in a SQLite database, keyed by
+    a hash of the embedding model name, its call arguments and the text.
+    Because the cache is keyed on the content, re-embedding an unchanged
+    text (e.g. when re-indexing a corpus) costs nothing, even across
+    processes.
+
+    When the number of cached vectors exceeds `max_entries`, the least
+    recently used vectors are evicted (down to 90% of `max_entries`).
+
+    Example:
+
+    ```python
+    import synalinks
+
+    embedding_model = synalinks.EmbeddingModel(
+        model="ollama/mxbai-embed-large",
+        cache=True,
+    )
+
+    # After some calls
+    print(embedding_model.cache.hits, embedding_model.cache.misses)
+    ```
+
+    Args:
+        path (str): Optional. The path of the SQLite database
+            (Default to `~/.synalinks/cache/embeddings.db`).
+        max_entries (int): Optional. The maximum number of vectors to keep,
+            `None` for no limit (Default to 1000000).
+    """
+
+    def __init__(self, path=None, max_entries=1000000):
+        if not path:
+            path = os.path.join(synalinks_home(), "cache", "embeddings.db")
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._table = SQLiteLRUTable(
+            self.path,
+            "embeddings",
+            {"vector": "BLOB"},
+            max_entries=max_entries,
+        )
+
+    @staticmethod
+    def get_key(namespace, text):
+        """Compute the cache key of a text.
+
+        Args:
+            namespace (str): The namespace of the key (the model and its arguments).
+            text (str): The text.
+
+        Returns:
+            (str): The cache key.
+        """
+        return hashlib.sha256(f"{namespace}\x00{text}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_namespace(model, **kwargs):
+        """Compute the namespace of an embedding model call.
+
+        Args:
+            model (str): The model name.
+            **kwargs (keyword arguments): The arguments of the call.
+
+        Returns:
+            (str): The namespace.
+        """
+        if not kwargs:
+            return model
+        return model + json.dumps(kwargs, sort_keys=True, default=str)
+
+    def get_many(self, namespace, texts):
+        """Get the cached vectors of the given texts.
+
+        Args:
+            namespace (str): The namespace (see `get_namespace()`).
+            texts (list): The texts to look up.
+
+        Returns:
+            (list): The cached vectors, `None` for the texts not in cache.
+        """
+        keys = [self.get_key(namespace, text) for text in texts]
+        found = self._table.get_many(keys)
+        vectors = []
+        for key in keys:
+            row = found.get(key)
+            if row is None:
+                self.misses += 1
+                vectors.append(None)
+            else:
+                self.hits += 1
+                vectors.append(np.frombuffer(row[0], dtype="float32").tolist())
+        return vectors
+
+    def put_many(self, namespace, texts, vectors):
+        """Add the given vectors to the cache.
+
+        Args:
+            namespace (str): The namespace (see `get_namespace()`).
+            texts (list): The embedded texts.
+            vectors (list): The corresponding vectors.
+        """
+        rows = [
+            (self.get_key(namespace, text), np.asarray(vector, dtype="float32").tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+        self._table.put_many(rows)
+
+    @property
+    def hit_rate(self):
+        """The ratio of texts found in the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """Remove every vector from the cache and reset the counters."""
+        self._table.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """Close the connection to the database."""
+        self._table.close()
+
+    def __len__(self):
+        return len(self._table)
+
+    def get_config(self):
+        return {
+            "path": self.path,
+            "max_entries": self.max_entries,
+        }
+
+    def __repr__(self):
+        return f"<EmbeddingCache path={self.path}>"
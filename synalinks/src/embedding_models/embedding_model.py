@@ -1,11 +1,11 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 import warnings
 
-import litellm
-
 from synalinks.src.api_export import synalinks_export
-
+from synalinks.src.embedding_models.embedding_cache import EmbeddingCache
+from synalinks.src.language_models.request_scheduler import RequestScheduler
 from synalinks.src.saving import serialization_lib
 from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
 
@@ -80,6 +80,39 @@ class EmbeddingModel(SynalinksSaveable):
     )
     ```
 
+    **Caching the embeddings**
+
+    ```python
+    import synalinks
+
+    embedding_model = synalinks.EmbeddingModel(
+        model="ollama/mxbai-embed-large",
+        cache=True,
+    )
+    ```
+
+    The vectors are stored on disk (in `~/.synalinks/cache/embeddings.db` by
+    default) and keyed on the model and the text, so only the texts never
+    embedded before are sent to the provider. Use a path or an `EmbeddingCache`
+    instance to configure the cache location and size.
+
+    **Limiting the requests**
+
+    ```python
+    import synalinks
+
+    embedding_model = synalinks.EmbeddingModel(
+        model="openai/text-embedding-3-small",
+        scheduler=synalinks.RequestScheduler(
+            max_concurrency=8,
+            tokens_per_minute=1000000,
+        ),
+    )
+    ```
+
+    The scheduler bounds the number of in-flight requests, enforces the rate
+    limits and retries the failed requests with an exponential backoff.
+
     **Note**: Obviously, use an `.env` file and `.gitignore` to avoid
     putting your API keys in the code or a config file that can lead to
     leackage when pushing it into repositories.
@@ -90,6 +123,12 @@ class EmbeddingModel(SynalinksSaveable):
         retry (int): Optional. The number of retry.
         fallback (EmbeddingModel): Optional. The embedding model to fallback
             if anything is wrong.
+        cache (bool | str | EmbeddingCache): Optional. Wether or not to cache the
+            embeddings on disk. Can be the path of the cache database or an
+            `EmbeddingCache` instance (Default to None).
+        scheduler (RequestScheduler): Optional. The scheduler of the requests
+            (concurrency, rate limits and backoff). If None, a scheduler without
+            limits is created (Default to None).
     """
 
     def __init__(
@@ -98,6 +137,8 @@ class EmbeddingModel(SynalinksSaveable):
         api_base=None,
         retry=5,
         fallback=None,
+        cache=None,
+        scheduler=None,
     ):
         if model is None:
             raise ValueError(
@@ -110,6 +151,22 @@ class EmbeddingModel(SynalinksSaveable):
             self.api_base = api_base
         self.retry = retry
         self.fallback = fallback
+        if cache is None or cache is False:
+            self.cache = None
+        elif isinstance(cache, EmbeddingCache):
+            self.cache = cache
+        elif isinstance(cache, dict):
+            self.cache = EmbeddingCache(**cache)
+        elif isinstance(cache, str):
+            self.cache = EmbeddingCache(path=cache)
+        else:
+            self.cache = EmbeddingCache()
+        if scheduler is None:
+            self.scheduler = RequestScheduler()
+        elif isinstance(scheduler, dict):
+            self.scheduler = serialization_lib.deserialize_synalinks_object(scheduler)
+        else:
+            self.scheduler = scheduler
 
     async def __call__(self, texts, **kwargs):
         """
@@ -121,35 +178,74 @@ class EmbeddingModel(SynalinksSaveable):
         Returns:
             (list): The list of corresponding vectors.
         """
-
+        if self.cache is None:
+            response = await self._embed(texts, **kwargs)
+        else:
+            response = await self._embed_with_cache(texts, **kwargs)
+        if response is None and self.fallback:
+            # The vectors of the fallback model live in another embedding
+            # space, so all the texts are embedded (and cached) by it
+            return await self.fallback(
+                texts,
+                **kwargs,
+            )
+        return response
+
+    async def _embed_with_cache(self, texts, **kwargs):
+        namespace = EmbeddingCache.get_namespace(self.model, **kwargs)
+        # SQLite is blocking, so the cache is accessed in a worker thread
+        vectors = await asyncio.to_thread(self.cache.get_many, namespace, texts)
+        missing_texts = list(
+            dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None)
+        )
+        if missing_texts:
+            response = await self._embed(missing_texts, **kwargs)
+            if not response:
+                return None
+            new_vectors = response["embeddings"]
+            if len(new_vectors) != len(missing_texts):
+                return response
+            await asyncio.to_thread(
+                self.cache.put_many, namespace, missing_texts, new_vectors
+            )
+            new_vectors = dict(zip(missing_texts, new_vectors))
+            vectors = [
+                new_vectors[text] if vector is None else vector
+                for text, vector in zip(texts, vectors)
+            ]
+        return {"embeddings": vectors}
+
+    async def _embed(self, texts, **kwargs):
+        import litellm
+
+        tokens = 0
+        if self.scheduler.tokens_per_minute:
+            tokens = sum(self.scheduler.estimate_tokens(text) for text in texts)
         for i in range(self.retry):
             try:
-                if self.api_base:
-                    response = await litellm.aembedding(
-                        model=self.model,
-                        input=texts,
-                        api_base=self.api_base,
-                        **kwargs,
-                    )
-                else:
-                    response = await litellm.aembedding(
-                        model=self.model,
-                        input=texts,
-                        **kwargs,
-                    )
+                async with self.scheduler.request(tokens=tokens):
+                    if self.api_base:
+                        response = await litellm.aembedding(
+                            model=self.model,
+                            input=texts,
+                            api_base=self.api_base,
+                            **kwargs,
+                        )
+                    else:
+                        response = await litellm.aembedding(
+                            model=self.model,
+                            input=texts,
+                            **kwargs,
+                        )
                 vectors = []
                 for data in response["data"]:
                     vectors.append(data["embedding"])
                 return {"embeddings": vectors}
             except Exception as e:
                 warnings.warn(f"Error occured while trying to call {self}: " + str(e))
-        if self.fallback:
-            return self.fallback(
-                texts,
-                **kwargs,
-            )
-        else:
-            return None
+                if i < self.retry - 1:
+                    await self.scheduler.backoff(i, error=e)
+        return None
 
     def _obj_type(self):
         return "EmbeddingModel"
@@ -159,6 +255,8 @@ class EmbeddingModel(SynalinksSaveable):
             "model": self.model,
             "api_base": self.api_base,
             "retry": self.retry,
+            "cache": self.cache.get_config() if self.cache is not None else None,
+            "scheduler": serialization_lib.serialize_synalinks_object(self.scheduler),
         }
         if self.fallback:
             fallback_config = {
@@ -1,9 +1,11 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import os
 from unittest.mock import patch
 
 from synalinks.src import testing
 from synalinks.src.backend import Embeddings
+from synalinks.src.embedding_models.embedding_cache import EmbeddingCache
 from synalinks.src.embedding_models.embedding_model import EmbeddingModel
 
 
@@ -18,3 +20,81 @@ class EmbeddingModelTest(testing.TestCase):
         result = await embedding_model(["What is the capital of France?"])
         self.assertEqual(result, Embeddings(**result).get_json())
         self.assertEqual(result, {"embeddings": [expected_value]})
+
+    @patch("litellm.aembedding")
+    async def test_call_api_with_cache(self, mock_embedding):
+        cache_path = os.path.join(self.get_temp_dir(), "embeddings.db")
+        embedding_model = EmbeddingModel(model="ollama/all-minilm", cache=cache_path)
+
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": [float(len(text)), 0.5]} for text in kwargs["input"]]
+        }
+
+        result = await embedding_model(["a", "bb"])
+        self.assertEqual(result, {"embeddings": [[1.0, 0.5], [2.0, 0.5]]})
+        self.assertEqual(mock_embedding.call_count, 1)
+
+        result = await embedding_model(["bb", "ccc", "a"])
+        self.assertEqual(result, {"embeddings": [[2.0, 0.5], [3.0, 0.5], [1.0, 0.5]]})
+        self.assertEqual(mock_embedding.call_count, 2)
+        self.assertEqual(mock_embedding.call_args.kwargs["input"], ["ccc"])
+        self.assertEqual(embedding_model.cache.hits, 2)
+        self.assertEqual(embedding_model.cache.misses, 3)
+
+        # The cache is persisted on disk
+        other_embedding_model = EmbeddingModel(
+            model="ollama/all-minilm",
+            cache=cache_path,
+        )
+        result = await other_embedding_model(["ccc"])
+        self.assertEqual(result, {"embeddings": [[3.0, 0.5]]})
+        self.assertEqual(mock_embedding.call_count, 2)
+
+    @patch("litellm.aembedding")
+    async def test_fallback_vectors_are_not_cached(self, mock_embedding):
+        fallback = EmbeddingModel(model="ollama/mxbai-embed-large")
+        embedding_model = EmbeddingModel(
+            model="ollama/all-minilm",
+            retry=1,
+            fallback=fallback,
+            cache=os.path.join(self.get_temp_dir(), "embeddings.db"),
+        )
+        primary_available = False
+
+        def embedding(**kwargs):
+            if kwargs["model"] == "ollama/all-minilm":
+                if not primary_available:
+                    raise ConnectionError("Model unavailable")
+                return {"data": [{"embedding": [1.0, 0.0]} for _ in kwargs["input"]]}
+            return {"data": [{"embedding": [0.0, 1.0, 0.0]} for _ in kwargs["input"]]}
+
+        mock_embedding.side_effect = embedding
+
+        with self.assertWarns(Warning):
+            result = await embedding_model(["a"])
+        self.assertEqual(result, {"embeddings": [[0.0, 1.0, 0.0]]})
+        self.assertEqual(len(embedding_model.cache), 0)
+
+        primary_available = True
+        result = await embedding_model(["a"])
+        self.assertEqual(result, {"embeddings": [[1.0, 0.0]]})
+        self.assertEqual(len(embedding_model.cache), 1)
+
+    def test_cache_eviction(self):
+        cache = EmbeddingCache(
+            path=os.path.join(self.get_temp_dir(), "embeddings.db"),
+            max_entries=10,
+        )
+        for i in range(20):
+            cache.put_many("model", [f"text {i}"], [[float(i)]])
+        self.assertLessEqual(len(cache), 10)
+        self.assertEqual(cache.get_many("model", ["text 19"]), [[19.0]])
+        self.assertEqual(cache.get_many("model", ["text 0"]), [None])
+
+    def test_cache_serialization(self):
+        cache_path = os.path.join(self.get_temp_dir(), "embeddings.db")
+        embedding_model = EmbeddingModel(model="ollama/all-minilm", cache=cache_path)
+        config = embedding_model.get_config()
+        cloned_embedding_model = EmbeddingModel.from_config(config)
+        self.assertEqual(cloned_embedding_model.cache.path, cache_path)
+        self.assertEqual(cloned_embedding_model.get_config(), config)
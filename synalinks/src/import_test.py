@@ -0,0 +1,62 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import json
+import os
+import subprocess
+import sys
+
+from synalinks.src import testing
+
+# Heavy dependencies that should only be imported when used
+DEFERRED_MODULES = [
+    "datasets",
+    "inquirer",
+    "litellm",
+    "matplotlib",
+    "mcp",
+    "neo4j",
+    "pydot",
+    "pydot_ng",
+    "pydotplus",
+    "rich",
+]
+
+# The time budget of `import synalinks` in seconds
+IMPORT_TIME_BUDGET = float(os.environ.get("SYNALINKS_IMPORT_TIME_BUDGET", 3.0))
+
+IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import synalinks
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_synalinks():
+    """Import synalinks in a fresh interpreter.
+
+    Returns:
+        (dict): The import time in seconds and the imported modules.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class ImportTest(testing.TestCase):
+    def test_heavy_dependencies_not_imported(self):
+        modules = set(import_synalinks()["modules"])
+        imported = [module for module in DEFERRED_MODULES if module in modules]
+        self.assertEqual(imported, [])
+
+    def test_import_time_budget(self):
+        elapsed = min(import_synalinks()["elapsed"] for _ in range(3))
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
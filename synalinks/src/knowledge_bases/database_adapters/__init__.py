@@ -1,6 +1,7 @@
 from synalinks.src.knowledge_bases.database_adapters.database_adapter import (
     DatabaseAdapter,
 )
+from synalinks.src.knowledge_bases.database_adapters.local_adapter import LocalAdapter
 from synalinks.src.knowledge_bases.database_adapters.memgraph_adapter import (
     MemGraphAdapter,
 )
@@ -14,6 +15,8 @@ def get(uri):
         return Neo4JAdapter
     elif uri.startswith("memgraph"):
         return MemGraphAdapter
+    elif uri.startswith("local"):
+        return LocalAdapter
     # elif uri.startswith("kuzu"):
     #     return KuzuAdapter
     else:
@@ -1,15 +1,41 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 import copy
 import re
 from typing import Any
 from typing import Dict
 
+from synalinks.src.backend import is_similarity_search
+from synalinks.src.backend import is_triplet_search
+from synalinks.src.backend.common import global_state
 from synalinks.src.embedding_models import EmbeddingModel
 from synalinks.src.utils.async_utils import run_maybe_nested
 from synalinks.src.utils.naming import to_snake_case
 
 
+async def get_embedding_dim(embedding_model):
+    """Get the dimension of the embeddings of an embedding model.
+
+    The dimension is probed with a single embedding call the first time,
+    then cached in the global state (until `synalinks.clear_session()`).
+
+    Args:
+        embedding_model (EmbeddingModel): The embedding model.
+
+    Returns:
+        (int): The dimension of the embeddings.
+    """
+    embedding_dims = global_state.get_global_attribute(
+        "embedding_dims", default={}, set_to_default=True
+    )
+    key = (embedding_model.model, embedding_model.api_base)
+    if key not in embedding_dims:
+        embeddings = await embedding_model(texts=["test"])
+        embedding_dims[key] = len(embeddings["embeddings"][0])
+    return embedding_dims[key]
+
+
 class DatabaseAdapter:
     def __init__(
         self,
@@ -19,6 +45,8 @@ class DatabaseAdapter:
         relation_models=None,
         metric="cosine",
         wipe_on_start=False,
+        embedding_dim=None,
+        lazy=False,
         **kwargs,
     ):
         self.uri = uri
@@ -30,9 +58,7 @@ class DatabaseAdapter:
             )
 
         self.embedding_model = embedding_model
-        self.embedding_dim = len(
-            run_maybe_nested(embedding_model(texts=["test"]))["embeddings"][0]
-        )
+        self.embedding_dim = embedding_dim
 
         if metric not in ("cosine", "euclidean"):
             raise ValueError(
@@ -52,11 +78,45 @@ class DatabaseAdapter:
 
         self.entity_models = entity_models
         self.relation_models = relation_models
+        self.wipe_on_start = wipe_on_start
 
-        if wipe_on_start:
-            self.wipe_database()
+        self._initialized = False
+        self._initialize_lock = None
+        if not lazy:
+            run_maybe_nested(self._run_and_close(self.initialize()))
 
-        self.create_vector_index()
+    async def initialize(self):
+        """Probe the embedding dimension, wipe the database (if `wipe_on_start`)
+        and create the vector indexes.
+
+        Only the first call does the work, so it is safe to call it before
+        each use of the adapter.
+        """
+        if self._initialized:
+            return
+        if self._initialize_lock is None:
+            self._initialize_lock = asyncio.Lock()
+        async with self._initialize_lock:
+            if self._initialized:
+                return
+            if self.embedding_dim is None:
+                self.embedding_dim = await get_embedding_dim(self.embedding_model)
+            if self.wipe_on_start:
+                await self._wipe_database()
+            await self._create_vector_index()
+            self._initialized = True
+
+    async def _run_and_close(self, coro):
+        """Run a setup coroutine and release the connections it opened.
+
+        Setup can happen from the constructor, possibly on a temporary event
+        loop, so the connections are closed afterwards and re-opened lazily
+        on the loop that runs the queries.
+        """
+        try:
+            return await coro
+        finally:
+            await self.close()
 
     def sanitize(self, string):
         """Prevent Cypher injections.
@@ -119,25 +179,212 @@ class DatabaseAdapter:
             f"{self.__class__} should implement the `create_vector_index()` method"
         )
 
+    async def _wipe_database(self):
+        """Async version of `wipe_database()`, override it for async adapters"""
+        self.wipe_database()
+
+    async def _create_vector_index(self):
+        """Async version of `create_vector_index()`, override it for async adapters"""
+        self.create_vector_index()
+
     async def update(self, data_model, threshold=0.8):
         raise NotImplementedError(
             f"{self.__class__} should implement the `update()` method"
         )
 
+    async def bulk_update(self, data_models, threshold=0.8, batch_size=1000):
+        """Update the database with many entities and relations.
+
+        Adapters that support batched writes should override this method,
+        by default the data models are updated one by one.
+
+        Args:
+            data_models (list): The list of entities and relations.
+            threshold (float): Similarity threshold for entity alignment.
+            batch_size (int): The maximum number of items written per query.
+
+        Returns:
+            (list): The written entities (as `{"node": ...}`) and relations
+                (as `{"subj": ..., "relation": ..., "obj": ...}`), without the
+                skipped ones and the entities merged into an existing one.
+        """
+        records = []
+        for data_model in data_models:
+            records.extend(await self.update(data_model, threshold=threshold) or [])
+        return records
+
     async def query(self, query: str, params: Dict[str, Any] = None, **kwargs):
         raise NotImplementedError(
             f"{self.__class__} should implement the `query()` method"
         )
 
-    async def similarity_search(self, text, data_model=None, k=10, threshold=0.8):
+    async def embed_texts(self, texts):
+        """Embed the given texts with a single call to the embedding model.
+
+        Args:
+            texts (list): The texts to embed (duplicates are embedded once).
+
+        Returns:
+            (dict): The vector of each text.
+        """
+        texts = list(dict.fromkeys(texts))
+        if not texts:
+            return {}
+        embeddings = (await self.embedding_model(texts=texts))["embeddings"]
+        return dict(zip(texts, embeddings))
+
+    def has_similarity_search(self, text):
+        """Whether a triplet search text is a similarity query (and not `?`)"""
+        return bool(text) and text != "?"
+
+    async def _gather(self, fn, items, max_concurrency=None):
+        """Concurrently apply `fn` to each item, at most `max_concurrency` at once"""
+        if not max_concurrency:
+            return await asyncio.gather(*[fn(item) for item in items])
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded_fn(item):
+            async with semaphore:
+                return await fn(item)
+
+        return await asyncio.gather(*[bounded_fn(item) for item in items])
+
+    async def similarity_search(self, similarity_search, k=10, threshold=0.8):
+        """Search the entities similar to the given text.
+
+        Args:
+            similarity_search (JsonDataModel): The `SimilaritySearch` data model.
+            k (int): Maximum number of similar entities to return.
+            threshold (float): Minimum similarity score for results.
+
+        Returns:
+            (list): The matching nodes with their score.
+        """
+        results = await self.similarity_search_many(
+            [similarity_search],
+            k=k,
+            threshold=threshold,
+        )
+        return results[0]
+
+    async def similarity_search_many(
+        self,
+        similarity_searches,
+        k=10,
+        threshold=0.8,
+        max_concurrency=None,
+    ):
+        """Run many similarity searches at once.
+
+        The texts of all the searches are embedded with a single embedding
+        call, then the searches run concurrently.
+
+        Args:
+            similarity_searches (list): The `SimilaritySearch` data models.
+            k (int): Maximum number of similar entities to return per search.
+            threshold (float): Minimum similarity score for results.
+            max_concurrency (int): Optional. The maximum number of searches
+                running at once (Default to None, all at once).
+
+        Returns:
+            (list): The results of each search.
+        """
+        for similarity_search in similarity_searches:
+            if not is_similarity_search(similarity_search):
+                raise ValueError(
+                    "The `similarity_search` argument "
+                    "should be a `SimilaritySearch` data model"
+                )
+        vectors = await self.embed_texts(
+            [search.get("similarity_search") for search in similarity_searches]
+        )
+
+        async def search(similarity_search):
+            return await self._similarity_search(
+                similarity_search,
+                vectors[similarity_search.get("similarity_search")],
+                k=k,
+                threshold=threshold,
+            )
+
+        return await self._gather(search, similarity_searches, max_concurrency)
+
+    async def _similarity_search(self, similarity_search, vector, k=10, threshold=0.8):
         raise NotImplementedError(
-            f"{self.__class__} should implement the `similarity_search()` method"
+            f"{self.__class__} should implement the `_similarity_search()` method"
         )
 
     async def triplet_search(self, triplet_search, k=10, threshold=0.8):
+        """Search the triplets matching the given triplet search.
+
+        Args:
+            triplet_search (JsonDataModel): The `TripletSearch` data model.
+            k (int): Maximum number of matching triplets to return.
+            threshold (float): Minimum similarity score for triplet matches.
+
+        Returns:
+            (list): The matching triplets with their score.
+        """
+        results = await self.triplet_search_many(
+            [triplet_search],
+            k=k,
+            threshold=threshold,
+        )
+        return results[0]
+
+    async def triplet_search_many(
+        self,
+        triplet_searches,
+        k=10,
+        threshold=0.8,
+        max_concurrency=None,
+    ):
+        """Run many triplet searches at once.
+
+        The subject and object similarity queries of all the searches are
+        embedded with a single embedding call, then the searches run
+        concurrently.
+
+        Args:
+            triplet_searches (list): The `TripletSearch` data models.
+            k (int): Maximum number of matching triplets to return per search.
+            threshold (float): Minimum similarity score for triplet matches.
+            max_concurrency (int): Optional. The maximum number of searches
+                running at once (Default to None, all at once).
+
+        Returns:
+            (list): The results of each search.
+        """
+        texts = []
+        for triplet_search in triplet_searches:
+            if not is_triplet_search(triplet_search):
+                raise ValueError(
+                    "The `triplet_search` argument should be a `TripletSearch` data model"
+                )
+            for key in ("subject_similarity_search", "object_similarity_search"):
+                text = triplet_search.get(key)
+                if self.has_similarity_search(text):
+                    texts.append(text)
+        vectors = await self.embed_texts(texts)
+
+        async def search(triplet_search):
+            return await self._triplet_search(
+                triplet_search,
+                vectors,
+                k=k,
+                threshold=threshold,
+            )
+
+        return await self._gather(search, triplet_searches, max_concurrency)
+
+    async def _triplet_search(self, triplet_search, vectors, k=10, threshold=0.8):
         raise NotImplementedError(
-            f"{self.__class__} should implement the `triplet_search()` method"
+            f"{self.__class__} should implement the `_triplet_search()` method"
         )
 
+    async def close(self):
+        """Release the connections held by the adapter (if any)"""
+        pass
+
     async def __repr__(self):
         return f"<DatabaseAdapter index={self.uri}>"
@@ -0,0 +1,461 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import collections
+import json
+import os
+import shutil
+import warnings
+
+import numpy as np
+
+from synalinks.src.backend import is_entity
+from synalinks.src.backend import is_relation
+from synalinks.src.backend.common.json_utils import copy_json
+from synalinks.src.knowledge_bases.database_adapters import DatabaseAdapter
+from synalinks.src.knowledge_bases.database_adapters.vector_index import VectorIndex
+
+METADATA_FILE = "metadata.json"
+ENTITIES_DIR = "entities"
+RELATIONS_FILE = "relations.jsonl"
+
+
+class LocalAdapter(DatabaseAdapter):
+    """Embedded knowledge base adapter, running in the Python process.
+
+    The entities and relations are kept in memory and persisted in a directory
+    (append-only JSON lines files), while the embeddings of each entity label
+    are stored in a contiguous float32 matrix, memory-mapped from the disk,
+    with an approximate nearest neighbours index for large knowledge bases
+    (see `VectorIndex`). No database server is needed.
+
+    The uri is `local://<directory>`, or `local://:memory:` (or `local://`)
+    for a knowledge base that is not persisted.
+
+    The `update()`, `similarity_search()` and `triplet_search()` methods have
+    the same semantics as the ones of the graph database adapters. Cypher
+    queries (`query()`) are not supported.
+    """
+
+    def __init__(
+        self,
+        uri=None,
+        entity_models=None,
+        relation_models=None,
+        embedding_model=None,
+        metric="cosine",
+        wipe_on_start=False,
+        embedding_dim=None,
+        lazy=False,
+    ):
+        path = uri.replace("local://", "", 1)
+        self.path = path if path and path != ":memory:" else None
+        self._reset()
+
+        super().__init__(
+            uri=uri,
+            entity_models=entity_models,
+            relation_models=relation_models,
+            embedding_model=embedding_model,
+            metric=metric,
+            wipe_on_start=wipe_on_start,
+            embedding_dim=embedding_dim,
+            lazy=lazy,
+        )
+
+    def _reset(self):
+        self._loaded = False
+        # The entities properties and vector index of each label
+        self._entities = {}
+        self._indexes = {}
+        # The relations and their indexes
+        self._relations = []
+        self._relation_ids = {}
+        self._relations_by_label = collections.defaultdict(list)
+        self._outgoing = collections.defaultdict(list)
+        self._incoming = collections.defaultdict(list)
+
+    def wipe_database(self):
+        """Wipe all data from the database"""
+        for index in self._indexes.values():
+            index.close()
+        self._reset()
+        if self.path is None:
+            return
+        shutil.rmtree(os.path.join(self.path, ENTITIES_DIR), ignore_errors=True)
+        for filename in (METADATA_FILE, RELATIONS_FILE):
+            if os.path.exists(os.path.join(self.path, filename)):
+                os.remove(os.path.join(self.path, filename))
+
+    def create_vector_index(self):
+        """Load the stored knowledge and create the vector indexes"""
+        if not self._loaded:
+            self._load()
+        for entity_model in self.entity_models:
+            self._get_index(self.sanitize_label(entity_model.get_schema().get("title")))
+
+    def _load(self):
+        self._loaded = True
+        if self.path is None:
+            return
+        os.makedirs(os.path.join(self.path, ENTITIES_DIR), exist_ok=True)
+        metadata_path = os.path.join(self.path, METADATA_FILE)
+        metadata = {"embedding_dim": self.embedding_dim, "metric": self.metric}
+        if os.path.exists(metadata_path):
+            with open(metadata_path, "r") as f:
+                stored_metadata = json.load(f)
+            if stored_metadata != metadata:
+                raise ValueError(
+                    f"The knowledge base at {self.path} was created with "
+                    f"{stored_metadata}, but the adapter uses {metadata}. "
+                    "Use `wipe_on_start=True` to recreate it."
+                )
+        else:
+            with open(metadata_path, "w") as f:
+                json.dump(metadata, f)
+        entities_dir = os.path.join(self.path, ENTITIES_DIR)
+        for filename in sorted(os.listdir(entities_dir)):
+            if filename.endswith(".jsonl"):
+                label = filename[: -len(".jsonl")]
+                self._entities[label] = self._read_lines(
+                    os.path.join(entities_dir, filename)
+                )
+                self._get_index(label)
+        for record in self._read_lines(os.path.join(self.path, RELATIONS_FILE)):
+            self._merge_relation(
+                record["label"],
+                tuple(record["subj"]),
+                tuple(record["obj"]),
+                record["properties"],
+            )
+
+    def _read_lines(self, path):
+        if not os.path.exists(path):
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _append_lines(self, filename, records):
+        if self.path is None or not records:
+            return
+        with open(os.path.join(self.path, filename), "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+
+    def _get_index(self, label):
+        index = self._indexes.get(label)
+        if index is None:
+            path = None
+            if self.path is not None:
+                path = os.path.join(self.path, ENTITIES_DIR, f"{label}.f32")
+            entities = self._entities.setdefault(label, [])
+            index = VectorIndex(
+                self.embedding_dim,
+                metric=self.metric,
+                path=path,
+                size=len(entities),
+            )
+            self._indexes[label] = index
+        return index
+
+    def _add_entities(self, label, vectors, properties):
+        index = self._get_index(label)
+        # The vectors are written first, so they are always in sync
+        # with the entities read back (the extra vectors are ignored)
+        ids = index.add(vectors)
+        index.flush()
+        self._append_lines(os.path.join(ENTITIES_DIR, f"{label}.jsonl"), properties)
+        self._entities[label].extend(properties)
+        return ids
+
+    def _merge_relation(self, label, subj, obj, properties):
+        key = (label, subj, obj)
+        relation_id = self._relation_ids.get(key)
+        if relation_id is None:
+            relation_id = len(self._relations)
+            self._relation_ids[key] = relation_id
+            self._relations.append(
+                {"label": label, "subj": subj, "obj": obj, "properties": {}}
+            )
+            self._relations_by_label[label].append(relation_id)
+            self._outgoing[subj].append(relation_id)
+            self._incoming[obj].append(relation_id)
+        self._relations[relation_id]["properties"].update(properties)
+
+    def _merge_relations(self, records):
+        for record in records:
+            self._merge_relation(
+                record["label"],
+                record["subj"],
+                record["obj"],
+                record["properties"],
+            )
+        self._append_lines(RELATIONS_FILE, records)
+
+    def _align(self, label, vectors, threshold):
+        """Returns the id of the most similar entity of each vector (or None)"""
+        index = self._indexes.get(label)
+        if index is None:
+            return [None] * len(vectors)
+        results = index.search(vectors, k=1, threshold=threshold)
+        return [(label, int(ids[0])) if len(ids) else None for ids, _ in results]
+
+    def _get_entity_properties(self, data_model):
+        properties = self.sanitize_properties(data_model.get_json())
+        properties.pop("embedding", None)
+        return properties
+
+    def _get_relation_properties(self, data_model):
+        properties = self.sanitize_properties(data_model.get_json())
+        return {k: v for k, v in properties.items() if k not in ("subj", "obj")}
+
+    async def query(self, query, params=None, **kwargs):
+        raise NotImplementedError(
+            "The local knowledge base doesn't support Cypher queries, use "
+            "`similarity_search()` and `triplet_search()` instead."
+        )
+
+    async def update(
+        self,
+        data_model,
+        threshold=0.8,
+    ):
+        if not is_relation(data_model) and not is_entity(data_model):
+            raise ValueError(
+                "The parameter `data_model` must be an `Entity` or `Relation` instance"
+            )
+        return await self.bulk_update([data_model], threshold=threshold)
+
+    async def bulk_update(
+        self,
+        data_models,
+        threshold=0.8,
+        batch_size=1000,
+    ):
+        """Update the knowledge base with many entities and relations.
+
+        The entities are aligned with the existing ones in batches (one
+        matrix product per label and batch), identical entities are
+        deduplicated, and all the entities are written before the relations,
+        so relations can be aligned with the new entities.
+
+        Args:
+            data_models (list): The list of entities and relations.
+            threshold (float): Similarity threshold for entity alignment.
+            batch_size (int): The maximum number of entities aligned at once
+                (Default to 1000).
+
+        Returns:
+            (list): The written entities and relations.
+        """
+        entity_rows = {}
+        relation_rows = []
+        skipped = 0
+        for data_model in data_models:
+            if is_relation(data_model):
+                subj = data_model.get_nested_entity("subj")
+                obj = data_model.get_nested_entity("obj")
+                subj_vector = subj.get("embedding")
+                obj_vector = obj.get("embedding")
+                if not subj_vector or not obj_vector:
+                    skipped += 1
+                    continue
+                relation_rows.append(
+                    {
+                        "label": self.sanitize_label(data_model.get("label")),
+                        "subj_label": self.sanitize_label(subj.get("label")),
+                        "subj_vector": subj_vector,
+                        "obj_label": self.sanitize_label(obj.get("label")),
+                        "obj_vector": obj_vector,
+                        "properties": self._get_relation_properties(data_model),
+                    }
+                )
+            elif is_entity(data_model):
+                vector = data_model.get("embedding")
+                if not vector:
+                    skipped += 1
+                    continue
+                node_label = self.sanitize_label(data_model.get("label"))
+                properties = self._get_entity_properties(data_model)
+                row_key = json.dumps(properties, sort_keys=True, default=str)
+                rows = entity_rows.setdefault(node_label, {})
+                rows.setdefault(row_key, (vector, properties))
+            else:
+                raise ValueError(
+                    "The parameter `data_models` must contain only "
+                    "`Entity` or `Relation` instances"
+                )
+        if skipped:
+            warnings.warn(
+                f"No embedding found for {skipped} entities or relations:"
+                " Entities and relations needs to be embedded. "
+                "Use `Embedding` module before `UpdateKnowledge`. "
+                "Skipping them."
+            )
+        written = []
+        for node_label, rows in entity_rows.items():
+            rows = list(rows.values())
+            for i in range(0, len(rows), batch_size):
+                batch = rows[i : i + batch_size]
+                aligned = self._align(node_label, [v for v, _ in batch], threshold)
+                new_rows = [row for row, match in zip(batch, aligned) if match is None]
+                if new_rows:
+                    self._add_entities(
+                        node_label,
+                        [vector for vector, _ in new_rows],
+                        [properties for _, properties in new_rows],
+                    )
+                    written.extend(
+                        {"node": copy_json(properties)} for _, properties in new_rows
+                    )
+        records = []
+        for i in range(0, len(relation_rows), batch_size):
+            batch = relation_rows[i : i + batch_size]
+            subjects = self._align_rows(batch, "subj", threshold)
+            objects = self._align_rows(batch, "obj", threshold)
+            for row, subj, obj in zip(batch, subjects, objects):
+                if subj is None or obj is None:
+                    continue
+                records.append(
+                    {
+                        "label": row["label"],
+                        "subj": subj,
+                        "obj": obj,
+                        "properties": row["properties"],
+                    }
+                )
+        self._merge_relations(records)
+        written.extend(
+            {
+                "subj": self._get_node(record["subj"]),
+                "relation": copy_json(record["properties"]),
+                "obj": self._get_node(record["obj"]),
+            }
+            for record in records
+        )
+        return written
+
+    def _align_rows(self, rows, role, threshold):
+        """Align the subjects or objects of relation rows, grouped by label"""
+        aligned = [None] * len(rows)
+        positions = collections.defaultdict(list)
+        for i, row in enumerate(rows):
+            positions[row[f"{role}_label"]].append(i)
+        for label, indices in positions.items():
+            vectors = [rows[i][f"{role}_vector"] for i in indices]
+            for i, match in zip(indices, self._align(label, vectors, threshold)):
+                aligned[i] = match
+        return aligned
+
+    def _match_labels(self, label):
+        """Returns the entity labels matching a (possibly `*`) label"""
+        if not label:
+            return list(self._indexes.keys())
+        return [label] if label in self._indexes else []
+
+    def _search_entities(self, label, vector, k, threshold):
+        """Returns the `k` most similar entities with their score"""
+        matches = []
+        for entity_label in self._match_labels(label):
+            index = self._indexes[entity_label]
+            ids, scores = index.search(vector, k=k, threshold=threshold)[0]
+            matches.extend(
+                ((entity_label, int(i)), float(s)) for i, s in zip(ids, scores)
+            )
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return dict(matches[:k])
+
+    def _get_node(self, entity):
+        label, row = entity
+        return copy_json(self._entities[label][row])
+
+    async def _similarity_search(
+        self,
+        similarity_search,
+        vector,
+        k=10,
+        threshold=0.7,
+    ):
+        entity_label = self.sanitize_label(similarity_search.get("entity_label"))
+        matches = self._search_entities(entity_label, vector, k, threshold)
+        # Same order as the graph database adapters (most similar last)
+        return [
+            {"node": self._get_node(entity), "score": score}
+            for entity, score in reversed(matches.items())
+        ]
+
+    async def _triplet_search(
+        self,
+        triplet_search,
+        vectors,
+        k=10,
+        threshold=0.7,
+    ):
+        subject_label = self.sanitize_label(triplet_search.get("subject_label"))
+        subject_similarity_search = triplet_search.get("subject_similarity_search")
+        relation_label = self.sanitize_label(triplet_search.get("relation_label"))
+        object_label = self.sanitize_label(triplet_search.get("object_label"))
+        object_similarity_search = triplet_search.get("object_similarity_search")
+
+        has_subject_similarity = self.has_similarity_search(subject_similarity_search)
+        has_object_similarity = self.has_similarity_search(object_similarity_search)
+
+        subjects = None
+        objects = None
+        if has_subject_similarity:
+            vector = vectors[subject_similarity_search]
+            subjects = self._search_entities(subject_label, vector, k, threshold)
+        if has_object_similarity:
+            vector = vectors[object_similarity_search]
+            objects = self._search_entities(object_label, vector, k, threshold)
+
+        if subjects is not None:
+            relation_ids = [i for s in subjects for i in self._outgoing.get(s, [])]
+        elif objects is not None:
+            relation_ids = [i for o in objects for i in self._incoming.get(o, [])]
+        elif relation_label:
+            relation_ids = self._relations_by_label.get(relation_label, [])
+        else:
+            relation_ids = range(len(self._relations))
+
+        triplets = []
+        for relation_id in relation_ids:
+            relation = self._relations[relation_id]
+            if relation_label and relation["label"] != relation_label:
+                continue
+            subj, obj = relation["subj"], relation["obj"]
+            if subjects is not None:
+                subj_score = subjects[subj]
+            elif has_object_similarity or not subject_label:
+                subj_score = 1.0
+            elif subj[0] == subject_label:
+                subj_score = 1.0
+            else:
+                continue
+            if objects is not None:
+                if obj not in objects:
+                    continue
+                obj_score = objects[obj]
+            elif has_subject_similarity or not object_label:
+                obj_score = 1.0
+            elif obj[0] == object_label:
+                obj_score = 1.0
+            else:
+                continue
+            triplets.append((relation, float(np.sqrt(subj_score * obj_score))))
+
+        triplets.sort(key=lambda triplet: triplet[1], reverse=True)
+        # Same order as the graph database adapters (most similar last)
+        return [
+            {
+                "subj": self._get_node(relation["subj"]),
+                "relation": copy_json(relation["properties"]),
+                "obj": self._get_node(relation["obj"]),
+                "score": score,
+            }
+            for relation, score in reversed(triplets[:k])
+        ]
+
+    async def close(self):
+        """Write the pending vectors to the disk"""
+        for index in self._indexes.values():
+            index.flush()
@@ -0,0 +1,289 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import tempfile
+import zlib
+from typing import Literal
+from typing import Union
+from unittest.mock import patch
+
+import numpy as np
+
+from synalinks.src import testing
+from synalinks.src.backend import Entity
+from synalinks.src.backend import Relation
+from synalinks.src.backend import SimilaritySearch
+from synalinks.src.backend import TripletSearch
+from synalinks.src.embedding_models import EmbeddingModel
+from synalinks.src.knowledge_bases import database_adapters
+from synalinks.src.knowledge_bases.database_adapters.local_adapter import LocalAdapter
+from synalinks.src.modules import Embedding
+from synalinks.src.modules import Input
+from synalinks.src.programs import Program
+
+
+class Document(Entity):
+    label: Literal["Document"]
+    text: str
+
+
+class Chunk(Document):
+    label: Literal["Chunk"]
+    text: str
+
+
+class IsPartOf(Relation):
+    obj: Union[Chunk, Document]
+    label: Literal["IsPartOf"]
+    subj: Document
+
+
+def embed(text):
+    """A deterministic embedding of the text (similar texts share words)"""
+    vector = np.zeros((64,))
+    for word in text.split():
+        rng = np.random.default_rng(zlib.crc32(word.encode()))
+        vector += rng.normal(size=(64,))
+    return vector.tolist()
+
+
+def mock_embedding_fn(**kwargs):
+    return {"data": [{"embedding": embed(text)} for text in kwargs["input"]]}
+
+
+async def get_embedding_program(embedding_model):
+    inputs = Input(data_model=Document)
+    outputs = await Embedding(
+        embedding_model=embedding_model,
+        in_mask=["text"],
+    )(inputs)
+    return Program(inputs=inputs, outputs=outputs)
+
+
+class LocalAdapterTest(testing.TestCase):
+    def get_adapter(self, uri="local://:memory:", wipe_on_start=False):
+        return LocalAdapter(
+            uri=uri,
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            wipe_on_start=wipe_on_start,
+        )
+
+    async def add_knowledge(self, adapter):
+        program = await get_embedding_program(adapter.embedding_model)
+        doc1 = Document(label="Document", text="the cat sat on the mat")
+        doc2 = Document(label="Document", text="stock markets fell sharply today")
+        chunk1 = Chunk(label="Chunk", text="the cat sat")
+        for data_model in [doc1, doc2, chunk1]:
+            await adapter.update(await program(data_model))
+        relation = IsPartOf(subj=chunk1, label="IsPartOf", obj=doc1)
+        await adapter.update(await program(relation))
+
+    @patch("litellm.aembedding")
+    def test_get_adapter(self, mock_embedding):
+        self.assertIs(database_adapters.get("local://:memory:"), LocalAdapter)
+
+    @patch("litellm.aembedding")
+    async def test_similarity_search(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        adapter = self.get_adapter()
+        await self.add_knowledge(adapter)
+
+        search = SimilaritySearch(
+            entity_label="Document",
+            similarity_search="cat on the mat",
+        ).to_json_data_model()
+        result = await adapter.similarity_search(search, k=2, threshold=0.0)
+        self.assertEqual(len(result), 2)
+        # The most similar last, like the graph databases adapters
+        self.assertEqual(result[-1]["node"]["text"], "the cat sat on the mat")
+        self.assertNotIn("embedding", result[-1]["node"])
+        self.assertGreater(result[-1]["score"], result[0]["score"])
+
+        search = SimilaritySearch(
+            entity_label="*",
+            similarity_search="the cat sat",
+        ).to_json_data_model()
+        result = await adapter.similarity_search(search, k=1, threshold=0.9)
+        self.assertEqual(result[0]["node"]["label"], "Chunk")
+
+    @patch("litellm.aembedding")
+    async def test_update_aligns_similar_entities(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        adapter = self.get_adapter()
+        await self.add_knowledge(adapter)
+        await self.add_knowledge(adapter)
+
+        self.assertEqual(len(adapter._entities["Document"]), 2)
+        self.assertEqual(len(adapter._entities["Chunk"]), 1)
+        self.assertEqual(len(adapter._relations), 1)
+
+    @patch("litellm.aembedding")
+    async def test_triplet_search(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        adapter = self.get_adapter()
+        await self.add_knowledge(adapter)
+
+        triplet_search = TripletSearch(
+            subject_label="Chunk",
+            subject_similarity_search="?",
+            relation_label="IsPartOf",
+            object_label="Document",
+            object_similarity_search="?",
+        ).to_json_data_model()
+        result = await adapter.triplet_search(triplet_search, threshold=0.0)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["subj"]["text"], "the cat sat")
+        self.assertEqual(result[0]["relation"]["label"], "IsPartOf")
+        self.assertEqual(result[0]["obj"]["text"], "the cat sat on the mat")
+        self.assertEqual(result[0]["score"], 1.0)
+
+        triplet_search = TripletSearch(
+            subject_label="Chunk",
+            subject_similarity_search="cat",
+            relation_label="IsPartOf",
+            object_label="Document",
+            object_similarity_search="on the mat",
+        ).to_json_data_model()
+        result = await adapter.triplet_search(triplet_search, threshold=0.5)
+        self.assertEqual(len(result), 1)
+        self.assertLess(result[0]["score"], 1.0)
+
+        triplet_search = TripletSearch(
+            subject_label="Chunk",
+            subject_similarity_search="?",
+            relation_label="IsPartOf",
+            object_label="Document",
+            object_similarity_search="stock markets",
+        ).to_json_data_model()
+        result = await adapter.triplet_search(triplet_search, threshold=0.9)
+        self.assertEqual(result, [])
+
+    @patch("litellm.aembedding")
+    async def test_persistence(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        with tempfile.TemporaryDirectory() as path:
+            adapter = self.get_adapter(uri=f"local://{path}")
+            await self.add_knowledge(adapter)
+            await adapter.close()
+
+            adapter = self.get_adapter(uri=f"local://{path}")
+            self.assertEqual(len(adapter._entities["Document"]), 2)
+            search = SimilaritySearch(
+                entity_label="Document",
+                similarity_search="stock markets",
+            ).to_json_data_model()
+            result = await adapter.similarity_search(search, k=1, threshold=0.0)
+            self.assertEqual(
+                result[0]["node"]["text"], "stock markets fell sharply today"
+            )
+            triplet_search = TripletSearch(
+                subject_label="Chunk",
+                subject_similarity_search="?",
+                relation_label="IsPartOf",
+                object_label="Document",
+                object_similarity_search="?",
+            ).to_json_data_model()
+            result = await adapter.triplet_search(triplet_search, threshold=0.0)
+            self.assertEqual(len(result), 1)
+
+            adapter = self.get_adapter(uri=f"local://{path}", wipe_on_start=True)
+            self.assertEqual(adapter._entities["Document"], [])
+            self.assertEqual(adapter._relations, [])
+
+    @patch("litellm.aembedding")
+    async def test_bulk_update(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        adapter = self.get_adapter()
+        program = await get_embedding_program(adapter.embedding_model)
+        documents = [
+            Document(label="Document", text=f"document number {i}") for i in range(20)
+        ]
+        embedded = await program.predict(np.array(documents, dtype="object"))
+        relations = [
+            IsPartOf(subj=documents[i], label="IsPartOf", obj=documents[i + 1])
+            for i in range(19)
+        ]
+        embedded_relations = await program.predict(np.array(relations, dtype="object"))
+        await adapter.bulk_update(
+            list(embedded) + list(embedded_relations) + list(embedded),
+            threshold=0.99,
+            batch_size=8,
+        )
+        self.assertEqual(len(adapter._entities["Document"]), 20)
+        self.assertEqual(len(adapter._relations), 19)
+
+    @patch("litellm.aembedding")
+    async def test_triplet_search_single_embedding_call(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        adapter = self.get_adapter()
+        await self.add_knowledge(adapter)
+        mock_embedding.reset_mock()
+
+        triplet_search = TripletSearch(
+            subject_label="Chunk",
+            subject_similarity_search="cat",
+            relation_label="IsPartOf",
+            object_label="Document",
+            object_similarity_search="on the mat",
+        ).to_json_data_model()
+        _ = await adapter.triplet_search(triplet_search, threshold=0.0)
+        self.assertEqual(mock_embedding.call_count, 1)
+        self.assertEqual(
+            mock_embedding.call_args.kwargs["input"],
+            ["cat", "on the mat"],
+        )
+
+    @patch("litellm.aembedding")
+    async def test_search_many(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        adapter = self.get_adapter()
+        await self.add_knowledge(adapter)
+
+        similarity_searches = [
+            SimilaritySearch(
+                entity_label=label,
+                similarity_search=text,
+            ).to_json_data_model()
+            for label, text in [
+                ("Document", "stock markets"),
+                ("Chunk", "the cat"),
+                ("Document", "stock markets"),
+            ]
+        ]
+        expected = [
+            await adapter.similarity_search(search, k=1, threshold=0.0)
+            for search in similarity_searches
+        ]
+        mock_embedding.reset_mock()
+        results = await adapter.similarity_search_many(
+            similarity_searches,
+            k=1,
+            threshold=0.0,
+        )
+        self.assertEqual(results, expected)
+        self.assertEqual(mock_embedding.call_count, 1)
+        self.assertEqual(
+            mock_embedding.call_args.kwargs["input"],
+            ["stock markets", "the cat"],
+        )
+
+        triplet_searches = [
+            TripletSearch(
+                subject_label="Chunk",
+                subject_similarity_search=subject,
+                relation_label="IsPartOf",
+                object_label="Document",
+                object_similarity_search=obj,
+            ).to_json_data_model()
+            for subject, obj in [("cat", "?"), ("?", "mat"), ("?", "?")]
+        ]
+        mock_embedding.reset_mock()
+        results = await adapter.triplet_search_many(
+            triplet_searches,
+            threshold=0.0,
+            max_concurrency=2,
+        )
+        self.assertEqual(len(results), 3)
+        self.assertEqual([len(result) for result in results], [1, 1, 1])
+        self.assertEqual(mock_embedding.call_count, 1)
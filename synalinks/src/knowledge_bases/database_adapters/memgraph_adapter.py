@@ -5,11 +5,8 @@ import warnings
 
 from synalinks.src.backend import is_entity
 from synalinks.src.backend import is_relation
-from synalinks.src.backend import is_similarity_search
-from synalinks.src.backend import is_triplet_search
 from synalinks.src.knowledge_bases.database_adapters import DatabaseAdapter
 from synalinks.src.knowledge_bases.database_adapters.neo4j_adapter import Neo4JAdapter
-from synalinks.src.utils.async_utils import run_maybe_nested
 from synalinks.src.utils.naming import to_snake_case
 
 
@@ -22,10 +19,17 @@ class MemGraphAdapter(Neo4JAdapter):
         embedding_model=None,
         metric="cosine",
         wipe_on_start=False,
+        embedding_dim=None,
+        lazy=False,
     ):
         self.db_name = os.getenv("MEMGRAPH_DATABASE", "memgraph")
         self.username = os.getenv("MEMGRAPH_USERNAME", "memgraph")
         self.password = os.getenv("MEMGRAPH_PASSWORD", "memgraph")
+        self.max_connection_pool_size = int(
+            os.getenv("MEMGRAPH_MAX_CONNECTION_POOL_SIZE", "100")
+        )
+        self._driver = None
+        self._driver_loop = None
 
         DatabaseAdapter.__init__(
             self,
@@ -35,18 +39,25 @@ class MemGraphAdapter(Neo4JAdapter):
             embedding_model=embedding_model,
             metric=metric,
             wipe_on_start=wipe_on_start,
+            embedding_dim=embedding_dim,
+            lazy=lazy,
         )
 
-    def wipe_database(self):
-        run_maybe_nested(self.query("MATCH (n) DETACH DELETE n;"))
+    async def _wipe_database(self):
+        await self.query("MATCH (n) DETACH DELETE n;", read_only=False)
 
-    def create_vector_index(self):
+    async def _create_vector_index(self):
         metric_mapping = {"cosine": "cos", "euclidean": "l2sq"}
         metric = metric_mapping[self.metric]
 
+        # MemGraph serializes the schema changes, so the indexes are created
+        # one by one (skipping the ones already created)
+        created_indexes = self._get_created_indexes()
         for entity_model in self.entity_models:
             node_label = self.sanitize_label(entity_model.get_schema().get("title"))
             index_name = to_snake_case(node_label)
+            if self._get_index_key(index_name) in created_indexes:
+                continue
             query = "\n".join(
                 [
                     f"CREATE VECTOR INDEX {index_name} ",
@@ -58,9 +69,8 @@ class MemGraphAdapter(Neo4JAdapter):
                     "};",
                 ]
             )
-            run_maybe_nested(
-                self.query(query),
-            )
+            await self.query(query, read_only=False)
+            created_indexes.add(self._get_index_key(index_name))
 
     async def update(
         self,
@@ -83,7 +93,7 @@ class MemGraphAdapter(Neo4JAdapter):
                     "Use `Embedding` module before `UpdateKnowledge`. "
                     "Skipping update."
                 )
-                return
+                return []
 
             relation_properties = self.sanitize_properties(data_model.get_json())
             set_clauses = []
@@ -108,6 +118,7 @@ class MemGraphAdapter(Neo4JAdapter):
                         if set_statement
                         else "// No additional properties to set"
                     ),
+                    "RETURN s AS subj, properties(r) AS relation, o AS obj",
                 ]
             )
             params = {
@@ -118,7 +129,7 @@ class MemGraphAdapter(Neo4JAdapter):
                 "objVector": obj_vector,
                 **relation_properties,
             }
-            await self.query(query, params=params)
+            return await self.query(query, params=params, read_only=False)
         elif is_entity(data_model):
             node_label = self.sanitize_label(data_model.get("label"))
             vector = data_model.get("embedding")
@@ -129,7 +140,7 @@ class MemGraphAdapter(Neo4JAdapter):
                     "Make sure to use `Embedding` module before `UpdateKnowledge`. "
                     "Skipping update."
                 )
-                return
+                return []
 
             node_properties = self.sanitize_properties(data_model.get_json())
             set_clauses = []
@@ -151,6 +162,7 @@ class MemGraphAdapter(Neo4JAdapter):
                         if set_statement
                         else "// No additional properties to set"
                     ),
+                    "RETURN n AS node",
                 ]
             )
             params = {
@@ -159,60 +171,71 @@ class MemGraphAdapter(Neo4JAdapter):
                 "vector": vector,
                 **node_properties,
             }
-            await self.query(query, params=params)
+            return await self.query(query, params=params, read_only=False)
         else:
             raise ValueError(
                 "The parameter `data_model` must be an `Entity` or `Relation` instance"
             )
 
-    async def similarity_search(
-        self,
-        similarity_search,
-        k=10,
-        threshold=0.7,
-    ):
-        if not is_similarity_search(similarity_search):
-            raise ValueError(
-                "The `similarity_search` argument "
-                "should be a `SimilaritySearch` data model"
-            )
-        text = similarity_search.get("similarity_search")
-        entity_label = similarity_search.get("entity_label")
-        vector = (await self.embedding_model(texts=[text]))["embeddings"][0]
+    def get_bulk_entities_query(self, node_label):
+        return "\n".join(
+            [
+                "UNWIND $rows AS row",
+                "CALL {",
+                "    WITH row",
+                "    CALL vector_search.search($indexName, 1, row.vector)",
+                "    YIELD node, similarity AS score",
+                "    WITH node, score",
+                "    WHERE score >= $threshold",
+                "    RETURN count(node) AS existing_count",
+                "}",
+                "WITH row, existing_count",
+                "WHERE existing_count = 0",
+                f"CREATE (n:{node_label})",
+                "SET n = row.properties",
+                "RETURN n AS node",
+            ]
+        )
 
-        index_name = to_snake_case(self.sanitize_label(entity_label))
+    def get_bulk_relations_query(self, relation_label):
+        return "\n".join(
+            [
+                "UNWIND $rows AS row",
+                "CALL vector_search.search($subjIndexName, 1, row.subjVector)",
+                "YIELD node AS s, similarity AS subj_score",
+                "WITH row, s, subj_score",
+                "WHERE subj_score >= $threshold",
+                "CALL vector_search.search($objIndexName, 1, row.objVector)",
+                "YIELD node AS o, similarity AS obj_score",
+                "WITH row, s, subj_score, o, obj_score",
+                "WHERE obj_score >= $threshold",
+                f"MERGE (s)-[r:{relation_label}]->(o)",
+                "SET r += row.properties",
+                "RETURN s AS subj, properties(r) AS relation, o AS obj",
+            ]
+        )
 
-        query = "\n".join(
+    def _get_similarity_search_query(self):
+        return "\n".join(
             [
+                "UNWIND $searches AS search",
                 "CALL vector_search.search(",
-                " $indexName,",
+                " search.indexName,",
                 " $numberOfNearestNeighbours,",
-                " $vector) YIELD node AS node, similarity AS score",
-                "WITH node, score",
+                " search.vector) YIELD node AS node, similarity AS score",
+                "WITH search, node, score",
                 "WHERE score >= $threshold",
-                "RETURN node AS node, score",
-                "LIMIT $numberOfNearestNeighbours",
+                "RETURN search.searchId AS searchId, node AS node, score",
             ]
         )
-        params = {
-            "indexName": index_name,
-            "numberOfNearestNeighbours": k,
-            "threshold": threshold,
-            "vector": vector,
-        }
-        result = await self.query(query, params=params)
-        return result
 
-    async def triplet_search(
+    async def _triplet_search(
         self,
         triplet_search,
+        vectors,
         k=10,
         threshold=0.7,
     ):
-        if not is_triplet_search(triplet_search):
-            raise ValueError(
-                "The `triplet_search` argument should be a `TripletSearch` data model"
-            )
 
         subject_label = triplet_search.get("subject_label")
         subject_label = self.sanitize_label(subject_label)
@@ -229,20 +252,12 @@ class MemGraphAdapter(Neo4JAdapter):
         }
         query_lines = []
 
-        has_subject_similarity = (
-            subject_similarity_search and subject_similarity_search != "?"
-        )
-        has_object_similarity = (
-            object_similarity_search and object_similarity_search != "?"
-        )
+        has_subject_similarity = self.has_similarity_search(subject_similarity_search)
+        has_object_similarity = self.has_similarity_search(object_similarity_search)
 
         if has_subject_similarity and has_object_similarity:
-            subject_vector = (
-                await self.embedding_model(texts=[subject_similarity_search])
-            )["embeddings"][0]
-            object_vector = (
-                await self.embedding_model(texts=[object_similarity_search])
-            )["embeddings"][0]
+            subject_vector = vectors[subject_similarity_search]
+            object_vector = vectors[object_similarity_search]
             params["subjVector"] = subject_vector
             params["objVector"] = object_vector
 
@@ -279,9 +294,7 @@ class MemGraphAdapter(Neo4JAdapter):
             query_lines.append("WITH subj, subj_score, relation, obj, obj_score")
 
         elif has_subject_similarity:
-            subject_vector = (
-                await self.embedding_model(texts=[subject_similarity_search])
-            )["embeddings"][0]
+            subject_vector = vectors[subject_similarity_search]
             params["subjVector"] = subject_vector
 
             params["subjIndexName"] = to_snake_case(subject_label)
@@ -302,9 +315,7 @@ class MemGraphAdapter(Neo4JAdapter):
             query_lines.append("WITH subj, subj_score, relation, obj, 1.0 AS obj_score")
 
         elif has_object_similarity:
-            object_vector = (
-                await self.embedding_model(texts=[object_similarity_search])
-            )["embeddings"][0]
+            object_vector = vectors[object_similarity_search]
             params["objVector"] = object_vector
             params["objIndexName"] = to_snake_case(object_label)
             query_lines.append(
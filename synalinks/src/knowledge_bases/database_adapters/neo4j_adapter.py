@@ -1,16 +1,16 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+import json
 import os
 import warnings
 from typing import Any
 from typing import Dict
 
-import neo4j
-
 from synalinks.src.backend import is_entity
 from synalinks.src.backend import is_relation
 from synalinks.src.backend import is_similarity_search
-from synalinks.src.backend import is_triplet_search
+from synalinks.src.backend.common import global_state
 from synalinks.src.backend.common.json_utils import out_mask_json
 from synalinks.src.knowledge_bases.database_adapters import DatabaseAdapter
 from synalinks.src.utils.async_utils import run_maybe_nested
@@ -26,10 +26,17 @@ class Neo4JAdapter(DatabaseAdapter):
         embedding_model=None,
         metric="cosine",
         wipe_on_start=False,
+        embedding_dim=None,
+        lazy=False,
     ):
         self.db_name = os.getenv("NEO4J_DATABASE", "neo4j")
         self.username = os.getenv("NEO4J_USERNAME", "neo4j")
         self.password = os.getenv("NEO4J_PASSWORD", "neo4j")
+        self.max_connection_pool_size = int(
+            os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "100")
+        )
+        self._driver = None
+        self._driver_loop = None
 
         super().__init__(
             uri=uri,
@@ -38,27 +45,52 @@ class Neo4JAdapter(DatabaseAdapter):
             embedding_model=embedding_model,
             metric=metric,
             wipe_on_start=wipe_on_start,
+            embedding_dim=embedding_dim,
+            lazy=lazy,
         )
 
     def wipe_database(self):
         """Wipe all data from the database"""
-        run_maybe_nested(
-            self.query(
-                """
-                MATCH (n)
-                CALL (n) {
-                    DETACH DELETE n
-                } IN TRANSACTIONS OF 10000 ROWS
-                """,
-                read_only=False,
-            )
+        run_maybe_nested(self._run_and_close(self._wipe_database()))
+
+    async def _wipe_database(self):
+        await self.query(
+            """
+            MATCH (n)
+            CALL (n) {
+                DETACH DELETE n
+            } IN TRANSACTIONS OF 10000 ROWS
+            """,
+            read_only=False,
         )
 
     def create_vector_index(self):
         """Create vector indexes"""
+        run_maybe_nested(self._run_and_close(self._create_vector_index()))
+
+    def _get_created_indexes(self):
+        """The vector indexes already created, cached in the global state as
+        (uri, database, index name, dimension, metric) tuples"""
+        return global_state.get_global_attribute(
+            "created_vector_indexes", default=set(), set_to_default=True
+        )
+
+    def _get_index_key(self, index_name):
+        return (self.uri, self.db_name, index_name, self.embedding_dim, self.metric)
+
+    async def _create_vector_index(self):
+        """Create the missing vector indexes concurrently.
+
+        The created indexes are remembered, so creating another adapter
+        on the same database doesn't query it again.
+        """
+        created_indexes = self._get_created_indexes()
+        queries = []
         for entity_model in self.entity_models:
             node_label = self.sanitize_label(entity_model.get_schema().get("title"))
             index_name = to_snake_case(node_label)
+            if self._get_index_key(index_name) in created_indexes:
+                continue
             query = "\n".join(
                 [
                     "CREATE VECTOR INDEX $indexName IF NOT EXISTS",
@@ -74,35 +106,97 @@ class Neo4JAdapter(DatabaseAdapter):
                 "dimension": self.embedding_dim,
                 "similarityFunction": self.metric,
             }
-            run_maybe_nested(
-                self.query(query, params=params),
+            queries.append((index_name, query, params))
+        if not queries:
+            return
+        await asyncio.gather(
+            *(
+                self.query(query, params=params, read_only=False)
+                for _, query, params in queries
             )
-        if self.entity_models:
-            run_maybe_nested(
-                self.query("CALL db.awaitIndexes(300)"),
+        )
+        await self.query("CALL db.awaitIndexes(300)")
+        created_indexes.update(
+            self._get_index_key(index_name) for index_name, _, _ in queries
+        )
+
+    def get_driver(self):
+        """Get the long-lived async driver bound to the running event loop.
+
+        The driver holds a bounded connection pool that is shared by every
+        query issued from the same event loop. It is created on first use
+        and re-created if the adapter is used from another event loop, the
+        previous driver being closed on its own event loop.
+
+        Returns:
+            (neo4j.AsyncDriver): The async driver.
+        """
+        import neo4j
+
+        loop = asyncio.get_running_loop()
+        if self._driver is None or self._driver_loop is not loop:
+            if self._driver is not None:
+                self._close_driver(self._driver, self._driver_loop)
+            self._driver = neo4j.AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.username, self.password),
+                max_connection_pool_size=self.max_connection_pool_size,
             )
+            self._driver_loop = loop
+        return self._driver
 
-    async def query(self, query: str, params: Dict[str, Any] = None, read_only=True, **kwargs):
-        driver = neo4j.GraphDatabase.driver(self.uri, auth=(self.username, self.password))
+    @staticmethod
+    def _close_driver(driver, loop):
+        """Schedule the closing of a driver on the event loop owning it.
+
+        The connections of the driver are bound to its event loop, so they
+        are closed there: right away if the loop is running in another
+        thread, or the next time it runs otherwise.
+
+        Args:
+            driver (neo4j.AsyncDriver): The driver to close.
+            loop (asyncio.AbstractEventLoop): The event loop of the driver.
+        """
+        if loop.is_closed():
+            # The connections can't be closed without their event loop
+            return
+        asyncio.run_coroutine_threadsafe(driver.close(), loop)
+
+    async def close(self):
+        """Close the driver and its connection pool"""
+        driver = self._driver
+        loop = self._driver_loop
+        self._driver = None
+        self._driver_loop = None
+        if driver is None:
+            return
+        if loop is asyncio.get_running_loop():
+            await driver.close()
+        else:
+            self._close_driver(driver, loop)
+
+    async def query(
+        self, query: str, params: Dict[str, Any] = None, read_only=True, **kwargs
+    ):
+        import neo4j
+
+        driver = self.get_driver()
+        access_mode = neo4j.READ_ACCESS if read_only else neo4j.WRITE_ACCESS
         result_list = []
-        if read_only:
-            if not params:
-                params = {}
-            params["routing_"] = neo4j.RoutingControl.READ
-        try:
-            with driver.session(database=self.db_name) as session:
-                if params:
-                    result = session.run(query, **params, **kwargs)
-                else:
-                    result = session.run(query, **kwargs)
-                for record in reversed(list(result)):
-                    data = record.data()
-                    if isinstance(data, dict):
-                        data = out_mask_json(data, mask=["embedding"])
-                    result_list.append(data)
-                session.close()
-        finally:
-            driver.close()
+        async with driver.session(
+            database=self.db_name,
+            default_access_mode=access_mode,
+        ) as session:
+            if params:
+                result = await session.run(query, **params, **kwargs)
+            else:
+                result = await session.run(query, **kwargs)
+            records = [record async for record in result]
+            for record in reversed(records):
+                data = record.data()
+                if isinstance(data, dict):
+                    data = out_mask_json(data, mask=["embedding"])
+                result_list.append(data)
         return result_list
 
     async def update(
@@ -126,7 +220,7 @@ class Neo4JAdapter(DatabaseAdapter):
                     "Use `Embedding` module before `UpdateKnowledge`. "
                     "Skipping update."
                 )
-                return
+                return []
 
             relation_properties = self.sanitize_properties(data_model.get_json())
             set_clauses = []
@@ -149,6 +243,7 @@ class Neo4JAdapter(DatabaseAdapter):
                         if set_statement
                         else "// No additional properties to set"
                     ),
+                    "RETURN s AS subj, properties(r) AS relation, o AS obj",
                 ]
             )
             params = {
@@ -159,7 +254,7 @@ class Neo4JAdapter(DatabaseAdapter):
                 "objVector": obj_vector,
                 **relation_properties,
             }
-            await self.query(query, params=params, read_only=False)
+            return await self.query(query, params=params, read_only=False)
         elif is_entity(data_model):
             node_label = self.sanitize_label(data_model.get("label"))
             vector = data_model.get("embedding")
@@ -170,7 +265,7 @@ class Neo4JAdapter(DatabaseAdapter):
                     "Make sure to use `Embedding` module before `UpdateKnowledge`. "
                     "Skipping update."
                 )
-                return
+                return []
 
             node_properties = self.sanitize_properties(data_model.get_json())
             set_clauses = []
@@ -191,6 +286,7 @@ class Neo4JAdapter(DatabaseAdapter):
                         if set_statement
                         else "// No additional properties to set"
                     ),
+                    "RETURN n AS node",
                 ]
             )
             params = {
@@ -199,58 +295,239 @@ class Neo4JAdapter(DatabaseAdapter):
                 "vector": vector,
                 **node_properties,
             }
-            await self.query(query, params=params, read_only=False)
+            return await self.query(query, params=params, read_only=False)
         else:
             raise ValueError(
                 "The parameter `data_model` must be an `Entity` or `Relation` instance"
             )
 
-    async def similarity_search(
+    async def bulk_update(
         self,
-        similarity_search,
-        k=10,
-        threshold=0.7,
+        data_models,
+        threshold=0.8,
+        batch_size=1000,
     ):
-        if not is_similarity_search(similarity_search):
-            raise ValueError(
-                "The `similarity_search` argument "
-                "should be a `SimilaritySearch` data model"
+        """Update the database with many entities and relations.
+
+        Entities are grouped by label and relations by type, then written
+        using parameterized `UNWIND $rows` queries of at most `batch_size` rows,
+        making the number of round-trips proportional to the number of batches
+        instead of the number of items. All the entities are written before
+        the relations, so relations can be aligned with the new entities.
+
+        Note that the alignment is performed against the entities already in
+        the database: identical entities within the same batch are
+        deduplicated, but entities that are only similar are not merged
+        together.
+
+        Args:
+            data_models (list): The list of entities and relations.
+            threshold (float): Similarity threshold for entity alignment.
+            batch_size (int): The maximum number of rows per query
+                (Default to 1000).
+
+        Returns:
+            (list): The written entities and relations.
+        """
+        entity_rows = {}
+        relation_rows = {}
+        skipped = 0
+        for data_model in data_models:
+            if is_relation(data_model):
+                subj = data_model.get_nested_entity("subj")
+                obj = data_model.get_nested_entity("obj")
+                subj_vector = subj.get("embedding")
+                obj_vector = obj.get("embedding")
+                if not subj_vector or not obj_vector:
+                    skipped += 1
+                    continue
+                relation_label = self.sanitize_label(data_model.get("label"))
+                subj_label = self.sanitize_label(subj.get("label"))
+                obj_label = self.sanitize_label(obj.get("label"))
+                relation_properties = self.sanitize_properties(data_model.get_json())
+                row = {
+                    "subjVector": subj_vector,
+                    "objVector": obj_vector,
+                    "properties": {
+                        k: v
+                        for k, v in relation_properties.items()
+                        if k not in ("subj", "obj")
+                    },
+                }
+                key = (relation_label, subj_label, obj_label)
+                relation_rows.setdefault(key, []).append(row)
+            elif is_entity(data_model):
+                vector = data_model.get("embedding")
+                if not vector:
+                    skipped += 1
+                    continue
+                node_label = self.sanitize_label(data_model.get("label"))
+                node_properties = self.sanitize_properties(data_model.get_json())
+                row_key = json.dumps(node_properties, sort_keys=True, default=str)
+                rows = entity_rows.setdefault(node_label, {})
+                rows.setdefault(
+                    row_key, {"vector": vector, "properties": node_properties}
+                )
+            else:
+                raise ValueError(
+                    "The parameter `data_models` must contain only "
+                    "`Entity` or `Relation` instances"
+                )
+        if skipped:
+            warnings.warn(
+                f"No embedding found for {skipped} entities or relations:"
+                " Entities and relations needs to be embedded. "
+                "Use `Embedding` module before `UpdateKnowledge`. "
+                "Skipping them."
             )
-        text = similarity_search.get("similarity_search")
-        entity_label = similarity_search.get("entity_label")
-        vector = (await self.embedding_model(texts=[text]))["embeddings"][0]
-        index_name = to_snake_case(self.sanitize_label(entity_label))
-        query = "\n".join(
+        records = []
+        for node_label, rows in entity_rows.items():
+            rows = list(rows.values())
+            query = self.get_bulk_entities_query(node_label)
+            for i in range(0, len(rows), batch_size):
+                params = {
+                    "indexName": to_snake_case(node_label),
+                    "threshold": threshold,
+                    "rows": rows[i : i + batch_size],
+                }
+                records.extend(await self.query(query, params=params, read_only=False))
+        for (relation_label, subj_label, obj_label), rows in relation_rows.items():
+            query = self.get_bulk_relations_query(relation_label)
+            for i in range(0, len(rows), batch_size):
+                params = {
+                    "subjIndexName": to_snake_case(subj_label),
+                    "objIndexName": to_snake_case(obj_label),
+                    "threshold": threshold,
+                    "rows": rows[i : i + batch_size],
+                }
+                records.extend(await self.query(query, params=params, read_only=False))
+        return records
+
+    def get_bulk_entities_query(self, node_label):
+        """Get the query creating a batch of entities
+
+        Args:
+            node_label (str): The sanitized label of the entities.
+
+        Returns:
+            (str): The Cypher query.
+        """
+        return "\n".join(
+            [
+                "UNWIND $rows AS row",
+                "CALL (row) {",
+                "    CALL db.index.vector.queryNodes($indexName, 1, row.vector)",
+                "    YIELD node, score",
+                "    WHERE score >= $threshold",
+                "    RETURN count(node) AS existing_count",
+                "}",
+                "WITH row, existing_count",
+                "WHERE existing_count = 0",
+                f"CREATE (n:{node_label})",
+                "SET n = row.properties",
+                "RETURN n AS node",
+            ]
+        )
+
+    def get_bulk_relations_query(self, relation_label):
+        """Get the query merging a batch of relations
+
+        Args:
+            relation_label (str): The sanitized label of the relations.
+
+        Returns:
+            (str): The Cypher query.
+        """
+        return "\n".join(
+            [
+                "UNWIND $rows AS row",
+                "CALL db.index.vector.queryNodes($subjIndexName, 1, row.subjVector)",
+                "YIELD node AS s, score AS subj_score",
+                "WHERE subj_score >= $threshold",
+                "CALL db.index.vector.queryNodes($objIndexName, 1, row.objVector)",
+                "YIELD node AS o, score AS obj_score",
+                "WHERE obj_score >= $threshold",
+                f"MERGE (s)-[r:{relation_label}]->(o)",
+                "SET r += row.properties",
+                "RETURN s AS subj, properties(r) AS relation, o AS obj",
+            ]
+        )
+
+    def _get_similarity_search_query(self):
+        return "\n".join(
             [
+                "UNWIND $searches AS search",
                 "CALL db.index.vector.queryNodes(",
-                " $indexName,",
+                " search.indexName,",
                 " $numberOfNearestNeighbours,",
-                " $vector) YIELD node AS node, score",
-                "WITH node, score",
+                " search.vector) YIELD node AS node, score",
+                "WITH search, node, score",
                 "WHERE score >= $threshold",
-                "RETURN node AS node, score",
-                "LIMIT $numberOfNearestNeighbours",
+                "RETURN search.searchId AS searchId, node AS node, score",
             ]
         )
+
+    async def similarity_search_many(
+        self,
+        similarity_searches,
+        k=10,
+        threshold=0.7,
+        max_concurrency=None,
+    ):
+        """Run many similarity searches in a single query.
+
+        The texts of all the searches are embedded with a single embedding
+        call, and the vector lookups are issued in a single Cypher statement.
+
+        Args:
+            similarity_searches (list): The `SimilaritySearch` data models.
+            k (int): Maximum number of similar entities to return per search.
+            threshold (float): Minimum similarity score for results.
+            max_concurrency (int): Unused, the searches are run by a single query.
+
+        Returns:
+            (list): The results of each search.
+        """
+        for similarity_search in similarity_searches:
+            if not is_similarity_search(similarity_search):
+                raise ValueError(
+                    "The `similarity_search` argument "
+                    "should be a `SimilaritySearch` data model"
+                )
+        texts = [search.get("similarity_search") for search in similarity_searches]
+        vectors = await self.embed_texts(texts)
+        searches = [
+            {
+                "searchId": i,
+                "indexName": to_snake_case(
+                    self.sanitize_label(similarity_search.get("entity_label"))
+                ),
+                "vector": vectors[text],
+            }
+            for i, (similarity_search, text) in enumerate(zip(similarity_searches, texts))
+        ]
         params = {
-            "indexName": index_name,
+            "searches": searches,
             "numberOfNearestNeighbours": k,
             "threshold": threshold,
-            "vector": vector,
         }
-        result = await self.query(query, params=params)
-        return result
+        results = [[] for _ in similarity_searches]
+        if not searches:
+            return results
+        for record in await self.query(
+            self._get_similarity_search_query(),
+            params=params,
+        ):
+            results[record.pop("searchId")].append(record)
+        return results
 
-    async def triplet_search(
+    async def _triplet_search(
         self,
         triplet_search,
+        vectors,
         k=10,
         threshold=0.7,
     ):
-        if not is_triplet_search(triplet_search):
-            raise ValueError(
-                "The `triplet_search` argument should be a `TripletSearch` data model"
-            )
         subject_label = triplet_search.get("subject_label")
         subject_label = self.sanitize_label(subject_label)
         subject_similarity_search = triplet_search.get("subject_similarity_search")
@@ -266,20 +543,12 @@ class Neo4JAdapter(DatabaseAdapter):
         }
         query_lines = []
 
-        has_subject_similarity = (
-            subject_similarity_search and subject_similarity_search != "?"
-        )
-        has_object_similarity = (
-            object_similarity_search and object_similarity_search != "?"
-        )
+        has_subject_similarity = self.has_similarity_search(subject_similarity_search)
+        has_object_similarity = self.has_similarity_search(object_similarity_search)
 
         if has_subject_similarity and has_object_similarity:
-            subject_vector = (
-                await self.embedding_model(texts=[subject_similarity_search])
-            )["embeddings"][0]
-            object_vector = (
-                await self.embedding_model(texts=[object_similarity_search])
-            )["embeddings"][0]
+            subject_vector = vectors[subject_similarity_search]
+            object_vector = vectors[object_similarity_search]
             params["subjVector"] = subject_vector
             params["objVector"] = object_vector
 
@@ -313,9 +582,7 @@ class Neo4JAdapter(DatabaseAdapter):
             query_lines.append(f"MATCH (subj)-[relation:{relation_label}]->(obj)")
             query_lines.append("WITH subj, subj_score, relation, obj, obj_score")
         elif has_subject_similarity:
-            subject_vector = (
-                await self.embedding_model(texts=[subject_similarity_search])
-            )["embeddings"][0]
+            subject_vector = vectors[subject_similarity_search]
             params["subjVector"] = subject_vector
 
             params["subjIndexName"] = to_snake_case(subject_label)
@@ -335,9 +602,7 @@ class Neo4JAdapter(DatabaseAdapter):
             query_lines.append("WITH subj, subj_score, relation, obj, 1.0 AS obj_score")
 
         elif has_object_similarity:
-            object_vector = (
-                await self.embedding_model(texts=[object_similarity_search])
-            )["embeddings"][0]
+            object_vector = vectors[object_similarity_search]
             params["objVector"] = object_vector
             params["objIndexName"] = to_snake_case(object_label)
             query_lines.append(
@@ -1,7 +1,10 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+import threading
 from typing import Literal
 from typing import Union
+from unittest.mock import AsyncMock
 from unittest.mock import patch
 
 import numpy as np
@@ -36,8 +39,9 @@ class IsPartOf(Relation):
 class Neo4JAdapterTest(testing.TestCase):
     @patch("litellm.aembedding")
     async def test_adapter(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(
             model="ollama/mxbai-embed-large",
@@ -53,10 +57,84 @@ class Neo4JAdapterTest(testing.TestCase):
 
         _ = await adapter.query("RETURN 1")
 
+    @patch("litellm.aembedding")
+    async def test_adapter_reuse_driver(self, mock_embedding):
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
+
+        embedding_model = EmbeddingModel(
+            model="ollama/mxbai-embed-large",
+        )
+
+        adapter = Neo4JAdapter(
+            uri="neo4j://localhost:7687",
+            embedding_model=embedding_model,
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+        )
+
+        _ = await adapter.query("RETURN 1")
+        driver = adapter.get_driver()
+        _ = await adapter.query("RETURN 1")
+        self.assertIs(adapter.get_driver(), driver)
+
+        await adapter.close()
+        self.assertIsNone(adapter._driver)
+
+    @patch("litellm.aembedding")
+    async def test_adapter_close_driver_of_previous_loop(self, mock_embedding):
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
+
+        embedding_model = EmbeddingModel(
+            model="ollama/mxbai-embed-large",
+        )
+
+        adapter = Neo4JAdapter(
+            uri="neo4j://localhost:7687",
+            embedding_model=embedding_model,
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            lazy=True,
+        )
+
+        async def get_driver():
+            return adapter.get_driver()
+
+        def run_on(loop, coro):
+            return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+        # Another event loop, running in another thread
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+        try:
+            other_driver = run_on(other_loop, get_driver())
+            with patch.object(other_driver, "close", new_callable=AsyncMock) as close:
+                driver = adapter.get_driver()
+                self.assertIsNot(driver, other_driver)
+                # The previous driver is closed on its own event loop
+                run_on(other_loop, asyncio.sleep(0))
+                close.assert_awaited_once()
+
+            other_driver = run_on(other_loop, get_driver())
+            with patch.object(other_driver, "close", new_callable=AsyncMock) as close:
+                await adapter.close()
+                self.assertIsNone(adapter._driver)
+                run_on(other_loop, asyncio.sleep(0))
+                close.assert_awaited_once()
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
     @patch("litellm.aembedding")
     async def test_adapter_update_entity(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(model="ollama/mxbai-embed-large")
 
@@ -90,8 +168,9 @@ class Neo4JAdapterTest(testing.TestCase):
 
     @patch("litellm.aembedding")
     async def test_adapter_update_relation(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(
             model="ollama/mxbai-embed-large",
@@ -135,10 +214,50 @@ class Neo4JAdapterTest(testing.TestCase):
 
         await adapter.update(embedded_rel)
 
+    @patch("litellm.aembedding")
+    async def test_adapter_bulk_update(self, mock_embedding):
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
+
+        embedding_model = EmbeddingModel(
+            model="ollama/mxbai-embed-large",
+        )
+
+        adapter = Neo4JAdapter(
+            uri="neo4j://localhost:7687",
+            embedding_model=embedding_model,
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            wipe_on_start=True,
+        )
+
+        docs = [Document(label="Document", text=f"test document {i}") for i in range(5)]
+        chunk = Chunk(label="Chunk", text="test chunk")
+        rel = IsPartOf(subj=docs[0], label="IsPartOf", obj=chunk)
+
+        inputs = Input(data_model=Document)
+        outputs = await Embedding(
+            embedding_model=embedding_model,
+            in_mask=["text"],
+        )(inputs)
+
+        program = Program(
+            inputs=inputs,
+            outputs=outputs,
+        )
+
+        embedded = [await program(doc) for doc in docs]
+        embedded.append(await program(chunk))
+        embedded.append(await program(rel))
+
+        await adapter.bulk_update(embedded, batch_size=2)
+
     @patch("litellm.aembedding")
     async def test_adapter_similarity_search(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(model="ollama/mxbai-embed-large")
 
@@ -193,8 +312,9 @@ class Neo4JAdapterTest(testing.TestCase):
     @patch("litellm.aembedding")
     async def test_adapter_triplet_search_basic(self, mock_embedding):
         """Test basic triplet search functionality"""
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(model="ollama/mxbai-embed-large")
 
@@ -253,8 +373,9 @@ class Neo4JAdapterTest(testing.TestCase):
     @patch("litellm.aembedding")
     async def test_adapter_triplet_search_with_similarity(self, mock_embedding):
         """Test triplet search with similarity queries"""
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(model="ollama/mxbai-embed-large")
 
@@ -305,8 +426,9 @@ class Neo4JAdapterTest(testing.TestCase):
     @patch("litellm.aembedding")
     async def test_adapter_triplet_search_with_object_similarity(self, mock_embedding):
         """Test triplet search with object similarity query"""
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(model="ollama/mxbai-embed-large")
 
@@ -357,8 +479,9 @@ class Neo4JAdapterTest(testing.TestCase):
     @patch("litellm.aembedding")
     async def test_adapter_triplet_search_with_both_similarities(self, mock_embedding):
         """Test triplet search with both subject and object similarity queries"""
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(model="ollama/mxbai-embed-large")
 
@@ -0,0 +1,249 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+
+import numpy as np
+
+# The number of vectors above which the searches are approximate
+ANN_THRESHOLD = 100_000
+
+# The number of rows processed at once when scoring or assigning vectors
+CHUNK_SIZE = 16_384
+
+
+class VectorIndex:
+    """In-process vector index over a contiguous float32 matrix.
+
+    The vectors are stored in a single float32 matrix, kept in memory or
+    memory-mapped from a file (so large indexes are loaded lazily by the OS
+    and shared between processes). The matrix grows by doubling its capacity.
+
+    Below `ann_threshold` vectors, the searches are exact (a single matrix
+    product). Above, an inverted file index (IVF) is trained with k-means:
+    each vector is assigned to its nearest centroid and only the vectors of
+    the `num_probes` clusters closest to the query are scored.
+
+    The scores follow the vector indexes of graph databases like Neo4j:
+    `(1 + cosine) / 2` for the `cosine` metric and `1 / (1 + distance²)`
+    for the `euclidean` metric, both between 0 and 1.
+
+    Args:
+        dim (int): The dimension of the vectors.
+        metric (str): The similarity metric (`cosine` or `euclidean`).
+            (Default to `cosine`).
+        path (str): Optional. The file storing the vectors, if None the
+            vectors are kept in memory (Default to None).
+        size (int): Optional. The number of vectors already stored in
+            the file (Default to 0).
+        ann_threshold (int): Optional. The number of vectors above which
+            the searches are approximate (Default to 100000).
+        num_probes (int): Optional. The number of clusters scored by the
+            approximate searches (Default to 1/16 of the clusters, at least 8).
+    """
+
+    def __init__(
+        self,
+        dim,
+        metric="cosine",
+        path=None,
+        size=0,
+        ann_threshold=ANN_THRESHOLD,
+        num_probes=None,
+    ):
+        if metric not in ("cosine", "euclidean"):
+            raise ValueError(
+                f"The `metric` should be `cosine` or `euclidean`. Received: {metric}"
+            )
+        self.dim = dim
+        self.metric = metric
+        self.path = path
+        self.size = size
+        self.ann_threshold = ann_threshold
+        self.num_probes = num_probes
+        self._vectors = None
+        self._centroids = None
+        self._assignments = None
+        self._trained_size = 0
+        self._reserve(max(size, 1024))
+
+    @property
+    def vectors(self):
+        """The stored vectors (normalized for the `cosine` metric)."""
+        return self._vectors[: self.size]
+
+    def _reserve(self, capacity):
+        if self._vectors is not None and len(self._vectors) >= capacity:
+            return
+        if self._vectors is not None:
+            capacity = max(capacity, 2 * len(self._vectors))
+        if self.path is None:
+            vectors = np.zeros((capacity, self.dim), dtype="float32")
+            if self._vectors is not None:
+                vectors[: self.size] = self._vectors[: self.size]
+            self._vectors = vectors
+            return
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+        row_size = self.dim * np.dtype("float32").itemsize
+        if os.path.exists(self.path):
+            capacity = max(capacity, os.path.getsize(self.path) // row_size)
+        with open(self.path, "ab") as f:
+            f.truncate(capacity * row_size)
+        self._vectors = np.memmap(
+            self.path,
+            dtype="float32",
+            mode="r+",
+            shape=(capacity, self.dim),
+        )
+
+    def _prepare(self, vectors):
+        vectors = np.asarray(vectors, dtype="float32")
+        if vectors.ndim == 1:
+            vectors = vectors[np.newaxis, :]
+        if vectors.shape[-1] != self.dim:
+            raise ValueError(
+                f"Expected vectors of dimension {self.dim}. "
+                f"Received vectors of shape {vectors.shape}"
+            )
+        if self.metric == "cosine":
+            norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+            vectors = vectors / np.maximum(norms, 1e-12)
+        return vectors
+
+    def add(self, vectors):
+        """Add vectors to the index.
+
+        Args:
+            vectors (np.ndarray | list): The vector or the batch of vectors.
+
+        Returns:
+            (np.ndarray): The ids (rows) of the added vectors.
+        """
+        vectors = self._prepare(vectors)
+        start = self.size
+        self._reserve(start + len(vectors))
+        self._vectors[start : start + len(vectors)] = vectors
+        self.size += len(vectors)
+        if self._centroids is not None:
+            self._assignments = np.concatenate([self._assignments, self._assign(vectors)])
+        return np.arange(start, self.size)
+
+    def flush(self):
+        """Write the memory-mapped vectors to the disk."""
+        if self.path is not None:
+            self._vectors.flush()
+
+    def close(self):
+        """Flush and release the memory-mapped file."""
+        self.flush()
+        self._vectors = None
+
+    def _score(self, vectors, queries):
+        """Returns the similarity scores of shape (len(vectors), len(queries))"""
+        products = vectors @ queries.T
+        if self.metric == "cosine":
+            return (1.0 + products) / 2.0
+        distances = (
+            np.einsum("ij,ij->i", vectors, vectors)[:, np.newaxis]
+            + np.einsum("ij,ij->i", queries, queries)[np.newaxis, :]
+            - 2.0 * products
+        )
+        return 1.0 / (1.0 + np.maximum(distances, 0.0))
+
+    def _assign(self, vectors):
+        """Returns the nearest centroid of each vector"""
+        assignments = []
+        for i in range(0, len(vectors), CHUNK_SIZE):
+            scores = self._score(vectors[i : i + CHUNK_SIZE], self._centroids)
+            assignments.append(np.argmax(scores, axis=-1))
+        if not assignments:
+            return np.zeros((0,), dtype="int64")
+        return np.concatenate(assignments)
+
+    def train(self, num_clusters=None, num_iterations=10, seed=0):
+        """Train the clusters of the approximate searches with k-means.
+
+        Args:
+            num_clusters (int): Optional. The number of clusters
+                (Default to the square root of the number of vectors).
+            num_iterations (int): Optional. The number of k-means iterations
+                (Default to 10).
+            seed (int): Optional. The random seed (Default to 0).
+        """
+        vectors = self.vectors
+        num_clusters = num_clusters or max(1, int(np.sqrt(self.size)))
+        num_clusters = min(num_clusters, self.size)
+        rng = np.random.default_rng(seed)
+        sample_size = min(self.size, 32 * num_clusters)
+        sample = np.asarray(
+            vectors[np.sort(rng.choice(self.size, sample_size, replace=False))]
+        )
+        self._centroids = sample[rng.choice(sample_size, num_clusters, replace=False)]
+        for _ in range(num_iterations):
+            assignments = self._assign(sample)
+            sums = np.zeros_like(self._centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=num_clusters)
+            non_empty = counts > 0
+            sums[non_empty] /= counts[non_empty, np.newaxis]
+            # Keep the previous centroid of the empty clusters
+            sums[~non_empty] = self._centroids[~non_empty]
+            self._centroids = self._prepare(sums) if self.metric == "cosine" else sums
+        self._assignments = self._assign(vectors)
+        self._trained_size = self.size
+
+    def _get_candidates(self, query):
+        num_clusters = len(self._centroids)
+        num_probes = self.num_probes or max(8, num_clusters // 16)
+        num_probes = min(num_probes, num_clusters)
+        scores = self._score(self._centroids, query[np.newaxis, :])[:, 0]
+        probes = np.argpartition(-scores, num_probes - 1)[:num_probes]
+        probed = np.zeros((num_clusters,), dtype=bool)
+        probed[probes] = True
+        return np.flatnonzero(probed[self._assignments])
+
+    def search(self, queries, k=10, threshold=None):
+        """Search the nearest neighbours of a batch of queries.
+
+        Args:
+            queries (np.ndarray | list): The query vector or batch of vectors.
+            k (int): The maximum number of neighbours per query (Default to 10).
+            threshold (float): Optional. The minimum score of the neighbours
+                (Default to None).
+
+        Returns:
+            (list): For each query, a tuple of the ids and the scores of its
+                neighbours, sorted by decreasing score.
+        """
+        queries = self._prepare(queries)
+        if self.size == 0 or k <= 0:
+            empty = (np.zeros((0,), dtype="int64"), np.zeros((0,), dtype="float32"))
+            return [empty for _ in queries]
+        if self.size >= self.ann_threshold:
+            if self._centroids is None or self.size > 2 * self._trained_size:
+                self.train()
+            results = []
+            for query in queries:
+                candidates = self._get_candidates(query)
+                scores = self._score(self.vectors[candidates], query[np.newaxis, :])
+                results.append(self._top_k(candidates, scores[:, 0], k, threshold))
+            return results
+        scores = np.concatenate(
+            [
+                self._score(self.vectors[i : i + CHUNK_SIZE], queries)
+                for i in range(0, self.size, CHUNK_SIZE)
+            ]
+        )
+        ids = np.arange(self.size)
+        return [self._top_k(ids, scores[:, j], k, threshold) for j in range(len(queries))]
+
+    def _top_k(self, ids, scores, k, threshold):
+        if threshold is not None:
+            mask = scores >= threshold
+            ids, scores = ids[mask], scores[mask]
+        if len(scores) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            ids, scores = ids[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+        return ids[order], scores[order]
@@ -0,0 +1,93 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from synalinks.src import testing
+from synalinks.src.knowledge_bases.database_adapters.vector_index import VectorIndex
+
+
+class VectorIndexTest(testing.TestCase):
+    def test_exact_search_cosine(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(100, 16))
+        index = VectorIndex(16, metric="cosine")
+        ids = index.add(vectors)
+        self.assertEqual(ids.tolist(), list(range(100)))
+
+        ids, scores = index.search(vectors[42], k=3)[0]
+        self.assertEqual(ids[0], 42)
+        np.testing.assert_allclose(scores[0], 1.0, atol=1e-5)
+        self.assertTrue(np.all(np.diff(scores) <= 0))
+
+        normalized = vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+        expected = (1.0 + normalized @ normalized[7]) / 2.0
+        ids, scores = index.search(vectors[7], k=100)[0]
+        np.testing.assert_allclose(scores, expected[ids], atol=1e-5)
+
+    def test_exact_search_euclidean(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(100, 16))
+        index = VectorIndex(16, metric="euclidean")
+        index.add(vectors)
+        ids, scores = index.search(vectors[3] + 0.01, k=1)[0]
+        self.assertEqual(ids.tolist(), [3])
+        expected = 1.0 / (1.0 + 16 * 0.01**2)
+        np.testing.assert_allclose(scores[0], expected, atol=1e-4)
+
+    def test_threshold(self):
+        index = VectorIndex(2)
+        index.add([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]])
+        ids, scores = index.search([1.0, 0.0], k=3, threshold=0.5)[0]
+        self.assertEqual(ids.tolist(), [0, 1])
+        np.testing.assert_allclose(scores, [1.0, 0.5])
+
+    def test_memory_mapped_storage(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(3000, 8))
+        with tempfile.TemporaryDirectory() as path:
+            path = os.path.join(path, "vectors.f32")
+            index = VectorIndex(8, path=path)
+            # Grows beyond the initial capacity
+            index.add(vectors[:1000])
+            index.add(vectors[1000:])
+            index.flush()
+            self.assertIsInstance(index.vectors, np.memmap)
+
+            index = VectorIndex(8, path=path, size=3000)
+            ids, _ = index.search(vectors[2500], k=1)[0]
+            self.assertEqual(ids.tolist(), [2500])
+            index.close()
+
+    def test_approximate_search(self):
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(200, 32))
+        vectors = centers[rng.integers(200, size=20000)] + 0.3 * rng.normal(
+            size=(20000, 32)
+        )
+        queries = vectors[rng.choice(20000, 50, replace=False)] + 0.05
+
+        exact_index = VectorIndex(32, ann_threshold=10**9)
+        exact_index.add(vectors)
+        ann_index = VectorIndex(32, ann_threshold=10000)
+        ann_index.add(vectors)
+        ann_index.train()
+
+        start = time.perf_counter()
+        exact_results = exact_index.search(queries, k=10)
+        exact_time = time.perf_counter() - start
+        start = time.perf_counter()
+        ann_results = ann_index.search(queries, k=10)
+        ann_time = time.perf_counter() - start
+
+        recall = np.mean(
+            [
+                len(set(exact_ids) & set(ann_ids)) / 10
+                for (exact_ids, _), (ann_ids, _) in zip(exact_results, ann_results)
+            ]
+        )
+        self.assertGreater(recall, 0.9)
+        self.assertLess(ann_time, 10 * exact_time + 0.5)
@@ -1,11 +1,19 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import hashlib
+import json
 from typing import Any
 from typing import Dict
 
 from synalinks.src.api_export import synalinks_export
+from synalinks.src.backend import SimilaritySearch
+from synalinks.src.backend import TripletSearch
 from synalinks.src.backend import is_symbolic_data_model
+from synalinks.src.backend.common.json_utils import copy_json
 from synalinks.src.knowledge_bases import database_adapters
+from synalinks.src.knowledge_bases.lexical_index import LexicalIndex
+from synalinks.src.knowledge_bases.lexical_index import reciprocal_rank_fusion
+from synalinks.src.knowledge_bases.search_cache import SearchCache
 from synalinks.src.saving import serialization_lib
 from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
 
@@ -38,6 +46,7 @@ class KnowledgeBase(SynalinksSaveable):
     os.environ["NEO4J_DATABASE"] = "your-neo4j-db" # (Default to "neo4j")
     os.environ["NEO4J_USERNAME"] = "your-neo4j-username" # (Default to "neo4j")
     os.environ["NEO4J_PASSWORD"] = "your-neo4j-password" # (Default to "neo4j")
+    os.environ["NEO4J_MAX_CONNECTION_POOL_SIZE"] = "50" # (Default to "100")
 
     knowledge_base = synalinks.KnowledgeBase(
         uri="neo4j://localhost:7687",
@@ -70,6 +79,105 @@ class KnowledgeBase(SynalinksSaveable):
 
     Learn more about MemGraph in their documentation **[here](https://memgraph.com/docs)**
 
+    ### Using the embedded local knowledge base
+
+    The local knowledge base runs in the Python process, without any database
+    server. The knowledge is persisted in the given directory (use
+    `local://:memory:` to keep it in memory only). Cypher queries are not
+    supported, but the similarity and triplet searches are.
+
+    ```python
+    knowledge_base = synalinks.KnowledgeBase(
+        uri="local://./knowledge_base",
+        entity_models=[Document, Chunk],
+        relation_models=[IsPartOf],
+        embedding_model=embedding_model,
+        metric="cosine",
+        wipe_on_start=False,
+    )
+    ```
+
+    ### Creating the knowledge base asynchronously
+
+    By default, the constructor probes the embedding dimension and creates the
+    vector indexes, blocking until it is done. Inside a running event loop, use
+    `create()` instead, or `lazy=True` to initialize the knowledge base on
+    first use. Providing the `embedding_dim` skips the embedding call used to
+    probe it.
+
+    ```python
+    knowledge_base = await synalinks.KnowledgeBase.create(
+        uri="neo4j://localhost:7687",
+        entity_models=[Document, Chunk],
+        relation_models=[IsPartOf],
+        embedding_model=embedding_model,
+        embedding_dim=1024,
+    )
+    ```
+
+    ### Hybrid lexical and vector searches
+
+    With `lexical_index`, a BM25 inverted index of the entities and relations
+    is maintained in the Python process alongside the knowledge base (kept in
+    memory with `True`, or persisted in the given file). The searches can then
+    use `search_type="lexical"`, answered without any embedding call and
+    matching exact identifiers, or `search_type="hybrid"`, fusing the lexical
+    and vector results with the reciprocal rank fusion.
+
+    ```python
+    knowledge_base = synalinks.KnowledgeBase(
+        uri="neo4j://localhost:7687",
+        entity_models=[Document, Chunk],
+        relation_models=[IsPartOf],
+        embedding_model=embedding_model,
+        lexical_index="./lexical_index.jsonl",
+    )
+    ```
+
+    Only the knowledge written with `update()` or `update_many()` (e.g. with
+    the `UpdateKnowledge` module) is indexed, without the entities merged
+    into existing ones and the entities and relations skipped by the
+    database.
+
+    ### Caching the search results
+
+    The retrievers often run the same searches again and again (e.g. when
+    evaluating or training a program with a deterministic query generator).
+    With `cache`, the results of the similarity and triplet searches are kept
+    in memory and returned without any embedding call or database query until
+    the next `update()` or `update_many()`.
+
+    ```python
+    knowledge_base = synalinks.KnowledgeBase(
+        uri="neo4j://localhost:7687",
+        entity_models=[Document, Chunk],
+        relation_models=[IsPartOf],
+        embedding_model=embedding_model,
+        cache=10000,  # or True for the default size
+    )
+
+    print(knowledge_base.cache.hits, knowledge_base.cache.misses)
+    ```
+
+    **Note**: The writes made with `query()` are not tracked, use
+    `knowledge_base.cache.invalidate()` after them.
+
+    ### Releasing the connections
+
+    The graph database adapters keep a pool of connections open for the lifetime
+    of the knowledge base. Use `close()` or the async context manager to
+    release them when you are done.
+
+    ```python
+    async with synalinks.KnowledgeBase(
+        uri="neo4j://localhost:7687",
+        entity_models=[Document, Chunk],
+        relation_models=[IsPartOf],
+        embedding_model=embedding_model,
+    ) as knowledge_base:
+        ...
+    ```
+
     **Note**: Obviously, use an `.env` file and `.gitignore` to avoid putting
     your username and password in the code or a config file that can lead to
     leackage when pushing it into repositories.
@@ -82,6 +190,16 @@ class KnowledgeBase(SynalinksSaveable):
         metric (str): The metric to use for the vector index (`cosine` or `euclidean`).
         wipe_on_start (bool): Wether or not to wipe the graph database at start
             (Default to False).
+        embedding_dim (int): Optional. The dimension of the embeddings, if None
+            it is probed with an embedding call (Default to None).
+        lazy (bool): Optional. If True, the knowledge base is initialized on
+            first use instead of in the constructor (Default to False).
+        lexical_index (bool | str): Optional. Whether or not to maintain a
+            BM25 index for the lexical and hybrid searches, if a string the
+            file persisting it (Default to False).
+        cache (bool | int): Optional. Whether or not to cache the search
+            results, if an integer the maximum number of cached results
+            (Default to False).
     """
 
     def __init__(
@@ -92,6 +210,10 @@ class KnowledgeBase(SynalinksSaveable):
         embedding_model=None,
         metric="cosine",
         wipe_on_start=False,
+        embedding_dim=None,
+        lazy=False,
+        lexical_index=False,
+        cache=False,
     ):
         self.adapter = database_adapters.get(uri)(
             uri=uri,
@@ -100,6 +222,8 @@ class KnowledgeBase(SynalinksSaveable):
             embedding_model=embedding_model,
             metric=metric,
             wipe_on_start=wipe_on_start,
+            embedding_dim=embedding_dim,
+            lazy=lazy,
         )
         self.uri = uri
         self.entity_models = entity_models
@@ -107,6 +231,48 @@ class KnowledgeBase(SynalinksSaveable):
         self.embedding_model = embedding_model
         self.metric = metric
         self.wipe_on_start = wipe_on_start
+        self.lexical_index = lexical_index
+        self._lexical_index = None
+        if lexical_index:
+            self._lexical_index = LexicalIndex(
+                path=lexical_index if isinstance(lexical_index, str) else None
+            )
+            if wipe_on_start:
+                self._lexical_index.clear()
+        if cache is None or cache is False:
+            self.cache = None
+        elif cache is True:
+            self.cache = SearchCache()
+        elif isinstance(cache, int):
+            self.cache = SearchCache(max_entries=cache)
+        else:
+            raise ValueError(
+                "The `cache` argument should be a boolean or an integer, "
+                f"received: {cache}"
+            )
+
+    @classmethod
+    async def create(cls, **kwargs):
+        """Create and initialize a knowledge base without blocking the event loop.
+
+        Args:
+            **kwargs (keyword arguments): The arguments of the constructor.
+
+        Returns:
+            (KnowledgeBase): The initialized knowledge base.
+        """
+        kwargs["lazy"] = True
+        knowledge_base = cls(**kwargs)
+        await knowledge_base.initialize()
+        return knowledge_base
+
+    async def initialize(self):
+        """Initialize the knowledge base (if not already done).
+
+        Probes the embedding dimension (unless `embedding_dim` is provided),
+        wipes the database (if `wipe_on_start`) and creates the vector indexes.
+        """
+        await self.adapter.initialize()
 
     async def update(
         self,
@@ -127,8 +293,53 @@ class KnowledgeBase(SynalinksSaveable):
             threshold (float): Similarity threshold for entity alignment.
                 Entities with similarity above this threshold will be merged.
                 Should be between 0.0 and 1.0 (Defaults to 0.8).
+
+        Returns:
+            (list): The written entities and relations.
         """
-        return await self.adapter.update(data_model)
+        await self.adapter.initialize()
+        try:
+            result = await self.adapter.update(data_model, threshold=threshold)
+            self._update_lexical_index(result)
+        finally:
+            self._invalidate_cache()
+        return result
+
+    async def update_many(
+        self,
+        data_models,
+        threshold=0.8,
+        batch_size=1000,
+    ):
+        """Update the knowledge base with many entities and relations at once.
+
+        Entities are grouped by label and relations by type and written in
+        batches, which is much faster than calling `update()` for each of them.
+
+        Args:
+            data_models (list): The list of entities and relations
+                (`JsonDataModel` or `DataModel`) to add or update in the
+                knowledge base.
+            threshold (float): Similarity threshold for entity alignment.
+                Entities with similarity above this threshold will be merged.
+                Should be between 0.0 and 1.0 (Defaults to 0.8).
+            batch_size (int): The maximum number of entities or relations
+                written per query (Defaults to 1000).
+
+        Returns:
+            (list): The written entities and relations.
+        """
+        await self.adapter.initialize()
+        try:
+            result = await self.adapter.bulk_update(
+                data_models,
+                threshold=threshold,
+                batch_size=batch_size,
+            )
+            self._update_lexical_index(result)
+        finally:
+            self._invalidate_cache()
+        return result
 
     async def query(self, query: str, params: Dict[str, Any] = None, **kwargs):
         """Execute a query against the knowledge base.
@@ -140,6 +351,7 @@ class KnowledgeBase(SynalinksSaveable):
         Returns:
             (GenericResult): the query results
         """
+        await self.adapter.initialize()
         return await self.adapter.query(query, params=params, **kwargs)
 
     async def similarity_search(
@@ -147,6 +359,7 @@ class KnowledgeBase(SynalinksSaveable):
         similarity_search,
         k=10,
         threshold=0.8,
+        search_type="vector",
     ):
         """Perform similarity search to find entities similar to the given text.
 
@@ -160,18 +373,93 @@ class KnowledgeBase(SynalinksSaveable):
             threshold (float): Minimum similarity score for results.
                 Entities with similarity below this threshold are excluded.
                 Should be between 0.0 and 1.0 (Defaults to 0.8).
+            search_type (str): The type of search, `vector`, `lexical` (BM25,
+                without embedding call) or `hybrid` (both fused with the
+                reciprocal rank fusion). The lexical and hybrid searches
+                require the `lexical_index` (Default to `vector`).
         """
-        return await self.adapter.similarity_search(
-            similarity_search,
+        results = await self.similarity_search_many(
+            [similarity_search],
             k=k,
             threshold=threshold,
+            search_type=search_type,
         )
+        return results[0]
+
+    async def similarity_search_many(
+        self,
+        similarity_searches,
+        k=10,
+        threshold=0.8,
+        max_concurrency=None,
+        search_type="vector",
+    ):
+        """Perform many similarity searches at once.
+
+        The texts of all the searches are embedded with a single embedding call
+        and, for the graph databases, looked up with a single query.
+
+        Args:
+            similarity_searches (list): The `SimilaritySearch` data models.
+            k (int): Maximum number of similar entities to return per search.
+                Defaults to 10.
+            threshold (float): Minimum similarity score for results.
+                Should be between 0.0 and 1.0 (Defaults to 0.8).
+            max_concurrency (int): Optional. The maximum number of searches
+                running at once, when they are not batched in a single query
+                (Default to None, all at once).
+            search_type (str): The type of search, `vector`, `lexical` or
+                `hybrid` (Default to `vector`).
+
+        Returns:
+            (list): The results of each search.
+        """
+        self._check_search_type(search_type)
+        await self.adapter.initialize()
+        return await self._cached_search(
+            self._similarity_search_many,
+            similarity_searches,
+            SimilaritySearch,
+            k=k,
+            threshold=threshold,
+            max_concurrency=max_concurrency,
+            search_type=search_type,
+        )
+
+    async def _similarity_search_many(
+        self,
+        similarity_searches,
+        k=10,
+        threshold=0.8,
+        max_concurrency=None,
+        search_type="vector",
+    ):
+        if search_type != "lexical":
+            vector_results = await self.adapter.similarity_search_many(
+                similarity_searches,
+                k=k,
+                threshold=threshold,
+                max_concurrency=max_concurrency,
+            )
+            if search_type == "vector":
+                return vector_results
+        lexical_results = [
+            self._lexical_similarity_search(similarity_search, k=k)
+            for similarity_search in similarity_searches
+        ]
+        if search_type == "lexical":
+            return lexical_results
+        return [
+            self._fuse_results(results, k=k)
+            for results in zip(vector_results, lexical_results)
+        ]
 
     async def triplet_search(
         self,
         triplet_search,
         k=10,
         threshold=0.8,
+        search_type="vector",
     ):
         """Search for triplets in the knowledge graph.
 
@@ -185,18 +473,282 @@ class KnowledgeBase(SynalinksSaveable):
             threshold (float, optional): Minimum similarity score for triplet matches.
                 Triplets with similarity below this threshold are excluded.
                 Should be between 0.0 and 1.0. (Defaults to 0.8).
+            search_type (str): The type of search, `vector`, `lexical` (BM25,
+                without embedding call) or `hybrid` (both fused with the
+                reciprocal rank fusion). The lexical and hybrid searches
+                require the `lexical_index` (Default to `vector`).
+        """
+        results = await self.triplet_search_many(
+            [triplet_search],
+            k=k,
+            threshold=threshold,
+            search_type=search_type,
+        )
+        return results[0]
+
+    async def triplet_search_many(
+        self,
+        triplet_searches,
+        k=10,
+        threshold=0.8,
+        max_concurrency=None,
+        search_type="vector",
+    ):
+        """Perform many triplet searches at once.
+
+        The similarity queries of all the searches are embedded with a single
+        embedding call, then the searches run concurrently.
+
+        The triplet searches without similarity query (only `?`) don't need
+        any embedding call, so they always use the vector search.
+
+        Args:
+            triplet_searches (list): The `TripletSearch` data models.
+            k (int): Maximum number of matching triplets to return per search.
+                (Defaults to 10).
+            threshold (float, optional): Minimum similarity score for triplet matches.
+                Should be between 0.0 and 1.0. (Defaults to 0.8).
+            max_concurrency (int): Optional. The maximum number of searches
+                running at once (Default to None, all at once).
+            search_type (str): The type of search, `vector`, `lexical` or
+                `hybrid` (Default to `vector`).
+
+        Returns:
+            (list): The results of each search.
         """
-        return await self.adapter.triplet_search(
-            triplet_search,
+        self._check_search_type(search_type)
+        await self.adapter.initialize()
+        return await self._cached_search(
+            self._triplet_search_many,
+            triplet_searches,
+            TripletSearch,
             k=k,
             threshold=threshold,
+            max_concurrency=max_concurrency,
+            search_type=search_type,
+        )
+
+    async def _triplet_search_many(
+        self,
+        triplet_searches,
+        k=10,
+        threshold=0.8,
+        max_concurrency=None,
+        search_type="vector",
+    ):
+        if search_type == "vector":
+            return await self.adapter.triplet_search_many(
+                triplet_searches,
+                k=k,
+                threshold=threshold,
+                max_concurrency=max_concurrency,
+            )
+        queries = [self._get_triplet_query(search) for search in triplet_searches]
+        vector_searches = [
+            search
+            for search, query in zip(triplet_searches, queries)
+            if search_type == "hybrid" or not query
+        ]
+        vector_results = iter(
+            await self.adapter.triplet_search_many(
+                vector_searches,
+                k=k,
+                threshold=threshold,
+                max_concurrency=max_concurrency,
+            )
+            if vector_searches
+            else []
         )
+        results = []
+        for triplet_search, query in zip(triplet_searches, queries):
+            if not query:
+                results.append(next(vector_results))
+                continue
+            lexical_results = self._lexical_triplet_search(triplet_search, query, k=k)
+            if search_type == "lexical":
+                results.append(lexical_results)
+            else:
+                results.append(
+                    self._fuse_results([next(vector_results), lexical_results], k=k)
+                )
+        return results
+
+    def _invalidate_cache(self):
+        # Bumped after the write, so the searches that ran during it are not cached
+        if self.cache is not None:
+            self.cache.invalidate()
+
+    async def _cached_search(self, search_fn, searches, search_model, **kwargs):
+        """Run the searches that are not in the cache and cache their results"""
+        if self.cache is None:
+            return await search_fn(searches, **kwargs)
+        generation = self.cache.generation
+        # Only the fields of the search are part of the key, not the other
+        # fields of the data model (e.g. the thinking of the retrievers)
+        fields = list(search_model.model_fields)
+        keys = [
+            self.cache.get_key(
+                search={field: search.get(field) for field in fields},
+                k=kwargs.get("k"),
+                threshold=kwargs.get("threshold"),
+                search_type=kwargs.get("search_type"),
+            )
+            for search in searches
+        ]
+        results = [self.cache.get(key) for key in keys]
+        # The identical searches missing from the cache run only once
+        missing = {}
+        for search, key, result in zip(searches, keys, results):
+            if result is None:
+                missing.setdefault(key, search)
+        if missing:
+            missing_results = await search_fn(list(missing.values()), **kwargs)
+            missing_results = dict(zip(missing.keys(), missing_results))
+            for key, result in missing_results.items():
+                self.cache.put(key, result, generation)
+            results = [
+                result if result is not None else copy_json(missing_results[key])
+                for key, result in zip(keys, results)
+            ]
+        return results
+
+    def _check_search_type(self, search_type):
+        if search_type not in ("vector", "lexical", "hybrid"):
+            raise ValueError(
+                "The `search_type` argument should be `vector`, `lexical` "
+                f"or `hybrid`. Received: {search_type}"
+            )
+        if search_type != "vector" and self._lexical_index is None:
+            raise ValueError(
+                f"The `{search_type}` searches require the `lexical_index` "
+                "argument of the knowledge base"
+            )
+
+    def _get_properties(self, json, exclude=("embedding",)):
+        """The properties as stored by the database adapters"""
+        properties = self.adapter.sanitize_properties(json)
+        return {key: value for key, value in properties.items() if key not in exclude}
+
+    def _get_text(self, properties):
+        texts = []
+        for key, value in properties.items():
+            if key == "label":
+                continue
+            if isinstance(value, str):
+                texts.append(value)
+            elif isinstance(value, list):
+                texts.extend(str(item) for item in value)
+        return " ".join(texts)
+
+    def _get_key(self, *values):
+        return hashlib.sha1(
+            json.dumps(values, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _update_lexical_index(self, records):
+        """Index the entities and relations written by the database adapter"""
+        if self._lexical_index is None or not records:
+            return
+        lexical_records = []
+        for record in records:
+            if "node" in record:
+                document = self._get_properties(record["node"])
+                labels = [self.adapter.sanitize_label(document.get("label"))]
+                text = self._get_text(document)
+            else:
+                subj = self._get_properties(record["subj"])
+                obj = self._get_properties(record["obj"])
+                properties = self._get_properties(record["relation"])
+                document = {"subj": subj, "relation": properties, "obj": obj}
+                labels = [
+                    self.adapter.sanitize_label(subj.get("label")),
+                    self.adapter.sanitize_label(properties.get("label")),
+                    self.adapter.sanitize_label(obj.get("label")),
+                ]
+                text = " ".join(
+                    [
+                        self._get_text(subj),
+                        self._get_text(properties),
+                        self._get_text(obj),
+                    ]
+                )
+            lexical_records.append(
+                {
+                    "key": self._get_key(labels, document),
+                    "text": text,
+                    "labels": labels,
+                    "document": document,
+                }
+            )
+        self._lexical_index.add(lexical_records)
+
+    def _lexical_similarity_search(self, similarity_search, k=10):
+        label = self.adapter.sanitize_label(similarity_search.get("entity_label"))
+        matches = self._lexical_index.search(
+            similarity_search.get("similarity_search"),
+            k=k,
+            labels=(label or None,),
+        )
+        # Same order as the database adapters (most similar last)
+        return [
+            {"node": copy_json(node), "score": score}
+            for _, node, score in reversed(matches)
+        ]
+
+    def _get_triplet_query(self, triplet_search):
+        texts = []
+        for key in ("subject_similarity_search", "object_similarity_search"):
+            text = triplet_search.get(key)
+            if self.adapter.has_similarity_search(text):
+                texts.append(text)
+        return " ".join(texts)
+
+    def _lexical_triplet_search(self, triplet_search, query, k=10):
+        labels = tuple(
+            self.adapter.sanitize_label(triplet_search.get(key)) or None
+            for key in ("subject_label", "relation_label", "object_label")
+        )
+        matches = self._lexical_index.search(query, k=k, labels=labels)
+        return [
+            {**copy_json(triplet), "score": score}
+            for _, triplet, score in reversed(matches)
+        ]
+
+    def _fuse_results(self, results, k=10):
+        """Fuse the results of several searches with the reciprocal rank fusion"""
+        rankings = []
+        for result in results:
+            ranking = []
+            # The results are sorted with the most similar last
+            for item in reversed(result):
+                item = {key: value for key, value in item.items() if key != "score"}
+                ranking.append((self._get_key(item), item))
+            rankings.append(ranking)
+        fused = reciprocal_rank_fusion(rankings, k=k)
+        return [{**item, "score": score} for item, score in reversed(fused)]
+
+    async def close(self):
+        """Close the connections to the underlying database.
+
+        The knowledge base can still be used after being closed,
+        the connections will be re-opened on the next query.
+        """
+        await self.adapter.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
 
     def get_config(self):
         config = {
             "uri": self.uri,
             "metric": self.metric,
             "wipe_on_start": self.wipe_on_start,
+            "embedding_dim": self.adapter.embedding_dim,
+            "lexical_index": self.lexical_index,
+            "cache": self.cache.max_entries if self.cache is not None else False,
         }
         entity_models_config = {
             "entity_models": [
@@ -1,5 +1,8 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import os
+import tempfile
+import zlib
 from typing import Literal
 from unittest.mock import patch
 
@@ -8,8 +11,13 @@ import numpy as np
 from synalinks.src import testing
 from synalinks.src.backend import Entity
 from synalinks.src.backend import Relation
+from synalinks.src.backend import SimilaritySearch
+from synalinks.src.backend import TripletSearch
 from synalinks.src.embedding_models import EmbeddingModel
 from synalinks.src.knowledge_bases import KnowledgeBase
+from synalinks.src.modules import Embedding
+from synalinks.src.modules import Input
+from synalinks.src.programs import Program
 
 
 class Document(Entity):
@@ -28,6 +36,41 @@ class IsPartOf(Relation):
     obj: Document
 
 
+class TripletSearchWithThinking(TripletSearch):
+    thinking: str
+
+
+def mock_embedding_fn(**kwargs):
+    embeddings = []
+    for text in kwargs["input"]:
+        rng = np.random.default_rng(zlib.crc32(text.encode()))
+        embeddings.append({"embedding": rng.normal(size=(16,)).tolist()})
+    return {"data": embeddings}
+
+
+async def add_knowledge(knowledge_base):
+    inputs = Input(data_model=Document)
+    outputs = await Embedding(
+        embedding_model=knowledge_base.embedding_model,
+        in_mask=["text"],
+    )(inputs)
+    program = Program(inputs=inputs, outputs=outputs)
+    documents = [
+        Document(label="Document", text=text)
+        for text in [
+            "Invoice INV-2024-0042 of the cat food",
+            "The cat sat on the mat",
+            "Stock markets fell sharply today",
+        ]
+    ]
+    chunk = Chunk(label="Chunk", text="The cat sat")
+    relation = IsPartOf(subj=chunk, label="IsPartOf", obj=documents[1])
+    data_models = await program.predict(
+        np.array(documents + [chunk, relation], dtype="object")
+    )
+    await knowledge_base.update_many(list(data_models), threshold=0.99)
+
+
 class KnowledgeBaseTest(testing.TestCase):
     @patch("litellm.aembedding")
     async def test_knowledge_base(self, mock_embedding):
@@ -73,3 +116,325 @@ class KnowledgeBaseTest(testing.TestCase):
             cloned_knowledge_base.get_config(),
             knowledge_base.get_config(),
         )
+
+    @patch("litellm.aembedding")
+    async def test_create(self, mock_embedding):
+        mock_embedding.return_value = {"data": [{"embedding": np.random.rand(16)}]}
+
+        knowledge_base = await KnowledgeBase.create(
+            uri="local://:memory:",
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+        )
+        self.assertTrue(knowledge_base.adapter._initialized)
+        self.assertEqual(knowledge_base.adapter.embedding_dim, 16)
+        self.assertEqual(knowledge_base.get_config()["embedding_dim"], 16)
+
+    @patch("litellm.aembedding")
+    async def test_embedding_dim_skips_probe(self, mock_embedding):
+        knowledge_base = await KnowledgeBase.create(
+            uri="local://:memory:",
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+            embedding_dim=16,
+        )
+        self.assertTrue(knowledge_base.adapter._initialized)
+        mock_embedding.assert_not_called()
+
+    @patch("litellm.aembedding")
+    async def test_embedding_dim_is_probed_once(self, mock_embedding):
+        mock_embedding.return_value = {"data": [{"embedding": np.random.rand(16)}]}
+
+        for _ in range(3):
+            _ = await KnowledgeBase.create(
+                uri="local://:memory:",
+                entity_models=[Document, Chunk],
+                relation_models=[IsPartOf],
+                embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+            )
+        self.assertEqual(mock_embedding.call_count, 1)
+
+    @patch("litellm.aembedding")
+    async def test_lazy_initialization(self, mock_embedding):
+        mock_embedding.return_value = {"data": [{"embedding": np.random.rand(16)}]}
+
+        knowledge_base = KnowledgeBase(
+            uri="local://:memory:",
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+            lazy=True,
+        )
+        self.assertFalse(knowledge_base.adapter._initialized)
+        self.assertIsNone(knowledge_base.adapter.embedding_dim)
+        mock_embedding.assert_not_called()
+
+        search = SimilaritySearch(
+            entity_label="Document",
+            similarity_search="test",
+        ).to_json_data_model()
+        result = await knowledge_base.similarity_search(search)
+        self.assertEqual(result, [])
+        self.assertTrue(knowledge_base.adapter._initialized)
+        self.assertEqual(knowledge_base.adapter.embedding_dim, 16)
+
+    @patch("litellm.aembedding")
+    async def test_lexical_search(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        knowledge_base = await KnowledgeBase.create(
+            uri="local://:memory:",
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+            embedding_dim=16,
+            lexical_index=True,
+        )
+        await add_knowledge(knowledge_base)
+        mock_embedding.reset_mock()
+
+        search = SimilaritySearch(
+            entity_label="Document",
+            similarity_search="INV-2024-0042",
+        ).to_json_data_model()
+        result = await knowledge_base.similarity_search(search, search_type="lexical")
+        self.assertEqual(len(result), 1)
+        self.assertEqual(
+            result[0]["node"]["text"], "Invoice INV-2024-0042 of the cat food"
+        )
+        mock_embedding.assert_not_called()
+
+        search = SimilaritySearch(
+            entity_label="*",
+            similarity_search="cat",
+        ).to_json_data_model()
+        result = await knowledge_base.similarity_search(search, search_type="lexical")
+        self.assertEqual(len(result), 3)
+        # Same order as the vector searches (most similar last)
+        self.assertEqual(result[-1]["node"]["text"], "The cat sat")
+
+        triplet_search = TripletSearch(
+            subject_label="Chunk",
+            subject_similarity_search="?",
+            relation_label="IsPartOf",
+            object_label="Document",
+            object_similarity_search="mat",
+        ).to_json_data_model()
+        result = await knowledge_base.triplet_search(
+            triplet_search, search_type="lexical"
+        )
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["subj"]["text"], "The cat sat")
+        self.assertEqual(result[0]["relation"]["label"], "IsPartOf")
+        mock_embedding.assert_not_called()
+
+    @patch("litellm.aembedding")
+    async def test_hybrid_search(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        knowledge_base = await KnowledgeBase.create(
+            uri="local://:memory:",
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+            embedding_dim=16,
+            lexical_index=True,
+        )
+        await add_knowledge(knowledge_base)
+
+        search = SimilaritySearch(
+            entity_label="Document",
+            similarity_search="The cat sat on the mat",
+        ).to_json_data_model()
+        result = await knowledge_base.similarity_search(
+            search, k=2, threshold=0.0, search_type="hybrid"
+        )
+        self.assertEqual(len(result), 2)
+        # First in both rankings
+        self.assertEqual(result[-1]["node"]["text"], "The cat sat on the mat")
+        self.assertAlmostEqual(result[-1]["score"], 2 / 61)
+        self.assertNotIn("embedding", result[-1]["node"])
+
+        triplet_search = TripletSearch(
+            subject_label="Chunk",
+            subject_similarity_search="The cat sat",
+            relation_label="IsPartOf",
+            object_label="Document",
+            object_similarity_search="?",
+        ).to_json_data_model()
+        result = await knowledge_base.triplet_search(
+            triplet_search, threshold=0.0, search_type="hybrid"
+        )
+        self.assertEqual(len(result), 1)
+        self.assertAlmostEqual(result[0]["score"], 2 / 61)
+
+    @patch("litellm.aembedding")
+    async def test_lexical_index_persistence(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        with tempfile.TemporaryDirectory() as path:
+            config = dict(
+                uri=f"local://{path}",
+                entity_models=[Document, Chunk],
+                relation_models=[IsPartOf],
+                embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+                embedding_dim=16,
+                lexical_index=os.path.join(path, "lexical_index.jsonl"),
+            )
+            knowledge_base = await KnowledgeBase.create(**config)
+            await add_knowledge(knowledge_base)
+            await knowledge_base.close()
+
+            knowledge_base = await KnowledgeBase.create(**config)
+            search = SimilaritySearch(
+                entity_label="Document",
+                similarity_search="markets",
+            ).to_json_data_model()
+            result = await knowledge_base.similarity_search(search, search_type="lexical")
+            self.assertEqual(len(result), 1)
+
+            knowledge_base = await KnowledgeBase.create(**config, wipe_on_start=True)
+            result = await knowledge_base.similarity_search(search, search_type="lexical")
+            self.assertEqual(result, [])
+
+    @patch("litellm.aembedding")
+    async def test_lexical_search_requires_lexical_index(self, mock_embedding):
+        knowledge_base = await KnowledgeBase.create(
+            uri="local://:memory:",
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+            embedding_dim=16,
+        )
+        search = SimilaritySearch(
+            entity_label="Document",
+            similarity_search="markets",
+        ).to_json_data_model()
+        with self.assertRaisesRegex(ValueError, "lexical_index"):
+            await knowledge_base.similarity_search(search, search_type="lexical")
+        with self.assertRaisesRegex(ValueError, "search_type"):
+            await knowledge_base.similarity_search(search, search_type="unknown")
+
+    @patch("litellm.aembedding")
+    async def test_search_cache(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        knowledge_base = await KnowledgeBase.create(
+            uri="local://:memory:",
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+            embedding_dim=16,
+            cache=True,
+        )
+        await add_knowledge(knowledge_base)
+        mock_embedding.reset_mock()
+
+        search = SimilaritySearch(
+            entity_label="Document",
+            similarity_search="The cat sat on the mat",
+        ).to_json_data_model()
+        result = await knowledge_base.similarity_search(search, threshold=0.0)
+        self.assertEqual(mock_embedding.call_count, 1)
+        cached_result = await knowledge_base.similarity_search(search, threshold=0.0)
+        self.assertEqual(cached_result, result)
+        self.assertEqual(mock_embedding.call_count, 1)
+        self.assertEqual(knowledge_base.cache.hits, 1)
+        self.assertEqual(knowledge_base.cache.misses, 1)
+
+        # The cached results are copies
+        cached_result[0]["node"]["text"] = "modified"
+        cached_result = await knowledge_base.similarity_search(search, threshold=0.0)
+        self.assertEqual(cached_result, result)
+
+        # Different arguments are different searches
+        await knowledge_base.similarity_search(search, k=1, threshold=0.0)
+        self.assertEqual(mock_embedding.call_count, 2)
+
+        triplet_search = TripletSearch(
+            subject_label="Chunk",
+            subject_similarity_search="The cat sat",
+            relation_label="IsPartOf",
+            object_label="Document",
+            object_similarity_search="?",
+        ).to_json_data_model()
+        results = await knowledge_base.triplet_search_many(
+            [triplet_search, triplet_search], threshold=0.0
+        )
+        self.assertEqual(len(results[0]), 1)
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(mock_embedding.call_count, 3)
+        await knowledge_base.triplet_search(triplet_search, threshold=0.0)
+        self.assertEqual(mock_embedding.call_count, 3)
+
+        # The other fields of the data model (e.g. the thinking of the
+        # retrievers) are not part of the key
+        for thinking in ("Let me search the chunks", "The chunks are needed"):
+            search_with_thinking = TripletSearchWithThinking(
+                thinking=thinking,
+                **triplet_search.get_json(),
+            ).to_json_data_model()
+            await knowledge_base.triplet_search(search_with_thinking, threshold=0.0)
+        self.assertEqual(mock_embedding.call_count, 3)
+
+        # The writes invalidate the cached results
+        await add_knowledge(knowledge_base)
+        self.assertEqual(len(knowledge_base.cache), 0)
+        mock_embedding.reset_mock()
+        await knowledge_base.similarity_search(search, threshold=0.0)
+        self.assertEqual(mock_embedding.call_count, 1)
+
+    @patch("litellm.aembedding")
+    async def test_search_cache_serialization(self, mock_embedding):
+        knowledge_base = KnowledgeBase(
+            uri="local://:memory:",
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+            embedding_dim=16,
+            cache=100,
+        )
+        config = knowledge_base.get_config()
+        self.assertEqual(config["cache"], 100)
+        cloned_knowledge_base = KnowledgeBase.from_config(config)
+        self.assertEqual(cloned_knowledge_base.cache.max_entries, 100)
+        with self.assertRaisesRegex(ValueError, "cache"):
+            KnowledgeBase(
+                uri="local://:memory:",
+                entity_models=[Document, Chunk],
+                relation_models=[IsPartOf],
+                embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+                embedding_dim=16,
+                cache="disk",
+            )
+
+    @patch("litellm.aembedding")
+    async def test_lexical_index_only_indexes_written_knowledge(self, mock_embedding):
+        mock_embedding.side_effect = mock_embedding_fn
+        knowledge_base = await KnowledgeBase.create(
+            uri="local://:memory:",
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+            embedding_dim=16,
+            lexical_index=True,
+        )
+        await add_knowledge(knowledge_base)
+        self.assertEqual(len(knowledge_base._lexical_index), 5)
+
+        # Skipped by the database (no embedding)
+        with self.assertWarns(Warning):
+            result = await knowledge_base.update(
+                Document(
+                    label="Document", text="An unembedded invoice"
+                ).to_json_data_model()
+            )
+        self.assertEqual(result, [])
+        search = SimilaritySearch(
+            entity_label="Document",
+            similarity_search="unembedded",
+        ).to_json_data_model()
+        result = await knowledge_base.similarity_search(search, search_type="lexical")
+        self.assertEqual(result, [])
+
+        # Merged into the existing entities
+        await add_knowledge(knowledge_base)
+        self.assertEqual(len(knowledge_base._lexical_index), 5)
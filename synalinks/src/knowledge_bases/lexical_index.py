@@ -0,0 +1,222 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import collections
+import json
+import math
+import os
+import re
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# The constant of the reciprocal rank fusion (from the original paper)
+RRF_CONSTANT = 60
+
+
+def tokenize(text):
+    """Split a text into lowercase word tokens.
+
+    Args:
+        text (str): The text to tokenize.
+
+    Returns:
+        (list): The tokens.
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def reciprocal_rank_fusion(rankings, k=None, constant=RRF_CONSTANT):
+    """Fuse several rankings with the reciprocal rank fusion.
+
+    Each item gets the score `sum(1 / (constant + rank))` over the rankings
+    it appears in, so the items ranked high by several retrievers come first,
+    whatever the scale of the scores of each retriever.
+
+    Args:
+        rankings (list): The rankings, each being a list of `(key, item)`
+            tuples sorted from the best to the worst. The items with the
+            same key are considered the same.
+        k (int): Optional. The maximum number of items to return
+            (Default to None, all of them).
+        constant (int): Optional. The rank constant (Default to 60).
+
+    Returns:
+        (list): The `(item, score)` tuples sorted by decreasing score.
+    """
+    scores = collections.defaultdict(float)
+    items = {}
+    for ranking in rankings:
+        for rank, (key, item) in enumerate(ranking, start=1):
+            scores[key] += 1.0 / (constant + rank)
+            items.setdefault(key, item)
+    keys = sorted(scores, key=lambda key: scores[key], reverse=True)
+    if k is not None:
+        keys = keys[:k]
+    return [(items[key], scores[key]) for key in keys]
+
+
+class LexicalIndex:
+    """In-process BM25 inverted index.
+
+    The documents are stored with their labels and a payload returned by the
+    searches, so the searches are answered without any embedding call or
+    database query. Adding a document with an existing key replaces it.
+
+    When a `path` is given, the index is persisted in an append-only JSON
+    lines file, replayed when the index is created (the last write of each
+    key wins) and compacted when it holds too many replaced documents.
+
+    Args:
+        path (str): Optional. The file persisting the index, if None the
+            index is kept in memory (Default to None).
+        k1 (float): Optional. The BM25 term frequency saturation
+            (Default to 1.2).
+        b (float): Optional. The BM25 length normalization (Default to 0.75).
+    """
+
+    def __init__(self, path=None, k1=1.2, b=0.75):
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self._reset()
+        if self.path is not None:
+            self._load()
+
+    def _reset(self):
+        # The documents by key as (labels, payload, term frequencies, length)
+        self._documents = {}
+        # The term frequency of each document key, for each term
+        self._postings = collections.defaultdict(dict)
+        self._total_length = 0
+        self._num_writes = 0
+
+    def __len__(self):
+        return len(self._documents)
+
+    def __contains__(self, key):
+        return key in self._documents
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._add(
+                        record["key"],
+                        record["text"],
+                        record["document"],
+                        record["labels"],
+                    )
+        if self._num_writes > 2 * len(self._documents):
+            self.compact()
+
+    def _remove(self, key):
+        _, _, frequencies, length = self._documents.pop(key)
+        for term in frequencies:
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= length
+
+    def _add(self, key, text, document, labels):
+        if key in self._documents:
+            self._remove(key)
+        tokens = tokenize(text)
+        frequencies = collections.Counter(tokens)
+        self._documents[key] = (tuple(labels), document, frequencies, len(tokens))
+        for term, frequency in frequencies.items():
+            self._postings[term][key] = frequency
+        self._total_length += len(tokens)
+        self._num_writes += 1
+
+    def add(self, records):
+        """Add (or replace) documents in the index.
+
+        Args:
+            records (list): The documents as dicts with a `key` (str)
+                identifying the document, the `text` to index, the `labels`
+                (list of str) used to filter the searches and the `document`
+                (dict) returned by the searches.
+        """
+        for record in records:
+            self._add(
+                record["key"],
+                record["text"],
+                record["document"],
+                record["labels"],
+            )
+        if self.path is not None and records:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a") as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+
+    def compact(self):
+        """Rewrite the persisted file without the replaced documents."""
+        if self.path is None:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            for key, (labels, document, frequencies, _) in self._documents.items():
+                record = {
+                    "key": key,
+                    "text": " ".join(frequencies.elements()),
+                    "labels": list(labels),
+                    "document": document,
+                }
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, self.path)
+        self._num_writes = len(self._documents)
+
+    def clear(self):
+        """Remove all the documents (and the persisted file)."""
+        self._reset()
+        if self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _match(self, labels, pattern):
+        if pattern is None:
+            return True
+        if len(labels) != len(pattern):
+            return False
+        return all(p is None or p == label for label, p in zip(labels, pattern))
+
+    def search(self, query, k=10, labels=None):
+        """Search the documents matching the query with BM25.
+
+        Args:
+            query (str): The query.
+            k (int): The maximum number of documents (Default to 10).
+            labels (tuple): Optional. The labels of the documents to search,
+                `None` matching any label (Default to None, all the documents).
+
+        Returns:
+            (list): The `(key, document, score)` tuples sorted by decreasing
+                score (only the documents sharing a term with the query).
+        """
+        num_documents = len(self._documents)
+        if not num_documents or k <= 0:
+            return []
+        average_length = self._total_length / num_documents
+        scores = collections.defaultdict(float)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(
+                1.0 + (num_documents - len(postings) + 0.5) / (len(postings) + 0.5)
+            )
+            for key, frequency in postings.items():
+                length = self._documents[key][3]
+                norm = self.k1 * (1.0 - self.b + self.b * length / average_length)
+                scores[key] += idf * frequency * (self.k1 + 1.0) / (frequency + norm)
+        results = []
+        for key in sorted(scores, key=lambda key: scores[key], reverse=True):
+            doc_labels, document, _, _ = self._documents[key]
+            if self._match(doc_labels, labels):
+                results.append((key, document, scores[key]))
+                if len(results) >= k:
+                    break
+        return results
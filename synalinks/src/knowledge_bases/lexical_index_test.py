@@ -0,0 +1,109 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+import tempfile
+
+from synalinks.src import testing
+from synalinks.src.knowledge_bases.lexical_index import LexicalIndex
+from synalinks.src.knowledge_bases.lexical_index import reciprocal_rank_fusion
+from synalinks.src.knowledge_bases.lexical_index import tokenize
+
+
+def get_records():
+    texts = {
+        "a": "the cat sat on the mat",
+        "b": "the dog chased the cat",
+        "c": "stock markets fell sharply today",
+        "d": "invoice INV-2024-0042 is overdue",
+    }
+    return [
+        {
+            "key": key,
+            "text": text,
+            "labels": ["Document"] if key != "d" else ["Invoice"],
+            "document": {"text": text},
+        }
+        for key, text in texts.items()
+    ]
+
+
+class LexicalIndexTest(testing.TestCase):
+    def test_tokenize(self):
+        self.assertEqual(
+            tokenize("Invoice INV-2024-0042, overdue!"),
+            ["invoice", "inv", "2024", "0042", "overdue"],
+        )
+
+    def test_search(self):
+        index = LexicalIndex()
+        index.add(get_records())
+        self.assertEqual(len(index), 4)
+
+        results = index.search("cat mat", k=10)
+        self.assertEqual([key for key, _, _ in results], ["a", "b"])
+        self.assertGreater(results[0][2], results[1][2])
+        self.assertEqual(results[0][1], {"text": "the cat sat on the mat"})
+
+        results = index.search("INV-2024-0042", k=1)
+        self.assertEqual([key for key, _, _ in results], ["d"])
+
+        self.assertEqual(index.search("unknown words"), [])
+
+    def test_search_labels(self):
+        index = LexicalIndex()
+        index.add(get_records())
+        results = index.search("overdue cat", labels=("Document",))
+        # The shortest document first
+        self.assertEqual([key for key, _, _ in results], ["b", "a"])
+        results = index.search("overdue cat", labels=("Invoice",))
+        self.assertEqual([key for key, _, _ in results], ["d"])
+        results = index.search("overdue cat", labels=(None,))
+        self.assertEqual(len(results), 3)
+
+    def test_replace(self):
+        index = LexicalIndex()
+        index.add(get_records())
+        index.add(
+            [
+                {
+                    "key": "a",
+                    "text": "a bird",
+                    "labels": ["Document"],
+                    "document": {"text": "a bird"},
+                }
+            ]
+        )
+        self.assertEqual(len(index), 4)
+        self.assertEqual([key for key, _, _ in index.search("mat")], [])
+        self.assertEqual([key for key, _, _ in index.search("bird")], ["a"])
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as path:
+            path = os.path.join(path, "lexical_index.jsonl")
+            index = LexicalIndex(path=path)
+            index.add(get_records())
+            for _ in range(10):
+                index.add(get_records()[:1])
+
+            index = LexicalIndex(path=path)
+            self.assertEqual(len(index), 4)
+            self.assertEqual(index.search("markets", k=1)[0][0], "c")
+            # The replaced documents are removed from the file
+            with open(path) as f:
+                self.assertEqual(len(f.readlines()), 4)
+            self.assertEqual(index.search("cat mat")[0][0], "a")
+
+            index.clear()
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(len(LexicalIndex(path=path)), 0)
+
+    def test_reciprocal_rank_fusion(self):
+        fused = reciprocal_rank_fusion(
+            [
+                [("a", "A"), ("b", "B"), ("c", "C")],
+                [("c", "C"), ("a", "A"), ("d", "D")],
+            ],
+            k=3,
+        )
+        self.assertEqual([item for item, _ in fused], ["A", "C", "B"])
+        self.assertAlmostEqual(fused[0][1], 1 / 61 + 1 / 62)
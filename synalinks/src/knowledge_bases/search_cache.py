@@ -0,0 +1,96 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import collections
+import hashlib
+import json
+
+from synalinks.src.backend.common.json_utils import copy_json
+
+
+class SearchCache:
+    """In-memory LRU cache of the knowledge base search results.
+
+    The results are cached using a hash of the search (its labels and
+    similarity queries), the number of results, the threshold and the type
+    of search. Each write to the knowledge base bumps the write generation,
+    which invalidates every cached result; the results of the searches
+    running during a write are not cached.
+
+    Args:
+        max_entries (int): Optional. The maximum number of search results to
+            keep, the least recently used are evicted first (Default to 1024).
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+
+    @staticmethod
+    def get_key(**kwargs):
+        """Compute the cache key of a search.
+
+        Args:
+            **kwargs (keyword arguments): The arguments of the search.
+
+        Returns:
+            (str): The cache key.
+        """
+        payload = json.dumps(kwargs, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Get the cached results of a search.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            (list): The cached results or `None` if not in cache.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return copy_json(value)
+
+    def put(self, key, value, generation):
+        """Add the results of a search to the cache.
+
+        Args:
+            key (str): The cache key.
+            value (list): The results to cache.
+            generation (int): The write generation when the search started,
+                the results are discarded if the knowledge base changed since.
+        """
+        if generation != self.generation:
+            return
+        self._entries[key] = copy_json(value)
+        self._entries.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """Bump the write generation and remove every cached result."""
+        self.generation += 1
+        self._entries.clear()
+
+    def clear(self):
+        """Remove every cached result and reset the counters."""
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """The ratio of searches answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,45 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+from synalinks.src import testing
+from synalinks.src.knowledge_bases.search_cache import SearchCache
+
+
+class SearchCacheTest(testing.TestCase):
+    def test_get_and_put(self):
+        cache = SearchCache()
+        key = cache.get_key(search={"similarity_search": "cat"}, k=10)
+        self.assertNotEqual(key, cache.get_key(search={"similarity_search": "cat"}, k=1))
+        self.assertIsNone(cache.get(key))
+        cache.put(key, [{"node": {"name": "cat"}}], cache.generation)
+        self.assertEqual(cache.get(key), [{"node": {"name": "cat"}}])
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hit_rate, 0.5)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hit_rate, 0.0)
+
+    def test_max_entries(self):
+        cache = SearchCache(max_entries=2)
+        cache.put("a", [1], cache.generation)
+        cache.put("b", [2], cache.generation)
+        cache.get("a")
+        cache.put("c", [3], cache.generation)
+        # The least recently used is evicted
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), [1])
+        self.assertEqual(cache.get("c"), [3])
+
+    def test_invalidate(self):
+        cache = SearchCache()
+        generation = cache.generation
+        cache.put("a", [1], generation)
+        cache.invalidate()
+        self.assertIsNone(cache.get("a"))
+        # The results of the searches started before the write are discarded
+        cache.put("a", [1], generation)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", [2], cache.generation)
+        self.assertEqual(cache.get("a"), [2])
@@ -1,5 +1,10 @@
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.language_models.language_model import LanguageModel
+from synalinks.src.language_models.language_model import StreamingIterator
+from synalinks.src.language_models.language_model_cache import DiskCache
+from synalinks.src.language_models.language_model_cache import InMemoryCache
+from synalinks.src.language_models.language_model_cache import LanguageModelCache
+from synalinks.src.language_models.request_scheduler import RequestScheduler
 from synalinks.src.saving import serialization_lib
 
 ALL_OBJECTS = {
@@ -4,10 +4,13 @@ import copy
 import json
 import warnings
 
-import litellm
-
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import ChatRole
+from synalinks.src.backend import PartialJsonParser
+from synalinks.src.language_models.language_model_cache import DiskCache
+from synalinks.src.language_models.language_model_cache import InMemoryCache
+from synalinks.src.language_models.language_model_cache import LanguageModelCache
+from synalinks.src.language_models.request_scheduler import RequestScheduler
 from synalinks.src.saving import serialization_lib
 from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
 
@@ -129,6 +132,44 @@ class LanguageModel(SynalinksSaveable):
     )
     ```
 
+    To avoid paying twice for identical calls (e.g. when re-running an evaluation
+    with a deterministic program), use the `cache` argument. The responses are
+    cached using a hash of the messages, the schema, the model and the call
+    arguments.
+
+    ```python
+    import synalinks
+
+    language_model = synalinks.LanguageModel(
+        model="ollama/mistral",
+        cache="disk",  # or "memory" or a `LanguageModelCache` instance
+    )
+    ```
+
+    **Note**: With a sampling temperature above 0, the cached response is one
+    sample among the possible ones. Use `use_cache=False` when calling the
+    language model to bypass the cache.
+
+    To respect the limits of your provider (and avoid rate limit errors when
+    running large batches), use the `scheduler` argument. The scheduler is
+    shared by every module using the language model, and can be shared
+    between models of the same provider.
+
+    ```python
+    import synalinks
+
+    language_model = synalinks.LanguageModel(
+        model="openai/gpt-4o-mini",
+        scheduler=synalinks.RequestScheduler(
+            max_concurrency=16,
+            requests_per_minute=500,
+        ),
+    )
+    ```
+
+    By default, the requests are not limited but the failed requests are
+    retried with an exponential backoff.
+
     **Note**: Obviously, use an `.env` file and `.gitignore` to avoid
     putting your API keys in the code or a config file that can lead to
     leackage when pushing it into repositories.
@@ -140,6 +181,12 @@ class LanguageModel(SynalinksSaveable):
         retry (int): Optional. The number of retry (default to 5).
         fallback (LanguageModel): Optional. The language model to fallback
             if anything is wrong.
+        cache (bool | str | LanguageModelCache): Optional. The response cache,
+            `True` or `"memory"` for an `InMemoryCache`, `"disk"` for a
+            `DiskCache` or a `LanguageModelCache` instance (Default to None).
+        scheduler (RequestScheduler): Optional. The scheduler of the requests
+            (concurrency, rate limits and backoff). If None, a scheduler without
+            limits is created (Default to None).
     """
 
     def __init__(
@@ -149,6 +196,8 @@ class LanguageModel(SynalinksSaveable):
         timeout=100,
         retry=5,
         fallback=None,
+        cache=None,
+        scheduler=None,
     ):
         if model is None:
             raise ValueError("You need to set the `model` argument for any LanguageModel")
@@ -165,8 +214,36 @@ class LanguageModel(SynalinksSaveable):
             self.api_base = api_base
         self.timeout = timeout
         self.retry = retry
+        if cache is None or cache is False:
+            self.cache = None
+        elif isinstance(cache, LanguageModelCache):
+            self.cache = cache
+        elif isinstance(cache, dict):
+            self.cache = serialization_lib.deserialize_synalinks_object(cache)
+        elif cache == "disk":
+            self.cache = DiskCache()
+        elif cache is True or cache == "memory":
+            self.cache = InMemoryCache()
+        else:
+            raise ValueError(
+                "The `cache` argument should be a boolean, `'memory'`, `'disk'` "
+                f"or a `LanguageModelCache` instance, received: {cache}"
+            )
+        if scheduler is None:
+            self.scheduler = RequestScheduler()
+        elif isinstance(scheduler, dict):
+            self.scheduler = serialization_lib.deserialize_synalinks_object(scheduler)
+        else:
+            self.scheduler = scheduler
 
-    async def __call__(self, messages, schema=None, streaming=False, **kwargs):
+    async def __call__(
+        self,
+        messages,
+        schema=None,
+        streaming=False,
+        use_cache=True,
+        **kwargs,
+    ):
         """
         Call method to generate a response using the language model.
 
@@ -175,15 +252,32 @@ class LanguageModel(SynalinksSaveable):
             schema (dict): The target JSON schema for structed output (optional).
                 If None, output a ChatMessage-like answer.
             streaming (bool): Enable streaming (optional). Default to False.
-                Can be enabled only if schema is None.
+                If True, returns a `StreamingIterator` yielding the new content
+                (or the structured output parsed so far if a schema is given).
+            use_cache (bool): Wether or not to use the response cache (if any)
+                for this call. Streamed responses are never cached.
+                Default to True.
             **kwargs (keyword arguments): The additional keywords arguments
                 forwarded to the LM call.
         Returns:
             (dict): The generated structured response.
         """
+        import litellm
+
         formatted_messages = messages.get_json().get("messages", [])
         json_instance = {}
         input_kwargs = copy.deepcopy(kwargs)
+        cache_key = None
+        if self.cache is not None and use_cache and not streaming:
+            cache_key = self.cache.get_key(
+                model=self.model,
+                messages=formatted_messages,
+                schema=schema,
+                kwargs=input_kwargs,
+            )
+            cached_json_instance = self.cache.get(cache_key)
+            if cached_json_instance is not None:
+                return cached_json_instance
         if schema:
             if self.model.startswith("groq"):
                 # Use a tool created on the fly for groq
@@ -265,22 +359,32 @@ class LanguageModel(SynalinksSaveable):
                     "api_base": self.api_base,
                 }
             )
-        if streaming and schema:
-            streaming = False
         if streaming:
             kwargs.update({"stream": True})
+        tokens = 0
+        if self.scheduler.tokens_per_minute:
+            tokens = self.scheduler.estimate_tokens(json.dumps(formatted_messages))
         for i in range(self.retry):
             try:
                 response_str = ""
-                response = await litellm.acompletion(
-                    model=self.model,
-                    messages=formatted_messages,
-                    timeout=self.timeout,
-                    caching=False,
-                    **kwargs,
-                )
+                async with self.scheduler.request(tokens=tokens):
+                    response = await litellm.acompletion(
+                        model=self.model,
+                        messages=formatted_messages,
+                        timeout=self.timeout,
+                        caching=False,
+                        **kwargs,
+                    )
                 if streaming:
-                    return StreamingIterator(response)
+                    return StreamingIterator(
+                        response,
+                        schema=schema,
+                        use_tool_calls=bool(schema)
+                        and (
+                            self.model.startswith("groq")
+                            or self.model.startswith("anthropic")
+                        ),
+                    )
                 if (
                     self.model.startswith("groq") or self.model.startswith("anthropic")
                 ) and schema:
@@ -298,14 +402,19 @@ class LanguageModel(SynalinksSaveable):
                         "tool_call_id": None,
                         "tool_calls": [],
                     }
+                if cache_key:
+                    self.cache.put(cache_key, json_instance)
                 return json_instance
             except Exception as e:
                 warnings.warn(f"Error occured while trying to call {self}: " + str(e))
+                if i < self.retry - 1:
+                    await self.scheduler.backoff(i, error=e)
         if self.fallback:
-            return self.fallback(
+            return await self.fallback(
                 messages,
                 schema=schema,
                 streaming=streaming,
+                use_cache=use_cache,
                 **input_kwargs,
             )
         else:
@@ -320,6 +429,12 @@ class LanguageModel(SynalinksSaveable):
             "api_base": self.api_base,
             "timeout": self.timeout,
             "retry": self.retry,
+            "cache": (
+                serialization_lib.serialize_synalinks_object(self.cache)
+                if self.cache is not None
+                else None
+            ),
+            "scheduler": serialization_lib.serialize_synalinks_object(self.scheduler),
         }
         if self.fallback:
             fallback_config = {
@@ -346,16 +461,114 @@ class LanguageModel(SynalinksSaveable):
         return f"<LanguageModel model={self.model}{api_base}>"
 
 
+@synalinks_export("synalinks.language_models.StreamingIterator")
 class StreamingIterator:
-    def __init__(self, iterator):
+    """An iterator over the chunks of a streamed language model response.
+
+    The iterator can be consumed with `async for` (the stream returned by the
+    provider being asynchronous) or with `for` when the underlying stream is
+    synchronous.
+
+    Without schema, each chunk is a ChatMessage-like dict with the new
+    content. With a schema, each chunk is the JSON object parsed so far,
+    allowing to stream the structured output field by field.
+
+    Once consumed, the complete response is given by `get_json()`.
+
+    Example:
+
+    ```python
+    response = await language_model(messages, streaming=True)
+    async for chunk in response:
+        print(chunk["content"], end="")
+    ```
+
+    Args:
+        iterator (Iterator | AsyncIterator): The stream returned by the provider.
+        schema (dict): Optional. The JSON schema of the structured output,
+            `None` for a ChatMessage-like output (Default to None).
+        use_tool_calls (bool): Optional. Whether the structured output is
+            streamed as the arguments of a tool call (Default to False).
+    """
+
+    def __init__(self, iterator, schema=None, use_tool_calls=False):
         self._iterator = iterator
+        self.schema = schema
+        self.use_tool_calls = use_tool_calls
+        self.content = ""
+        self._parser = PartialJsonParser() if schema else None
+        self._last_json = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            if hasattr(self._iterator, "__anext__"):
+                chunk = await self._iterator.__anext__()
+            else:
+                try:
+                    chunk = next(self._iterator)
+                except StopIteration:
+                    raise StopAsyncIteration
+            value = self._process_chunk(chunk)
+            if value is not None:
+                return value
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        content = self._iterator.__next__()["choices"][0]["delta"]["content"]
-        if content:
-            return {"role": ChatRole.ASSISTANT, "content": content}
+        while True:
+            value = self._process_chunk(next(self._iterator))
+            if value is not None:
+                return value
+
+    def _process_chunk(self, chunk):
+        delta = _get_field(_get_field(chunk, "choices")[0], "delta")
+        if self.use_tool_calls:
+            tool_calls = _get_field(delta, "tool_calls")
+            if not tool_calls:
+                return None
+            content = _get_field(_get_field(tool_calls[0], "function"), "arguments")
         else:
-            raise StopIteration
+            content = _get_field(delta, "content")
+        # Skip the chunks without content (e.g. role or finish reason only)
+        if not content:
+            return None
+        self.content += content
+        if not self.schema:
+            return {"role": ChatRole.ASSISTANT, "content": content}
+        # The parser returns a new object at each feed, no need to copy it
+        json_instance = self._parser.feed(content)
+        if json_instance is None or json_instance == self._last_json:
+            return None
+        self._last_json = json_instance
+        return json_instance
+
+    def get_json(self):
+        """Returns the complete response (once the stream is consumed).
+
+        Returns:
+            (dict): The generated structured output or ChatMessage-like answer,
+                `None` if the structured output is not valid JSON (e.g. a
+                truncated stream).
+        """
+        if self.schema:
+            try:
+                return json.loads(self.content)
+            except ValueError as e:
+                warnings.warn(f"Invalid JSON in the streamed response: {e}")
+                return None
+        return {
+            "role": ChatRole.ASSISTANT,
+            "content": self.content.strip(),
+            "tool_call_id": None,
+            "tool_calls": [],
+        }
+
+
+def _get_field(obj, name):
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
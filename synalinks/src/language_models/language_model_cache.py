@@ -0,0 +1,235 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import collections
+import copy
+import hashlib
+import json
+import os
+import time
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.backend.config import synalinks_home
+from synalinks.src.utils.sqlite_utils import SQLiteLRUTable
+
+
+@synalinks_export("synalinks.language_models.LanguageModelCache")
+class LanguageModelCache:
+    """Base class for the language models' response caches.
+
+    A response cache maps a canonical hash of a language model call
+    (messages, schema, model and sampling arguments) to its response,
+    so that identical calls (e.g. when re-running an evaluation) are
+    answered without calling the provider.
+
+    Subclasses should implement the `_get()`, `_put()` and `_clear()` methods.
+
+    Args:
+        ttl (float): Optional. The time to live of the cached responses
+            in seconds, `None` for no expiration (Default to None).
+    """
+
+    def __init__(self, ttl=None):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(**kwargs):
+        """Compute the cache key of a language model call.
+
+        Args:
+            **kwargs (keyword arguments): The arguments of the call.
+
+        Returns:
+            (str): The cache key.
+        """
+        payload = json.dumps(kwargs, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Get the cached response of a call.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            (dict): The cached response or `None` if not in cache.
+        """
+        value = self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Add a response to the cache.
+
+        Args:
+            key (str): The cache key.
+            value (dict): The response to cache.
+        """
+        self._put(key, value)
+
+    def clear(self):
+        """Remove every response from the cache and reset the counters."""
+        self._clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """The ratio of calls answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _is_expired(self, created):
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    def _get(self, key):
+        raise NotImplementedError(
+            f"{self.__class__} should implement the `_get()` method"
+        )
+
+    def _put(self, key, value):
+        raise NotImplementedError(
+            f"{self.__class__} should implement the `_put()` method"
+        )
+
+    def _clear(self):
+        raise NotImplementedError(
+            f"{self.__class__} should implement the `_clear()` method"
+        )
+
+    def get_config(self):
+        return {"ttl": self.ttl}
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config)
+
+
+@synalinks_export("synalinks.language_models.InMemoryCache")
+class InMemoryCache(LanguageModelCache):
+    """An in-memory LRU cache for the language models' responses.
+
+    Example:
+
+    ```python
+    import synalinks
+
+    language_model = synalinks.LanguageModel(
+        model="ollama/mistral",
+        cache=synalinks.language_models.InMemoryCache(max_entries=1000),
+    )
+    ```
+
+    Args:
+        max_entries (int): Optional. The maximum number of responses to keep,
+            the least recently used are evicted first (Default to 1024).
+        ttl (float): Optional. The time to live of the cached responses
+            in seconds, `None` for no expiration (Default to None).
+    """
+
+    def __init__(self, max_entries=1024, ttl=None):
+        super().__init__(ttl=ttl)
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+
+    def _get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        created, value = entry
+        if self._is_expired(created):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def _put(self, key, value):
+        self._entries[key] = (time.time(), copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_config(self):
+        return {"max_entries": self.max_entries, **super().get_config()}
+
+
+@synalinks_export("synalinks.language_models.DiskCache")
+class DiskCache(LanguageModelCache):
+    """A persistent cache for the language models' responses.
+
+    The responses are stored as JSON in a SQLite database, so they are
+    shared across processes and runs.
+
+    Example:
+
+    ```python
+    import synalinks
+
+    language_model = synalinks.LanguageModel(
+        model="ollama/mistral",
+        cache=synalinks.language_models.DiskCache(ttl=24 * 3600),
+    )
+    ```
+
+    Args:
+        path (str): Optional. The path of the SQLite database
+            (Default to `~/.synalinks/cache/responses.db`).
+        max_entries (int): Optional. The maximum number of responses to keep,
+            the least recently used are evicted first (Default to 100000).
+        ttl (float): Optional. The time to live of the cached responses
+            in seconds, `None` for no expiration (Default to None).
+    """
+
+    def __init__(self, path=None, max_entries=100000, ttl=None):
+        super().__init__(ttl=ttl)
+        if not path:
+            path = os.path.join(synalinks_home(), "cache", "responses.db")
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        self._table = SQLiteLRUTable(
+            self.path,
+            "responses",
+            {"value": "TEXT", "created": "REAL"},
+            max_entries=max_entries,
+        )
+
+    def _get(self, key):
+        row = self._table.get_many([key]).get(key)
+        if row is None:
+            return None
+        value, created = row
+        if self._is_expired(created):
+            self._table.delete(key)
+            return None
+        return json.loads(value)
+
+    def _put(self, key, value):
+        self._table.put_many([(key, json.dumps(value), time.time())])
+
+    def _clear(self):
+        self._table.clear()
+
+    def close(self):
+        """Close the connection to the database."""
+        self._table.close()
+
+    def __len__(self):
+        return len(self._table)
+
+    def get_config(self):
+        return {
+            "path": self.path,
+            "max_entries": self.max_entries,
+            **super().get_config(),
+        }
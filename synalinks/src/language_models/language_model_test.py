@@ -1,5 +1,7 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import json
+import os
 from unittest.mock import patch
 
 from synalinks.src import testing
@@ -7,6 +9,8 @@ from synalinks.src.backend import ChatMessage
 from synalinks.src.backend import ChatMessages
 from synalinks.src.backend import ChatRole
 from synalinks.src.backend import DataModel
+from synalinks.src.language_models import DiskCache
+from synalinks.src.language_models import InMemoryCache
 from synalinks.src.language_models import LanguageModel
 
 
@@ -105,3 +109,127 @@ class LanguageModelTest(testing.TestCase):
             result += msg.get("content")
 
         self.assertEqual(result, expected)
+
+    @patch("litellm.acompletion")
+    async def test_call_api_async_streaming_mode(self, mock_completion):
+        language_model = LanguageModel(model="ollama/mistral")
+
+        messages = ChatMessages(
+            messages=[ChatMessage(role=ChatRole.USER, content="Hello")]
+        )
+
+        async def mock_response_stream():
+            yield {"choices": [{"delta": {"role": "assistant", "content": None}}]}
+            yield {"choices": [{"delta": {"content": "Hello,"}}]}
+            yield {"choices": [{"delta": {"content": ""}}]}
+            yield {"choices": [{"delta": {"content": " how can I help you?"}}]}
+            yield {"choices": [{"delta": {}, "finish_reason": "stop"}]}
+
+        mock_completion.return_value = mock_response_stream()
+
+        response = await language_model(messages, streaming=True)
+
+        chunks = [chunk async for chunk in response]
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(
+            "".join(chunk["content"] for chunk in chunks),
+            "Hello, how can I help you?",
+        )
+        self.assertEqual(response.get_json()["content"], "Hello, how can I help you?")
+
+    @patch("litellm.acompletion")
+    async def test_call_api_structured_streaming_mode(self, mock_completion):
+        class AnswerWithRationale(DataModel):
+            rationale: str
+            answer: str
+
+        language_model = LanguageModel(model="ollama/mistral")
+
+        messages = ChatMessages(
+            messages=[ChatMessage(role=ChatRole.USER, content="What is 1 + 1?")]
+        )
+
+        expected = {"rationale": "One plus one equals two", "answer": "2"}
+        text = json.dumps(expected)
+
+        async def mock_response_stream():
+            for i in range(0, len(text), 5):
+                yield {"choices": [{"delta": {"content": text[i : i + 5]}}]}
+
+        mock_completion.return_value = mock_response_stream()
+
+        response = await language_model(
+            messages,
+            schema=AnswerWithRationale.get_schema(),
+            streaming=True,
+        )
+
+        chunks = [chunk async for chunk in response]
+        self.assertGreater(len(chunks), 2)
+        self.assertEqual(chunks[0], {})
+        self.assertIn({"rationale": "One plus one eq"}, chunks)
+        self.assertEqual(chunks[-1], expected)
+        self.assertEqual(response.get_json(), expected)
+
+    @patch("litellm.acompletion")
+    async def test_call_api_with_in_memory_cache(self, mock_completion):
+        language_model = LanguageModel(model="ollama/mistral", cache=True)
+
+        messages = ChatMessages(
+            messages=[ChatMessage(role=ChatRole.USER, content="Hello")]
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": "Hello, how can I help you?"}}]
+        }
+
+        result = await language_model(messages)
+        cached_result = await language_model(messages)
+        self.assertEqual(result, cached_result)
+        self.assertEqual(mock_completion.call_count, 1)
+        self.assertEqual(language_model.cache.hits, 1)
+        self.assertEqual(language_model.cache.misses, 1)
+
+        _ = await language_model(messages, temperature=0.5)
+        self.assertEqual(mock_completion.call_count, 2)
+
+        _ = await language_model(messages, use_cache=False)
+        self.assertEqual(mock_completion.call_count, 3)
+
+    @patch("litellm.acompletion")
+    async def test_call_api_with_disk_cache(self, mock_completion):
+        cache_path = os.path.join(self.get_temp_dir(), "responses.db")
+        language_model = LanguageModel(
+            model="ollama/mistral",
+            cache=DiskCache(path=cache_path),
+        )
+
+        messages = ChatMessages(
+            messages=[ChatMessage(role=ChatRole.USER, content="Hello")]
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": "Hello, how can I help you?"}}]
+        }
+
+        result = await language_model(messages)
+
+        config = language_model.get_config()
+        cloned_language_model = LanguageModel.from_config(config)
+        self.assertEqual(cloned_language_model.get_config(), config)
+        cached_result = await cloned_language_model(messages)
+        self.assertEqual(result, cached_result)
+        self.assertEqual(mock_completion.call_count, 1)
+
+    def test_in_memory_cache_eviction_and_ttl(self):
+        cache = InMemoryCache(max_entries=2)
+        cache.put("a", {"answer": "a"})
+        cache.put("b", {"answer": "b"})
+        cache.get("a")
+        cache.put("c", {"answer": "c"})
+        self.assertEqual(cache.get("a"), {"answer": "a"})
+        self.assertIsNone(cache.get("b"))
+
+        cache = InMemoryCache(ttl=-1)
+        cache.put("a", {"answer": "a"})
+        self.assertIsNone(cache.get("a"))
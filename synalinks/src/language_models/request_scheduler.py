@@ -0,0 +1,348 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+import collections
+import contextlib
+import random
+import threading
+import time
+
+from synalinks.src.api_export import synalinks_export
+
+
+@synalinks_export(
+    [
+        "synalinks.RequestScheduler",
+        "synalinks.language_models.RequestScheduler",
+        "synalinks.embedding_models.RequestScheduler",
+    ]
+)
+class RequestScheduler:
+    """A scheduler for the requests sent to a model provider.
+
+    The scheduler bounds the number of in-flight requests, enforces the
+    requests per minute (RPM) and tokens per minute (TPM) limits of the
+    provider using token buckets, and computes the exponential backoff
+    (with jitter) to wait between the retries of a request that failed with
+    a transient error (rate limit, timeout, connection or server error).
+
+    Every program, module or batch using the same language or embedding model
+    share the same scheduler. To share the limits of a provider between
+    several models, give them the same scheduler instance.
+
+    Example:
+
+    ```python
+    import synalinks
+
+    scheduler = synalinks.RequestScheduler(
+        max_concurrency=16,
+        requests_per_minute=500,
+        tokens_per_minute=200000,
+    )
+
+    language_model = synalinks.LanguageModel(
+        model="openai/gpt-4o-mini",
+        scheduler=scheduler,
+    )
+
+    embedding_model = synalinks.EmbeddingModel(
+        model="openai/text-embedding-3-small",
+        scheduler=scheduler,
+    )
+
+    # After some calls
+    print(scheduler.get_metrics())
+    ```
+
+    Args:
+        max_concurrency (int): Optional. The maximum number of in-flight requests,
+            `None` for no limit (Default to None).
+        requests_per_minute (int): Optional. The maximum number of requests
+            per minute, `None` for no limit (Default to None).
+        tokens_per_minute (int): Optional. The maximum number of tokens per minute,
+            `None` for no limit (Default to None).
+        backoff_initial_delay (float): Optional. The delay in seconds before the
+            first retry (Default to 1.0).
+        backoff_max_delay (float): Optional. The maximum delay in seconds between
+            two retries (Default to 30.0).
+        backoff_multiplier (float): Optional. The factor applied to the delay
+            after each retry (Default to 2.0).
+    """
+
+    def __init__(
+        self,
+        max_concurrency=None,
+        requests_per_minute=None,
+        tokens_per_minute=None,
+        backoff_initial_delay=1.0,
+        backoff_max_delay=30.0,
+        backoff_multiplier=2.0,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                "`max_concurrency` should be a positive integer or `None`. "
+                f"Received: {max_concurrency}"
+            )
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.backoff_initial_delay = backoff_initial_delay
+        self.backoff_max_delay = backoff_max_delay
+        self.backoff_multiplier = backoff_multiplier
+
+        # The scheduler can be used from several threads and event loops
+        # (see `run_maybe_nested()`), so the waiters are woken up thread-safely
+        self._lock = threading.Lock()
+        self._waiters = collections.deque()
+        self._in_flight = 0
+        self._queue_depth = 0
+        self._peak_queue_depth = 0
+        self._requests = 0
+        self._retries = 0
+        self._buckets = {}
+        if requests_per_minute:
+            self._buckets["requests"] = [float(requests_per_minute), time.monotonic()]
+        if tokens_per_minute:
+            self._buckets["tokens"] = [float(tokens_per_minute), time.monotonic()]
+
+    @contextlib.asynccontextmanager
+    async def request(self, tokens=0):
+        """Wait until a request can be sent to the provider.
+
+        Example:
+
+        ```python
+        async with scheduler.request(tokens=1000):
+            response = await litellm.acompletion(...)
+        ```
+
+        Args:
+            tokens (int): Optional. The estimated number of tokens of the
+                request, used for the TPM limit (Default to 0).
+        """
+        with self._lock:
+            self._queue_depth += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._queue_depth)
+        try:
+            await self._acquire_rate(tokens)
+            await self._acquire_slot()
+        finally:
+            with self._lock:
+                self._queue_depth -= 1
+        with self._lock:
+            self._requests += 1
+        try:
+            yield
+        finally:
+            self._release_slot()
+
+    @staticmethod
+    def estimate_tokens(text):
+        """Roughly estimate the number of tokens of a text (~4 characters per token).
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            (int): The estimated number of tokens.
+        """
+        return len(text) // 4 + 1
+
+    def get_backoff_delay(self, attempt):
+        """Compute the delay to wait before retrying a request.
+
+        The delay grows exponentially with the number of attempts and half of
+        it is randomized (jitter) to avoid synchronized retries.
+
+        Args:
+            attempt (int): The index of the failed attempt (starting at 0).
+
+        Returns:
+            (float): The delay in seconds.
+        """
+        delay = min(
+            self.backoff_max_delay,
+            self.backoff_initial_delay * self.backoff_multiplier**attempt,
+        )
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    @staticmethod
+    def is_transient_error(error):
+        """Check if an error is transient (rate limit, timeout, server error...).
+
+        Args:
+            error (Exception): The error raised by the request.
+
+        Returns:
+            (bool): True if the request should be retried after a delay.
+        """
+        import litellm
+
+        transient_errors = (
+            litellm.RateLimitError,
+            litellm.Timeout,
+            litellm.APIConnectionError,
+            litellm.ServiceUnavailableError,
+            litellm.InternalServerError,
+            litellm.BadGatewayError,
+            asyncio.TimeoutError,
+            ConnectionError,
+        )
+        if isinstance(error, transient_errors):
+            return True
+        status_code = getattr(error, "status_code", None)
+        return isinstance(status_code, int) and (
+            status_code in (408, 429) or status_code >= 500
+        )
+
+    async def backoff(self, attempt, error=None):
+        """Wait before retrying a failed request.
+
+        The requests failing with a non-transient error (e.g. an invalid
+        response) are retried without waiting.
+
+        Args:
+            attempt (int): The index of the failed attempt (starting at 0).
+            error (Exception): Optional. The error raised by the request.
+        """
+        with self._lock:
+            self._retries += 1
+        if error is not None and not self.is_transient_error(error):
+            return
+        delay = self.get_backoff_delay(attempt)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @property
+    def in_flight(self):
+        """The number of requests currently sent to the provider."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self):
+        """The number of requests waiting to be sent."""
+        return self._queue_depth
+
+    def get_metrics(self):
+        """Returns the metrics of the scheduler.
+
+        Returns:
+            (dict): The number of in-flight and queued requests, the peak
+                queue depth and the total number of requests and retries.
+        """
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "queue_depth": self._queue_depth,
+                "peak_queue_depth": self._peak_queue_depth,
+                "requests": self._requests,
+                "retries": self._retries,
+            }
+
+    def _refill(self, name, capacity, now):
+        bucket = self._buckets[name]
+        bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * capacity / 60.0)
+        bucket[1] = now
+        return bucket
+
+    async def _acquire_rate(self, tokens):
+        if not self._buckets:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = 0.0
+                needs = []
+                if self.requests_per_minute:
+                    capacity = float(self.requests_per_minute)
+                    needs.append((self._refill("requests", capacity, now), 1.0, capacity))
+                if self.tokens_per_minute and tokens:
+                    capacity = float(self.tokens_per_minute)
+                    # A request bigger than the bucket waits for a full bucket
+                    needs.append(
+                        (
+                            self._refill("tokens", capacity, now),
+                            min(float(tokens), capacity),
+                            capacity,
+                        )
+                    )
+                for bucket, amount, capacity in needs:
+                    if bucket[0] < amount:
+                        wait = max(wait, (amount - bucket[0]) * 60.0 / capacity)
+                if not wait:
+                    for bucket, amount, _ in needs:
+                        bucket[0] -= amount
+                    return
+            await asyncio.sleep(wait)
+
+    async def _acquire_slot(self):
+        if not self.max_concurrency:
+            with self._lock:
+                self._in_flight += 1
+            return
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._in_flight < self.max_concurrency and not self._waiters:
+                self._in_flight += 1
+                return
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, future))
+                    granted = False
+                except ValueError:
+                    # The slot was handed over, if the future is cancelled
+                    # `_wake()` gives it to the next waiter
+                    granted = not future.cancelled()
+            if granted:
+                self._release_slot()
+            raise
+
+    def _release_slot(self):
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._in_flight -= 1
+                    return
+                # Hand over the slot to the next waiter
+                loop, future = self._waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(self._wake, future)
+                return
+            except RuntimeError:
+                # The event loop of the waiter is closed, so it can't be
+                # woken up, give the slot to the next one
+                continue
+
+    def _wake(self, future):
+        if future.done():
+            # The waiter was cancelled, give the slot to the next one
+            self._release_slot()
+        else:
+            future.set_result(None)
+
+    def get_config(self):
+        return {
+            "max_concurrency": self.max_concurrency,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "backoff_initial_delay": self.backoff_initial_delay,
+            "backoff_max_delay": self.backoff_max_delay,
+            "backoff_multiplier": self.backoff_multiplier,
+        }
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config)
+
+    def __repr__(self):
+        return (
+            f"<RequestScheduler max_concurrency={self.max_concurrency} "
+            f"requests_per_minute={self.requests_per_minute} "
+            f"tokens_per_minute={self.tokens_per_minute}>"
+        )
@@ -0,0 +1,135 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import litellm
+
+from synalinks.src import testing
+from synalinks.src.backend import ChatMessage
+from synalinks.src.backend import ChatMessages
+from synalinks.src.backend import ChatRole
+from synalinks.src.embedding_models import EmbeddingModel
+from synalinks.src.language_models import LanguageModel
+from synalinks.src.language_models import RequestScheduler
+from synalinks.src.saving import serialization_lib
+
+
+class RequestSchedulerTest(testing.TestCase):
+    async def test_max_concurrency(self):
+        scheduler = RequestScheduler(max_concurrency=2)
+        peak_in_flight = 0
+
+        async def request():
+            nonlocal peak_in_flight
+            async with scheduler.request():
+                peak_in_flight = max(peak_in_flight, scheduler.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[request() for _ in range(10)])
+        self.assertEqual(peak_in_flight, 2)
+        metrics = scheduler.get_metrics()
+        self.assertEqual(metrics["requests"], 10)
+        self.assertEqual(metrics["in_flight"], 0)
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertEqual(metrics["peak_queue_depth"], 8)
+
+    async def test_cancelled_request_release_slot(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+
+        async def request():
+            async with scheduler.request():
+                await asyncio.sleep(0.05)
+
+        first = asyncio.ensure_future(request())
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(request())
+        await asyncio.sleep(0)
+        second.cancel()
+        await first
+        with self.assertRaises(asyncio.CancelledError):
+            await second
+        self.assertEqual(scheduler.in_flight, 0)
+        await request()
+        self.assertEqual(scheduler.get_metrics()["requests"], 2)
+
+    async def test_closed_loop_waiter_release_slot(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+
+        async def request():
+            async with scheduler.request():
+                pass
+
+        def wait_in_closed_loop():
+            loop = asyncio.new_event_loop()
+            loop.create_task(request())
+            # Let the request wait for the slot, then close its loop
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+
+        async with scheduler.request():
+            await asyncio.to_thread(wait_in_closed_loop)
+            self.assertEqual(scheduler.queue_depth, 1)
+        # The slot is not lost with the waiter of the closed loop
+        self.assertEqual(scheduler.in_flight, 0)
+        await request()
+
+    async def test_requests_per_minute(self):
+        scheduler = RequestScheduler(requests_per_minute=600)
+        # Empty the bucket, the next request waits for a refill (0.1s)
+        scheduler._buckets["requests"][0] = 0.0
+        start = time.monotonic()
+        async with scheduler.request():
+            pass
+        self.assertGreater(time.monotonic() - start, 0.05)
+
+    async def test_no_backoff_on_invalid_response(self):
+        scheduler = RequestScheduler(backoff_initial_delay=10.0)
+        start = time.monotonic()
+        await scheduler.backoff(0, error=ValueError("Invalid JSON"))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(scheduler.get_metrics()["retries"], 1)
+
+    def test_backoff_delay(self):
+        scheduler = RequestScheduler(backoff_initial_delay=1.0, backoff_max_delay=5.0)
+        for _ in range(10):
+            self.assertTrue(0.5 <= scheduler.get_backoff_delay(0) <= 1.0)
+            self.assertTrue(2.0 <= scheduler.get_backoff_delay(2) <= 4.0)
+            self.assertTrue(2.5 <= scheduler.get_backoff_delay(10) <= 5.0)
+
+    @patch("litellm.acompletion")
+    async def test_language_model_retry_with_backoff(self, mock_completion):
+        scheduler = RequestScheduler(backoff_initial_delay=0.0)
+        language_model = LanguageModel(model="ollama/mistral", scheduler=scheduler)
+
+        messages = ChatMessages(
+            messages=[ChatMessage(role=ChatRole.USER, content="Hello")]
+        )
+
+        mock_completion.side_effect = [
+            litellm.RateLimitError(
+                "Rate limit exceeded", llm_provider="ollama", model="mistral"
+            ),
+            {"choices": [{"message": {"content": "Hello, how can I help you?"}}]},
+        ]
+        result = await language_model(messages)
+        self.assertEqual(result["content"], "Hello, how can I help you?")
+        metrics = scheduler.get_metrics()
+        self.assertEqual(metrics["requests"], 2)
+        self.assertEqual(metrics["retries"], 1)
+
+    def test_shared_scheduler_serialization(self):
+        scheduler = RequestScheduler(max_concurrency=4, tokens_per_minute=1000)
+        language_model = LanguageModel(model="ollama/mistral", scheduler=scheduler)
+        embedding_model = EmbeddingModel(
+            model="ollama/mxbai-embed-large", scheduler=scheduler
+        )
+        self.assertIs(language_model.scheduler, embedding_model.scheduler)
+
+        config = serialization_lib.serialize_synalinks_object(language_model)
+        new_language_model = serialization_lib.deserialize_synalinks_object(config)
+        self.assertEqual(
+            new_language_model.scheduler.get_config(),
+            scheduler.get_config(),
+        )
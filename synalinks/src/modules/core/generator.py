@@ -1,10 +1,14 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import functools
 import re
+import warnings
 from typing import List
 from typing import Optional
 
 import jinja2
+from jinja2 import meta
+from jinja2 import nodes
 
 from synalinks.src import ops
 from synalinks.src.api_export import synalinks_export
@@ -13,8 +17,11 @@ from synalinks.src.backend import ChatMessages
 from synalinks.src.backend import ChatRole
 from synalinks.src.backend import DataModel
 from synalinks.src.backend import Instructions
+from synalinks.src.backend import JsonDataModel
 from synalinks.src.backend import Prediction
 from synalinks.src.backend import SymbolicDataModel
+from synalinks.src.backend import get_predictions_scope
+from synalinks.src.backend import get_streaming_scope
 from synalinks.src.modules.module import Module
 from synalinks.src.saving import serialization_lib
 
@@ -25,6 +32,55 @@ XML_TAGS_REGEX = re.compile(
     re.MULTILINE,
 )
 
+SYSTEM_BLOCK_REGEX = re.compile(
+    r"^\s*<"
+    + ChatRole.SYSTEM
+    + r"\s*(?:[^>]*)>([\s\S]*?)</"
+    + ChatRole.SYSTEM
+    + r">([\s\S]*)$"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_prompt_template(prompt_template):
+    """Compile a jinja2 prompt template (cached by template text).
+
+    When the template starts with a system block that does not depend on the
+    `inputs`, the block is compiled separately from the rest of the template.
+    This allows to render the system message without extracting it from the
+    whole rendered prompt.
+
+    Args:
+        prompt_template (str): The jinja2 prompt template.
+
+    Returns:
+        (tuple): The compiled template, the compiled system block content
+            and the compiled rest of the template (`None` if the template
+            couldn't be split).
+    """
+    template = jinja2.Template(prompt_template)
+    match = SYSTEM_BLOCK_REGEX.match(prompt_template)
+    if match:
+        system_source, rest_source = match.groups()
+        try:
+            environment = jinja2.Environment()
+            system_ast = environment.parse(system_source)
+            variables = meta.find_undeclared_variables(system_ast)
+            # Variables or macros defined in the system block are needed by the rest
+            definitions = list(
+                system_ast.find_all((nodes.Assign, nodes.AssignBlock, nodes.Macro))
+            )
+            if "inputs" not in variables and not definitions:
+                environment.parse(rest_source)
+                return (
+                    template,
+                    jinja2.Template(system_source),
+                    jinja2.Template(rest_source),
+                )
+        except jinja2.TemplateSyntaxError:
+            pass
+    return template, None, None
+
 
 @synalinks_export("synalinks.default_prompt_template")
 def default_prompt_template():
@@ -261,23 +317,34 @@ class Generator(Module):
             streaming = True
         else:
             streaming = False
-        result = await ops.predict(
-            msgs,
-            schema=self.schema,
-            language_model=self.language_model,
-            streaming=streaming,
-            name=self.name + "_prediction",
-        )
-        if streaming:
-            return result
+        streaming_scope = get_streaming_scope()
+        if (
+            not training
+            and streaming_scope is not None
+            and streaming_scope.is_streamed(self)
+        ):
+            result = await self._stream_prediction(msgs, streaming_scope)
+        else:
+            result = await ops.predict(
+                msgs,
+                schema=self.schema,
+                language_model=self.language_model,
+                streaming=streaming,
+                name=self.name + "_prediction",
+            )
+            if streaming:
+                return result
         if result:
             if training:
-                self.state.get("predictions").append(
-                    Prediction(
-                        inputs=inputs.get_json(),
-                        outputs=result.get_json(),
-                    ).get_json()
-                )
+                prediction = Prediction(
+                    inputs=inputs.get_json(),
+                    outputs=result.get_json(),
+                ).get_json()
+                predictions_scope = get_predictions_scope()
+                if predictions_scope is not None:
+                    predictions_scope.record(self.state, prediction)
+                else:
+                    self.state.get("predictions").append(prediction)
             if self.return_inputs:
                 return await ops.concat(
                     inputs,
@@ -288,6 +355,51 @@ class Generator(Module):
                 return result
         return None
 
+    async def _stream_prediction(self, msgs, streaming_scope):
+        """Stream the language model response into the given streaming scope.
+
+        Like the non streamed predictions, the failed streams (e.g. truncated
+        or invalid structured outputs) are retried `language_model.retry`
+        times. Once a chunk has been put in the scope, the stream is not
+        retried anymore, as the consumer would receive the chunks of both
+        attempts.
+
+        Args:
+            msgs (ChatMessages): The messages to send to the language model.
+            streaming_scope (StreamingScope): The scope receiving the chunks.
+
+        Returns:
+            (JsonDataModel): The complete prediction or `None` if it failed.
+        """
+        for _ in range(self.language_model.retry):
+            stream = await self.language_model(
+                msgs,
+                schema=self.schema,
+                streaming=True,
+            )
+            if stream is None:
+                return None
+            streamed = False
+            try:
+                async for chunk in stream:
+                    streaming_scope.put(chunk)
+                    streamed = True
+            except Exception as e:
+                warnings.warn(f"Error occured while streaming {self.name}: " + str(e))
+                if streamed:
+                    return None
+                continue
+            json = stream.get_json()
+            if json is not None:
+                return JsonDataModel(
+                    json=json,
+                    schema=self.schema if self.schema else ChatMessage.get_schema(),
+                    name=self.name + "_prediction",
+                )
+            if streamed:
+                return None
+        return None
+
     async def compute_output_spec(self, inputs, training=False):
         if self.schema:
             if self.return_inputs:
@@ -321,8 +433,10 @@ class Generator(Module):
                 )
 
     def format_messages(self, inputs=None):
-        template = jinja2.Template(self.state.get("prompt_template"))
-        rendered_prompt = template.render(
+        template, system_template, rest_template = _compile_prompt_template(
+            self.state.get("prompt_template")
+        )
+        variables = dict(
             static_system_prompt=self.static_system_prompt,
             inputs_schema=inputs.get_schema() if self.use_inputs_schema else None,
             outputs_schema=self.schema if self.use_outputs_schema else None,
@@ -333,8 +447,16 @@ class Generator(Module):
             instructions=self.state.get("instructions").get("instructions"),
             inputs=inputs.get_json() if inputs else None,
         )
+        if system_template:
+            extracted_tags = [
+                (ChatRole.SYSTEM, system_template.render(**variables).strip())
+            ]
+            rendered_prompt = rest_template.render(**variables)
+        else:
+            extracted_tags = []
+            rendered_prompt = template.render(**variables)
         matches = XML_TAGS_REGEX.findall(rendered_prompt)
-        extracted_tags = [(match[0], match[1].strip()) for match in matches]
+        extracted_tags.extend([(match[0], match[1].strip()) for match in matches])
         messages = []
         for message in extracted_tags:
             role, content = message
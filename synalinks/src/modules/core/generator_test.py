@@ -3,12 +3,15 @@
 import json
 from unittest.mock import patch
 
+import jinja2
+
 from synalinks import modules
 from synalinks.src import testing
 from synalinks.src.backend import DataModel
 from synalinks.src.language_models import LanguageModel
 from synalinks.src.modules import Generator
 from synalinks.src.modules import Input
+from synalinks.src.modules.core.generator import XML_TAGS_REGEX
 from synalinks.src.programs import Program
 
 
@@ -52,6 +55,59 @@ class GeneratorModuleTest(testing.TestCase):
         )
         self.assertTrue(len(msgs) == 2)
 
+    def test_format_message_same_as_full_template(self):
+        class Query(DataModel):
+            query: str
+
+        class AnswerWithRationale(DataModel):
+            rationale: str
+            answer: str
+
+        language_model = LanguageModel(model="ollama/mistral")
+
+        generator = Generator(
+            data_model=AnswerWithRationale,
+            language_model=language_model,
+            instructions=["You are an helpfull assistant"],
+        )
+        inputs = Query(query="What is the french city of aerospace and robotics?")
+        rendered_prompt = jinja2.Template(generator.prompt_template).render(
+            examples=[],
+            instructions=generator.state.get("instructions").get("instructions"),
+            inputs=inputs.get_json(),
+        )
+        expected = [
+            (role, content.strip())
+            for role, content in XML_TAGS_REGEX.findall(rendered_prompt)
+        ]
+        msgs = generator.format_messages(inputs)
+        self.assertEqual([(msg.role, msg.content) for msg in msgs], expected)
+
+    def test_format_message_after_prompt_template_change(self):
+        class Query(DataModel):
+            query: str
+
+        class Answer(DataModel):
+            answer: str
+
+        language_model = LanguageModel(model="ollama/mistral")
+
+        generator = Generator(
+            data_model=Answer,
+            language_model=language_model,
+            instructions=["You are an helpfull assistant"],
+        )
+        inputs = Query(query="What is the french city of aerospace and robotics?")
+        msgs = generator.format_messages(inputs)
+        self.assertEqual(msgs[0].role, "system")
+        generator.state.update(
+            {"prompt_template": "<user>{{ inputs }}</user>"},
+        )
+        msgs = generator.format_messages(inputs)
+        self.assertEqual(len(msgs), 1)
+        self.assertEqual(msgs[0].role, "user")
+        self.assertEqual(msgs[0].content, str(inputs.get_json()))
+
     def test_format_message_with_examples(self):
         class Query(DataModel):
             query: str
@@ -234,6 +290,150 @@ class GeneratorModuleTest(testing.TestCase):
 
         self.assertEqual(result.get_json(), json.loads(expected_string))
 
+    @patch("litellm.acompletion")
+    async def test_program_stream(self, mock_completion):
+        class Query(DataModel):
+            query: str
+
+        class Rationale(DataModel):
+            rationale: str
+
+        language_model = LanguageModel(model="ollama/mistral")
+
+        inputs = Input(data_model=Query)
+        x = await Generator(
+            data_model=Rationale,
+            language_model=language_model,
+        )(inputs)
+        outputs = await Generator(
+            language_model=language_model,
+        )(x)
+        program = Program(inputs=inputs, outputs=outputs)
+
+        async def mock_response_stream():
+            for content in ["The answer", " is", " Toulouse."]:
+                yield {"choices": [{"delta": {"content": content}}]}
+
+        mock_completion.side_effect = [
+            {
+                "choices": [
+                    {"message": {"content": '{"rationale": "Toulouse hosts Airbus."}'}}
+                ]
+            },
+            mock_response_stream(),
+        ]
+
+        chunks = []
+        async for chunk in program.stream(
+            Query(query="What is the french city of aerospace and robotics?")
+        ):
+            chunks.append(chunk)
+
+        self.assertEqual(
+            [chunk["content"] for chunk in chunks],
+            ["The answer", " is", " Toulouse."],
+        )
+        # Only the final generator is streamed
+        self.assertNotIn("stream", mock_completion.call_args_list[0].kwargs)
+        self.assertTrue(mock_completion.call_args_list[1].kwargs["stream"])
+
+    @patch("litellm.acompletion")
+    async def test_program_stream_structured_output(self, mock_completion):
+        class Query(DataModel):
+            query: str
+
+        class AnswerWithRationale(DataModel):
+            rationale: str
+            answer: str
+
+        language_model = LanguageModel(model="ollama/mistral")
+
+        inputs = Input(data_model=Query)
+        outputs = await Generator(
+            data_model=AnswerWithRationale,
+            language_model=language_model,
+        )(inputs)
+        program = Program(inputs=inputs, outputs=outputs)
+
+        expected = {"rationale": "Toulouse hosts Airbus.", "answer": "Toulouse"}
+        text = json.dumps(expected)
+
+        async def mock_response_stream():
+            for i in range(0, len(text), 4):
+                yield {"choices": [{"delta": {"content": text[i : i + 4]}}]}
+
+        mock_completion.return_value = mock_response_stream()
+
+        chunks = []
+        async for chunk in program.stream(
+            Query(query="What is the french city of aerospace and robotics?")
+        ):
+            chunks.append(chunk)
+
+        self.assertGreater(len(chunks), 2)
+        self.assertEqual(chunks[-1], expected)
+
+    @patch("litellm.acompletion")
+    async def test_program_stream_invalid_structured_output(self, mock_completion):
+        class Query(DataModel):
+            query: str
+
+        class AnswerWithRationale(DataModel):
+            rationale: str
+            answer: str
+
+        language_model = LanguageModel(model="ollama/mistral", retry=2)
+
+        inputs = Input(data_model=Query)
+        outputs = await Generator(
+            data_model=AnswerWithRationale,
+            language_model=language_model,
+        )(inputs)
+        program = Program(inputs=inputs, outputs=outputs)
+
+        expected = {"rationale": "Toulouse hosts Airbus.", "answer": "Toulouse"}
+        text = json.dumps(expected)
+
+        def mock_response_stream(text):
+            async def stream():
+                for i in range(0, len(text), 4):
+                    yield {"choices": [{"delta": {"content": text[i : i + 4]}}]}
+
+            return stream()
+
+        async def mock_failed_stream():
+            raise ConnectionError("Connection reset")
+            yield
+
+        # The stream failing before its first chunk is retried
+        mock_completion.side_effect = [
+            mock_failed_stream(),
+            mock_response_stream(text),
+        ]
+        with self.assertWarns(Warning):
+            chunks = [
+                chunk
+                async for chunk in program.stream(
+                    Query(query="What is the french city of aerospace and robotics?")
+                )
+            ]
+        self.assertEqual(chunks[-1], expected)
+
+        # The truncated stream is not retried, its chunks being already received
+        mock_completion.reset_mock()
+        mock_completion.side_effect = [
+            mock_response_stream(text[:20]),
+            mock_response_stream(text),
+        ]
+        chunks = [
+            chunk
+            async for chunk in program.stream(
+                Query(query="What is the french city of aerospace and robotics?")
+            )
+        ]
+        self.assertNotIn(expected, chunks)
+        self.assertEqual(mock_completion.call_count, 1)
+
     def test_serialization(self):
         class Query(DataModel):
             query: str
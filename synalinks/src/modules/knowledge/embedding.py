@@ -1,9 +1,11 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 import copy
 import warnings
 
 from synalinks.src import ops
+from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import Embedding as EmbeddingVector
 from synalinks.src.backend import JsonDataModel
@@ -16,6 +18,88 @@ from synalinks.src.modules.module import Module
 from synalinks.src.saving import serialization_lib
 
 
+class _EmbeddingBatcher:
+    """Coalesce the texts to embed into as few embedding requests as possible.
+
+    The texts requested by concurrent callers during the same event loop
+    iteration (e.g. the samples of a `predict()` batch) are merged together,
+    deduplicated and sent to the embedding model in chunks of `batch_size`.
+    """
+
+    def __init__(self, embedding_model, batch_size=512):
+        self.embedding_model = embedding_model
+        self.batch_size = batch_size
+        self._pending = []
+        self._loop = None
+        # The event loop only keeps a weak reference to its tasks
+        self._flush_task = None
+
+    async def embed(self, texts):
+        """Embed the given texts.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            (list): The corresponding vectors, `None` for the texts
+                that couldn't be embedded.
+        """
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._pending = []
+            self._loop = loop
+        future = loop.create_future()
+        self._pending.append((texts, future))
+        if len(self._pending) == 1:
+            self._flush_task = loop.create_task(self._flush())
+        return await future
+
+    async def _flush(self):
+        pending = None
+        try:
+            # Let the other concurrent callers register their texts
+            await asyncio.sleep(0)
+            pending = self._pending
+            self._pending = []
+            await self._embed_pending(pending)
+        finally:
+            if pending is None:
+                # Cancelled before the pending texts were taken
+                pending = self._pending
+                self._pending = []
+            # Don't leave the callers waiting if the flush was cancelled
+            for _, future in pending:
+                if not future.done():
+                    future.cancel()
+
+    async def _embed_pending(self, pending):
+        unique_texts = list(dict.fromkeys(t for texts, _ in pending for t in texts))
+        chunks = [
+            unique_texts[i : i + self.batch_size]
+            for i in range(0, len(unique_texts), self.batch_size)
+        ]
+        try:
+            results = await asyncio.gather(
+                *[self.embedding_model(texts=chunk) for chunk in chunks]
+            )
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        vectors = {}
+        for chunk, result in zip(chunks, results):
+            embeddings = result.get("embeddings") if result else None
+            if not embeddings or len(embeddings) != len(chunk):
+                continue
+            vectors.update(zip(chunk, embeddings))
+        for texts, future in pending:
+            if not future.done():
+                future.set_result([vectors.get(t) for t in texts])
+
+
 @synalinks_export(
     [
         "synalinks.modules.Embedding",
@@ -70,6 +154,11 @@ class Embedding(Module):
         asyncio.run(main())
     ```
 
+    All the texts to embed (from the entities and the relations' subjects and
+    objects) are sent to the embedding model together, in chunks of `batch_size`
+    texts. When processing a batch with `program.predict()`, the texts of the
+    samples processed concurrently are also merged into the same requests.
+
     If you want to process batch asynchronously
     use `program.predict()` instead, see the [FAQ](https://synalinks.github.io/synalinks/FAQ/#whats-the-difference-between-program-methods-predict-and-__call__)
     to understand the difference between `program()` and `program.predict()`
@@ -118,6 +207,8 @@ class Embedding(Module):
         embedding_model (EmbeddingModel): The embedding model to use.
         in_mask (list): A mask applied to keep specific entity fields.
         out_mask (list): A mask applied to remove specific entity fields.
+        batch_size (int): The maximum number of texts sent per embedding
+            request (Default to 512).
         name (str): Optional. The name of the module.
         description (str): Optional. The description of the module.
         trainable (bool): Whether the module's variables should be trainable.
@@ -128,6 +219,7 @@ class Embedding(Module):
         embedding_model=None,
         in_mask=None,
         out_mask=None,
+        batch_size=512,
         name=None,
         description=None,
         trainable=False,
@@ -140,19 +232,10 @@ class Embedding(Module):
         self.embedding_model = embedding_model
         self.in_mask = in_mask
         self.out_mask = out_mask
+        self.batch_size = batch_size
+        self._batcher = _EmbeddingBatcher(embedding_model, batch_size=batch_size)
 
-    async def _embed_entity(self, entity):
-        # # Check if entity is already embedded and has valid embeddings
-        embeddings = entity.get("embeddings")
-        if embeddings:
-            warnings.warn(
-                "Embeddings already generated for entity.Returning original entity."
-            )
-            return JsonDataModel(
-                json=entity.get_json(),
-                schema=entity.get_schema(),
-                name=entity.name + "_embedded",
-            )
+    async def _get_texts(self, entity):
         # Apply masking to the entity
         filtered_entity = entity  # Default to original entity
 
@@ -170,46 +253,86 @@ class Embedding(Module):
                 recursive=False,
                 name=entity.name + "_in_mask",
             )
-
-        # Generate embeddings
-        embeddings = await ops.embedding(
-            filtered_entity,
-            embedding_model=self.embedding_model,
-            name=entity.name + "_embedding",
+        return tree.flatten(
+            tree.map_structure(lambda field: str(field), filtered_entity.get_json())
         )
 
-        # Validate embeddings
-        if not embeddings or not embeddings.get("embeddings"):
-            warnings.warn(
-                f"No embeddings generated for entity {entity.name}. "
-                "Please check that your schema is correct."
+    async def _embed_entities(self, entities):
+        """Embed the given entities using as few embedding requests as possible.
+
+        Returns:
+            (list): The embedded entities, `None` for the entities that
+                couldn't be embedded.
+        """
+        outputs = [None] * len(entities)
+        texts = []
+        indices = []
+        for i, entity in enumerate(entities):
+            # Check if entity is already embedded and has valid embeddings
+            if entity.get("embeddings"):
+                warnings.warn(
+                    "Embeddings already generated for entity.Returning original entity."
+                )
+                outputs[i] = JsonDataModel(
+                    json=entity.get_json(),
+                    schema=entity.get_schema(),
+                    name=entity.name + "_embedded",
+                )
+                continue
+            entity_texts = await self._get_texts(entity)
+            if not entity_texts:
+                warnings.warn(
+                    f"No embeddings generated for entity {entity.name}. "
+                    "Please check that your schema is correct."
+                )
+                continue
+            if len(entity_texts) != 1:
+                warnings.warn(
+                    "Entities can only have one embedding vector per entity, "
+                    "adjust `Embedding` module's `in_mask` or `out_mask` "
+                    "to keep only one field. Skipping embedding."
+                )
+                continue
+            texts.append(entity_texts[0])
+            indices.append(i)
+
+        vectors = await self._batcher.embed(texts)
+
+        for i, vector in zip(indices, vectors):
+            entity = entities[i]
+            if vector is None:
+                warnings.warn(
+                    f"No embeddings generated for entity {entity.name}. "
+                    "Please check that your schema is correct."
+                )
+                continue
+            # Add embedding to entity
+            outputs[i] = await ops.concat(
+                entity,
+                EmbeddingVector(embedding=vector),
+                name=entity.name + "_embedded",
             )
-            return None
+        return outputs
 
-        embedding_list = embeddings.get("embeddings")
-        if len(embedding_list) != 1:
-            warnings.warn(
-                "Entities can only have one embedding vector per entity, "
-                "adjust `Embedding` module's `in_mask` or `out_mask` "
-                "to keep only one field. Skipping embedding."
-            )
+    async def _embed_entity(self, entity):
+        return (await self._embed_entities([entity]))[0]
+
+    def _get_relations_entities(self, relations):
+        entities = []
+        for relation in relations:
+            subj = relation.get_nested_entity("subj")
+            obj = relation.get_nested_entity("obj")
+            if not subj or not obj:
+                entities.extend([None, None])
+            else:
+                entities.extend([subj, obj])
+        return entities
+
+    def _build_embedded_relation(self, relation, embedded_subj, embedded_obj):
+        if not embedded_subj or not embedded_obj:
             return None
-
-        # Add embedding to entity
-        vector = embedding_list[0]
-        return await ops.concat(
-            entity,
-            EmbeddingVector(embedding=vector),
-            name=entity.name + "_embedded",
-        )
-
-    async def _embed_relation(self, relation):
         subj = relation.get_nested_entity("subj")
         obj = relation.get_nested_entity("obj")
-        if not subj or not obj:
-            return None
-        embedded_subj = await self._embed_entity(subj)
-        embedded_obj = await self._embed_entity(obj)
 
         relation_json = copy.deepcopy(relation.get_json())
         relation_json.update(
@@ -245,6 +368,32 @@ class Embedding(Module):
             name=relation.name + "_embedded",
         )
 
+    async def _embed_relations(self, relations, entities=None):
+        """Embed the given relations (and entities) in a single pass.
+
+        Returns:
+            (tuple): The embedded entities and the embedded relations.
+        """
+        entities = entities or []
+        relations_entities = self._get_relations_entities(relations)
+        to_embed = [entity for entity in entities + relations_entities if entity]
+        embedded = iter(await self._embed_entities(to_embed))
+        embedded_entities = [next(embedded) for _ in entities]
+        embedded_relations = []
+        for i, relation in enumerate(relations):
+            subj, obj = relations_entities[2 * i], relations_entities[2 * i + 1]
+            if not subj or not obj:
+                embedded_relations.append(None)
+                continue
+            embedded_relations.append(
+                self._build_embedded_relation(relation, next(embedded), next(embedded))
+            )
+        return embedded_entities, embedded_relations
+
+    async def _embed_relation(self, relation):
+        _, embedded_relations = await self._embed_relations([relation])
+        return embedded_relations[0]
+
     async def call(self, inputs):
         if not inputs:
             return None
@@ -253,9 +402,15 @@ class Embedding(Module):
             relations_json = []
             outputs_schema = copy.deepcopy(inputs.get_schema())
 
+            entities = inputs.get_nested_entity_list("entities")
+            relations = inputs.get_nested_entity_list("relations")
+            embedded_entities, embedded_relations = await self._embed_relations(
+                relations,
+                entities=entities,
+            )
+
             # Process entities
-            for entity in inputs.get_nested_entity_list("entities"):
-                embedded_entity = await self._embed_entity(entity)
+            for entity, embedded_entity in zip(entities, embedded_entities):
                 if embedded_entity:
                     entities_json.append(embedded_entity.get_json())
 
@@ -269,8 +424,7 @@ class Embedding(Module):
                                     "properties"
                                 ].update(embedded_schema["properties"])
             # Process relations
-            for relation in inputs.get_nested_entity_list("relations"):
-                embedded_relation = await self._embed_relation(relation)
+            for embedded_relation in embedded_relations:
                 if embedded_relation:
                     relations_json.append(embedded_relation.get_json())
 
@@ -289,8 +443,11 @@ class Embedding(Module):
                                     outputs_schema["$defs"][def_key] = def_value
 
             # Update output JSON
-            outputs_json = inputs.get_json()
-            outputs_json.update({"entities": entities_json, "relations": relations_json})
+            outputs_json = {
+                **inputs.get_json(),
+                "entities": entities_json,
+                "relations": relations_json,
+            }
             return JsonDataModel(
                 json=outputs_json,
                 schema=outputs_schema,
@@ -302,8 +459,9 @@ class Embedding(Module):
             outputs_schema = copy.deepcopy(inputs.get_schema())
 
             # Process all entities and collect schema updates
-            for entity in inputs.get_nested_entity_list("entities"):
-                embedded_entity = await self._embed_entity(entity)
+            entities = inputs.get_nested_entity_list("entities")
+            embedded_entities = await self._embed_entities(entities)
+            for entity, embedded_entity in zip(entities, embedded_entities):
                 if embedded_entity:
                     entities_json.append(embedded_entity.get_json())
 
@@ -318,8 +476,7 @@ class Embedding(Module):
                                 ].update(embedded_schema["properties"])
 
             # Update output JSON with embedded entities
-            outputs_json = inputs.get_json()
-            outputs_json.update({"entities": entities_json})
+            outputs_json = {**inputs.get_json(), "entities": entities_json}
 
             return JsonDataModel(
                 json=outputs_json,
@@ -332,8 +489,10 @@ class Embedding(Module):
             outputs_schema = copy.deepcopy(inputs.get_schema())
 
             # Process all relations
-            for relation in inputs.get_nested_entity_list("relations"):
-                embedded_relation = await self._embed_relation(relation)
+            _, embedded_relations = await self._embed_relations(
+                inputs.get_nested_entity_list("relations")
+            )
+            for embedded_relation in embedded_relations:
                 if embedded_relation:
                     relations_json.append(embedded_relation.get_json())
 
@@ -353,8 +512,7 @@ class Embedding(Module):
                                     outputs_schema["$defs"][def_key] = def_value
 
             # Update output JSON
-            outputs_json = inputs.get_json()
-            outputs_json.update({"relations": relations_json})
+            outputs_json = {**inputs.get_json(), "relations": relations_json}
 
             return JsonDataModel(
                 json=outputs_json,
@@ -375,6 +533,7 @@ class Embedding(Module):
         config = {
             "in_mask": self.in_mask,
             "out_mask": self.out_mask,
+            "batch_size": self.batch_size,
             "name": self.name,
             "description": self.description,
             "trainable": self.trainable,
@@ -1,5 +1,6 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 from typing import List
 from typing import Literal
 from unittest.mock import patch
@@ -16,6 +17,7 @@ from synalinks.src.backend import is_embedded_entity
 from synalinks.src.embedding_models import EmbeddingModel
 from synalinks.src.modules import Input
 from synalinks.src.modules.knowledge.embedding import Embedding
+from synalinks.src.modules.knowledge.embedding import _EmbeddingBatcher
 from synalinks.src.programs import Program
 
 
@@ -46,8 +48,9 @@ class DocumentGraph(KnowledgeGraph):
 class EmbeddingTest(testing.TestCase):
     @patch("litellm.aembedding")
     async def test_embedding_single_entity(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(
             model="ollama/mxbai-embed-large",
@@ -77,8 +80,9 @@ class EmbeddingTest(testing.TestCase):
 
     @patch("litellm.aembedding")
     async def test_embedding_single_relation(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(
             model="ollama/mxbai-embed-large",
@@ -119,8 +123,9 @@ class EmbeddingTest(testing.TestCase):
 
     @patch("litellm.aembedding")
     async def test_embedding_entities(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(
             model="ollama/mxbai-embed-large",
@@ -159,10 +164,64 @@ class EmbeddingTest(testing.TestCase):
         for entity in result.get_nested_entity_list("entities"):
             self.assertTrue(is_embedded_entity(entity))
 
+    @patch("litellm.aembedding")
+    async def test_embedding_entities_does_not_mutate_inputs(self, mock_embedding):
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
+
+        embedding_model = EmbeddingModel(
+            model="ollama/mxbai-embed-large",
+        )
+
+        embedding = Embedding(
+            embedding_model=embedding_model,
+            in_mask=["text"],
+        )
+
+        inputs = Documents(
+            entities=[
+                Document(
+                    label="Document",
+                    text="test document",
+                ),
+            ]
+        ).to_json_data_model()
+        clone = inputs.clone()
+
+        result = await embedding(inputs)
+        self.assertIn("embedding", result.get_json()["entities"][0])
+        self.assertEqual(
+            inputs.get_json(),
+            {"entities": [{"label": "Document", "text": "test document"}]},
+        )
+        self.assertIs(clone.get_json(), inputs.get_json())
+
+    async def test_embedding_batcher_flush_cancelled(self):
+        started = asyncio.Event()
+
+        async def embedding_model(texts=None):
+            started.set()
+            await asyncio.sleep(10)
+
+        batcher = _EmbeddingBatcher(embedding_model)
+        results = asyncio.gather(
+            batcher.embed(["test document 1"]),
+            batcher.embed(["test document 2"]),
+            return_exceptions=True,
+        )
+        await started.wait()
+        batcher._flush_task.cancel()
+        # The callers are not left waiting
+        results = await asyncio.wait_for(results, timeout=10)
+        for result in results:
+            self.assertIsInstance(result, asyncio.CancelledError)
+
     @patch("litellm.aembedding")
     async def test_embedding_relations(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(
             model="ollama/mxbai-embed-large",
@@ -229,8 +288,9 @@ class EmbeddingTest(testing.TestCase):
 
     @patch("litellm.aembedding")
     async def test_embedding_knowledge_graph(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(
             model="ollama/mxbai-embed-large",
@@ -310,3 +370,84 @@ class EmbeddingTest(testing.TestCase):
             obj = relation.get_nested_entity("obj")
             self.assertTrue(is_embedded_entity(subj))
             self.assertTrue(is_embedded_entity(obj))
+
+    @patch("litellm.aembedding")
+    async def test_embedding_knowledge_graph_single_request(self, mock_embedding):
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
+
+        embedding_model = EmbeddingModel(
+            model="ollama/mxbai-embed-large",
+        )
+
+        i0 = Input(data_model=DocumentGraph)
+
+        x0 = await Embedding(
+            embedding_model=embedding_model,
+            in_mask=["text"],
+        )(i0)
+
+        program = Program(
+            inputs=i0,
+            outputs=x0,
+            name="test_embedding",
+            description="test_embedding",
+        )
+
+        inputs = DocumentGraph(
+            entities=[
+                Document(label="Document", text=f"test document {i}") for i in range(10)
+            ],
+            relations=[
+                IsPartOf(
+                    subj=Document(label="Document", text=f"test document {i}"),
+                    label="IsPartOf",
+                    obj=Document(label="Document", text=f"test document {i + 1}"),
+                )
+                for i in range(5)
+            ],
+        )
+
+        mock_embedding.reset_mock()
+        result = await program(inputs)
+        self.assertEqual(mock_embedding.call_count, 1)
+        self.assertEqual(len(mock_embedding.call_args.kwargs["input"]), 10)
+        for entity in result.get_nested_entity_list("entities"):
+            self.assertTrue(is_embedded_entity(entity))
+
+    @patch("litellm.aembedding")
+    async def test_embedding_predict_batch_chunked_requests(self, mock_embedding):
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
+
+        embedding_model = EmbeddingModel(
+            model="ollama/mxbai-embed-large",
+        )
+
+        i0 = Input(data_model=Document)
+
+        x0 = await Embedding(
+            embedding_model=embedding_model,
+            in_mask=["text"],
+            batch_size=4,
+        )(i0)
+
+        program = Program(
+            inputs=i0,
+            outputs=x0,
+            name="test_embedding",
+            description="test_embedding",
+        )
+
+        docs = np.array(
+            [Document(label="Document", text=f"test document {i}") for i in range(10)],
+            dtype="object",
+        )
+
+        mock_embedding.reset_mock()
+        results = await program.predict(docs, batch_size=10, verbose=0)
+        self.assertEqual(mock_embedding.call_count, 3)
+        for result in results:
+            self.assertTrue(is_embedded_entity(result))
@@ -4,6 +4,7 @@ from synalinks.src import ops
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import SimilaritySearch
 from synalinks.src.backend.common.dynamic_json_schema_utils import dynamic_enum
+from synalinks.src.backend.common.dynamic_json_schema_utils import dynamic_list
 from synalinks.src.modules import Module
 from synalinks.src.modules.core.generator import Generator
 
@@ -110,6 +111,14 @@ class EntityRetriever(Module):
         threshold (float): Minimum similarity score for results.
             Entities with similarity below this threshold are excluded.
             Should be between 0.0 and 1.0 (Defaults to 0.5).
+        num_searches (int): Optional. The maximum number of similarity searches
+            generated from the inputs, they are run concurrently (Default to 1).
+        max_concurrency (int): Optional. The maximum number of searches running
+            at once (Default to None, all at once).
+        search_type (str): Optional. The type of search, `vector`, `lexical`
+            (BM25, without embedding call) or `hybrid` (both fused with the
+            reciprocal rank fusion). The lexical and hybrid searches require
+            the `lexical_index` of the knowledge base (Default to `vector`).
         prompt_template (str): The default jinja2 prompt template
             to use (see `Generator`).
         examples (list): The default examples to use in the prompt
@@ -135,6 +144,9 @@ class EntityRetriever(Module):
         entity_models=None,
         k=10,
         threshold=0.5,
+        num_searches=1,
+        max_concurrency=None,
+        search_type="vector",
         prompt_template=None,
         examples=None,
         instructions=None,
@@ -155,6 +167,9 @@ class EntityRetriever(Module):
         self.language_model = language_model
         self.k = k
         self.threshold = threshold
+        self.num_searches = num_searches
+        self.max_concurrency = max_concurrency
+        self.search_type = search_type
         self.prompt_template = prompt_template
         self.examples = examples
         if not instructions:
@@ -165,6 +180,11 @@ class EntityRetriever(Module):
                     "entities to match",
                 )
             ]
+            if num_searches > 1:
+                instructions.append(
+                    f"Use up to {num_searches} similarity searches to retrieve "
+                    "the different pieces of knowledge needed"
+                )
         self.instructions = instructions
         self.use_inputs_schema = use_inputs_schema
         self.use_outputs_schema = use_outputs_schema
@@ -187,6 +207,15 @@ class EntityRetriever(Module):
             description="The entity label to search for",
         )
 
+        if self.num_searches > 1:
+            self.schema = dynamic_list(
+                schema=self.schema,
+                prop_name="similarity_searches",
+                title="SimilaritySearches",
+                max_items=self.num_searches,
+                description="The similarity searches to run",
+            )
+
         self.query_generator = Generator(
             schema=self.schema,
             language_model=self.language_model,
@@ -217,6 +246,8 @@ class EntityRetriever(Module):
                             knowledge_base=self.knowledge_base,
                             k=self.k,
                             threshold=self.threshold,
+                            max_concurrency=self.max_concurrency,
+                            search_type=self.search_type,
                             name=self.name + "_similarity_search",
                         ),
                         name=self.name + "_similarity_search_with_query_and_inputs",
@@ -230,6 +261,8 @@ class EntityRetriever(Module):
                         knowledge_base=self.knowledge_base,
                         k=self.k,
                         threshold=self.threshold,
+                        max_concurrency=self.max_concurrency,
+                        search_type=self.search_type,
                         name=self.name + "_similarity_search",
                     ),
                     name=self.name + "_similarity_search_with_inputs",
@@ -243,6 +276,8 @@ class EntityRetriever(Module):
                         knowledge_base=self.knowledge_base,
                         k=self.k,
                         threshold=self.threshold,
+                        max_concurrency=self.max_concurrency,
+                        search_type=self.search_type,
                         name=self.name + "_similarity_search",
                     ),
                     name=self.name + "_similarity_search_with_query",
@@ -253,5 +288,7 @@ class EntityRetriever(Module):
                     knowledge_base=self.knowledge_base,
                     k=self.k,
                     threshold=self.threshold,
+                    max_concurrency=self.max_concurrency,
+                    search_type=self.search_type,
                     name=self.name + "_similarity_search",
                 )
@@ -4,6 +4,7 @@ from synalinks.src import ops
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import TripletSearch
 from synalinks.src.backend.common.dynamic_json_schema_utils import dynamic_enum
+from synalinks.src.backend.common.dynamic_json_schema_utils import dynamic_list
 from synalinks.src.modules import Module
 from synalinks.src.modules.ttc.chain_of_thought import ChainOfThought
 
@@ -125,6 +126,14 @@ class KnowledgeRetriever(Module):
         threshold (float): Minimum similarity score for results.
             Entities with similarity below this threshold are excluded.
             Should be between 0.0 and 1.0 (Defaults to 0.5).
+        num_searches (int): Optional. The maximum number of triplet searches
+            generated from the inputs, they are run concurrently (Default to 1).
+        max_concurrency (int): Optional. The maximum number of searches running
+            at once (Default to None, all at once).
+        search_type (str): Optional. The type of search, `vector`, `lexical`
+            (BM25, without embedding call) or `hybrid` (both fused with the
+            reciprocal rank fusion). The lexical and hybrid searches require
+            the `lexical_index` of the knowledge base (Default to `vector`).
         prompt_template (str): The default jinja2 prompt template
             to use (see `Generator`).
         examples (list): The default examples to use in the prompt
@@ -151,6 +160,9 @@ class KnowledgeRetriever(Module):
         relation_models=None,
         k=10,
         threshold=0.5,
+        num_searches=1,
+        max_concurrency=None,
+        search_type="vector",
         prompt_template=None,
         examples=None,
         instructions=None,
@@ -171,6 +183,9 @@ class KnowledgeRetriever(Module):
         self.language_model = language_model
         self.k = k
         self.threshold = threshold
+        self.num_searches = num_searches
+        self.max_concurrency = max_concurrency
+        self.search_type = search_type
         self.prompt_template = prompt_template
         self.examples = examples
         if not instructions:
@@ -189,6 +204,11 @@ class KnowledgeRetriever(Module):
                     "for the entity you are looking for"
                 ),
             ]
+            if num_searches > 1:
+                instructions.append(
+                    f"Use up to {num_searches} triplet searches to retrieve "
+                    "the different pieces of knowledge needed"
+                )
         self.instructions = instructions
         self.use_inputs_schema = use_inputs_schema
         self.use_outputs_schema = use_outputs_schema
@@ -233,6 +253,15 @@ class KnowledgeRetriever(Module):
             description="The object label to match",
         )
 
+        if self.num_searches > 1:
+            self.schema = dynamic_list(
+                schema=self.schema,
+                prop_name="triplet_searches",
+                title="TripletSearches",
+                max_items=self.num_searches,
+                description="The triplet searches to run",
+            )
+
         self.query_generator = ChainOfThought(
             schema=self.schema,
             language_model=self.language_model,
@@ -263,6 +292,8 @@ class KnowledgeRetriever(Module):
                             knowledge_base=self.knowledge_base,
                             k=self.k,
                             threshold=self.threshold,
+                            max_concurrency=self.max_concurrency,
+                            search_type=self.search_type,
                             name=self.name + "_similarity_search",
                         ),
                         name=self.name + "_similarity_search_with_query_and_inputs",
@@ -276,6 +307,8 @@ class KnowledgeRetriever(Module):
                         knowledge_base=self.knowledge_base,
                         k=self.k,
                         threshold=self.threshold,
+                        max_concurrency=self.max_concurrency,
+                        search_type=self.search_type,
                         name=self.name + "_similarity_search",
                     ),
                     name=self.name + "_similarity_search_with_inputs",
@@ -289,6 +322,8 @@ class KnowledgeRetriever(Module):
                         knowledge_base=self.knowledge_base,
                         k=self.k,
                         threshold=self.threshold,
+                        max_concurrency=self.max_concurrency,
+                        search_type=self.search_type,
                         name=self.name + "_similarity_search",
                     ),
                     name=self.name + "_similarity_search_with_query",
@@ -299,5 +334,7 @@ class KnowledgeRetriever(Module):
                     knowledge_base=self.knowledge_base,
                     k=self.k,
                     threshold=self.threshold,
+                    max_concurrency=self.max_concurrency,
+                    search_type=self.search_type,
                     name=self.name + "_similarity_search",
                 )
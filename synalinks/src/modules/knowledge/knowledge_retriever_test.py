@@ -1,7 +1,138 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import json
+import zlib
+from typing import Literal
+from unittest.mock import patch
+
+import numpy as np
+
 from synalinks.src import testing
+from synalinks.src.backend import DataModel
+from synalinks.src.backend import Entity
+from synalinks.src.backend import Field
+from synalinks.src.backend import Relation
+from synalinks.src.embedding_models import EmbeddingModel
+from synalinks.src.knowledge_bases import KnowledgeBase
+from synalinks.src.language_models import LanguageModel
+from synalinks.src.modules import Input
+from synalinks.src.modules.knowledge.embedding import Embedding
+from synalinks.src.modules.knowledge.knowledge_retriever import KnowledgeRetriever
+from synalinks.src.programs import Program
+
+
+class Query(DataModel):
+    query: str = Field(
+        description="The user query",
+    )
+
+
+class City(Entity):
+    label: Literal["City"]
+    name: str
+
+
+class Country(Entity):
+    label: Literal["Country"]
+    name: str
+
+
+class IsCapitalOf(Relation):
+    subj: City
+    label: Literal["IsCapitalOf"]
+    obj: Country
+
+
+def mock_embedding_fn(**kwargs):
+    embeddings = []
+    for text in kwargs["input"]:
+        rng = np.random.default_rng(zlib.crc32(text.encode()))
+        embeddings.append({"embedding": rng.normal(size=(16,)).tolist()})
+    return {"data": embeddings}
 
 
 class KnowledgeRetrieverTest(testing.TestCase):
-    pass
+    @patch("litellm.aembedding")
+    @patch("litellm.acompletion")
+    async def test_knowledge_retriever_num_searches(
+        self, mock_completion, mock_embedding
+    ):
+        mock_embedding.side_effect = mock_embedding_fn
+        embedding_model = EmbeddingModel(model="ollama/mxbai-embed-large")
+        knowledge_base = await KnowledgeBase.create(
+            uri="local://:memory:",
+            entity_models=[City, Country],
+            relation_models=[IsCapitalOf],
+            embedding_model=embedding_model,
+        )
+
+        inputs = Input(data_model=IsCapitalOf)
+        outputs = await Embedding(
+            embedding_model=embedding_model,
+            in_mask=["name"],
+        )(inputs)
+        embedding_program = Program(inputs=inputs, outputs=outputs)
+        relations = [
+            IsCapitalOf(
+                subj=City(label="City", name=city),
+                label="IsCapitalOf",
+                obj=Country(label="Country", name=country),
+            )
+            for city, country in [("Paris", "France"), ("Berlin", "Germany")]
+        ]
+        embedded_relations = await embedding_program.predict(
+            np.array(relations, dtype="object")
+        )
+        entities = []
+        for relation in embedded_relations:
+            entities.append(relation.get_nested_entity("subj"))
+            entities.append(relation.get_nested_entity("obj"))
+        await knowledge_base.update_many(entities + list(embedded_relations))
+
+        inputs = Input(data_model=Query)
+        outputs = await KnowledgeRetriever(
+            knowledge_base=knowledge_base,
+            language_model=LanguageModel(model="ollama/mistral"),
+            entity_models=[City, Country],
+            relation_models=[IsCapitalOf],
+            threshold=0.9,
+            num_searches=2,
+            max_concurrency=1,
+            return_inputs=False,
+            return_query=False,
+        )(inputs)
+        program = Program(inputs=inputs, outputs=outputs)
+
+        triplet_searches = [
+            {
+                "subject_label": "City",
+                "subject_similarity_search": "?",
+                "relation_label": "IsCapitalOf",
+                "object_label": "Country",
+                "object_similarity_search": country,
+            }
+            for country in ("France", "Germany")
+        ]
+        mock_completion.return_value = {
+            "choices": [
+                {
+                    "message": {
+                        "content": json.dumps(
+                            {
+                                "thinking": "Both capitals are needed",
+                                "triplet_searches": triplet_searches,
+                            }
+                        )
+                    }
+                }
+            ]
+        }
+        mock_embedding.reset_mock()
+
+        result = await program(
+            Query(query="What are the capitals of France and Germany?")
+        )
+        cities = [triplet["subj"]["name"] for triplet in result.get("result")]
+        self.assertEqual(cities, ["Paris", "Berlin"])
+        # The similarity queries are embedded with a single call
+        self.assertEqual(mock_embedding.call_count, 1)
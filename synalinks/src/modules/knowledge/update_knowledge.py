@@ -1,7 +1,6 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 
-from synalinks.src import ops
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import is_entities
 from synalinks.src.backend import is_entity
@@ -32,11 +31,17 @@ class UpdateKnowledge(Module):
     It however needs to have the entities embeded using the `Embedding` module before
     updating the knwoledge base.
 
+    The entities and relations are written in batches (grouped by label), so
+    updating the knowledge base with a large knowledge graph only takes a few
+    round-trips to the database.
+
     Args:
         knowledge_base (KnowledgeBase): The knowledge base to update.
         threshold (float): Similarity threshold for entity alignment.
             Entities with similarity above this threshold may be merged.
             Should be between 0.0 and 1.0 (Defaults to 0.8).
+        batch_size (int): The maximum number of entities or relations
+            written per query (Defaults to 1000).
         name (str): Optional. The name of the module.
         description (str): Optional. The description of the module.
         trainable (bool): Whether the module's variables should be trainable.
@@ -46,6 +51,7 @@ class UpdateKnowledge(Module):
         self,
         knowledge_base=None,
         threshold=0.8,
+        batch_size=1000,
         name=None,
         description=None,
         trainable=False,
@@ -57,106 +63,53 @@ class UpdateKnowledge(Module):
         )
         self.knowledge_base = knowledge_base
         self.threshold = threshold
+        self.batch_size = batch_size
 
     async def call(self, inputs):
         if not inputs:
             return None
         if is_knowledge_graph(inputs):
-            for entity in inputs.get_nested_entity_list("entities"):
-                _ = await ops.update_knowledge(
-                    entity,
-                    knowledge_base=self.knowledge_base,
-                    threshold=self.threshold,
-                    name=entity.name + "_updated",
-                )
-            for relation in inputs.get_nested_entity_list("relations"):
-                subj = relation.get_nested_entity("subj")
-                if not subj:
-                    continue
-                _ = await ops.update_knowledge(
-                    subj,
-                    knowledge_base=self.knowledge_base,
-                    threshold=self.threshold,
-                    name=subj.name + "_updated",
-                )
-                obj = relation.get_nested_entity("obj")
-                if not obj:
-                    continue
-                _ = await ops.update_knowledge(
-                    obj,
-                    knowledge_base=self.knowledge_base,
-                    threshold=self.threshold,
-                    name=obj.name + "_updated",
-                )
-                _ = await ops.update_knowledge(
-                    relation,
-                    knowledge_base=self.knowledge_base,
-                    threshold=self.threshold,
-                    name=relation.name + "_updated",
+            data_models = inputs.get_nested_entity_list("entities")
+            data_models.extend(
+                self._get_relations_data_models(
+                    inputs.get_nested_entity_list("relations")
                 )
-            return inputs.clone(name=inputs.name + "_updated")
+            )
         elif is_entities(inputs):
-            for entity in inputs.get_nested_entity_list("entities"):
-                _ = await ops.update_knowledge(
-                    entity,
-                    knowledge_base=self.knowledge_base,
-                    threshold=self.threshold,
-                    name=entity.name + "_updated",
-                )
-            return inputs.clone(name=inputs.name + "_updated")
+            data_models = inputs.get_nested_entity_list("entities")
         elif is_relations(inputs):
-            for relation in inputs.get_nested_entity_list("relations"):
-                subj = relation.get_nested_entity("subj")
-                if not subj:
-                    continue
-                _ = await ops.update_knowledge(
-                    subj,
-                    knowledge_base=self.knowledge_base,
-                    threshold=self.threshold,
-                    name=subj.name + "_updated",
-                )
-                obj = relation.get_nested_entity("obj")
-                if not obj:
-                    continue
-                _ = await ops.update_knowledge(
-                    obj,
-                    knowledge_base=self.knowledge_base,
-                    threshold=self.threshold,
-                    name=obj.name + "_updated",
-                )
-                _ = await ops.update_knowledge(
-                    relation,
-                    knowledge_base=self.knowledge_base,
-                    threshold=self.threshold,
-                    name=relation.name + "_updated",
-                )
-            return inputs.clone(name=inputs.name + "_updated")
-        elif is_relation(inputs):
-            subj = inputs.get_nested_entity("subj")
-            _ = await ops.update_knowledge(
-                subj,
-                knowledge_base=self.knowledge_base,
-                threshold=self.threshold,
-                name=subj.name + "_updated",
+            data_models = self._get_relations_data_models(
+                inputs.get_nested_entity_list("relations")
             )
-            obj = inputs.get_nested_entity("obj")
-            _ = await ops.update_knowledge(
-                obj,
-                knowledge_base=self.knowledge_base,
-                threshold=self.threshold,
-                name=obj.name + "_updated",
-            )
-            return inputs.clone(name=inputs.name + "_updated")
+        elif is_relation(inputs):
+            data_models = [
+                inputs.get_nested_entity("subj"),
+                inputs.get_nested_entity("obj"),
+            ]
         elif is_entity(inputs):
-            _ = await ops.update_knowledge(
-                inputs,
-                knowledge_base=self.knowledge_base,
-                threshold=self.threshold,
-                name=inputs.name + "_updated",
-            )
-            return inputs.clone(name=inputs.name + "_updated")
+            data_models = [inputs]
         else:
             return None
+        await self.knowledge_base.update_many(
+            data_models,
+            threshold=self.threshold,
+            batch_size=self.batch_size,
+        )
+        return inputs.clone(name=inputs.name + "_updated")
+
+    def _get_relations_data_models(self, relations):
+        data_models = []
+        for relation in relations:
+            subj = relation.get_nested_entity("subj")
+            if not subj:
+                continue
+            data_models.append(subj)
+            obj = relation.get_nested_entity("obj")
+            if not obj:
+                continue
+            data_models.append(obj)
+            data_models.append(relation)
+        return data_models
 
     async def compute_output_spec(self, inputs):
         return inputs.clone()
@@ -164,6 +117,7 @@ class UpdateKnowledge(Module):
     def get_config(self):
         config = {
             "threshold": self.threshold,
+            "batch_size": self.batch_size,
             "name": self.name,
             "description": self.description,
             "trainable": self.trainable,
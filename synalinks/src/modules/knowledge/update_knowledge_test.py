@@ -47,8 +47,9 @@ class DocumentRelations(Relations):
 class UpdateKnowledgeTest(testing.TestCase):
     @patch("litellm.aembedding")
     async def test_update_knowledge_single_entity(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(model="ollama/mxbai-embed-large")
 
@@ -86,8 +87,9 @@ class UpdateKnowledgeTest(testing.TestCase):
 
     @patch("litellm.aembedding")
     async def test_update_knowledge_single_relation(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(
             model="ollama/mxbai-embed-large",
@@ -137,8 +139,9 @@ class UpdateKnowledgeTest(testing.TestCase):
 
     @patch("litellm.aembedding")
     async def test_update_knowledge_entities(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(
             model="ollama/mxbai-embed-large",
@@ -181,8 +184,9 @@ class UpdateKnowledgeTest(testing.TestCase):
 
     @patch("litellm.aembedding")
     async def test_update_knowledge_relations(self, mock_embedding):
-        expected_value = np.random.rand(1024)
-        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_embedding.side_effect = lambda **kwargs: {
+            "data": [{"embedding": np.random.rand(1024)} for _ in kwargs["input"]]
+        }
 
         embedding_model = EmbeddingModel(
             model="ollama/mxbai-embed-large",
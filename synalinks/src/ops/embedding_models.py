@@ -96,4 +96,4 @@ async def embedding(x, embedding_model=None, name=None, description=None, **kwar
         name=name,
         description=description,
         **kwargs,
-    )(x)
+    ).call(x)
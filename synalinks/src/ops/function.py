@@ -4,11 +4,15 @@
 
 import asyncio
 import collections
+import contextlib
+import contextvars
+import weakref
 
 from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import SymbolicDataModel
 from synalinks.src.backend import is_schema_equal
+from synalinks.src.backend.config import max_concurrent_operations
 from synalinks.src.ops.operation import Operation
 
 
@@ -84,6 +88,27 @@ class Function(Operation):
         self._nodes_by_depth = nodes_by_depth
         self._operations = operations
         self._operations_by_depth = operations_by_depth
+        self._build_dataflow()
+
+    def _build_dataflow(self):
+        """Index the nodes by their input data models for the dataflow execution."""
+        # Nodes to compute, in the same deterministic order than the depths
+        self._dataflow_nodes = []
+        # node -> ids of the (unique) input data models of the node
+        self._dataflow_node_inputs = {}
+        # id(data_model) -> nodes consuming the data model
+        self._dataflow_consumers = collections.defaultdict(list)
+        depth_keys = list(self._nodes_by_depth.keys())
+        depth_keys.sort(reverse=True)
+        for depth in depth_keys:
+            for node in self._nodes_by_depth[depth]:
+                if not node.operation or node.is_input:
+                    continue  # Input data_models already exist.
+                input_ids = set(id(x) for x in node.input_data_models)
+                self._dataflow_nodes.append(node)
+                self._dataflow_node_inputs[node] = input_ids
+                for input_id in input_ids:
+                    self._dataflow_consumers[input_id].append(node)
 
     @property
     def operations(self):
@@ -140,6 +165,11 @@ class Function(Operation):
 
         At each node we compute outputs via
         `operation_fn(node.operation)(*args, **kwargs)`.
+
+        The graph is executed as a dataflow: each node is scheduled as soon
+        as all its input data models are computed, instead of waiting for
+        every node of the previous depth. The nodes with missing inputs
+        (e.g. not selected branches) are skipped.
         """
         inputs = tree.flatten(inputs)
 
@@ -148,44 +178,57 @@ class Function(Operation):
         for x, y in zip(self.inputs, inputs):
             data_model_dict[id(x)] = y
 
-        nodes_by_depth = self._nodes_by_depth
-        depth_keys = list(nodes_by_depth.keys())
-        depth_keys.sort(reverse=True)
-
-        async def compute_node(node, operation_fn, call_fn):
+        async def compute_node(node):
             args, kwargs = node.arguments.fill_in(data_model_dict)
             op = operation_fn(node.operation)
-            if call_fn is not None:
-                outputs = await call_fn(op, *args, **kwargs)
-            else:
-                outputs = await op(*args, **kwargs)
+            async with operation_slot():
+                if call_fn is not None:
+                    outputs = await call_fn(op, *args, **kwargs)
+                else:
+                    outputs = await op(*args, **kwargs)
             return outputs
 
-        for depth in depth_keys:
-            nodes = nodes_by_depth[depth]
-            tasks = []
-
-            for node in nodes:
-                if not node.operation or node.is_input:
-                    continue  # Input data_models already exist.
-
-                if any(id(x) not in data_model_dict for x in node.input_data_models):
-                    continue  # Node is not computable, try skipping.
-
-                tasks.append(compute_node(node, operation_fn, call_fn))
-
-            results = await asyncio.gather(*tasks)
-
-            for i, node in enumerate(nodes):
-                if not node.operation or node.is_input:
-                    continue  # Input data_models already exist.
-
-                if any(id(x) not in data_model_dict for x in node.input_data_models):
-                    continue  # Node is not computable, try skipping.
+        # node -> number of input data models not computed yet
+        waiting = {}
+        ready = []
+        for node in self._dataflow_nodes:
+            missing = sum(
+                1
+                for input_id in self._dataflow_node_inputs[node]
+                if input_id not in data_model_dict
+            )
+            if missing:
+                waiting[node] = missing
+            else:
+                ready.append(node)
 
-                # Update data_model_dict.
-                for x, y in zip(node.outputs, tree.flatten(results[i])):
-                    data_model_dict[id(x)] = y
+        running = {}
+        try:
+            while ready or running:
+                for node in ready:
+                    running[asyncio.ensure_future(compute_node(node))] = node
+                ready = []
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                # Process in launch order to keep the scheduling deterministic
+                for task in [task for task in running if task in done]:
+                    node = running.pop(task)
+                    results = task.result()
+                    # Update data_model_dict.
+                    for x, y in zip(node.outputs, tree.flatten(results)):
+                        is_new = id(x) not in data_model_dict
+                        data_model_dict[id(x)] = y
+                        if not is_new:
+                            continue
+                        for consumer in self._dataflow_consumers.get(id(x), []):
+                            if consumer not in waiting:
+                                continue
+                            waiting[consumer] -= 1
+                            if not waiting[consumer]:
+                                del waiting[consumer]
+                                ready.append(consumer)
+        finally:
+            for task in running:
+                task.cancel()
 
         output_data_models = []
         for x in self.outputs:
@@ -220,6 +263,38 @@ class Function(Operation):
                 )
 
 
+# event loop -> (limit, semaphore) shared by every graph running in the loop
+_OPERATIONS_SEMAPHORES = weakref.WeakKeyDictionary()
+
+# Whether the current task already runs inside an operation slot
+_IN_OPERATION_SLOT = contextvars.ContextVar("in_operation_slot", default=False)
+
+
+@contextlib.asynccontextmanager
+async def operation_slot():
+    """Wait for a slot to execute an operation.
+
+    The number of slots is given by `synalinks.config.max_concurrent_operations()`.
+    The operations nested inside an operation holding a slot do not take
+    another one, so that nested programs cannot deadlock.
+    """
+    limit = max_concurrent_operations()
+    if not limit or _IN_OPERATION_SLOT.get():
+        yield
+        return
+    loop = asyncio.get_running_loop()
+    entry = _OPERATIONS_SEMAPHORES.get(loop)
+    if entry is None or entry[0] != limit:
+        entry = (limit, asyncio.Semaphore(limit))
+        _OPERATIONS_SEMAPHORES[loop] = entry
+    async with entry[1]:
+        token = _IN_OPERATION_SLOT.set(True)
+        try:
+            yield
+        finally:
+            _IN_OPERATION_SLOT.reset(token)
+
+
 def make_node_key(op, node_index):
     return str(id(op)) + "_ib-" + str(node_index)
 
@@ -2,12 +2,32 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+
 from synalinks.src import testing
 from synalinks.src.backend import DataModel
 from synalinks.src.backend import JsonDataModel
 from synalinks.src.backend import SymbolicDataModel
+from synalinks.src.backend import config
 from synalinks.src.ops import function
 from synalinks.src.ops.json import concat
+from synalinks.src.ops.operation import Operation
+
+
+class Delay(Operation):
+    def __init__(self, delay=0.0, events=None, name=None):
+        super().__init__(name=name)
+        self.delay = delay
+        self.events = events if events is not None else []
+
+    async def call(self, x):
+        self.events.append(("start", self.name))
+        await asyncio.sleep(self.delay)
+        self.events.append(("end", self.name))
+        return JsonDataModel(json=x.get_json(), schema=x.get_schema(), name=self.name)
+
+    async def compute_output_spec(self, x):
+        return SymbolicDataModel(schema=x.get_schema(), name=self.name)
 
 
 class FunctionTest(testing.TestCase):
@@ -74,6 +94,59 @@ class FunctionTest(testing.TestCase):
         self.assertEqual(output_val.get_json(), expected_value)
         self.assertEqual(output_val.get_schema(), expected_schema)
 
+    async def test_dataflow_execution(self):
+        class Query(DataModel):
+            query: str
+
+        events = []
+        inputs = SymbolicDataModel(data_model=Query)
+        x1 = await Delay(delay=0.2, events=events, name="slow_a")(inputs)
+        x1 = await Delay(events=events, name="fast_a")(x1)
+        x2 = await Delay(events=events, name="fast_b")(inputs)
+        x2 = await Delay(delay=0.2, events=events, name="slow_b")(x2)
+        outputs = await concat(x1, x2)
+        fn = function.Function(inputs=inputs, outputs=outputs)
+
+        query = JsonDataModel(data_model=Query(query="What is the capital of France?"))
+        result = await fn(query)
+        self.assertEqual(
+            result.get_json(),
+            {
+                "query": "What is the capital of France?",
+                "query_1": "What is the capital of France?",
+            },
+        )
+        # `slow_b` doesn't wait for `slow_a` (at the same depth than `fast_b`)
+        self.assertLess(
+            events.index(("start", "slow_b")),
+            events.index(("end", "slow_a")),
+        )
+
+    async def test_max_concurrent_operations(self):
+        class Query(DataModel):
+            query: str
+
+        events = []
+        inputs = SymbolicDataModel(data_model=Query)
+        x1 = await Delay(delay=0.01, events=events, name="delay_a")(inputs)
+        x2 = await Delay(delay=0.01, events=events, name="delay_b")(inputs)
+        outputs = await concat(x1, x2)
+        fn = function.Function(inputs=inputs, outputs=outputs)
+
+        query = JsonDataModel(data_model=Query(query="What is the capital of France?"))
+        config.set_max_concurrent_operations(1)
+        try:
+            await fn(query)
+        finally:
+            config.set_max_concurrent_operations(None)
+        self.assertEqual(
+            [event for event, _ in events],
+            ["start", "end", "start", "end"],
+        )
+
+        with self.assertRaises(ValueError):
+            config.set_max_concurrent_operations(0)
+
     async def test_invalid_inputs_error(self):
         class Query(DataModel):
             query: str
@@ -97,7 +97,7 @@ async def concat(x1, x2, name=None, description=None):
     return await Concat(
         name=name,
         description=description,
-    )(x1, x2)
+    ).call(x1, x2)
 
 
 class And(Operation):
@@ -170,7 +170,7 @@ async def logical_and(x1, x2, name=None, description=None):
     return await And(
         name=name,
         description=description,
-    )(x1, x2)
+    ).call(x1, x2)
 
 
 class Or(Operation):
@@ -246,7 +246,7 @@ async def logical_or(x1, x2, name=None, description=None):
     return await Or(
         name=name,
         description=description,
-    )(x1, x2)
+    ).call(x1, x2)
 
 
 class Xor(Operation):
@@ -319,7 +319,7 @@ async def logical_xor(x1, x2, name=None, description=None):
     return await Xor(
         name=name,
         description=description,
-    )(x1, x2)
+    ).call(x1, x2)
 
 
 class Factorize(Operation):
@@ -374,7 +374,7 @@ async def factorize(x, name=None, description=None):
     return await Factorize(
         name=name,
         description=description,
-    )(x)
+    ).call(x)
 
 
 class OutMask(Operation):
@@ -442,7 +442,7 @@ async def out_mask(x, mask=None, recursive=True, name=None, description=None):
         recursive=recursive,
         name=name,
         description=description,
-    )(x)
+    ).call(x)
 
 
 class InMask(Operation):
@@ -510,7 +510,7 @@ async def in_mask(x, mask=None, recursive=True, name=None, description=None):
         recursive=recursive,
         name=name,
         description=description,
-    )(x)
+    ).call(x)
 
 
 class Prefix(Operation):
@@ -568,7 +568,7 @@ async def prefix(x, prefix=None, name=None, description=None):
         prefix=prefix,
         name=name,
         description=description,
-    )(x)
+    ).call(x)
 
 
 class Suffix(Operation):
@@ -626,4 +626,4 @@ async def suffix(x, suffix=None, name=None, description=None):
         suffix=suffix,
         name=name,
         description=description,
-    )(x)
+    ).call(x)
@@ -1,10 +1,13 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+from synalinks.src import backend
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import GenericResult
 from synalinks.src.backend import JsonDataModel
 from synalinks.src.backend import SymbolicDataModel
 from synalinks.src.backend import any_symbolic_data_models
+from synalinks.src.backend import is_similarity_search
+from synalinks.src.backend import is_triplet_search
 from synalinks.src.ops.operation import Operation
 from synalinks.src.saving import serialization_lib
 
@@ -106,7 +109,7 @@ async def update_knowledge(
         knowledge_base=knowledge_base,
         name=name,
         description=description,
-    )(x)
+    ).call(x)
 
 
 class TripletSearch(Operation):
@@ -115,6 +118,8 @@ class TripletSearch(Operation):
         knowledge_base=None,
         k=10,
         threshold=0.7,
+        max_concurrency=None,
+        search_type="vector",
         name=None,
         description=None,
         **kwargs,
@@ -126,13 +131,30 @@ class TripletSearch(Operation):
         self.knowledge_base = knowledge_base
         self.k = k
         self.threshold = threshold
+        self.max_concurrency = max_concurrency
+        self.search_type = search_type
 
     async def call(self, x):
-        result = await self.knowledge_base.triplet_search(
-            x,
-            k=self.k,
-            threshold=self.threshold,
-        )
+        if not is_triplet_search(x) and x.get("triplet_searches") is not None:
+            triplet_searches = [
+                JsonDataModel(json=json, schema=backend.TripletSearch.get_schema())
+                for json in x.get("triplet_searches")
+            ]
+            results = await self.knowledge_base.triplet_search_many(
+                triplet_searches,
+                k=self.k,
+                threshold=self.threshold,
+                max_concurrency=self.max_concurrency,
+                search_type=self.search_type,
+            )
+            result = [triplet for triplets in results for triplet in triplets]
+        else:
+            result = await self.knowledge_base.triplet_search(
+                x,
+                k=self.k,
+                threshold=self.threshold,
+                search_type=self.search_type,
+            )
         return JsonDataModel(
             json={"result": result},
             schema=GenericResult.get_schema(),
@@ -149,6 +171,8 @@ class TripletSearch(Operation):
         config = {
             "k": self.k,
             "threshold": self.threshold,
+            "max_concurrency": self.max_concurrency,
+            "search_type": self.search_type,
             "name": self.name,
             "description": self.description,
         }
@@ -170,6 +194,8 @@ async def triplet_search(
     knowledge_base=None,
     k=10,
     threshold=0.7,
+    max_concurrency=None,
+    search_type="vector",
     name=None,
     description=None,
 ):
@@ -179,11 +205,16 @@ async def triplet_search(
     using the input data as the query (see `TripletSearch` data model).
 
     Args:
-        x (JsonDataModel | SymbolicDataModel): The query for the triplet search.
+        x (JsonDataModel | SymbolicDataModel): The query for the triplet search,
+            or a data model with a list of `triplet_searches` to run at once.
         knowledge_base (KnowledgeBase): The knowledge base to search in.
         k (int): Maximum number of results to return. Defaults to 10.
         threshold (float): Similarity threshold for filtering results. Only results with
             similarity scores above this threshold will be returned. Defaults to 0.7.
+        max_concurrency (int): Optional. The maximum number of searches running
+            at once, when `x` contains a list of `triplet_searches` (Default to None).
+        search_type (str): The type of search, `vector`, `lexical` or `hybrid`
+            (see `KnowledgeBase`) (Default to `vector`).
         name (str): Optional name for the operation.
         description (str): Optional description for the operation.
 
@@ -198,6 +229,10 @@ async def triplet_search(
     if any_symbolic_data_models(x):
         return await TripletSearch(
             knowledge_base=knowledge_base,
+            k=k,
+            threshold=threshold,
+            max_concurrency=max_concurrency,
+            search_type=search_type,
             name=name,
             description=description,
         ).symbolic_call(x)
@@ -205,9 +240,11 @@ async def triplet_search(
         knowledge_base=knowledge_base,
         k=k,
         threshold=threshold,
+        max_concurrency=max_concurrency,
+        search_type=search_type,
         name=name,
         description=description,
-    )(x)
+    ).call(x)
 
 
 class SimilaritySearch(Operation):
@@ -216,6 +253,8 @@ class SimilaritySearch(Operation):
         knowledge_base=None,
         k=10,
         threshold=0.7,
+        max_concurrency=None,
+        search_type="vector",
         name=None,
         description=None,
     ):
@@ -226,13 +265,33 @@ class SimilaritySearch(Operation):
         self.knowledge_base = knowledge_base
         self.k = k
         self.threshold = threshold
+        self.max_concurrency = max_concurrency
+        self.search_type = search_type
 
     async def call(self, x):
-        result = await self.knowledge_base.similarity_search(
-            x,
-            k=self.k,
-            threshold=self.threshold,
-        )
+        if not is_similarity_search(x) and x.get("similarity_searches") is not None:
+            similarity_searches = [
+                JsonDataModel(
+                    json=json,
+                    schema=backend.SimilaritySearch.get_schema(),
+                )
+                for json in x.get("similarity_searches")
+            ]
+            results = await self.knowledge_base.similarity_search_many(
+                similarity_searches,
+                k=self.k,
+                threshold=self.threshold,
+                max_concurrency=self.max_concurrency,
+                search_type=self.search_type,
+            )
+            result = [node for nodes in results for node in nodes]
+        else:
+            result = await self.knowledge_base.similarity_search(
+                x,
+                k=self.k,
+                threshold=self.threshold,
+                search_type=self.search_type,
+            )
         return JsonDataModel(
             json={"result": result},
             schema=GenericResult.get_schema(),
@@ -249,6 +308,8 @@ class SimilaritySearch(Operation):
         config = {
             "k": self.k,
             "threshold": self.threshold,
+            "max_concurrency": self.max_concurrency,
+            "search_type": self.search_type,
             "name": self.name,
             "description": self.description,
         }
@@ -276,6 +337,8 @@ async def similarity_search(
     knowledge_base=None,
     k=10,
     threshold=0.7,
+    max_concurrency=None,
+    search_type="vector",
     name=None,
     description=None,
 ):
@@ -285,11 +348,16 @@ async def similarity_search(
     using the input data as the query.
 
     Args:
-        x (JsonDataModel | SymbolicDataModel): The query for the similarity search.
+        x (JsonDataModel | SymbolicDataModel): The query for the similarity search,
+            or a data model with a list of `similarity_searches` to run at once.
         knowledge_base (KnowledgeBase): The knowledge base to search in.
         k (int): Maximum number of results to return (Defaults to 10).
         threshold (float): Similarity threshold for filtering results. Only results with
             similarity scores above this threshold will be returned (Defaults to 0.7).
+        max_concurrency (int): Optional. The maximum number of searches running
+            at once, when `x` contains a list of `similarity_searches` (Default to None).
+        search_type (str): The type of search, `vector`, `lexical` or `hybrid`
+            (see `KnowledgeBase`) (Default to `vector`).
         name (str): Optional name for the operation.
         description (str): Optional description for the operation.
 
@@ -306,6 +374,8 @@ async def similarity_search(
             knowledge_base=knowledge_base,
             k=k,
             threshold=threshold,
+            max_concurrency=max_concurrency,
+            search_type=search_type,
             name=name,
             description=description,
         ).symbolic_call(x)
@@ -313,6 +383,8 @@ async def similarity_search(
         knowledge_base=knowledge_base,
         k=k,
         threshold=threshold,
+        max_concurrency=max_concurrency,
+        search_type=search_type,
         name=name,
         description=description,
-    )(x)
+    ).call(x)
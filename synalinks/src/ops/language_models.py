@@ -131,4 +131,4 @@ async def predict(
         name=name,
         description=description,
         **kwargs,
-    )(x)
+    ).call(x)
@@ -2,6 +2,7 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import functools
 import inspect
 import textwrap
 
@@ -22,12 +23,7 @@ class Operation:
         if name is None:
             name = auto_name(self.__class__.__name__)
         if description is None:
-            if self.__class__.__doc__:
-                description = docstring_parser.parse(
-                    self.__class__.__doc__
-                ).short_description
-            else:
-                description = ""
+            description = get_default_description(self.__class__)
         if not isinstance(name, str) or "/" in name:
             raise ValueError(
                 "Argument `name` must be a string and "
@@ -87,21 +83,25 @@ class Operation:
         instance = super(Operation, cls).__new__(cls)
 
         # Generate a config to be returned by default by `get_config()`.
-        arg_names = inspect.getfullargspec(cls.__init__).args
-        kwargs.update(dict(zip(arg_names[1 : len(args) + 1], args)))
+        if args:
+            arg_names = get_init_arg_names(cls)
+            kwargs.update(dict(zip(arg_names[1 : len(args) + 1], args)))
 
         # For safety, we only rely on auto-configs for a small set of
         # serializable types.
         supported_types = (str, int, float, bool, type(None))
-        try:
-            flat_arg_values = tree.flatten(kwargs)
-            auto_config = True
-            for value in flat_arg_values:
-                if not isinstance(value, supported_types):
-                    auto_config = False
-                    break
-        except TypeError:
-            auto_config = False
+        # Fast path for the common case of flat arguments
+        auto_config = all(isinstance(v, supported_types) for v in kwargs.values())
+        if not auto_config:
+            try:
+                flat_arg_values = tree.flatten(kwargs)
+                auto_config = True
+                for value in flat_arg_values:
+                    if not isinstance(value, supported_types):
+                        auto_config = False
+                        break
+            except TypeError:
+                auto_config = False
         try:
             instance._lock = False
             if auto_config:
@@ -236,3 +236,33 @@ class Operation:
     def _post_untrack_variable(self, variable):
         """Can be overridden for per backend post untrack actions."""
         pass
+
+
+@functools.lru_cache(maxsize=None)
+def get_init_arg_names(cls):
+    """Returns the names of the arguments of a class constructor (cached).
+
+    Args:
+        cls (type): The class.
+
+    Returns:
+        (list): The names of the arguments (including `self`).
+    """
+    return inspect.getfullargspec(cls.__init__).args
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_description(cls):
+    """Returns the default description of a class (cached).
+
+    The default description is the short description of the class docstring.
+
+    Args:
+        cls (type): The class.
+
+    Returns:
+        (str): The description.
+    """
+    if cls.__doc__:
+        return docstring_parser.parse(cls.__doc__).short_description
+    return ""
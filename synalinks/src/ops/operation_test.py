@@ -1 +1,120 @@
-# TODO
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import inspect
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+import docstring_parser
+
+from synalinks.src import testing
+from synalinks.src.backend import DataModel
+from synalinks.src.backend import JsonDataModel
+from synalinks.src.ops import json as json_ops
+from synalinks.src.ops.operation import Operation
+from synalinks.src.ops.operation import get_default_description
+
+
+class MyOperation(Operation):
+    """My custom operation.
+
+    With a longer description.
+    """
+
+    def __init__(self, foo, bar=None, name=None, description=None):
+        super().__init__(name=name, description=description)
+        self.foo = foo
+        self.bar = bar
+
+    async def call(self, x):
+        return x
+
+
+class Query(DataModel):
+    query: str
+
+
+class Answer(DataModel):
+    answer: str
+
+
+class OperationTest(testing.TestCase):
+    def test_default_description(self):
+        op = MyOperation("a")
+        self.assertEqual(op.description, "My custom operation.")
+        self.assertEqual(
+            get_default_description(MyOperation),
+            "My custom operation.",
+        )
+
+    def test_auto_config(self):
+        op = MyOperation("a", bar=[1, 2], name="my_op")
+        config = op.get_config()
+        self.assertEqual(config["foo"], "a")
+        self.assertEqual(config["bar"], [1, 2])
+        self.assertEqual(config["name"], "my_op")
+        new_op = MyOperation.from_config(config)
+        self.assertEqual(new_op.foo, "a")
+        self.assertEqual(new_op.bar, [1, 2])
+
+    def test_no_auto_config_with_non_serializable_arguments(self):
+        op = MyOperation(object())
+        with self.assertRaises(NotImplementedError):
+            op.get_config()
+
+    async def test_eager_ops(self):
+        x1 = JsonDataModel(json={"query": "What is 1 + 1?"}, schema=Query.get_schema())
+        x2 = JsonDataModel(json={"answer": "2"}, schema=Answer.get_schema())
+
+        result = await json_ops.concat(x1, x2)
+        self.assertEqual(result.get_json(), {"query": "What is 1 + 1?", "answer": "2"})
+
+    @unittest.skipUnless(
+        os.environ.get("SYNALINKS_BENCHMARKS"),
+        "benchmarks only run with SYNALINKS_BENCHMARKS=1",
+    )
+    async def test_eager_ops_overhead_benchmark(self):
+        x1 = JsonDataModel(json={"query": "What is 1 + 1?"}, schema=Query.get_schema())
+        x2 = JsonDataModel(json={"answer": "2"}, schema=Answer.get_schema())
+
+        n = 1000
+        start = time.perf_counter()
+        for _ in range(n):
+            await json_ops.concat(x1, x2)
+            await json_ops.logical_and(x1, x2)
+            await json_ops.out_mask(x1, mask=["query"])
+            await json_ops.prefix(x1, prefix="input")
+        elapsed = (time.perf_counter() - start) / n / 4
+        self.assertLess(elapsed, 1e-3)
+
+    @unittest.skipUnless(
+        os.environ.get("SYNALINKS_BENCHMARKS"),
+        "benchmarks only run with SYNALINKS_BENCHMARKS=1",
+    )
+    def test_operation_instantiation_overhead_benchmark(self):
+        n = 1000
+        start = time.perf_counter()
+        for _ in range(n):
+            json_ops.Concat()
+            json_ops.Prefix(prefix="input")
+        elapsed = (time.perf_counter() - start) / n / 2
+        # ~5µs here, ~70µs more when parsing the docstring at each call
+        self.assertLess(elapsed, 30e-6)
+
+    def test_operation_metadata_is_computed_once_per_class(self):
+        class MyOtherOperation(MyOperation):
+            """My other operation."""
+
+        with (
+            patch("docstring_parser.parse", wraps=docstring_parser.parse) as mock_parse,
+            patch(
+                "inspect.getfullargspec", wraps=inspect.getfullargspec
+            ) as mock_getfullargspec,
+        ):
+            for _ in range(10):
+                op = MyOtherOperation("a", [1, 2])
+        self.assertEqual(op.description, "My other operation.")
+        self.assertEqual(op.get_config()["bar"], [1, 2])
+        self.assertEqual(mock_parse.call_count, 1)
+        self.assertEqual(mock_getfullargspec.call_count, 1)
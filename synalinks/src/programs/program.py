@@ -2,6 +2,7 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 import inspect
 import json
 import typing
@@ -9,6 +10,7 @@ import warnings
 
 from synalinks.src import utils
 from synalinks.src.api_export import synalinks_export
+from synalinks.src.backend import StreamingScope
 from synalinks.src.modules import Module
 from synalinks.src.trainers.trainer import Trainer
 from synalinks.src.utils import file_utils
@@ -316,6 +318,58 @@ class Program(Trainer, Module):
             "method implemented."
         )
 
+    async def stream(self, inputs):
+        """Run the program while streaming the response of its final generator.
+
+        The modules upstream run normally, while the `Generator` producing the
+        outputs of the program streams its language model response as it is
+        generated. This allows to reduce the time to first token of chat
+        applications.
+
+        Without schema, each chunk is a ChatMessage-like dict with the new
+        content. With a schema, each chunk is the structured output parsed
+        so far (so the fields are streamed one by one). If the outputs of the
+        program are not produced by a `Generator`, the complete outputs are
+        yielded at the end as a single chunk.
+
+        Example:
+
+        ```python
+        async for chunk in program.stream(inputs):
+            print(chunk["content"], end="")
+        ```
+
+        Args:
+            inputs (JsonDataModel | DataModel): The inputs of the program.
+
+        Yields:
+            (dict): The chunks of the response.
+        """
+        streaming_scope = StreamingScope(modules=lambda: get_output_generators(self))
+        end_of_stream = object()
+
+        async def run():
+            try:
+                return await self(inputs)
+            finally:
+                streaming_scope.queue.put_nowait(end_of_stream)
+
+        with streaming_scope:
+            # The task copies the context, and thus the streaming scope
+            task = asyncio.ensure_future(run())
+        try:
+            while True:
+                chunk = await streaming_scope.queue.get()
+                if chunk is end_of_stream:
+                    break
+                yield chunk
+            outputs = await task
+            if not streaming_scope.streamed and outputs:
+                yield outputs.get_json()
+        finally:
+            if not task.done():
+                task.cancel()
+
     @property
     def modules(self):
         return list(self._flatten_modules(include_self=False, recursive=False))
@@ -719,7 +773,10 @@ class Program(Trainer, Module):
                     if parent_path.startswith(variable_path) and variable.get(
                         nested_field_name, None
                     ):
-                        variable.get_json()[nested_field_name].update({field_name: value})
+                        nested_json = variable.get_json()[nested_field_name]
+                        variable.update(
+                            {nested_field_name: {**nested_json, field_name: value}}
+                        )
                         break
 
     def _flatten_nested_dict(self, nested_dict):
@@ -886,3 +943,31 @@ def inject_functional_program_class(cls):
     cls.__new__(cls)
 
     return cls
+
+
+def get_output_generators(module):
+    """Get the `Generator` modules producing the outputs of a module.
+
+    The graph of functional programs is traversed recursively from their
+    outputs. The generators of subclassed programs can't be found.
+
+    Args:
+        module (Module): The module.
+
+    Returns:
+        (list): The generators producing the outputs.
+    """
+    from synalinks.src.modules.core.generator import Generator
+
+    if isinstance(module, Generator):
+        return [module]
+    functional = getattr(module, "_functional", None)
+    if functional is not None:
+        # Sequential programs
+        return get_output_generators(functional)
+    generators = []
+    for output in getattr(module, "_outputs", None) or []:
+        history = getattr(output, "_synalinks_history", None)
+        if history is not None:
+            generators.extend(get_output_generators(history.operation))
+    return generators
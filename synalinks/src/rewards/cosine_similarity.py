@@ -2,7 +2,10 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+
 from synalinks.src import ops
+from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend.common import numpy as np
 from synalinks.src.rewards.reward import Reward
@@ -50,6 +53,92 @@ async def cosine_similarity(y_true, y_pred, embedding_model=None, axis=-1):
     return reward
 
 
+def _get_texts(x):
+    return tree.flatten(tree.map_structure(lambda field: str(field), x.get_json()))
+
+
+@synalinks_export("synalinks.rewards.cosine_similarity_batch")
+async def cosine_similarity_batch(y_true, y_pred, embedding_model=None, axis=-1):
+    """
+    Computes the cosine similarity between `y_true` and `y_pred` for a batch.
+
+    The texts of every sample are embedded with a single call to the embedding
+    model and the similarities are computed all at once, the result is the same
+    as calling `cosine_similarity()` on each sample.
+
+    Args:
+        y_true (list): The ground truth JSON data_models.
+        y_pred (list): The predicted JSON data_models.
+        embedding_model (EmbeddingModel): The embedding model to use to compute the
+            cosine similarity.
+        axis (int): (Optional) Defaults to `-1`. The dimension along which the cosine
+            similarity is computed.
+
+    Returns:
+        (list): The reward values of each sample, which tend to 1.0 if the values
+            are similar, and towards 0.0 otherwise.
+    """
+    texts = []
+    indices = []
+    for y_t, y_p in zip(y_true, y_pred):
+        if y_p is None:
+            indices.append(None)
+            continue
+        true_texts = _get_texts(y_t)
+        pred_texts = _get_texts(y_p)
+        start = len(texts)
+        texts.extend(true_texts)
+        texts.extend(pred_texts)
+        true_indices = list(range(start, start + len(true_texts)))
+        pred_indices = list(range(start + len(true_texts), len(texts)))
+        indices.append((true_indices, pred_indices))
+
+    rewards = [0.0] * len(indices)
+    if not texts:
+        return rewards
+
+    embeddings = await embedding_model(texts)
+    if not embeddings:
+        raise ValueError("The embedding model failed to compute the embeddings.")
+    embeddings = embeddings.get("embeddings")
+    if len(embeddings) != len(texts):
+        # The provider didn't return one vector per text, fallback to
+        # embedding each sample separately
+        return await asyncio.gather(
+            *[
+                cosine_similarity(y_t, y_p, embedding_model=embedding_model, axis=axis)
+                for y_t, y_p in zip(y_true, y_pred)
+            ]
+        )
+    embeddings = np.normalize(np.convert_to_tensor(embeddings), axis=axis)
+
+    # The samples with the same number of fields in `y_true` and `y_pred`
+    # are computed with a single vectorized operation
+    aligned = [
+        i
+        for i, idx in enumerate(indices)
+        if idx is not None and len(idx[0]) == len(idx[1])
+    ]
+    if aligned:
+        true_indices = [j for i in aligned for j in indices[i][0]]
+        pred_indices = [j for i in aligned for j in indices[i][1]]
+        similarities = (
+            np.sum(embeddings[true_indices] * embeddings[pred_indices], axis=axis) + 1
+        ) / 2
+        offset = 0
+        for i in aligned:
+            size = len(indices[i][0])
+            rewards[i] = similarities[offset : offset + size]
+            offset += size
+
+    for i, idx in enumerate(indices):
+        if idx is None or len(idx[0]) == len(idx[1]):
+            continue
+        y_t, y_p = squeeze_or_expand_to_same_rank(embeddings[idx[0]], embeddings[idx[1]])
+        rewards[i] = (np.sum(y_t * y_p, axis=axis) + 1) / 2
+    return rewards
+
+
 @synalinks_export(
     [
         "synalinks.CosineSimilarity",
@@ -107,6 +196,16 @@ class CosineSimilarity(RewardFunctionWrapper):
             axis=axis,
             embedding_model=embedding_model,
         )
+        self.embedding_model = embedding_model
+        self.axis = axis
+
+    async def call_batch(self, y_true, y_pred):
+        return await cosine_similarity_batch(
+            y_true,
+            y_pred,
+            embedding_model=self.embedding_model,
+            axis=self.axis,
+        )
 
     def get_config(self):
         config = Reward.get_config()
@@ -43,3 +43,44 @@ class CosineSimilarityTest(testing.TestCase):
         cosine_similarity = CosineSimilarity(embedding_model=embedding_model)
         reward = await cosine_similarity(y_true, y_pred)
         self.assertEqual(reward, 1.0)
+
+    @patch("litellm.aembedding")
+    async def test_batch_single_embedding_request(self, mock_embedding):
+        embedding_model = EmbeddingModel(model="ollama/all-minilm")
+        vectors = {
+            "Paris": [0.0, 0.1, 0.2, 0.3, 0.4],
+            "London": [0.4, 0.3, 0.2, 0.1, 0.0],
+            "Berlin": [0.1, 0.0, 0.3, 0.2, 0.1],
+        }
+
+        def embed(model=None, input=None, **kwargs):
+            return {"data": [{"embedding": vectors[text]} for text in input]}
+
+        mock_embedding.side_effect = embed
+
+        class Answer(DataModel):
+            answer: str
+
+        y_true = [
+            Answer(answer="Paris"),
+            Answer(answer="London"),
+            Answer(answer="Berlin"),
+        ]
+        y_pred = [
+            Answer(answer="Paris"),
+            Answer(answer="Paris"),
+            None,
+        ]
+
+        cosine_similarity = CosineSimilarity(embedding_model=embedding_model)
+        rewards = await cosine_similarity.compute_batch(y_true, y_pred)
+        self.assertEqual(mock_embedding.call_count, 1)
+
+        expected_rewards = []
+        for y_t, y_p in zip(y_true, y_pred):
+            expected_rewards.append(await cosine_similarity(y_t, y_p))
+        self.assertEqual(len(rewards), 3)
+        for reward, expected_reward in zip(rewards, expected_rewards):
+            self.assertAlmostEqual(reward, expected_reward)
+        self.assertAlmostEqual(rewards[0], 1.0)
+        self.assertEqual(rewards[2], 0.0)
@@ -2,11 +2,14 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+
 from synalinks.src import ops
 from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend.common import numpy as np
 from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
+from synalinks.src.utils import python_utils
 from synalinks.src.utils.naming import auto_name
 
 
@@ -23,6 +26,10 @@ class Reward(SynalinksSaveable):
 
     * `call()`: Contains the logic for eval calculation using `y_true`,
         `y_pred`.
+
+    Optionally, subclasses can implement `call_batch()` to compute the rewards
+    of a batch of samples at once (e.g. with a single request to a model),
+    it is used by the trainer when available.
     """
 
     def __init__(
@@ -39,37 +46,71 @@ class Reward(SynalinksSaveable):
 
     async def __call__(self, y_true, y_pred):
         with ops.name_scope(self.name):
-            y_pred = tree.map_structure(
-                lambda x: ops.convert_to_json_data_model(x), y_pred
-            )
-            y_true = tree.map_structure(
-                lambda x: ops.convert_to_json_data_model(x), y_true
-            )
-
-            if self.in_mask:
-                y_pred = tree.map_structure(
-                    lambda x: x.in_mask(mask=self.in_mask), y_pred
-                )
-                y_true = tree.map_structure(
-                    lambda x: x.in_mask(mask=self.in_mask), y_true
-                )
-            if self.out_mask:
-                y_pred = tree.map_structure(
-                    lambda x: x.out_mask(mask=self.out_mask), y_pred
-                )
-                y_true = tree.map_structure(
-                    lambda x: x.out_mask(mask=self.out_mask), y_true
-                )
-
+            y_true, y_pred = self._standardize_inputs(y_true, y_pred)
             rewards = await self.call(y_true, y_pred)
             return reduce_values(
                 rewards,
                 reduction=self.reduction,
             )
 
+    async def compute_batch(self, y_true, y_pred):
+        """Compute the rewards of a batch of samples.
+
+        Args:
+            y_true (list): The ground truth data models of the samples.
+            y_pred (list): The predicted data models of the samples.
+
+        Returns:
+            (list): The reward value of each sample.
+        """
+        with ops.name_scope(self.name):
+            y_true, y_pred = (
+                zip(
+                    *[
+                        self._standardize_inputs(y_t, y_p)
+                        for y_t, y_p in zip(y_true, y_pred)
+                    ]
+                )
+                if len(y_true)
+                else ((), ())
+            )
+            rewards = await self.call_batch(list(y_true), list(y_pred))
+            return [reduce_values(reward, reduction=self.reduction) for reward in rewards]
+
+    def _standardize_inputs(self, y_true, y_pred):
+        y_pred = tree.map_structure(lambda x: ops.convert_to_json_data_model(x), y_pred)
+        y_true = tree.map_structure(lambda x: ops.convert_to_json_data_model(x), y_true)
+
+        if self.in_mask:
+            y_pred = tree.map_structure(lambda x: x.in_mask(mask=self.in_mask), y_pred)
+            y_true = tree.map_structure(lambda x: x.in_mask(mask=self.in_mask), y_true)
+        if self.out_mask:
+            y_pred = tree.map_structure(lambda x: x.out_mask(mask=self.out_mask), y_pred)
+            y_true = tree.map_structure(lambda x: x.out_mask(mask=self.out_mask), y_true)
+        return y_true, y_pred
+
     async def call(self, y_true, y_pred):
         raise NotImplementedError
 
+    @python_utils.default
+    async def call_batch(self, y_true, y_pred):
+        """Compute the rewards of a batch of samples.
+
+        The default implementation calls `call()` on each sample concurrently.
+        Subclasses can override it to compute the rewards of the whole batch
+        at once.
+
+        Args:
+            y_true (list): The ground truth data models of the samples.
+            y_pred (list): The predicted data models of the samples.
+
+        Returns:
+            (list): The (non reduced) rewards of each sample.
+        """
+        return await asyncio.gather(
+            *[self.call(y_t, y_p) for y_t, y_p in zip(y_true, y_pred)]
+        )
+
     def get_config(self):
         return {
             "name": self.name,
@@ -10,6 +10,7 @@ from synalinks.src import rewards as rewards_module
 from synalinks.src import tree
 from synalinks.src.backend.common import numpy
 from synalinks.src.backend.common.symbolic_data_model import SymbolicDataModel
+from synalinks.src.utils import python_utils
 from synalinks.src.utils.naming import get_object_name
 from synalinks.src.utils.tracking import Tracker
 
@@ -671,6 +672,49 @@ class CompileReward(rewards_module.Reward):
             return total_reward
         return None
 
+    def supports_call_batch(self, y_true, y_pred):
+        """Check if the rewards of a batch can be computed with `call_batch()`.
+
+        This is the case for a single output program with a single reward
+        implementing `Reward.call_batch()`.
+
+        Args:
+            y_true (list): The ground truth of each sample.
+            y_pred (list): The prediction of each sample.
+
+        Returns:
+            (bool): True if `call_batch()` can be used.
+        """
+        if y_true is None or y_pred is None:
+            return False
+        if len(y_true) == 0 or len(y_true) != len(y_pred):
+            return False
+        if any(tree.is_nested(y_t) for y_t in y_true) or any(
+            tree.is_nested(y_p) for y_p in y_pred
+        ):
+            return False
+        if not self.built:
+            self.build(y_true[0], y_pred[0])
+        if len(self._flat_rewards) != 1:
+            return False
+        _, reward_fn, _, _ = self._flat_rewards[0]
+        return not python_utils.is_default(reward_fn.call_batch)
+
+    async def call_batch(self, y_true, y_pred):
+        """Compute the rewards of a batch of samples at once.
+
+        Args:
+            y_true (list): The ground truth of each sample.
+            y_pred (list): The prediction of each sample.
+
+        Returns:
+            (list): The reward of each sample.
+        """
+        with ops.name_scope(self.name):
+            _, reward_fn, _, _ = self._flat_rewards[0]
+            rewards = await reward_fn.compute_batch(y_true, y_pred)
+            return [numpy.convert_to_tensor(reward) for reward in rewards]
+
     def get_config(self):
         raise NotImplementedError
 
@@ -3,9 +3,10 @@ import types
 from synalinks.src.trainers.data_adapters import array_data_adapter
 from synalinks.src.trainers.data_adapters import data_adapter
 from synalinks.src.trainers.data_adapters.array_data_adapter import ArrayDataAdapter
-from synalinks.src.trainers.data_adapters.generator_data_adapter import (
-    GeneratorDataAdapter,
-)
+from synalinks.src.trainers.data_adapters.iterable_data_adapter import IterableDataAdapter
+from synalinks.src.trainers.data_adapters.iterable_data_adapter import is_iterable_source
+from synalinks.src.trainers.data_adapters.lazy_dataset import LazyDataset
+from synalinks.src.trainers.data_adapters.lazy_dataset_adapter import LazyDatasetAdapter
 
 
 def get_data_adapter(
@@ -19,7 +20,15 @@ def get_data_adapter(
     if isinstance(x, data_adapter.DataAdapter):
         return x
 
-    if array_data_adapter.can_convert_arrays((x, y)):
+    if isinstance(x, LazyDataset) or isinstance(y, LazyDataset):
+        return LazyDatasetAdapter(
+            x,
+            y,
+            shuffle=shuffle,
+            batch_size=batch_size,
+            steps=steps_per_epoch,
+        )
+    elif array_data_adapter.can_convert_arrays((x, y)):
         return ArrayDataAdapter(
             x,
             y,
@@ -27,10 +36,12 @@ def get_data_adapter(
             batch_size=batch_size,
             steps=steps_per_epoch,
         )
-    elif isinstance(x, types.GeneratorType):
+    elif isinstance(x, types.GeneratorType) or is_iterable_source(x):
         if y is not None:
-            raise_unsupported_arg("y", "the targets", "PyDataset")
-        return GeneratorDataAdapter(x)
+            raise_unsupported_arg("y", "the targets", "iterable")
+        # The `steps_per_epoch` are handled by the epoch iterator, the
+        # single use sources being consumed across the epochs
+        return IterableDataAdapter(x, batch_size=batch_size)
 
     else:
         raise ValueError(f"Unrecognized data type: x={x} (of type {type(x)})")
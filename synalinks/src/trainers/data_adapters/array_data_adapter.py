@@ -14,7 +14,12 @@ from synalinks.src.trainers.data_adapters.data_adapter import DataAdapter
 
 
 class ArrayDataAdapter(DataAdapter):
-    """Adapter for array-like objects, e.g. NumPy arrays."""
+    """Adapter for array-like objects, e.g. NumPy arrays.
+
+    The inputs are converted once to object arrays (without copy if they
+    already are) and the batches are sliced from them, so the data models
+    are never copied over the epochs.
+    """
 
     def __init__(
         self,
@@ -25,7 +30,14 @@ class ArrayDataAdapter(DataAdapter):
         shuffle=False,
     ):
         inputs = data_adapter_utils.pack_x_y(x, y)
-        num_samples = set(i.shape[0] for i in tree.flatten(inputs)).pop()
+        inputs = tree.map_structure(self._convert_input, inputs)
+        num_samples = set(len(i) for i in tree.flatten(inputs) if i is not None)
+        if len(num_samples) > 1:
+            raise ValueError(
+                "All the arrays should contain the same number of samples. "
+                f"Received arrays of lengths: {sorted(num_samples)}"
+            )
+        num_samples = num_samples.pop()
         self._num_samples = num_samples
         self._inputs = inputs
 
@@ -39,15 +51,15 @@ class ArrayDataAdapter(DataAdapter):
         self._partial_batch_size = num_samples % batch_size
         self._shuffle = shuffle
 
-    def get_numpy_iterator(self):
-        inputs = np.array(self._inputs, dtype="object")
+    def _convert_input(self, x):
+        return convert_to_object_array(x)
 
-        def slice_and_convert_to_numpy(sliceable, indices=None):
-            x = sliceable[indices]
-            x = np.array(x, dtype="object")
-            return x
+    def get_numpy_iterator(self):
+        def slice_array(sliceable, indices=None):
+            # A view for contiguous batches, a batch-sized copy when shuffled
+            return sliceable[indices]
 
-        return self._get_iterator(slice_and_convert_to_numpy, inputs)
+        return self._get_iterator(slice_array, self._inputs)
 
     def _get_iterator(self, slice_and_convert_fn, inputs):
         global_permutation = None
@@ -68,12 +80,16 @@ class ArrayDataAdapter(DataAdapter):
                 slice_and_convert_fn, indices=indices
             )
             x = tree.map_structure(slice_indices_and_convert_fn, inputs[0])
-            if inputs.shape[0] > 1:
+            if len(inputs) > 1:
                 y = tree.map_structure(slice_indices_and_convert_fn, inputs[1])
             else:
                 y = None
             yield data_adapter_utils.pack_x_y(x, y=y)
 
+    @property
+    def num_samples(self):
+        return self._num_samples
+
     @property
     def num_batches(self):
         return self._size
@@ -91,6 +107,30 @@ class ArrayDataAdapter(DataAdapter):
         return self._partial_batch_size or None
 
 
+def convert_to_object_array(x):
+    """Convert an array-like object to a 1D object array.
+
+    Object arrays are returned as is, other array-like objects are converted
+    without numpy trying to unpack the data models they contain.
+
+    Args:
+        x (np.ndarray | list): The array-like object.
+
+    Returns:
+        (np.ndarray): The object array (or `None` if `x` is `None`).
+    """
+    if x is None:
+        return None
+    if isinstance(x, np.ndarray) and x.dtype == object and x.ndim == 1:
+        return x
+    if isinstance(x, np.ndarray):
+        return x.astype("object")
+    array = np.empty(len(x), dtype="object")
+    for i, sample in enumerate(x):
+        array[i] = sample
+    return array
+
+
 def can_convert_arrays(arrays):
     """Check if array like-inputs can be handled by `ArrayDataAdapter`
 
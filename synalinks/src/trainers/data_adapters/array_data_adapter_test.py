@@ -2,6 +2,9 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import tracemalloc
+
+import numpy as np
 from absl.testing import parameterized
 
 from synalinks.src import testing
@@ -42,3 +45,34 @@ class TestArrayDataAdapter(testing.TestCase):
             self.assertIsInstance(x[1], Query)
             self.assertIsInstance(y[0], AnswerWithRationale)
             self.assertIsInstance(y[1], AnswerWithRationale)
+
+    def test_batches_are_views(self):
+        (x, y), _ = load_test_data()
+        adapter = ArrayDataAdapter(x, y=y, batch_size=1)
+        self.assertEqual(adapter.num_samples, 2)
+        for i, (x_batch, y_batch) in enumerate(adapter.get_numpy_iterator()):
+            self.assertTrue(np.shares_memory(x_batch, x))
+            self.assertTrue(np.shares_memory(y_batch, y))
+            self.assertIs(x_batch[0], x[i])
+
+    def test_mismatched_number_of_samples(self):
+        (x, y), _ = load_test_data()
+        with self.assertRaises(ValueError):
+            ArrayDataAdapter(x, y=y[:1])
+
+    def test_memory_usage(self):
+        num_samples = 200_000
+        x = np.full(num_samples, Query(query="What is the capital of France?"))
+        y = np.full(num_samples, AnswerWithRationale(rationale="", answer="Paris"))
+        adapter = ArrayDataAdapter(x, y=y, batch_size=32)
+
+        tracemalloc.start()
+        try:
+            for _ in range(2):
+                for x_batch, y_batch in adapter.get_numpy_iterator():
+                    pass
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # A single copy of the references of `x` takes 1.6MB
+        self.assertLess(peak, x.nbytes / 10)
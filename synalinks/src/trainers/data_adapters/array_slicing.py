@@ -7,8 +7,9 @@ import math
 import numpy as np
 
 from synalinks.src import tree
+from synalinks.src.trainers.data_adapters.lazy_dataset import LazyDataset
 
-ARRAY_TYPES = (np.ndarray, list, tuple)
+ARRAY_TYPES = (np.ndarray, list, tuple, LazyDataset)
 
 
 def can_slice_array(x):
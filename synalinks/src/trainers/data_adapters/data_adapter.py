@@ -19,6 +19,18 @@ class DataAdapter:
         """
         raise NotImplementedError
 
+    async def get_async_iterator(self):
+        """Get an async iterable for the `DataAdapter`, that yields Numpy object arrays.
+
+        The default implementation iterates over `get_numpy_iterator()`.
+        Adapters reading from asynchronous sources override it.
+
+        Returns:
+            A Python async iterator.
+        """
+        for data in self.get_numpy_iterator():
+            yield data
+
     @property
     def num_batches(self):
         """Return the size (number of batches) for the dataset created.
@@ -0,0 +1,324 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+import collections
+import math
+import types
+
+import numpy as np
+
+from synalinks.src.trainers.data_adapters import data_adapter_utils
+from synalinks.src.trainers.data_adapters.array_data_adapter import (
+    convert_to_object_array,
+)
+from synalinks.src.trainers.data_adapters.data_adapter import DataAdapter
+
+_END = object()
+
+
+class _ReadError:
+    def __init__(self, error):
+        self.error = error
+
+
+class IterableDataAdapter(DataAdapter):
+    """Adapter for iterables, iterators and (async) generators.
+
+    The source can yield batches, i.e. `(x,)` or `(x, y)` tuples of arrays,
+    or single samples, i.e. data models or `(x, y)` tuples of data models,
+    which are grouped into batches of `batch_size` samples by the adapter.
+
+    The source is read ahead of the program in a bounded buffer: the reading
+    pauses when the buffer is full (backpressure), so datasets larger than
+    memory (e.g. streamed from a queue or a database cursor) can be used.
+    Synchronous iterators are read in a worker thread so that a blocking
+    source doesn't block the event loop.
+
+    Sources that can only be iterated once (iterators and generators) are
+    consumed across the epochs: when an iteration is interrupted (e.g.
+    after `steps_per_epoch` batches), the samples read ahead but not yielded
+    yet are given back to the next iteration. To iterate over the whole
+    source at each epoch, give a re-iterable source (e.g. a list) or a
+    function returning the (async) iterator.
+
+    Example:
+
+    ```python
+    async def samples():
+        async for row in cursor:
+            yield Query(query=row["query"]), Answer(answer=row["answer"])
+
+    adapter = IterableDataAdapter(samples, batch_size=32, shuffle_buffer_size=1000)
+
+    await program.fit(x=adapter, epochs=2)
+    ```
+
+    Args:
+        source (Iterable | AsyncIterable | callable): The source of the data
+            or a function returning it.
+        batch_size (int): Optional. The number of samples per batch when
+            the source yields single samples (Default to 32).
+        steps (int): Optional. The number of batches of the source, used
+            when it can't be infered (Default to None).
+        buffer_size (int): Optional. The maximum number of items read ahead
+            from the source (Default to `2 * batch_size`).
+        shuffle_buffer_size (int): Optional. If given, the samples are
+            shuffled using a buffer of `shuffle_buffer_size` samples
+            (Default to None).
+        seed (int): Optional. The random seed used for the shuffling
+            (Default to None).
+    """
+
+    def __init__(
+        self,
+        source,
+        batch_size=None,
+        steps=None,
+        buffer_size=None,
+        shuffle_buffer_size=None,
+        seed=None,
+    ):
+        if not is_iterable_source(source):
+            raise ValueError(
+                "Expected an iterable, an async iterable or a function returning "
+                f"one. Received: source={source} (of type {type(source)})"
+            )
+        self._source = source
+        self._batch_size = batch_size or 32
+        self._steps = steps
+        self._buffer_size = buffer_size or 2 * self._batch_size
+        self._shuffle_buffer_size = shuffle_buffer_size
+        self._rng = np.random.default_rng(seed)
+        self._reusable = callable(source) or (
+            not hasattr(source, "__next__") and not hasattr(source, "__anext__")
+        )
+        # The state of single use sources shared by the successive iterations
+        self._reader = None
+        self._pending = collections.deque()
+
+    def _get_source(self):
+        if callable(self._source):
+            return self._source()
+        return self._source
+
+    def _get_reader(self):
+        if self._reusable:
+            return _Reader(self._get_source(), self._buffer_size)
+        if self._reader is None or self._reader.loop is not asyncio.get_running_loop():
+            self._reader = _Reader(self._get_source(), self._buffer_size)
+        return self._reader
+
+    def get_numpy_iterator(self):
+        source = self._get_source()
+        if hasattr(source, "__aiter__"):
+            raise ValueError(
+                "Async sources can only be iterated with `get_async_iterator()`."
+            )
+        batcher = _Batcher(self._batch_size, self._shuffle_buffer_size, self._rng)
+        for item in source:
+            batcher.add(item)
+            while batcher.ready:
+                yield batcher.pop()
+        batcher.flush()
+        while batcher.ready:
+            yield batcher.pop()
+
+    def get_async_iterator(self):
+        return _AsyncBatchIterator(self)
+
+    @property
+    def num_batches(self):
+        if self._steps:
+            return self._steps
+        if isinstance(self._source, (list, tuple)) and self._source:
+            if _is_batch(self._source[0]):
+                return len(self._source)
+            return int(math.ceil(len(self._source) / self._batch_size))
+        return None
+
+    @property
+    def batch_size(self):
+        return self._batch_size
+
+    @property
+    def has_partial_batch(self):
+        return None
+
+    @property
+    def partial_batch_size(self):
+        return None
+
+
+class _Reader:
+    """Read a source ahead of the consumer in a bounded queue."""
+
+    def __init__(self, source, buffer_size):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=buffer_size)
+        self.task = asyncio.ensure_future(self._read(source))
+
+    async def _read(self, source):
+        try:
+            if hasattr(source, "__aiter__"):
+                async for item in source:
+                    await self.queue.put(item)
+            elif isinstance(source, (list, tuple, np.ndarray)):
+                for item in source:
+                    await self.queue.put(item)
+            else:
+                iterator = iter(source)
+                while True:
+                    item = await asyncio.to_thread(next, iterator, _END)
+                    if item is _END:
+                        break
+                    await self.queue.put(item)
+        except Exception as e:
+            await self.queue.put(_ReadError(e))
+            return
+        await self.queue.put(_END)
+
+    async def get(self):
+        item = await self.queue.get()
+        if item is _END:
+            # Keep the end of the source for the next iterations
+            self.queue.put_nowait(_END)
+        elif isinstance(item, _ReadError):
+            raise item.error
+        return item
+
+    def close(self):
+        self.task.cancel()
+
+
+class _Batcher:
+    """Group the items of a source into batches, with an optional shuffle buffer."""
+
+    def __init__(self, batch_size, shuffle_buffer_size=None, rng=None):
+        self.batch_size = batch_size
+        self.shuffle_buffer_size = shuffle_buffer_size
+        self.rng = rng or np.random.default_rng()
+        self.shuffle_buffer = []
+        self.samples = []
+        self.ready = collections.deque()
+
+    def add(self, item):
+        if _is_batch(item):
+            self.ready.append([item])
+            return
+        if self.shuffle_buffer_size:
+            if len(self.shuffle_buffer) < self.shuffle_buffer_size:
+                self.shuffle_buffer.append(item)
+                return
+            i = self.rng.integers(len(self.shuffle_buffer))
+            item, self.shuffle_buffer[i] = self.shuffle_buffer[i], item
+        self._add_sample(item)
+
+    def _add_sample(self, sample):
+        self.samples.append(sample)
+        if len(self.samples) == self.batch_size:
+            self.ready.append(self.samples)
+            self.samples = []
+
+    def flush(self):
+        self.rng.shuffle(self.shuffle_buffer)
+        for sample in self.shuffle_buffer:
+            self._add_sample(sample)
+        self.shuffle_buffer = []
+        if self.samples:
+            self.ready.append(self.samples)
+            self.samples = []
+
+    def pop(self):
+        return _make_batch(self.ready.popleft())
+
+    def get_items(self):
+        """Returns the items that were not yielded in a batch yet."""
+        items = [item for items in self.ready for item in items]
+        return items + self.samples + self.shuffle_buffer
+
+
+class _AsyncBatchIterator:
+    """Async iterator over the batches of an `IterableDataAdapter`.
+
+    The items read ahead but not yielded in a batch are given back to the
+    next iteration if this one is interrupted.
+    """
+
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self.reader = None
+        self.batcher = _Batcher(
+            adapter._batch_size,
+            adapter._shuffle_buffer_size,
+            adapter._rng,
+        )
+        self.exhausted = False
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def _next_item(self):
+        if not self.adapter._reusable and self.adapter._pending:
+            return self.adapter._pending.popleft()
+        if self.reader is None:
+            self.reader = self.adapter._get_reader()
+        return await self.reader.get()
+
+    async def __anext__(self):
+        if self.closed:
+            raise StopAsyncIteration
+        while not self.batcher.ready:
+            if self.exhausted:
+                self.close()
+                raise StopAsyncIteration
+            item = await self._next_item()
+            if item is _END:
+                self.exhausted = True
+                self.batcher.flush()
+            else:
+                self.batcher.add(item)
+        return self.batcher.pop()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self.adapter._reusable:
+            if self.reader is not None:
+                self.reader.close()
+        elif not self.exhausted:
+            self.adapter._pending.extendleft(reversed(self.batcher.get_items()))
+
+
+def _is_batch(item):
+    x, _ = data_adapter_utils.unpack_x_y(item)
+    return isinstance(x, (np.ndarray, list))
+
+
+def _make_batch(items):
+    if len(items) == 1 and _is_batch(items[0]):
+        x, y = data_adapter_utils.unpack_x_y(items[0])
+        y = convert_to_object_array(y) if y is not None else None
+        return data_adapter_utils.pack_x_y(convert_to_object_array(x), y)
+    samples = [data_adapter_utils.unpack_x_y(item) for item in items]
+    x = convert_to_object_array([x for x, _ in samples])
+    if all(y is None for _, y in samples):
+        return (x,)
+    return (x, convert_to_object_array([y for _, y in samples]))
+
+
+def is_iterable_source(x):
+    """Check if `x` can be handled by `IterableDataAdapter`.
+
+    Args:
+        x: The data.
+
+    Returns:
+        (bool): True if `x` is an (async) iterable or a function.
+    """
+    if isinstance(x, (dict, str, bytes)):
+        return False
+    if isinstance(x, (types.FunctionType, types.MethodType)):
+        return True
+    return hasattr(x, "__aiter__") or hasattr(x, "__iter__")
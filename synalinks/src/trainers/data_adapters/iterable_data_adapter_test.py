@@ -0,0 +1,175 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+
+import numpy as np
+
+from synalinks.src import testing
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.testing.test_utils import Query
+from synalinks.src.trainers.data_adapters import get_data_adapter
+from synalinks.src.trainers.data_adapters.iterable_data_adapter import IterableDataAdapter
+from synalinks.src.trainers.epoch_iterator import EpochIterator
+
+
+def get_sample(i):
+    return (
+        Query(query=f"What is {i} + {i}?"),
+        AnswerWithRationale(rationale="", answer=str(2 * i)),
+    )
+
+
+def get_index(x):
+    return int(x.query.split(" ")[2])
+
+
+async def collect(iterator):
+    return [batch async for batch in iterator]
+
+
+class IterableDataAdapterTest(testing.TestCase):
+    def test_sync_generator_of_samples(self):
+        def samples():
+            for i in range(10):
+                yield get_sample(i)
+
+        adapter = get_data_adapter(samples(), batch_size=4)
+        self.assertIsInstance(adapter, IterableDataAdapter)
+        self.assertIsNone(adapter.num_batches)
+
+        batches = list(adapter.get_numpy_iterator())
+        self.assertEqual([len(x) for x, _ in batches], [4, 4, 2])
+        x, y = batches[0]
+        self.assertIsInstance(x, np.ndarray)
+        self.assertIsInstance(x[0], Query)
+        self.assertIsInstance(y[0], AnswerWithRationale)
+
+    async def test_async_generator_of_samples(self):
+        async def samples():
+            for i in range(10):
+                await asyncio.sleep(0)
+                yield get_sample(i)
+
+        adapter = IterableDataAdapter(samples, batch_size=4)
+        # A function returning the source is iterated at each epoch
+        for _ in range(2):
+            batches = await collect(adapter.get_async_iterator())
+            self.assertEqual([len(x) for x, _ in batches], [4, 4, 2])
+            indices = [get_index(x) for batch in batches for x in batch[0]]
+            self.assertEqual(indices, list(range(10)))
+
+    async def test_bounded_buffer(self):
+        produced = 0
+
+        async def samples():
+            nonlocal produced
+            for i in range(100):
+                produced += 1
+                yield get_sample(i)
+
+        adapter = IterableDataAdapter(samples(), batch_size=4, buffer_size=8)
+        iterator = adapter.get_async_iterator()
+        await iterator.__anext__()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        # The batch, the buffer and the item waiting to be buffered
+        self.assertLessEqual(produced, 4 + 8 + 1)
+        iterator.close()
+
+    def test_shuffle_buffer(self):
+        samples = [get_sample(i) for i in range(20)]
+        adapter = IterableDataAdapter(
+            samples,
+            batch_size=4,
+            shuffle_buffer_size=8,
+            seed=1,
+        )
+        self.assertEqual(adapter.num_batches, 5)
+        indices = [
+            get_index(x) for x_batch, _ in adapter.get_numpy_iterator() for x in x_batch
+        ]
+        self.assertEqual(sorted(indices), list(range(20)))
+        self.assertNotEqual(indices, list(range(20)))
+
+    async def test_interrupted_iteration_gives_back_read_ahead_samples(self):
+        def samples():
+            for i in range(10):
+                yield get_sample(i)
+
+        adapter = IterableDataAdapter(
+            samples(),
+            batch_size=4,
+            shuffle_buffer_size=4,
+            seed=1,
+        )
+        iterator = adapter.get_async_iterator()
+        # The samples in the shuffle buffer are read ahead of the batch
+        x, _ = await iterator.__anext__()
+        yielded = [get_index(sample) for sample in x]
+        self.assertEqual(len(iterator.batcher.get_items()), 4)
+        iterator.close()
+
+        # Only the samples that were not yielded are given back
+        batches = await collect(adapter.get_async_iterator())
+        indices = [get_index(x) for batch in batches for x in batch[0]]
+        self.assertEqual(len(indices), 6)
+        self.assertEqual(sorted(yielded + indices), list(range(10)))
+
+        # The generator is consumed
+        batches = await collect(adapter.get_async_iterator())
+        self.assertEqual(batches, [])
+
+    async def test_source_of_batches(self):
+        def batches():
+            for i in range(0, 6, 2):
+                x, y = zip(get_sample(i), get_sample(i + 1))
+                yield np.array(x, dtype="object"), np.array(y, dtype="object")
+
+        adapter = IterableDataAdapter(batches)
+        results = await collect(adapter.get_async_iterator())
+        self.assertEqual(len(results), 3)
+        x, y = results[2]
+        self.assertEqual(get_index(x[1]), 5)
+        self.assertEqual(y[1].answer, "10")
+
+    async def test_source_error(self):
+        async def samples():
+            yield get_sample(0)
+            raise ValueError("Connection lost")
+
+        adapter = IterableDataAdapter(samples, batch_size=4)
+        with self.assertRaisesRegex(ValueError, "Connection lost"):
+            await collect(adapter.get_async_iterator())
+
+    async def test_epoch_iterator(self):
+        async def samples():
+            for i in range(10):
+                yield get_sample(i)
+
+        epoch_iterator = EpochIterator(x=samples, batch_size=4)
+        for _ in range(2):
+            steps = []
+            async for step, iterator in epoch_iterator:
+                x_batch, y_batch = iterator[0]
+                steps.append(step)
+            self.assertEqual(steps, [0, 1, 2])
+
+    async def test_steps_per_epoch_consumes_single_use_source(self):
+        def samples():
+            for i in range(10):
+                yield get_sample(i)
+
+        epoch_iterator = EpochIterator(x=samples(), batch_size=2, steps_per_epoch=2)
+        epochs = []
+        for _ in range(2):
+            indices = []
+            async for _, iterator in epoch_iterator:
+                x_batch, _ = iterator[0]
+                indices.append([get_index(x) for x in x_batch])
+            epochs.append(indices)
+        self.assertEqual(epochs, [[[0, 1], [2, 3]], [[4, 5], [6, 7]]])
+
+    def test_unrecognized_data_type(self):
+        for x in ({"a": 1}, "data"):
+            with self.assertRaisesRegex(ValueError, "Unrecognized data type"):
+                get_data_adapter(x)
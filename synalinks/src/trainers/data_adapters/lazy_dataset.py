@@ -0,0 +1,117 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import numpy as np
+
+from synalinks.src.api_export import synalinks_export
+
+
+@synalinks_export(
+    [
+        "synalinks.utils.LazyDataset",
+        "synalinks.datasets.LazyDataset",
+    ]
+)
+class LazyDataset:
+    """A sliceable dataset building its data models on access.
+
+    The dataset wraps a sequence of raw records (e.g. a list of dicts or a
+    HuggingFace dataset) and a function converting a record into a
+    `DataModel`. The data models are only built when accessed, so large
+    datasets can be fed to `program.fit()` without building every sample
+    beforehand.
+
+    Slicing, indexing with an array of indices or shuffling the dataset
+    returns a new view on the same records, without building any data model.
+
+    Example:
+
+    ```python
+    class Query(synalinks.DataModel):
+        query: str
+
+    records = [{"question": "What is 1 + 1?"}, {"question": "What is 2 + 2?"}]
+
+    x_train = synalinks.datasets.LazyDataset(
+        records,
+        lambda record: Query(query=record["question"]),
+    )
+
+    print(len(x_train)) # 2
+    print(x_train[0]) # The data model is built here
+    x_train = x_train.shuffle(seed=42)[:1]
+    ```
+
+    Args:
+        records (list): The sequence of raw records, it should support
+            `len()` and indexing with an integer.
+        fn (callable): The function converting a record into a data model.
+        indices (np.ndarray): Optional. The indices of the records in the
+            dataset, all the records are used if not provided
+            (Default to None).
+    """
+
+    def __init__(self, records, fn, indices=None):
+        self.records = records
+        self.fn = fn
+        if indices is None:
+            indices = np.arange(len(records))
+        self.indices = np.asarray(indices, dtype="int64")
+
+    def __len__(self):
+        return len(self.indices)
+
+    @property
+    def shape(self):
+        return (len(self.indices),)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self.fn(self.records[int(self.indices[key])])
+        return LazyDataset(self.records, self.fn, indices=self.indices[key])
+
+    def __iter__(self):
+        for index in self.indices:
+            yield self.fn(self.records[int(index)])
+
+    def get_batch(self, indices):
+        """Build the data models of a batch.
+
+        Args:
+            indices (slice | np.ndarray): The indices of the samples in
+                the dataset.
+
+        Returns:
+            (np.ndarray): The object array of data models.
+        """
+        indices = self.indices[indices]
+        batch = np.empty(len(indices), dtype="object")
+        for i, index in enumerate(indices):
+            batch[i] = self.fn(self.records[int(index)])
+        return batch
+
+    def shuffle(self, seed=None):
+        """Returns a shuffled view of the dataset.
+
+        Args:
+            seed (int): Optional. The random seed (Default to None).
+
+        Returns:
+            (LazyDataset): The shuffled dataset.
+        """
+        permutation = np.random.default_rng(seed).permutation(len(self.indices))
+        return LazyDataset(self.records, self.fn, indices=self.indices[permutation])
+
+    def batch(self, batch_size):
+        """Iterate over the dataset by batches.
+
+        Args:
+            batch_size (int): The number of samples per batch.
+
+        Yields:
+            (np.ndarray): The object arrays of data models.
+        """
+        for start in range(0, len(self.indices), batch_size):
+            yield self.get_batch(slice(start, start + batch_size))
+
+    def __repr__(self):
+        return f"<LazyDataset num_samples={len(self.indices)}>"
@@ -0,0 +1,24 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+from synalinks.src.trainers.data_adapters.array_data_adapter import ArrayDataAdapter
+from synalinks.src.trainers.data_adapters.lazy_dataset import LazyDataset
+
+
+class LazyDatasetAdapter(ArrayDataAdapter):
+    """Adapter for `LazyDataset`s, building the data models of each batch on access.
+
+    The inputs can mix `LazyDataset`s and array-like objects.
+    """
+
+    def _convert_input(self, x):
+        if isinstance(x, LazyDataset):
+            return x
+        return super()._convert_input(x)
+
+    def get_numpy_iterator(self):
+        def slice_dataset(sliceable, indices=None):
+            if isinstance(sliceable, LazyDataset):
+                return sliceable.get_batch(indices)
+            return sliceable[indices]
+
+        return self._get_iterator(slice_dataset, self._inputs)
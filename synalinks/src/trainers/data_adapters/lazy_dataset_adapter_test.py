@@ -0,0 +1,117 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import numpy as np
+from absl.testing import parameterized
+
+from synalinks.src import testing
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.testing.test_utils import Query
+from synalinks.src.testing.test_utils import named_product
+from synalinks.src.trainers.data_adapters import array_slicing
+from synalinks.src.trainers.data_adapters import get_data_adapter
+from synalinks.src.trainers.data_adapters.lazy_dataset import LazyDataset
+from synalinks.src.trainers.data_adapters.lazy_dataset_adapter import LazyDatasetAdapter
+
+
+def get_test_datasets(num_samples=10):
+    records = [
+        {"question": f"What is {i} + {i}?", "answer": str(2 * i)}
+        for i in range(num_samples)
+    ]
+    built = []
+
+    def get_input(record):
+        built.append(record["question"])
+        return Query(query=record["question"])
+
+    def get_output(record):
+        return AnswerWithRationale(rationale="", answer=record["answer"])
+
+    return LazyDataset(records, get_input), LazyDataset(records, get_output), built
+
+
+class LazyDatasetTest(testing.TestCase):
+    def test_lazy_access(self):
+        x, _, built = get_test_datasets()
+        self.assertEqual(len(x), 10)
+        self.assertEqual(x.shape, (10,))
+
+        subset = x[2:5]
+        self.assertIsInstance(subset, LazyDataset)
+        self.assertEqual(len(subset), 3)
+        self.assertEqual(built, [])
+
+        self.assertEqual(subset[0].query, "What is 2 + 2?")
+        self.assertEqual(subset[-1].query, "What is 4 + 4?")
+        self.assertEqual(len(built), 2)
+
+    def test_shuffle(self):
+        x, y, _ = get_test_datasets()
+        x_shuffled = x.shuffle(seed=42)
+        y_shuffled = y.shuffle(seed=42)
+        self.assertEqual(len(x_shuffled), 10)
+        self.assertEqual(
+            sorted(sample.query for sample in x_shuffled),
+            sorted(sample.query for sample in x),
+        )
+        for x_sample, y_sample in zip(x_shuffled, y_shuffled):
+            i = x_sample.query.split(" ")[2]
+            self.assertEqual(y_sample.answer, str(2 * int(i)))
+
+    def test_batch(self):
+        x, _, _ = get_test_datasets()
+        batches = list(x.batch(4))
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+        self.assertIsInstance(batches[0], np.ndarray)
+        self.assertIsInstance(batches[0][0], Query)
+
+    def test_validation_split(self):
+        x, y, built = get_test_datasets()
+        (x_train, y_train), (x_val, y_val) = array_slicing.train_validation_split(
+            (x, y), validation_split=0.2
+        )
+        self.assertEqual(len(x_train), 8)
+        self.assertEqual(len(y_val), 2)
+        self.assertEqual(built, [])
+
+
+class LazyDatasetAdapterTest(testing.TestCase):
+    @parameterized.named_parameters(
+        named_product(
+            shuffle=[False, "batch", True],
+        )
+    )
+    def test_basic_flow(self, shuffle):
+        x, y, built = get_test_datasets()
+        adapter = get_data_adapter(x, y, batch_size=4, shuffle=shuffle)
+        self.assertIsInstance(adapter, LazyDatasetAdapter)
+        self.assertEqual(adapter.num_batches, 3)
+        self.assertEqual(adapter.partial_batch_size, 2)
+        self.assertEqual(built, [])
+
+        iterator = adapter.get_numpy_iterator()
+        x_batch, y_batch = next(iterator)
+        # Only the samples of the first batch are built
+        self.assertEqual(len(built), 4)
+        self.assertIsInstance(x_batch, np.ndarray)
+        self.assertIsInstance(x_batch[0], Query)
+        self.assertIsInstance(y_batch[0], AnswerWithRationale)
+
+        num_samples = len(x_batch)
+        for x_batch, y_batch in iterator:
+            num_samples += len(x_batch)
+            for x_sample, y_sample in zip(x_batch, y_batch):
+                i = x_sample.query.split(" ")[2]
+                self.assertEqual(y_sample.answer, str(2 * int(i)))
+        self.assertEqual(num_samples, 10)
+
+    def test_mixed_inputs(self):
+        x, _, _ = get_test_datasets(num_samples=3)
+        y = np.array(
+            [AnswerWithRationale(rationale="", answer=str(2 * i)) for i in range(3)],
+            dtype="object",
+        )
+        adapter = get_data_adapter(x, y, batch_size=2)
+        batches = list(adapter.get_numpy_iterator())
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(batches[1][1][0].answer, "4")
@@ -2,6 +2,8 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+import collections
 import contextlib
 import warnings
 
@@ -23,6 +25,7 @@ class EpochIterator:
         self._current_iterator = None
         self._epoch_iterator = None
         self._steps_seen = 0
+        self._async = False
         self.data_adapter = data_adapters.get_data_adapter(
             x=x,
             y=y,
@@ -33,7 +36,18 @@ class EpochIterator:
         self._num_batches = self.data_adapter.num_batches
 
     def _get_iterator(self):
-        return self.data_adapter.get_numpy_iterator()
+        self._close_iterator()
+        if self._async:
+            return self.data_adapter.get_async_iterator()
+        return iter(self.data_adapter.get_numpy_iterator())
+
+    def _close_iterator(self):
+        # Let the adapter know that the current iterator is abandoned
+        # (e.g. to give back the samples read ahead of a stream)
+        close = getattr(self._current_iterator, "close", None)
+        if close is not None:
+            close()
+        self._current_iterator = None
 
     def _interrupted_warning(self):
         warnings.warn(
@@ -44,7 +58,7 @@ class EpochIterator:
         )
 
     def reset(self):
-        self._current_iterator = None
+        self._close_iterator()
         self._num_batches = self.data_adapter.num_batches
         self._steps_seen = 0
         self._epoch_iterator = None
@@ -56,7 +70,7 @@ class EpochIterator:
 
         if steps_per_epoch > 0:
             if self._current_iterator is None or self.steps_per_epoch is None:
-                self._current_iterator = iter(self._get_iterator())
+                self._current_iterator = self._get_iterator()
                 self._steps_seen = 0
             for step in range(0, steps_per_epoch, self.steps_per_execution):
                 if self._num_batches and self._steps_seen >= self._num_batches:
@@ -66,21 +80,32 @@ class EpochIterator:
                 self._steps_seen += self.steps_per_execution
                 yield step, self._current_iterator
             if self._num_batches and self._steps_seen >= self._num_batches:
-                self._current_iterator = iter(self._get_iterator())
+                self._current_iterator = self._get_iterator()
                 self._steps_seen = 0
         else:
-            iterator = iter(self._get_iterator())
+            self._current_iterator = self._get_iterator()
             step = -self.steps_per_execution
             while True:
                 step += self.steps_per_execution
                 self._steps_seen = step + self.steps_per_execution
-                yield step, iterator
+                yield step, self._current_iterator
         self.data_adapter.on_epoch_end()
 
     def __iter__(self):
+        self._set_async(False)
+        self._epoch_iterator = self._enumerate_iterator()
+        return self
+
+    def __aiter__(self):
+        self._set_async(True)
         self._epoch_iterator = self._enumerate_iterator()
         return self
 
+    def _set_async(self, value):
+        if self._async != value:
+            self._close_iterator()
+            self._async = value
+
     def __next__(self):
         buffer = []
         step, iterator = next(self._epoch_iterator)
@@ -93,10 +118,74 @@ class EpochIterator:
             return step, buffer
         raise StopIteration
 
+    async def __anext__(self):
+        buffer = []
+        try:
+            step, iterator = next(self._epoch_iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+        with self.catch_stop_iteration():
+            for _ in range(self.steps_per_execution):
+                try:
+                    data = await iterator.__anext__()
+                except StopAsyncIteration:
+                    raise StopIteration
+                buffer.append(data)
+            return step, buffer
+        if buffer:
+            return step, buffer
+        raise StopAsyncIteration
+
     def enumerate_epoch(self):
         for step, data in self:
             yield step, data
 
+    async def prefetch(self, fn, buffer_size=1):
+        """Asynchronously apply a function to the upcoming batches of the epoch.
+
+        While the caller processes a batch, `fn` already runs on the next
+        `buffer_size` batches. The results are yielded in the order of the
+        batches.
+
+        Example:
+
+        ```python
+        async with contextlib.aclosing(
+            epoch_iterator.prefetch(predict_fn, buffer_size=2)
+        ) as batches:
+            async for step, iterator, y_pred in batches:
+                x_batch, y_batch = iterator[0]
+        ```
+
+        Args:
+            fn (callable): The async function to apply to the data of each batch
+                (as returned when iterating over the epoch iterator).
+            buffer_size (int): Optional. The number of batches processed
+                ahead of the current one (Default to 1).
+
+        Yields:
+            (tuple): The step, the data and the result of `fn` for each batch.
+        """
+        pending = collections.deque()
+        iterator = self.__aiter__()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) <= buffer_size:
+                    try:
+                        step, data = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.append((step, data, asyncio.ensure_future(fn(data))))
+                if not pending:
+                    break
+                step, data, future = pending.popleft()
+                yield step, data, await future
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
     @contextlib.contextmanager
     def catch_stop_iteration(self):
         """Catches errors when an iterator runs out of data."""
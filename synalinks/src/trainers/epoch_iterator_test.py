@@ -2,6 +2,9 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+import contextlib
+
 import numpy as np
 
 from synalinks.src import testing
@@ -29,3 +32,26 @@ class EpochIteratorTest(testing.TestCase):
                 self.assertIsInstance(y_batch, np.ndarray)
                 self.assertIsInstance(x_batch[0], Query)
                 self.assertIsInstance(y_batch[0], AnswerWithRationale)
+
+    async def test_prefetch(self):
+        x = np.array([Query(query=f"Query {i}") for i in range(6)], dtype="object")
+        epoch_iterator = EpochIterator(x=x, batch_size=1)
+
+        started = []
+
+        async def fn(iterator):
+            x_batch = iterator[0][0]
+            started.append(x_batch[0].query)
+            # The batches complete in reverse order
+            await asyncio.sleep(0.01 * (6 - len(started)))
+            return x_batch[0].query
+
+        results = []
+        async with contextlib.aclosing(
+            epoch_iterator.prefetch(fn, buffer_size=2)
+        ) as batches:
+            async for step, _, result in batches:
+                # At most `buffer_size` batches are processed ahead
+                self.assertLessEqual(len(started), step + 3)
+                results.append((step, result))
+        self.assertEqual(results, [(i, f"Query {i}") for i in range(6)])
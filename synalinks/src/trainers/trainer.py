@@ -3,6 +3,7 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 import asyncio
+import contextlib
 import inspect
 import warnings
 
@@ -31,6 +32,7 @@ class Trainer:
         self.compiled = False
         self.reward = None
         self.steps_per_execution = 1
+        self.max_concurrency = None
         # Can be set by callbacks in on_train_begin
         self._initial_epoch = None
         self._compute_reward_has_training_arg = (
@@ -51,6 +53,7 @@ class Trainer:
         metrics=None,
         run_eagerly=False,
         steps_per_execution=1,
+        max_concurrency=None,
     ):
         """Configures the program for training.
 
@@ -101,7 +104,15 @@ class Trainer:
                 `Callback.on_batch_begin` and `Callback.on_batch_end` methods
                 will only be called every `N` batches (i.e. before/after
                 each compiled function execution).
+            max_concurrency (int): Optional. The maximum number of samples whose
+                reward and metrics are computed concurrently, `None` for
+                the whole batch (Default to None).
         """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                "`max_concurrency` should be a positive integer or `None`. "
+                f"Received: {max_concurrency}"
+            )
         self._clear_previous_trainer_metrics()
         self._optimizer = optimizer
 
@@ -121,6 +132,7 @@ class Trainer:
         self.compiled = True
         self._reward_tracker = metrics_module.Mean(name="reward")
         self.steps_per_execution = steps_per_execution
+        self.max_concurrency = max_concurrency
 
         self._compile_config = serialization_lib.SerializableDict(
             optimizer=optimizer,
@@ -129,6 +141,7 @@ class Trainer:
             metrics=metrics,
             run_eagerly=run_eagerly,
             steps_per_execution=steps_per_execution,
+            max_concurrency=max_concurrency,
         )
 
     @property
@@ -208,6 +221,10 @@ class Trainer:
     ):
         """Compute the total reward, validate it, and return it.
 
+        The rewards of the samples are computed concurrently (see the
+        `max_concurrency` argument of `compile()`), or all at once when the
+        reward implements `Reward.call_batch()`.
+
         Subclasses can optionally override this method to provide custom reward
         computation logic.
 
@@ -226,8 +243,11 @@ class Trainer:
         del training
         rewards = []
         if self._compile_reward is not None:
-            for y_t, y_p in zip(y, y_pred):
-                reward = await self._compile_reward(y_t, y_p)
+            if self._compile_reward.supports_call_batch(y, y_pred):
+                batch_rewards = await self._compile_reward.call_batch(y, y_pred)
+            else:
+                batch_rewards = await self._map_samples(self._compile_reward, y, y_pred)
+            for reward in batch_rewards:
                 if reward is not None:
                     rewards.append(reward)
         for reward in self.rewards:
@@ -289,7 +309,11 @@ class Trainer:
         updating and collection logic. Custom metrics are not passed in
         `compile()`, they can be created in `__init__` or `build`. They are
         automatically tracked and returned by `self.metrics`.
-        ```
+
+        The metrics of the samples are computed concurrently (see the
+        `max_concurrency` argument of `compile()`), so the `update_state()`
+        method of custom metrics should only update their state after
+        their last `await`.
 
         Args:
             x: Input data.
@@ -304,10 +328,32 @@ class Trainer:
         """
         del x  # The default implementation does not use `x`.
         if self._compile_metrics is not None:
-            for y_t, y_p in zip(y, y_pred):
-                await self._compile_metrics.update_state(y_t, y_p)
+            await self._map_samples(self._compile_metrics.update_state, y, y_pred)
         return self.get_metrics_result()
 
+    async def _map_samples(self, fn, y, y_pred):
+        """Concurrently apply `fn(y_true, y_pred)` to each sample of a batch.
+
+        Args:
+            fn (callable): The async function to apply.
+            y (list): Target data.
+            y_pred (list): Predictions returned by the program.
+
+        Returns:
+            (list): The results in the order of the samples.
+        """
+        if not self.max_concurrency:
+            return await asyncio.gather(*[fn(y_t, y_p) for y_t, y_p in zip(y, y_pred)])
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded_fn(y_t, y_p):
+            async with semaphore:
+                return await fn(y_t, y_p)
+
+        return await asyncio.gather(
+            *[bounded_fn(y_t, y_p) for y_t, y_p in zip(y, y_pred)]
+        )
+
     def get_metrics_result(self):
         """Returns the program's metrics values as a dict.
 
@@ -344,6 +390,7 @@ class Trainer:
         validation_batch_size=None,
         validation_freq=1,
         train_optimizer=False,
+        prefetch_batches=0,
     ):
         """Trains the program for a fixed number of epochs (dataset iterations).
 
@@ -444,6 +491,13 @@ class Trainer:
                 e.g. `validation_freq=2` runs validation every 2 epochs.
             train_optimizer (bool): Wether or not to train the optimizer
                 if possible (Default to False).
+            prefetch_batches (int): The number of upcoming batches predicted
+                while the rewards, optimization and metrics of the current batch
+                are computed. The optimizer updates are still applied in the
+                order of the batches, but the predictions of the prefetched
+                batches don't see the updates of the batches before them.
+                Also used for the validation. Only used when `train_on_batch()`
+                is not overridden (Default to 0).
 
         Returns:
             (History): A `History` object. Its `History.history` attribute is
@@ -475,7 +529,7 @@ class Trainer:
 
         if not all(module.built for module in self._flatten_modules()):
             # Build the model on one batch of data.
-            for _, data in epoch_iterator:
+            async for _, data in epoch_iterator:
                 data_batch = data[0]
                 self._auto_build(
                     iterator=epoch_iterator,
@@ -496,6 +550,13 @@ class Trainer:
                 program=self,
             )
 
+        if prefetch_batches < 0:
+            raise ValueError(
+                "`prefetch_batches` should be a positive integer or 0. "
+                f"Received: {prefetch_batches}"
+            )
+        pipelined = prefetch_batches > 0 and python_utils.is_default(self.train_on_batch)
+
         self.stop_training = False
         callbacks.on_train_begin()
         training_logs = None
@@ -506,19 +567,30 @@ class Trainer:
             self.reset_metrics()
             callbacks.on_epoch_begin(epoch)
             with epoch_iterator.catch_stop_iteration():
-                for step, iterator in epoch_iterator:
-                    data = iterator[0]
-                    x_batch, y_batch = data_adapter_utils.unpack_x_y(data)
-                    callbacks.on_train_batch_begin(step)
-                    logs = await self.train_on_batch(
-                        x=x_batch,
-                        y=y_batch,
-                        return_dict=True,
-                        train_optimizer=train_optimizer,
+                if pipelined:
+                    logs = (
+                        await self._pipelined_train_loop(
+                            epoch_iterator,
+                            callbacks,
+                            prefetch_batches=prefetch_batches,
+                            train_optimizer=train_optimizer,
+                        )
+                        or logs
                     )
-                    callbacks.on_train_batch_end(step, logs)
-                    if self.stop_training:
-                        break
+                else:
+                    async for step, iterator in epoch_iterator:
+                        data = iterator[0]
+                        x_batch, y_batch = data_adapter_utils.unpack_x_y(data)
+                        callbacks.on_train_batch_begin(step)
+                        logs = await self.train_on_batch(
+                            x=x_batch,
+                            y=y_batch,
+                            return_dict=True,
+                            train_optimizer=train_optimizer,
+                        )
+                        callbacks.on_train_batch_end(step, logs)
+                        if self.stop_training:
+                            break
 
             # Override with model metrics instead of last step logs if needed.
             epoch_logs = dict(self._get_metrics_result_or_logs(logs))
@@ -541,6 +613,7 @@ class Trainer:
                     batch_size=validation_batch_size or batch_size,
                     steps=validation_steps,
                     callbacks=callbacks,
+                    prefetch_batches=prefetch_batches,
                     _use_cached_eval_dataset=True,
                 )
                 val_logs = {"val_" + name: val for name, val in val_logs.items()}
@@ -574,6 +647,8 @@ class Trainer:
         steps=None,
         callbacks=None,
         return_dict=True,
+        window_size=None,
+        prefetch_batches=0,
         **kwargs,
     ):
         """Returns the reward value & metrics values for the program in test mode.
@@ -613,6 +688,15 @@ class Trainer:
             return_dict (bool): If `True`, reward and metric results are returned as a
                 dict, with each key being the name of the metric.
                 If `False`, they are returned as a list.
+            window_size (int): Optional. If given, the samples are predicted in
+                a sliding window of `window_size` concurrent samples spanning
+                the batches, instead of waiting for each batch to complete.
+                Only used when `test_on_batch()` is not overridden
+                (Default to None).
+            prefetch_batches (int): The number of upcoming batches predicted
+                while the rewards and metrics of the current batch are
+                computed. Only used when `test_on_batch()` is not overridden
+                (Default to 0).
 
         Returns:
             (float | list | dict): Scalar test reward
@@ -640,7 +724,7 @@ class Trainer:
 
         if not all(module.built for module in self._flatten_modules()):
             # Build the model on one batch of data.
-            for _, data in epoch_iterator:
+            async for _, data in epoch_iterator:
                 data_batch = data[0]
                 self._auto_build(
                     iterator=epoch_iterator,
@@ -661,22 +745,42 @@ class Trainer:
                 program=self,
             )
 
+        if prefetch_batches < 0:
+            raise ValueError(
+                "`prefetch_batches` should be a positive integer or 0. "
+                f"Received: {prefetch_batches}"
+            )
+        pipelined = (window_size or prefetch_batches > 0) and python_utils.is_default(
+            self.test_on_batch
+        )
+
         self.stop_evaluating = False
         callbacks.on_test_begin()
         logs = {}
         self.reset_metrics()
-        for step, iterator in epoch_iterator:
-            callbacks.on_test_batch_begin(step)
-            data = iterator[0]
-            x_batch, y_batch = data_adapter_utils.unpack_x_y(data)
-            logs = await self.test_on_batch(
-                x=x_batch,
-                y=y_batch,
-                return_dict=True,
+        if pipelined:
+            logs = (
+                await self._pipelined_test_loop(
+                    epoch_iterator,
+                    callbacks,
+                    prefetch_batches=prefetch_batches,
+                    window_size=window_size,
+                )
+                or logs
             )
-            callbacks.on_test_batch_end(step, logs)
-            if self.stop_evaluating:
-                break
+        else:
+            async for step, iterator in epoch_iterator:
+                callbacks.on_test_batch_begin(step)
+                data = iterator[0]
+                x_batch, y_batch = data_adapter_utils.unpack_x_y(data)
+                logs = await self.test_on_batch(
+                    x=x_batch,
+                    y=y_batch,
+                    return_dict=True,
+                )
+                callbacks.on_test_batch_end(step, logs)
+                if self.stop_evaluating:
+                    break
         logs = self._get_metrics_result_or_logs(logs)
         callbacks.on_test_end(logs)
 
@@ -685,7 +789,13 @@ class Trainer:
         return self._flatten_metrics_in_order(logs)
 
     async def predict(
-        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        window_size=None,
     ):
         """Generates output predictions for the input samples.
 
@@ -725,6 +835,10 @@ class Trainer:
                 repeating dataset, it will run indefinitely.
             callbacks (list): List of `synalinks.callbacks.Callback` instances.
                 List of callbacks to apply during prediction.
+            window_size (int): Optional. If given, the samples are predicted in
+                a sliding window of `window_size` concurrent samples spanning
+                the batches, instead of waiting for each batch to complete
+                (Default to None).
 
         Returns:
             (list): `JsonDataModel` array(s) of predictions.
@@ -754,18 +868,33 @@ class Trainer:
         self.stop_predicting = False
         callbacks.on_test_begin()
         outputs = []
-        for step, iterator in epoch_iterator:
-            callbacks.on_predict_batch_begin(step)
-            data = iterator[0]
-            x_batch, _ = data_adapter_utils.unpack_x_y(data)
-            batch_outputs = await self.predict_on_batch(x_batch)
-            outputs.extend(batch_outputs)
-            callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
-            if self.stop_predicting:
-                break
+        if window_size:
+            predict_fn, buffer_size = self._get_prefetch_predict_fn(
+                window_size=window_size,
+            )
+            async with contextlib.aclosing(
+                epoch_iterator.prefetch(predict_fn, buffer_size=buffer_size)
+            ) as batches:
+                async for step, _, batch_outputs in batches:
+                    callbacks.on_predict_batch_begin(step)
+                    outputs.extend(batch_outputs)
+                    callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
+                    if self.stop_predicting:
+                        break
+        else:
+            async for step, iterator in epoch_iterator:
+                callbacks.on_predict_batch_begin(step)
+                data = iterator[0]
+                x_batch, _ = data_adapter_utils.unpack_x_y(data)
+                batch_outputs = await self.predict_on_batch(x_batch)
+                outputs.extend(batch_outputs)
+                callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
+                if self.stop_predicting:
+                    break
         callbacks.on_predict_end()
         return np.array(outputs, dtype="object")
 
+    @python_utils.default
     async def train_on_batch(
         self,
         x,
@@ -792,6 +921,18 @@ class Trainer:
         """
         y_pred = await self.predict_on_batch(x, training=True)
 
+        metrics = await self._train_on_predictions(
+            x,
+            y,
+            y_pred,
+            train_optimizer=train_optimizer,
+        )
+
+        if return_dict:
+            return metrics
+        return self._flatten_metrics_in_order(metrics)
+
+    async def _train_on_predictions(self, x, y, y_pred, train_optimizer=False):
         reward = await self.compute_reward(
             x=x,
             y=y,
@@ -818,12 +959,9 @@ class Trainer:
                 reward=reward,
             )
 
-        metrics = await self.compute_metrics(x, y, y_pred)
-
-        if return_dict:
-            return metrics
-        return self._flatten_metrics_in_order(metrics)
+        return await self.compute_metrics(x, y, y_pred)
 
+    @python_utils.default
     async def test_on_batch(
         self,
         x,
@@ -847,6 +985,13 @@ class Trainer:
         """
         y_pred = await self.predict_on_batch(x, training=False)
 
+        metrics = await self._test_on_predictions(x, y, y_pred)
+
+        if return_dict:
+            return metrics
+        return self._flatten_metrics_in_order(metrics)
+
+    async def _test_on_predictions(self, x, y, y_pred):
         reward = await self.compute_reward(
             x=x,
             y=y,
@@ -856,11 +1001,115 @@ class Trainer:
 
         await self._reward_tracker.update_state(reward)
 
-        metrics = await self.compute_metrics(x, y, y_pred)
+        return await self.compute_metrics(x, y, y_pred)
 
-        if return_dict:
-            return metrics
-        return self._flatten_metrics_in_order(metrics)
+    async def _pipelined_train_loop(
+        self,
+        epoch_iterator,
+        callbacks,
+        prefetch_batches=1,
+        train_optimizer=False,
+    ):
+        """Training loop predicting the next batches while training on the current one.
+
+        Returns:
+            (dict): The logs of the last batch or `None` if no batch.
+        """
+        predict_batch_fn, _ = self._get_prefetch_predict_fn(training=True)
+
+        async def predict_fn(iterator):
+            # The predictions of the batches predicted ahead are recorded at
+            # their turn, so the optimizer only rewards them with their reward
+            with backend.PredictionsScope() as predictions_scope:
+                y_pred = await predict_batch_fn(iterator)
+            return predictions_scope, y_pred
+
+        logs = None
+        async with contextlib.aclosing(
+            epoch_iterator.prefetch(predict_fn, buffer_size=prefetch_batches)
+        ) as batches:
+            async for step, iterator, (predictions_scope, y_pred) in batches:
+                x_batch, y_batch = data_adapter_utils.unpack_x_y(iterator[0])
+                predictions_scope.flush()
+                callbacks.on_train_batch_begin(step)
+                logs = await self._train_on_predictions(
+                    x_batch,
+                    y_batch,
+                    y_pred,
+                    train_optimizer=train_optimizer,
+                )
+                callbacks.on_train_batch_end(step, logs)
+                if self.stop_training:
+                    break
+        return logs
+
+    async def _pipelined_test_loop(
+        self,
+        epoch_iterator,
+        callbacks,
+        prefetch_batches=0,
+        window_size=None,
+    ):
+        """Evaluation loop scoring each batch while predicting the next ones.
+
+        Returns:
+            (dict): The logs of the last batch or `None` if no batch.
+        """
+        predict_fn, buffer_size = self._get_prefetch_predict_fn(
+            window_size=window_size,
+        )
+        logs = None
+        async with contextlib.aclosing(
+            epoch_iterator.prefetch(
+                predict_fn,
+                buffer_size=max(buffer_size, prefetch_batches),
+            )
+        ) as batches:
+            async for step, iterator, y_pred in batches:
+                x_batch, y_batch = data_adapter_utils.unpack_x_y(iterator[0])
+                callbacks.on_test_batch_begin(step)
+                logs = await self._test_on_predictions(x_batch, y_batch, y_pred)
+                callbacks.on_test_batch_end(step, logs)
+                if self.stop_evaluating:
+                    break
+        return logs
+
+    def _get_prefetch_predict_fn(self, training=False, window_size=None):
+        """Returns the function predicting the batches of a prefetched epoch.
+
+        Without `window_size`, each batch is predicted with `predict_on_batch()`
+        and the next batch is prefetched. Otherwise, the samples of all the
+        batches share a window of `window_size` concurrent predictions.
+
+        Returns:
+            (tuple): The async predict function and the prefetch buffer size.
+        """
+        if not window_size:
+
+            async def predict_fn(iterator):
+                x_batch, _ = data_adapter_utils.unpack_x_y(iterator[0])
+                return await self.predict_on_batch(x_batch, training=training)
+
+            return predict_fn, 1
+
+        if window_size < 1:
+            raise ValueError(
+                "`window_size` should be a positive integer or `None`. "
+                f"Received: {window_size}"
+            )
+        semaphore = asyncio.Semaphore(window_size)
+
+        async def predict_sample(inputs):
+            async with semaphore:
+                return await self(inputs, training=training)
+
+        async def predict_fn(iterator):
+            x_batch, _ = data_adapter_utils.unpack_x_y(iterator[0])
+            return await asyncio.gather(*[predict_sample(inputs) for inputs in x_batch])
+
+        # Every batch has at least one sample, so prefetching `window_size`
+        # batches is enough to keep the window full
+        return predict_fn, window_size
 
     async def predict_on_batch(self, x, training=False):
         """Returns predictions for a single batch of samples.
@@ -1,8 +1,12 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 import json
 from unittest.mock import patch
 
+import numpy as np
+
+from synalinks.src import callbacks
 from synalinks.src import metrics
 from synalinks.src import modules
 from synalinks.src import optimizers
@@ -10,6 +14,7 @@ from synalinks.src import programs
 from synalinks.src import rewards
 from synalinks.src import testing
 from synalinks.src.backend import JsonDataModel
+from synalinks.src.embedding_models import EmbeddingModel
 from synalinks.src.language_models import LanguageModel
 from synalinks.src.testing.test_utils import AnswerWithRationale
 from synalinks.src.testing.test_utils import Query
@@ -170,3 +175,307 @@ class TestTrainer(testing.TestCase):
         self.assertEqual(len(y_data), 2)
         self.assertIsInstance(y_data[0], JsonDataModel)
         self.assertIsInstance(y_data[1], JsonDataModel)
+
+    @patch("litellm.acompletion")
+    async def test_concurrent_rewards(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def slow_reward(y_true, y_pred):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await rewards.exact_match(y_true, y_pred)
+
+        program = await program_test()
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+        x_test = list(x_test) * 4
+        y_test = list(y_test) * 4
+
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.RewardFunctionWrapper(slow_reward, in_mask=["answer"]),
+        )
+        logs = await program.test_on_batch(x_test, y_test, return_dict=True)
+        self.assertEqual(logs["reward"], 0.5)
+        self.assertEqual(peak_in_flight, 8)
+
+        peak_in_flight = 0
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.RewardFunctionWrapper(slow_reward, in_mask=["answer"]),
+            max_concurrency=2,
+        )
+        logs = await program.test_on_batch(x_test, y_test, return_dict=True)
+        self.assertEqual(logs["reward"], 0.5)
+        self.assertEqual(peak_in_flight, 2)
+
+    @patch("litellm.acompletion")
+    async def test_fit_with_prefetch(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        program = await program_test()
+
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+        )
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+
+        history = await program.fit(
+            x=x_train,
+            y=y_train,
+            batch_size=1,
+            epochs=2,
+            verbose=0,
+            prefetch_batches=1,
+        )
+        self.assertEqual(history.history["reward"], [0.5, 0.5])
+
+        with self.assertRaises(ValueError):
+            await program.fit(x=x_train, y=y_train, verbose=0, prefetch_batches=-1)
+
+    @patch("litellm.acompletion")
+    async def test_fit_with_prefetch_rewards_each_prediction(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        program = await program_test()
+
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+        )
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+
+        rewarded_predictions = {}
+
+        class PredictionsLogger(callbacks.Callback):
+            def on_train_batch_end(self, batch, logs=None):
+                for variable in program.trainable_variables:
+                    for prediction in variable.get("predictions"):
+                        query = prediction["inputs"]["query"]
+                        rewarded_predictions[query] = prediction["reward"]
+
+        await program.fit(
+            x=x_train,
+            y=y_train,
+            batch_size=1,
+            epochs=1,
+            verbose=0,
+            prefetch_batches=1,
+            callbacks=[PredictionsLogger()],
+        )
+        # The prediction of the batch predicted ahead is not rewarded
+        # with the reward of the current batch
+        self.assertEqual(
+            rewarded_predictions,
+            {
+                "What is the capital of France?": 1.0,
+                "What is the French city of aeronautics?": 0.0,
+            },
+        )
+
+    @patch("litellm.acompletion")
+    async def test_evaluate_with_window(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def completion(*args, **kwargs):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {
+                "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+            }
+
+        mock_completion.side_effect = completion
+
+        program = await program_test()
+
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+        )
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+        x_test = np.array(list(x_test) * 4, dtype="object")
+        y_test = np.array(list(y_test) * 4, dtype="object")
+
+        # The window spans the batches of 2 samples
+        logs = await program.evaluate(
+            x=x_test,
+            y=y_test,
+            batch_size=2,
+            verbose=0,
+            window_size=3,
+        )
+        self.assertEqual(logs["reward"], 0.5)
+        self.assertEqual(peak_in_flight, 3)
+
+        peak_in_flight = 0
+        y_pred = await program.predict(
+            x=x_test,
+            batch_size=2,
+            verbose=0,
+            window_size=3,
+        )
+        self.assertEqual(len(y_pred), 8)
+        self.assertEqual(peak_in_flight, 3)
+
+    @patch("litellm.acompletion")
+    async def test_evaluate_with_prefetch(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        program = await program_test()
+
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+        )
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+
+        predicted_at_batch_begin = []
+
+        class PredictionsCounter(callbacks.Callback):
+            def on_test_batch_begin(self, batch, logs=None):
+                predicted_at_batch_begin.append(mock_completion.call_count)
+
+        # By default, each batch is predicted after its callbacks
+        logs = await program.evaluate(
+            x=x_test,
+            y=y_test,
+            batch_size=1,
+            verbose=0,
+            callbacks=[PredictionsCounter()],
+        )
+        self.assertEqual(logs["reward"], 0.5)
+        self.assertEqual(predicted_at_batch_begin, [0, 1])
+
+        mock_completion.reset_mock()
+        logs = await program.evaluate(
+            x=x_test,
+            y=y_test,
+            batch_size=1,
+            verbose=0,
+            prefetch_batches=1,
+        )
+        self.assertEqual(logs["reward"], 0.5)
+        self.assertEqual(mock_completion.call_count, 2)
+
+        with self.assertRaises(ValueError):
+            await program.evaluate(x=x_test, y=y_test, verbose=0, prefetch_batches=-1)
+
+    @patch("litellm.aembedding")
+    @patch("litellm.acompletion")
+    async def test_batch_rewards(self, mock_completion, mock_embedding):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        def embed(model=None, input=None, **kwargs):
+            return {"data": [{"embedding": [1.0, 0.0, 0.0]} for _ in input]}
+
+        mock_embedding.side_effect = embed
+
+        program = await program_test()
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.CosineSimilarity(
+                embedding_model=EmbeddingModel(model="ollama/all-minilm"),
+                in_mask=["answer"],
+            ),
+        )
+        logs = await program.test_on_batch(x_test, y_test, return_dict=True)
+        self.assertEqual(logs["reward"], 1.0)
+        # All the samples are embedded in a single request
+        self.assertEqual(mock_embedding.call_count, 1)
+
+    @patch("litellm.acompletion")
+    async def test_evaluate_multiple_batches(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        program = await program_test()
+
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+            metrics=[
+                metrics.MeanMetricWrapper(rewards.exact_match, in_mask=["answer"]),
+            ],
+        )
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+
+        logs = await program.evaluate(
+            x=x_test,
+            y=y_test,
+            batch_size=1,
+            verbose=0,
+        )
+        self.assertEqual(logs["reward"], 0.5)
+        self.assertEqual(logs["mean_metric_wrapper"], 0.5)
@@ -1,11 +1,13 @@
+from __future__ import annotations
+
 import asyncio
 from contextlib import asynccontextmanager
 from types import TracebackType
+from typing import TYPE_CHECKING
 from typing import AsyncIterator
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.utils.async_utils import create_task
-from synalinks.src.utils.mcp.sessions import ClientSession
 from synalinks.src.utils.mcp.sessions import Connection
 from synalinks.src.utils.mcp.sessions import McpHttpClientFactory
 from synalinks.src.utils.mcp.sessions import SSEConnection
@@ -16,6 +18,9 @@ from synalinks.src.utils.mcp.sessions import create_session
 from synalinks.src.utils.mcp.tools import load_mcp_tools
 from synalinks.src.utils.tool_utils import Tool
 
+if TYPE_CHECKING:
+    from mcp import ClientSession
+
 ASYNC_CONTEXT_MANAGER_ERROR = (
     "MultiServerMCPClient cannot be used as a context "
     "manager (e.g., async with MultiServerMCPClient(...)). "
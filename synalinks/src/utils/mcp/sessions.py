@@ -1,19 +1,20 @@
+from __future__ import annotations
+
 import os
 from contextlib import asynccontextmanager
 from datetime import timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import AsyncIterator
 from typing import Literal
 from typing import Protocol
 from typing import TypedDict
 
-import httpx
-from mcp import ClientSession
-from mcp import StdioServerParameters
-from mcp.client.sse import sse_client
-from mcp.client.stdio import stdio_client
-from mcp.client.streamable_http import streamablehttp_client
+if TYPE_CHECKING:
+    # `mcp` is imported when a session is created to keep `import synalinks` fast
+    import httpx
+    from mcp import ClientSession
 
 EncodingErrorHandler = Literal["strict", "ignore", "replace"]
 
@@ -156,6 +157,10 @@ async def _create_stdio_session(
     # NOTE: execution commands (e.g., `uvx` / `npx`) require PATH envvar to be set.
     # To address this, we automatically inject existing PATH envvar into the `env` value,
     # if it's not already set.
+    from mcp import ClientSession
+    from mcp import StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
     env = env or {}
     if "PATH" not in env:
         env["PATH"] = os.environ.get("PATH", "")
@@ -195,6 +200,9 @@ async def _create_sse_session(
         session_kwargs: Additional keyword arguments to pass to the ClientSession
         httpx_client_factory: Custom factory for httpx.AsyncClient (optional)
     """
+    from mcp import ClientSession
+    from mcp.client.sse import sse_client
+
     # Create and store the connection
     kwargs = {}
     if httpx_client_factory is not None:
@@ -231,6 +239,9 @@ async def _create_streamable_http_session(
         session_kwargs: Additional keyword arguments to pass to the ClientSession
         httpx_client_factory: Custom factory for httpx.AsyncClient (optional)
     """
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+
     # Create and store the connection
     kwargs = {}
     if httpx_client_factory is not None:
@@ -258,6 +269,8 @@ async def _create_websocket_session(
     Raises:
         ImportError: If websockets package is not installed
     """
+    from mcp import ClientSession
+
     try:
         from mcp.client.websocket import websocket_client
     except ImportError:
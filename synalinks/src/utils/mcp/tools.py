@@ -1,19 +1,25 @@
+from __future__ import annotations
+
 import inspect
 import typing
+from typing import TYPE_CHECKING
 from typing import cast
 
-from mcp import ClientSession
-from mcp.types import CallToolResult
-from mcp.types import EmbeddedResource
-from mcp.types import ImageContent
-from mcp.types import TextContent
-from mcp.types import Tool as MCPTool
-
 from synalinks.src.utils.mcp.sessions import Connection
 from synalinks.src.utils.mcp.sessions import create_session
 from synalinks.src.utils.tool_utils import Tool
 
-NonTextContent = ImageContent | EmbeddedResource
+if TYPE_CHECKING:
+    # `mcp` is imported when used to keep `import synalinks` fast
+    from mcp import ClientSession
+    from mcp.types import CallToolResult
+    from mcp.types import EmbeddedResource
+    from mcp.types import ImageContent
+    from mcp.types import TextContent
+    from mcp.types import Tool as MCPTool
+
+    NonTextContent = ImageContent | EmbeddedResource
+
 MAX_ITERATIONS = 1000
 
 
@@ -34,6 +40,8 @@ class ToolMessage(typing.TypedDict):
 def _convert_call_tool_result(
     call_tool_result: CallToolResult,
 ) -> tuple[str | list[str], list[NonTextContent] | None]:
+    from mcp.types import TextContent
+
     text_contents: list[TextContent] = []
     non_text_contents = []
 
@@ -160,7 +168,7 @@ def _create_async_function_from_mcp_tool(
             # will create a session one on the fly
             async with create_session(connection) as tool_session:
                 await tool_session.initialize()
-                call_tool_result = await cast(ClientSession, tool_session).call_tool(
+                call_tool_result = await cast("ClientSession", tool_session).call_tool(
                     mcp_tool.name, filtered_kwargs
                 )
         else:
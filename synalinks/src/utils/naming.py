@@ -3,6 +3,7 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 import collections
+import functools
 import re
 
 from synalinks.src.api_export import synalinks_export
@@ -28,6 +29,7 @@ def uniquify(name):
     return unique_name
 
 
+@functools.lru_cache(maxsize=1024)
 def to_snake_case(name):
     name = re.sub(r"\W+", "", name)
     name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
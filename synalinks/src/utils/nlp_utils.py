@@ -1,5 +1,6 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import functools
 import re
 import string
 
@@ -290,7 +291,7 @@ def remove_numerical_suffix(property_key):
     Returns:
         (str): The property key with the suffix removed.
     """
-    return re.sub(SUFFIX_PATTERN, "", property_key)
+    return SUFFIX_PATTERN.sub("", property_key)
 
 
 def add_suffix(property_key, suffix):
@@ -307,6 +308,7 @@ def add_suffix(property_key, suffix):
     return f"{property_key}_{suffix}"
 
 
+@functools.lru_cache(maxsize=4096)
 def to_singular_without_numerical_suffix(property_key):
     """
     Convert a property key to its base (singular) form by removing
@@ -322,6 +324,7 @@ def to_singular_without_numerical_suffix(property_key):
     return to_singular_property(property_key)
 
 
+@functools.lru_cache(maxsize=4096)
 def to_plural_without_numerical_suffix(property_key):
     """
     Convert a property key to its list (plural) form by removing
@@ -337,6 +340,7 @@ def to_plural_without_numerical_suffix(property_key):
     return to_plural_property(property_key)
 
 
+@functools.lru_cache(maxsize=4096)
 def is_plural(property_key):
     """
     Check if the last word of a property key is in plural form.
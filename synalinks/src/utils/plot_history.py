@@ -2,9 +2,7 @@
 
 import os
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.ticker import MaxNLocator
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.utils.plot_utils import generate_distinct_colors
@@ -61,6 +59,9 @@ def plot_history(
             for inline display. If running in a Marimo notebook returns a marimo image.
             Otherwise returns the filepath where the image has been saved.
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import MaxNLocator
+
     all_metrics = list(history.history.keys())
 
     if metrics_filter is not None:
@@ -177,6 +178,9 @@ def plot_history_with_mean_and_std(
             for inline display. If running in a Marimo notebook returns a marimo image.
             Otherwise returns the filepath where the image has been saved.
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import MaxNLocator
+
     if not history_list:
         raise ValueError("history_list cannot be empty")
 
@@ -364,6 +368,9 @@ def plot_history_comparison(
             for inline display. If running in a Marimo notebook returns a marimo image.
             Otherwise returns the filepath where the image has been saved.
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import MaxNLocator
+
     if not history_dict:
         raise ValueError("history_dict cannot be empty")
 
@@ -517,6 +524,9 @@ def plot_history_comparison_with_mean_and_std(
             for inline display. If running in a Marimo notebook returns a marimo image.
             Otherwise returns the filepath where the image has been saved.
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import MaxNLocator
+
     if not history_comparison_dict:
         raise ValueError("history_comparison_dict cannot be empty")
 
@@ -2,7 +2,6 @@
 
 import os
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from synalinks.src.api_export import synalinks_export
@@ -60,6 +59,8 @@ def plot_metrics(
             for inline display. If running in a Marimo notebook returns a marimo image.
             Otherwise returns the filepath where the image has been saved.
     """
+    import matplotlib.pyplot as plt
+
     all_metrics = list(metrics.keys())
 
     if metrics_filter is not None:
@@ -176,6 +177,8 @@ def plot_metrics_comparison(
             for inline display. If running in a Marimo notebook returns a marimo image.
             Otherwise returns the filepath where the image has been saved.
     """
+    import matplotlib.pyplot as plt
+
     if not metrics_dict:
         raise ValueError("metrics_dict cannot be empty")
 
@@ -339,6 +342,8 @@ def plot_metrics_comparison_with_mean_and_std(
             for inline display. If running in a Marimo notebook returns a marimo image.
             Otherwise returns the filepath where the image has been saved.
     """
+    import matplotlib.pyplot as plt
+
     if not metrics_comparison_dict:
         raise ValueError("metrics_comparison_dict cannot be empty")
 
@@ -554,6 +559,8 @@ def plot_metrics_with_mean_and_std(
             for inline display. If running in a Marimo notebook returns a marimo image.
             Otherwise returns the filepath where the image has been saved.
     """
+    import matplotlib.pyplot as plt
+
     if not metrics_list:
         raise ValueError("metrics_list cannot be empty")
 
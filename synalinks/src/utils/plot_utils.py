@@ -1,7 +1,6 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 import numpy as np
-from matplotlib import colormaps
 
 
 def generate_distinct_colors(n):
@@ -10,6 +9,8 @@ def generate_distinct_colors(n):
     Args:
         n (int): The number of colors to generate
     """
+    from matplotlib import colormaps
+
     if n <= 10:
         # Use qualitative colormap for small number of categories
         cmap = colormaps["Set3"]
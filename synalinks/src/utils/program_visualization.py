@@ -3,6 +3,7 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 import copy
+import functools
 import json
 import os
 import sys
@@ -11,30 +12,36 @@ from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.utils import io_utils
 
-try:
-    # pydot-ng is a fork of pydot that is better maintained.
-    import pydot_ng as pydot
-except ImportError:
-    # pydotplus is an improved version of pydot
+
+@functools.lru_cache(maxsize=None)
+def get_pydot():
+    # Returns the PyDot module (imported on first use) or None if unavailable.
     try:
-        import pydotplus as pydot
+        # pydot-ng is a fork of pydot that is better maintained.
+        import pydot_ng as pydot
     except ImportError:
-        # Fall back on pydot if necessary.
+        # pydotplus is an improved version of pydot
         try:
-            import pydot
+            import pydotplus as pydot
         except ImportError:
-            pydot = None
+            # Fall back on pydot if necessary.
+            try:
+                import pydot
+            except ImportError:
+                pydot = None
+    return pydot
 
 
 def check_pydot():
     # Returns True if PyDot is available.
-    return pydot is not None
+    return get_pydot() is not None
 
 
 def check_graphviz():
     # Returns True if both PyDot and Graphviz are available.
     if not check_pydot():
         return False
+    pydot = get_pydot()
     try:
         # Attempt to create an image of a blank graph
         # to check the pydot/graphviz installation.
@@ -46,7 +53,7 @@ def check_graphviz():
 
 def add_edge(dot, src, dst):
     if not dot.get_edge(src, dst):
-        edge = pydot.Edge(src, dst)
+        edge = get_pydot().Edge(src, dst)
         edge.set("penwidth", "2")
         dot.add_edge(edge)
 
@@ -165,7 +172,7 @@ def make_module_label(module, **kwargs):
 
 
 def make_node(module, **kwargs):
-    node = pydot.Node(str(id(module)), label=make_module_label(module, **kwargs))
+    node = get_pydot().Node(str(id(module)), label=make_module_label(module, **kwargs))
     node.set("fontname", "Helvetica")
     node.set("border", "0")
     node.set("margin", "0")
@@ -231,6 +238,7 @@ def program_to_dot(
         raise ImportError(
             "You must install pydot (`pip install pydot`) for program_to_dot to work."
         )
+    pydot = get_pydot()
 
     if subgraph:
         dot = pydot.Cluster(style="dashed", graph_name=program.name)
@@ -0,0 +1,158 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+import sqlite3
+import threading
+import time
+
+# The maximum number of variables per statement (below the SQLite limit)
+MAX_VARIABLES = 500
+
+
+class SQLiteLRUTable:
+    """A persistent key-value table evicting the least recently used rows.
+
+    Each row has a `key`, the given value columns and the time of its last
+    access. When the number of rows exceeds `max_entries`, the least recently
+    used rows are evicted (down to 90% of `max_entries`). The connection is
+    opened on first use and shared by the threads, behind a lock.
+
+    Args:
+        path (str): The path of the SQLite database.
+        table (str): The name of the table.
+        columns (dict): The SQL type of each value column.
+        max_entries (int): Optional. The maximum number of rows to keep,
+            `None` for no limit (Default to None).
+    """
+
+    def __init__(self, path, table, columns, max_entries=None):
+        self.path = path
+        self.table = table
+        self.columns = columns
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self._size = None
+        self._connection = None
+
+    def _get_connection(self):
+        if self._connection is None:
+            dirname = os.path.dirname(self.path)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            columns = ", ".join(
+                f"{name} {sql_type} NOT NULL" for name, sql_type in self.columns.items()
+            )
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                f"key TEXT PRIMARY KEY, {columns}, last_access REAL NOT NULL)"
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_last_access "
+                f"ON {self.table}(last_access)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _count(self, connection):
+        (count,) = connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        return count
+
+    def get_many(self, keys):
+        """Get the rows of the given keys and mark them as recently used.
+
+        Args:
+            keys (list): The keys to look up.
+
+        Returns:
+            (dict): The values of the rows found (as tuples), by key.
+        """
+        keys = list(dict.fromkeys(keys))
+        names = ", ".join(self.columns)
+        found = {}
+        with self.lock:
+            connection = self._get_connection()
+            for i in range(0, len(keys), MAX_VARIABLES):
+                chunk = keys[i : i + MAX_VARIABLES]
+                placeholders = ", ".join(["?"] * len(chunk))
+                rows = connection.execute(
+                    f"SELECT key, {names} FROM {self.table} "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                found.update((row[0], row[1:]) for row in rows)
+            if found:
+                now = time.time()
+                connection.executemany(
+                    f"UPDATE {self.table} SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                connection.commit()
+        return found
+
+    def put_many(self, rows):
+        """Insert (or replace) rows, evicting the least recently used if needed.
+
+        Args:
+            rows (list): The rows as `(key, *values)` tuples, with the values
+                in the order of the columns.
+        """
+        now = time.time()
+        names = ", ".join(["key", *self.columns, "last_access"])
+        placeholders = ", ".join(["?"] * (len(self.columns) + 2))
+        with self.lock:
+            connection = self._get_connection()
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table} ({names}) VALUES ({placeholders})",
+                [(*row, now) for row in rows],
+            )
+            if self.max_entries is not None:
+                # Upper bound of the size, replaced rows are counted twice
+                if self._size is None:
+                    self._size = self._count(connection)
+                else:
+                    self._size += len(rows)
+                if self._size > self.max_entries:
+                    self._size = self._count(connection)
+                if self._size > self.max_entries:
+                    target_size = int(self.max_entries * 0.9)
+                    connection.execute(
+                        f"DELETE FROM {self.table} WHERE key IN ("
+                        f"SELECT key FROM {self.table} "
+                        "ORDER BY last_access ASC, rowid ASC LIMIT ?)",
+                        (self._size - target_size,),
+                    )
+                    self._size = target_size
+            connection.commit()
+
+    def delete(self, key):
+        """Remove a row.
+
+        Args:
+            key (str): The key of the row.
+        """
+        with self.lock:
+            connection = self._get_connection()
+            connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            connection.commit()
+
+    def clear(self):
+        """Remove every row."""
+        with self.lock:
+            connection = self._get_connection()
+            connection.execute(f"DELETE FROM {self.table}")
+            connection.commit()
+            self._size = 0
+
+    def close(self):
+        """Close the connection to the database."""
+        with self.lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __len__(self):
+        with self.lock:
+            return self._count(self._get_connection())
@@ -0,0 +1,41 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+
+from synalinks.src import testing
+from synalinks.src.utils.sqlite_utils import SQLiteLRUTable
+
+
+class SQLiteLRUTableTest(testing.TestCase):
+    def get_table(self, max_entries=None):
+        return SQLiteLRUTable(
+            os.path.join(self.get_temp_dir(), "cache.db"),
+            "values_table",
+            {"value": "TEXT", "created": "REAL"},
+            max_entries=max_entries,
+        )
+
+    def test_get_and_put(self):
+        table = self.get_table()
+        table.put_many([("a", "1", 0.0), ("b", "2", 1.0)])
+        self.assertEqual(table.get_many(["a", "c", "a"]), {"a": ("1", 0.0)})
+        table.put_many([("a", "3", 2.0)])
+        self.assertEqual(table.get_many(["a"]), {"a": ("3", 2.0)})
+        self.assertEqual(len(table), 2)
+        table.delete("a")
+        self.assertEqual(table.get_many(["a", "b"]), {"b": ("2", 1.0)})
+        table.clear()
+        self.assertEqual(len(table), 0)
+        table.close()
+
+    def test_eviction(self):
+        table = self.get_table(max_entries=10)
+        for i in range(5):
+            table.put_many([(f"key {i}", str(i), 0.0)])
+        # Recently used, so kept
+        table.get_many(["key 0"])
+        for i in range(5, 20):
+            table.put_many([(f"key {i}", str(i), 0.0)])
+        self.assertLessEqual(len(table), 10)
+        self.assertIn("key 19", table.get_many(["key 19"]))
+        self.assertEqual(table.get_many(["key 1"]), {})
@@ -6,9 +6,6 @@ import json
 import re
 import shutil
 
-import rich
-import rich.table
-
 from synalinks.src import tree
 from synalinks.src.utils import io_utils
 
@@ -112,6 +109,9 @@ def print_summary(
             matches `module_range[1]`. By default (`None`) all
             modules in the program are included in the summary.
     """
+    import rich
+    import rich.table
+
     from synalinks.src.programs import Functional
     from synalinks.src.programs import Sequential
 